@@ -38,6 +38,9 @@ from . import (
     # Vedic Advanced Features
     yogas,
     ashtakavarga,
+    shadbala,
+    # Chart comparison
+    synastry,
     # Phase 6: Coloring Book / Art Therapy
     coloring_book,
 )
@@ -91,6 +94,10 @@ router.include_router(image_ws.router, tags=["Images"])
 # Vedic Advanced Features
 router.include_router(yogas.router, prefix="/yogas", tags=["Yogas"])
 router.include_router(ashtakavarga.router, prefix="/ashtakavarga", tags=["Ashtakavarga"])
+router.include_router(shadbala.router, prefix="/shadbala", tags=["Shadbala"])
+
+# Chart comparison
+router.include_router(synastry.router, prefix="/synastry", tags=["Synastry"])
 
 # Phase 6: Coloring Book / Art Therapy
 router.include_router(coloring_book.router, tags=["Coloring Book"])
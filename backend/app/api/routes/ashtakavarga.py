@@ -4,6 +4,9 @@ Ashtakavarga API Routes
 Endpoints for calculating Ashtakavarga (8-fold strength) in Vedic astrology.
 """
 
+from datetime import datetime
+from typing import Dict
+
 from fastapi import APIRouter, HTTPException, Depends
 from sqlalchemy.orm import Session
 
@@ -11,7 +14,8 @@ from app.core.database_sqlite import get_db
 from app.models.birth_data import BirthData
 from app.models.chart import Chart
 from app.services.ashtakavarga_calculator import AshtakavargaCalculator
-from app.services.vedic_calculator import VedicChartCalculator
+from app.services.vedic_chart_service import VedicChartService
+from app.services.calculation_executor import get_calculation_executor
 from app.schemas.ashtakavarga import (
     AshtakavargaRequest,
     AshtakavargaFromChartRequest,
@@ -22,6 +26,20 @@ from app.schemas.ashtakavarga import (
 
 router = APIRouter()
 
+def _vedic_chart_data(birth_data_id: str, ayanamsa: str, db: Session) -> Dict:
+    """Vedic chart data for birth data (see VedicChartService.chart_data)"""
+    birth_data = db.query(BirthData).filter(BirthData.id == birth_data_id).first()
+    if not birth_data:
+        raise HTTPException(status_code=404, detail="Birth data not found")
+
+    try:
+        return VedicChartService.chart_data(db, birth_data, ayanamsa)
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to calculate chart: {str(e)}"
+        )
+
 
 @router.post("/calculate", response_model=AshtakavargaResponse)
 async def calculate_ashtakavarga(request: AshtakavargaRequest, db: Session = Depends(get_db)):
@@ -31,48 +49,7 @@ async def calculate_ashtakavarga(request: AshtakavargaRequest, db: Session = Dep
     Returns both Bhinnashtakavarga (individual planets) and
     Sarvashtakavarga (combined totals) with analysis.
     """
-    # Get birth data
-    birth_data = db.query(BirthData).filter(BirthData.id == request.birth_data_id).first()
-    if not birth_data:
-        raise HTTPException(status_code=404, detail="Birth data not found")
-
-    # Check for existing Vedic chart
-    chart = db.query(Chart).filter(
-        Chart.birth_data_id == request.birth_data_id,
-        Chart.chart_type == 'vedic'
-    ).first()
-
-    if chart and chart.chart_data:
-        chart_data = chart.chart_data
-    else:
-        # Calculate Vedic chart
-        try:
-            from datetime import datetime, date, time
-            # Handle date/time that may be stored as strings in SQLite
-            if isinstance(birth_data.birth_date, str):
-                bd = datetime.strptime(birth_data.birth_date, "%Y-%m-%d").date()
-            else:
-                bd = birth_data.birth_date
-
-            if isinstance(birth_data.birth_time, str):
-                bt = datetime.strptime(birth_data.birth_time, "%H:%M:%S").time()
-            else:
-                bt = birth_data.birth_time
-
-            birth_datetime = datetime.combine(bd, bt)
-
-            calculator = VedicChartCalculator()
-            chart_data = calculator.calculate_vedic_chart(
-                birth_datetime=birth_datetime,
-                latitude=birth_data.latitude,
-                longitude=birth_data.longitude,
-                ayanamsa=request.ayanamsa
-            )
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to calculate chart: {str(e)}"
-            )
+    chart_data = _vedic_chart_data(request.birth_data_id, request.ayanamsa, db)
 
     # Extract planet and ascendant data
     d1_data = chart_data.get('d1', chart_data)
@@ -149,53 +126,7 @@ async def get_transit_score(request: TransitScoreRequest, db: Session = Depends(
 
     Useful for timing analysis and transit predictions.
     """
-    # First calculate Ashtakavarga
-    av_request = AshtakavargaRequest(
-        birth_data_id=request.birth_data_id,
-        ayanamsa=request.ayanamsa
-    )
-
-    # Get birth data and calculate
-    birth_data = db.query(BirthData).filter(BirthData.id == request.birth_data_id).first()
-    if not birth_data:
-        raise HTTPException(status_code=404, detail="Birth data not found")
-
-    # Get or calculate chart data
-    chart = db.query(Chart).filter(
-        Chart.birth_data_id == request.birth_data_id,
-        Chart.chart_type == 'vedic'
-    ).first()
-
-    if chart and chart.chart_data:
-        chart_data = chart.chart_data
-    else:
-        try:
-            from datetime import datetime
-            # Handle date/time that may be stored as strings in SQLite
-            if isinstance(birth_data.birth_date, str):
-                bd = datetime.strptime(birth_data.birth_date, "%Y-%m-%d").date()
-            else:
-                bd = birth_data.birth_date
-
-            if isinstance(birth_data.birth_time, str):
-                bt = datetime.strptime(birth_data.birth_time, "%H:%M:%S").time()
-            else:
-                bt = birth_data.birth_time
-
-            birth_datetime = datetime.combine(bd, bt)
-
-            calculator = VedicChartCalculator()
-            chart_data = calculator.calculate_vedic_chart(
-                birth_datetime=birth_datetime,
-                latitude=birth_data.latitude,
-                longitude=birth_data.longitude,
-                ayanamsa=request.ayanamsa
-            )
-        except Exception as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to calculate chart: {str(e)}"
-            )
+    chart_data = _vedic_chart_data(request.birth_data_id, request.ayanamsa, db)
 
     # Calculate Ashtakavarga
     d1_data = chart_data.get('d1', chart_data)
@@ -212,3 +143,61 @@ async def get_transit_score(request: TransitScoreRequest, db: Session = Depends(
     )
 
     return transit_score
+
+
+@router.get("/transit-series/{birth_data_id}")
+async def get_transit_strength_series(
+    birth_data_id: str,
+    start: datetime,
+    end: datetime,
+    step_days: float = 1.0,
+    ayanamsa: str = "lahiri",
+    include_periods: bool = False,
+    db: Session = Depends(get_db)
+):
+    """
+    Get Ashtakavarga transit strength of all 7 planets over a date range.
+
+    Returns sample-by-planet arrays of transit sign, kakshya, own (Bhinna)
+    bindus, Sarva bindus and kakshya bindu. With include_periods, each
+    planet's sign and kakshya periods are added.
+    """
+    if end <= start:
+        raise HTTPException(status_code=400, detail="end must be after start")
+    if step_days <= 0:
+        raise HTTPException(status_code=400, detail="step_days must be positive")
+    samples = (end - start).total_seconds() / 86400 / step_days
+    if samples > VedicChartService.MAX_SERIES_SAMPLES:
+        raise HTTPException(
+            status_code=400,
+            detail=(
+                f"{int(samples)} samples in range (max {VedicChartService.MAX_SERIES_SAMPLES}); "
+                "narrow the range or increase step_days"
+            )
+        )
+
+    chart_data = _vedic_chart_data(birth_data_id, ayanamsa, db)
+    d1_data = chart_data.get('d1', chart_data)
+    planet_signs = AshtakavargaCalculator._get_planet_signs(d1_data.get('planets', {}))
+    planet_signs['ascendant'] = int(d1_data.get('houses', {}).get('ascendant', 0) / 30)
+    matrices = AshtakavargaCalculator.calculate_matrices(planet_signs)
+
+    series = await get_calculation_executor().run(
+        AshtakavargaCalculator.transit_strength_series,
+        matrices, start, end, step_days, ayanamsa
+    )
+
+    result = {
+        'start': start.isoformat(),
+        'end': end.isoformat(),
+        'step_days': step_days,
+        'bhinna_bindus_by_sign': dict(zip(AshtakavargaCalculator.PLANETS, matrices.bhinna.tolist())),
+        'sarva_bindus_by_sign': matrices.sarva.tolist(),
+        **series.to_dict(),
+    }
+    if include_periods:
+        result['periods'] = {
+            planet: series.periods(planet, by_kakshya=True)
+            for planet in AshtakavargaCalculator.PLANETS
+        }
+    return result
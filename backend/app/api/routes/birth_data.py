@@ -19,6 +19,8 @@ from app.schemas import (
     Message,
 )
 from app.schemas.birth_data import RELATIONSHIP_TYPES
+from app.services.daily_insights_service import DailyInsightsService
+from app.services.natal_cache_service import NatalCacheService
 
 router = APIRouter()
 
@@ -316,6 +318,10 @@ async def update_birth_data(
 
     # Coordinates are validated by database CHECK constraints
 
+    # Cached natal computations and precomputed day energy are now stale
+    NatalCacheService.invalidate(birth_data.id, db)
+    DailyInsightsService.invalidate_energy(birth_data.id, db)
+
     db.commit()
     db.refresh(birth_data)
 
@@ -352,6 +358,7 @@ async def delete_birth_data(
             detail="Birth data not found"
         )
 
+    NatalCacheService.invalidate(birth_data.id, db)
     db.delete(birth_data)
     db.commit()
 
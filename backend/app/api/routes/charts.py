@@ -3,30 +3,49 @@ Chart management and calculation endpoints (single-user mode)
 
 No user authentication - all charts belong to "the user"
 """
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+import asyncio
+import json
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from uuid import UUID
 
 from app.core.database_sqlite import get_db
-from app.models import BirthData, Chart
+from app.models import BirthData, Chart, UserEvent
 from app.schemas import (
     ChartCreate,
     ChartUpdate,
     ChartResponse,
     ChartCalculationRequest,
     ChartCalculationResponse,
+    ReturnSeriesRequest,
+    RectificationRequest,
     Message,
 )
 from app.utils.ephemeris import EphemerisCalculator
 from app.services.chart_calculator import NatalChartCalculator
 from app.services.vedic_calculator import VedicChartCalculator
+from app.services.predictive_calculator import PredictiveChartCalculator
+from app.services.rectification_service import RectificationService
+from app.services.natal_cache_service import NatalCacheService
+from app.services.calculation_executor import get_calculation_executor
 from app.core.config import settings
 
 router = APIRouter()
 
+# Body whose return defines each return chart type
+RETURN_BODIES = {"solar_return": "sun", "lunar_return": "moon"}
+
+# chart_data key holding the reference date of dated predictive charts
+DATED_CHART_KEYS = {
+    "progressed": "progressed_date",
+    "solar_return": "return_search_date",
+    "lunar_return": "return_search_date",
+}
+
 
 # =============================================================================
 # Chart CRUD Operations
@@ -310,6 +329,18 @@ async def calculate_chart(
                 calc_request,
                 settings
             )
+        elif calc_request.chart_type == "progressed":
+            chart_data = await _calculate_progressed_chart(
+                birth_data,
+                calc_request,
+                settings
+            )
+        elif calc_request.chart_type in RETURN_BODIES:
+            chart_data = await _calculate_return_chart(
+                birth_data,
+                calc_request,
+                settings
+            )
         # Add more chart types here as needed
         else:
             raise HTTPException(
@@ -378,51 +409,58 @@ async def calculate_chart(
 # Helper Functions for Chart Calculations
 # =============================================================================
 
-async def _calculate_natal_chart(
-    birth_data: BirthData,
-    calc_request: ChartCalculationRequest,
-    settings
-) -> Dict[str, Any]:
-    """Calculate natal chart using appropriate system (Western or Vedic)"""
-
-    # Convert birth datetime (SQLite stores as strings)
-    from datetime import datetime as dt, time as dt_time, date as dt_date
-
+def _birth_datetime(birth_data: BirthData) -> datetime:
+    """Birth date and time of a record (SQLite stores them as strings)"""
     # Parse date string to date object
     if isinstance(birth_data.birth_date, str):
-        birth_date = dt.fromisoformat(birth_data.birth_date).date()
+        birth_date = datetime.fromisoformat(birth_data.birth_date).date()
     else:
         birth_date = birth_data.birth_date
 
     # Parse time string to time object
     if birth_data.birth_time:
         if isinstance(birth_data.birth_time, str):
-            birth_time = dt.fromisoformat(f"2000-01-01T{birth_data.birth_time}").time()
+            birth_time = datetime.fromisoformat(f"2000-01-01T{birth_data.birth_time}").time()
         else:
             birth_time = birth_data.birth_time
     else:
         birth_time = datetime.min.time()
 
-    birth_datetime = datetime.combine(birth_date, birth_time)
+    return datetime.combine(birth_date, birth_time)
 
-    # Route to appropriate calculator based on astro_system
-    if calc_request.astro_system == "vedic":
-        # Calculate Vedic chart
-        chart_data = VedicChartCalculator.calculate_vedic_chart(
-            birth_datetime=birth_datetime,
-            latitude=float(birth_data.latitude),
-            longitude=float(birth_data.longitude),
-            timezone_offset_minutes=birth_data.utc_offset or 0,
-            ayanamsa=calc_request.ayanamsa or 'lahiri',
-            house_system=calc_request.house_system or 'whole_sign',
-            include_divisional=[1, 9],  # D-1 (Rasi) and D-9 (Navamsa) by default
-            include_western_aspects=calc_request.include_western_aspects,
-            include_minor_aspects=calc_request.include_minor_aspects,
-            custom_orbs=calc_request.custom_orbs
-        )
-    else:
+
+async def _calculate_natal_chart(
+    birth_data: BirthData,
+    calc_request: ChartCalculationRequest,
+    settings
+) -> Dict[str, Any]:
+    """Calculate natal chart using appropriate system (Western or Vedic)"""
+
+    birth_datetime = _birth_datetime(birth_data)
+
+    # Route to appropriate calculator based on astro_system; the calculation
+    # itself runs on the calculation executor, off the event loop
+    executor = get_calculation_executor()
+
+    def compute():
+        if calc_request.astro_system == "vedic":
+            # Calculate Vedic chart
+            return executor.run(
+                VedicChartCalculator.calculate_vedic_chart,
+                birth_datetime=birth_datetime,
+                latitude=float(birth_data.latitude),
+                longitude=float(birth_data.longitude),
+                timezone_offset_minutes=birth_data.utc_offset or 0,
+                ayanamsa=calc_request.ayanamsa or 'lahiri',
+                house_system=calc_request.house_system or 'whole_sign',
+                include_divisional=calc_request.include_divisional or [1, 9],  # D-1 and D-9 by default
+                include_western_aspects=calc_request.include_western_aspects,
+                include_minor_aspects=calc_request.include_minor_aspects,
+                custom_orbs=calc_request.custom_orbs
+            )
         # Calculate Western chart
-        chart_data = NatalChartCalculator.calculate_natal_chart(
+        return executor.run(
+            NatalChartCalculator.calculate_natal_chart,
             birth_datetime=birth_datetime,
             latitude=float(birth_data.latitude),
             longitude=float(birth_data.longitude),
@@ -435,6 +473,24 @@ async def _calculate_natal_chart(
             include_nakshatras=calc_request.include_nakshatras
         )
 
+    # Natal data is served from the natal cache when possible
+    chart_data = await NatalCacheService.get_or_compute_async(
+        None,
+        birth_data,
+        'vedic' if calc_request.astro_system == "vedic" else 'western',
+        compute,
+        astro_system=calc_request.astro_system,
+        zodiac=calc_request.zodiac_type or 'tropical',
+        ayanamsa=calc_request.ayanamsa or 'lahiri',
+        house_system=calc_request.house_system,
+        include_minor_aspects=calc_request.include_minor_aspects,
+        include_western_aspects=calc_request.include_western_aspects,
+        include_nakshatras=calc_request.include_nakshatras,
+        custom_orbs=calc_request.custom_orbs,
+        include_divisional=calc_request.include_divisional or [1, 9],
+        default_time='00:00:00'
+    )
+
     # Add metadata
     chart_data['calculation_method'] = "Swiss Ephemeris"
     chart_data['ephemeris_version'] = "SE 2.10"
@@ -484,9 +540,13 @@ async def get_or_create_chart(
             detail="Birth data not found"
         )
 
-    # For transit charts, default to current time if not provided
+    # For dated charts, default to current time if not provided
     if calc_request.chart_type == "transit" and not calc_request.transit_date:
         calc_request.transit_date = datetime.utcnow()
+    elif calc_request.chart_type == "progressed" and not calc_request.progressed_date:
+        calc_request.progressed_date = datetime.utcnow()
+    elif calc_request.chart_type in RETURN_BODIES and not calc_request.return_date:
+        calc_request.return_date = datetime.utcnow()
 
     # Try to find existing chart
     query = db.query(Chart).filter(
@@ -509,6 +569,25 @@ async def get_or_create_chart(
                 if stored_date_str == transit_date_str:
                     existing_chart = chart
                     break
+    elif calc_request.chart_type in DATED_CHART_KEYS:
+        # Progressed and return charts: one calculated for the same day, place and zodiac
+        date_key = DATED_CHART_KEYS[calc_request.chart_type]
+        requested = (calc_request.progressed_date if calc_request.chart_type == "progressed"
+                     else calc_request.return_date)
+        location = (_return_location(birth_data, calc_request)
+                    if calc_request.chart_type in RETURN_BODIES else None)
+        query = query.filter(
+            Chart.house_system == (calc_request.house_system or "placidus"),
+            Chart.zodiac_type == calc_request.zodiac_type
+        )
+        if calc_request.zodiac_type == "sidereal":
+            query = query.filter(Chart.ayanamsa == calc_request.ayanamsa)
+        for chart in query.all():
+            if (chart.chart_data
+                    and chart.chart_data.get(date_key, "")[:10] == requested.date().isoformat()
+                    and chart.chart_data.get("return_location") == location):
+                existing_chart = chart
+                break
     elif calc_request.chart_type == "natal":
         # For natal charts, just find any existing natal chart
         existing_chart = query.first()
@@ -544,6 +623,10 @@ async def get_or_create_chart(
             chart_data = await _calculate_natal_chart(birth_data, calc_request, settings)
         elif calc_request.chart_type == "transit":
             chart_data = await _calculate_transit_chart(birth_data, calc_request, settings)
+        elif calc_request.chart_type == "progressed":
+            chart_data = await _calculate_progressed_chart(birth_data, calc_request, settings)
+        elif calc_request.chart_type in RETURN_BODIES:
+            chart_data = await _calculate_return_chart(birth_data, calc_request, settings)
         else:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -601,6 +684,145 @@ async def get_or_create_chart(
     }
 
 
+# =============================================================================
+# Return Series
+# =============================================================================
+
+@router.post("/returns")
+async def calculate_return_series(
+    request: ReturnSeriesRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Find every solar or lunar return in a date range
+
+    All returns are solved together (one batched ephemeris call per Newton
+    iteration), so decades of lunar returns come back in one request.
+    With include_charts, each return also carries its planets and houses.
+    """
+    birth_data = db.query(BirthData).filter(
+        BirthData.id == str(request.birth_data_id)
+    ).first()
+
+    if not birth_data:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Birth data not found"
+        )
+
+    try:
+        returns = await get_calculation_executor().run(
+            PredictiveChartCalculator.calculate_returns,
+            birth_datetime=_birth_datetime(birth_data),
+            latitude=float(birth_data.latitude),
+            longitude=float(birth_data.longitude),
+            timezone_offset_minutes=birth_data.utc_offset or 0,
+            body=request.body,
+            start_date=request.start_date,
+            end_date=request.end_date,
+            return_latitude=request.return_latitude,
+            return_longitude=request.return_longitude,
+            include_charts=request.include_charts,
+            house_system=request.house_system or 'placidus',
+            zodiac=request.zodiac_type or 'tropical',
+            ayanamsa=request.ayanamsa or 'lahiri'
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Return calculation failed: {str(e)}"
+        )
+
+    return {
+        "birth_data_id": birth_data.id,
+        "body": request.body,
+        "start_date": request.start_date.isoformat(),
+        "end_date": request.end_date.isoformat(),
+        "count": len(returns),
+        "returns": returns,
+    }
+
+
+# =============================================================================
+# Birth Time Rectification
+# =============================================================================
+
+@router.post("/rectify")
+async def rectify_birth_time(
+    request: RectificationRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Rank candidate birth times across the birth day against timeline events
+
+    Streams newline-delimited JSON progress updates:
+    - {"stage": "ephemeris" | "transits" | "progressed" | "directed", "progress": 0..1}
+    - {"stage": "done", "progress": 1.0, "result": {...}} with the ranked
+      candidates (time, angles, cusps, contributing contacts) and one score
+      per candidate time
+    - {"stage": "error", "error": message} if scoring fails mid-stream
+
+    Event times without a recorded time are taken as local noon, in the
+    birth timezone.
+    """
+    birth_data = db.query(BirthData).filter(
+        BirthData.id == str(request.birth_data_id)
+    ).first()
+
+    if not birth_data:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Birth data not found"
+        )
+
+    query = db.query(UserEvent).filter(UserEvent.birth_data_id == birth_data.id)
+    if request.event_ids is not None:
+        query = query.filter(UserEvent.id.in_([str(event_id) for event_id in request.event_ids]))
+
+    offset = birth_data.utc_offset or 0
+    events = []
+    for event in query.order_by(UserEvent.event_date).all():
+        local = datetime.fromisoformat(f"{event.event_date}T{event.event_time or '12:00:00'}")
+        events.append({
+            'id': event.id,
+            'title': event.title,
+            'date': local - timedelta(minutes=offset),
+            'importance': event.importance,
+        })
+
+    updates = RectificationService.iter_rectification(
+        birth_date=_birth_datetime(birth_data).date(),
+        latitude=float(birth_data.latitude),
+        longitude=float(birth_data.longitude),
+        timezone_offset_minutes=offset,
+        events=events,
+        step_minutes=request.step_minutes,
+        top=request.top,
+        house_system=request.house_system or 'placidus'
+    )
+
+    # The first update comes after input validation and the ephemeris
+    # setup, so bad requests fail before streaming starts
+    try:
+        first = await asyncio.to_thread(next, updates)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    async def generate_lines():
+        yield json.dumps(first) + "\n"
+        while True:
+            try:
+                update = await asyncio.to_thread(next, updates, None)
+            except Exception as e:
+                yield json.dumps({'stage': 'error', 'error': str(e)}) + "\n"
+                return
+            if update is None:
+                return
+            yield json.dumps(update) + "\n"
+
+    return StreamingResponse(generate_lines(), media_type="application/x-ndjson")
+
+
 async def _calculate_transit_chart(
     birth_data: BirthData,
     calc_request: ChartCalculationRequest,
@@ -614,13 +836,152 @@ async def _calculate_transit_chart(
     # Calculate natal chart first
     natal_data = await _calculate_natal_chart(birth_data, calc_request, settings)
 
-    # Calculate transiting planet positions
+    # Calculate transiting planet positions and aspects on the executor
+    transit_planets, transit_aspects = await get_calculation_executor().run(
+        _calculate_transit_positions,
+        natal_data["planets"],
+        calc_request.transit_date,
+        calc_request.zodiac_type,
+        calc_request.custom_orbs
+    )
     transit_jd = EphemerisCalculator.datetime_to_julian_day(
         calc_request.transit_date,
         0  # Transits in UTC
     )
 
-    flags = EphemerisCalculator.get_calc_flags(calc_request.zodiac_type)
+    # Assemble transit chart data
+    chart_data = {
+        "natal": natal_data,
+        "transit_planets": transit_planets,
+        "transit_date": calc_request.transit_date.isoformat(),
+        "transit_julian_day": transit_jd,
+        "transit_aspects": transit_aspects,
+        "calculation_method": "Swiss Ephemeris",
+        "ephemeris_version": "SE 2.10"
+    }
+
+    return chart_data
+
+
+async def _calculate_progressed_chart(
+    birth_data: BirthData,
+    calc_request: ChartCalculationRequest,
+    settings
+) -> Dict[str, Any]:
+    """Calculate secondary progressed chart with solar arc directions"""
+
+    if not calc_request.progressed_date:
+        raise ValueError("Progressed date is required for progressed chart calculation")
+
+    natal_data = await _calculate_natal_chart(birth_data, calc_request, settings)
+
+    progressions = await get_calculation_executor().run(
+        PredictiveChartCalculator.calculate_progressions,
+        birth_datetime=_birth_datetime(birth_data),
+        latitude=float(birth_data.latitude),
+        longitude=float(birth_data.longitude),
+        timezone_offset_minutes=birth_data.utc_offset or 0,
+        target_dates=[calc_request.progressed_date],
+        house_system=calc_request.house_system or 'placidus',
+        zodiac=calc_request.zodiac_type or 'tropical',
+        ayanamsa=calc_request.ayanamsa or 'lahiri'
+    )
+    progressed = progressions[0]
+
+    return {
+        "natal": natal_data,
+        "progressed_planets": progressed["planets"],
+        "progressed_houses": progressed["houses"],
+        "solar_arc": progressed["solar_arc"],
+        "progressed_date": calc_request.progressed_date.isoformat(),
+        "progressed_julian_day": progressed["progressed_julian_day"],
+        "progressed_datetime": progressed["progressed_datetime"],
+        "calculation_method": "Swiss Ephemeris",
+        "ephemeris_version": "SE 2.10"
+    }
+
+
+def _return_location(birth_data: BirthData, calc_request: ChartCalculationRequest) -> Dict[str, float]:
+    """Place a return chart is cast for: the requested one, or the birth place"""
+    if calc_request.return_latitude is None or calc_request.return_longitude is None:
+        return {"latitude": float(birth_data.latitude), "longitude": float(birth_data.longitude)}
+    return {"latitude": calc_request.return_latitude, "longitude": calc_request.return_longitude}
+
+
+async def _calculate_return_chart(
+    birth_data: BirthData,
+    calc_request: ChartCalculationRequest,
+    settings
+) -> Dict[str, Any]:
+    """Calculate solar or lunar return chart (first return on or after return_date)"""
+
+    if not calc_request.return_date:
+        raise ValueError("Return date is required for return chart calculation")
+
+    body = RETURN_BODIES[calc_request.chart_type]
+    location = _return_location(birth_data, calc_request)
+
+    natal_data = await _calculate_natal_chart(birth_data, calc_request, settings)
+
+    executor = get_calculation_executor()
+    period = PredictiveChartCalculator.RETURN_PERIODS[body]
+    returns = await executor.run(
+        PredictiveChartCalculator.calculate_returns,
+        birth_datetime=_birth_datetime(birth_data),
+        latitude=float(birth_data.latitude),
+        longitude=float(birth_data.longitude),
+        timezone_offset_minutes=birth_data.utc_offset or 0,
+        body=body,
+        start_date=calc_request.return_date,
+        end_date=calc_request.return_date + timedelta(days=1.1 * period),
+        zodiac=calc_request.zodiac_type or 'tropical',
+        ayanamsa=calc_request.ayanamsa or 'lahiri'
+    )
+    if not returns:
+        raise ValueError(f"No {body} return found after {calc_request.return_date.isoformat()}")
+
+    # The return chart is a chart cast for the return moment and place
+    return_chart = await executor.run(
+        NatalChartCalculator.calculate_natal_chart,
+        birth_datetime=datetime.fromisoformat(returns[0]["datetime"]),
+        latitude=location["latitude"],
+        longitude=location["longitude"],
+        timezone_offset_minutes=0,
+        house_system=calc_request.house_system or 'placidus',
+        zodiac=calc_request.zodiac_type or 'tropical',
+        ayanamsa=calc_request.ayanamsa or 'lahiri',
+        include_minor_aspects=calc_request.include_minor_aspects,
+        custom_orbs=calc_request.custom_orbs
+    )
+
+    return {
+        "natal": natal_data,
+        "return_chart": return_chart,
+        "return_body": body,
+        "return_search_date": calc_request.return_date.isoformat(),
+        "return_date": returns[0]["datetime"],
+        "return_julian_day": returns[0]["julian_day"],
+        "return_location": location,
+        "calculation_method": "Swiss Ephemeris",
+        "ephemeris_version": "SE 2.10"
+    }
+
+
+def _calculate_transit_positions(
+    natal_planets: Dict[str, Any],
+    transit_date: datetime,
+    zodiac_type: str,
+    custom_orbs: Optional[Dict[str, float]]
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Transit positions and transit-to-natal aspects (runs in a calculation worker)"""
+
+    # Calculate transiting planet positions
+    transit_jd = EphemerisCalculator.datetime_to_julian_day(
+        transit_date,
+        0  # Transits in UTC
+    )
+
+    flags = EphemerisCalculator.get_calc_flags(zodiac_type)
 
     transit_planets = {}
     planet_list = list(EphemerisCalculator.PLANETS.keys())
@@ -631,7 +992,7 @@ async def _calculate_transit_chart(
                 planet_name,
                 transit_jd,
                 flags,
-                calc_request.zodiac_type
+                zodiac_type
             )
             transit_planets[planet_name] = planet_data
         except Exception as e:
@@ -641,11 +1002,11 @@ async def _calculate_transit_chart(
     # Calculate aspects between transits and natal planets
     transit_aspects = []
     for transit_planet, transit_pos in transit_planets.items():
-        for natal_planet, natal_pos in natal_data["planets"].items():
+        for natal_planet, natal_pos in natal_planets.items():
             aspect = EphemerisCalculator.calculate_aspect_between_planets(
                 transit_pos["longitude"],
                 natal_pos["longitude"],
-                custom_orbs=calc_request.custom_orbs
+                custom_orbs=custom_orbs
             )
             if aspect:
                 transit_aspects.append({
@@ -656,15 +1017,4 @@ async def _calculate_transit_chart(
                     "exact": aspect["exact"]
                 })
 
-    # Assemble transit chart data
-    chart_data = {
-        "natal": natal_data,
-        "transit_planets": transit_planets,
-        "transit_date": calc_request.transit_date.isoformat(),
-        "transit_julian_day": transit_jd,
-        "transit_aspects": transit_aspects,
-        "calculation_method": "Swiss Ephemeris",
-        "ephemeris_version": "SE 2.10"
-    }
-
-    return chart_data
+    return transit_planets, transit_aspects
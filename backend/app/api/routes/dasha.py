@@ -9,8 +9,8 @@ from datetime import datetime, timedelta
 from typing import Optional
 from fastapi import APIRouter, HTTPException, Depends
 
-from app.services.dasha_calculator import VimshottariDashaCalculator
-from app.utils.ephemeris import EphemerisCalculator
+from app.services.dasha_calculator import DASHA_LEVELS, VimshottariDashaCalculator
+from app.utils import nakshatra
 from app.schemas.dasha import (
     DashaRequest,
     DashaFromChartRequest,
@@ -25,6 +25,9 @@ from app.core.database_sqlite import get_db
 
 router = APIRouter()
 
+# Most periods one /periods request may return
+MAX_PERIODS = 5000
+
 
 def _convert_dasha_dates_to_strings(dasha_data: dict) -> dict:
     """Convert datetime objects to ISO strings for JSON serialization"""
@@ -61,26 +64,8 @@ async def calculate_dasha_from_birth_data(request: DashaRequest, db=Depends(get_
     if not birth_data:
         raise HTTPException(status_code=404, detail="Birth data not found")
 
-    # Parse birth datetime
-    birth_date = datetime.strptime(birth_data.birth_date, "%Y-%m-%d").date()
-    birth_time = (
-        datetime.strptime(birth_data.birth_time, "%H:%M:%S").time()
-        if birth_data.birth_time
-        else datetime.min.time()
-    )
-    birth_datetime = datetime.combine(birth_date, birth_time)
-
-    # Calculate Moon's sidereal position
-    jd = EphemerisCalculator.datetime_to_julian_day(
-        birth_datetime,
-        birth_data.utc_offset or 0
-    )
-
-    moon_position = EphemerisCalculator.calculate_planet_position(
-        'moon', jd, zodiac='sidereal', ayanamsa=request.ayanamsa
-    )
-
-    moon_longitude = moon_position['longitude']
+    # Moon's sidereal position at birth
+    birth_datetime, moon_longitude = VimshottariDashaCalculator.birth_moon(birth_data, request.ayanamsa)
 
     # Calculate Dasha
     calculate_to_date = birth_datetime + timedelta(days=365.25 * request.calculate_years)
@@ -191,69 +176,124 @@ async def get_current_dasha(
     """
     Get just the current Dasha periods for a birth data record.
 
-    Returns a simplified summary of what periods are currently active.
+    Returns a simplified summary of what periods are currently active, down
+    to the Pranadasha. Only the periods containing today are derived.
     """
     # Get birth data
     birth_data = db.query(BirthData).filter(BirthData.id == birth_data_id).first()
     if not birth_data:
         raise HTTPException(status_code=404, detail="Birth data not found")
 
-    # Parse birth datetime
-    birth_date = datetime.strptime(birth_data.birth_date, "%Y-%m-%d").date()
-    birth_time = (
-        datetime.strptime(birth_data.birth_time, "%H:%M:%S").time()
-        if birth_data.birth_time
-        else datetime.min.time()
-    )
-    birth_datetime = datetime.combine(birth_date, birth_time)
+    timeline = VimshottariDashaCalculator.timeline_for_birth_data(birth_data, ayanamsa)
+    current = dict(zip(DASHA_LEVELS, timeline.periods_at(datetime.now())))
 
-    # Calculate Moon's sidereal position
-    jd = EphemerisCalculator.datetime_to_julian_day(
-        birth_datetime,
-        birth_data.utc_offset or 0
-    )
+    summary = VimshottariDashaCalculator.get_dasha_summary({
+        f'current_{level}': period for level, period in current.items()
+    })
 
-    moon_position = EphemerisCalculator.calculate_planet_position(
-        'moon', jd, zodiac='sidereal', ayanamsa=ayanamsa
-    )
+    response = {'current_period': summary['current_period_string']}
+    for level in DASHA_LEVELS:
+        period = current.get(level)
+        response[level] = {
+            'planet': period['planet'],
+            'planet_name': period['planet_name'],
+            'start_date': period['start_date'].isoformat(),
+            'end_date': period['end_date'].isoformat(),
+        } if period else None
 
-    # Calculate Dasha (only need current periods)
-    dasha_data = VimshottariDashaCalculator.calculate(
-        moon_longitude=moon_position['longitude'],
-        birth_datetime=birth_datetime,
-        include_antardashas=True,
-        include_pratyantardashas=True
-    )
+    if response['mahadasha']:
+        remaining = summary.get('time_remaining_in_mahadasha') or {}
+        response['mahadasha']['remaining_years'] = remaining.get('years')
 
-    summary = VimshottariDashaCalculator.get_dasha_summary(dasha_data)
+    return response
 
-    # Add current period details
-    current_maha = dasha_data.get('current_mahadasha')
-    current_antar = dasha_data.get('current_antardasha')
-    current_pratyantar = dasha_data.get('current_pratyantardasha')
 
-    return {
-        'current_period': summary['current_period_string'],
-        'mahadasha': {
-            'planet': current_maha['planet'] if current_maha else None,
-            'planet_name': current_maha['planet_name'] if current_maha else None,
-            'start_date': current_maha['start_date'].isoformat() if current_maha else None,
-            'end_date': current_maha['end_date'].isoformat() if current_maha else None,
-            'remaining_years': summary['time_remaining_in_mahadasha']['years'] if summary.get('time_remaining_in_mahadasha') else None,
-        } if current_maha else None,
-        'antardasha': {
-            'planet': current_antar['planet'] if current_antar else None,
-            'planet_name': current_antar['planet_name'] if current_antar else None,
-            'start_date': current_antar['start_date'].isoformat() if current_antar else None,
-            'end_date': current_antar['end_date'].isoformat() if current_antar else None,
-        } if current_antar else None,
-        'pratyantardasha': {
-            'planet': current_pratyantar['planet'] if current_pratyantar else None,
-            'planet_name': current_pratyantar['planet_name'] if current_pratyantar else None,
-            'start_date': current_pratyantar['start_date'].isoformat() if current_pratyantar else None,
-            'end_date': current_pratyantar['end_date'].isoformat() if current_pratyantar else None,
-        } if current_pratyantar else None,
-    }
+@router.get("/at/{birth_data_id}")
+async def get_dasha_at_date(
+    birth_data_id: str,
+    date: datetime,
+    level: str = "pranadasha",
+    ayanamsa: str = "lahiri",
+    db=Depends(get_db)
+):
+    """
+    Get the Dasha periods containing a date, Mahadasha first.
+
+    Each period carries its 'path' (row index at every level), which
+    /periods results share, so the timeline UI can drill into any period.
+    """
+    depth = _level_depth(level)
+
+    birth_data = db.query(BirthData).filter(BirthData.id == birth_data_id).first()
+    if not birth_data:
+        raise HTTPException(status_code=404, detail="Birth data not found")
+
+    date = VimshottariDashaCalculator.local_datetime(date, birth_data)
+    timeline = VimshottariDashaCalculator.timeline_for_birth_data(birth_data, ayanamsa)
+    path = timeline.path_at(date, depth)
+
+    periods = []
+    if path is not None:
+        periods = [
+            {**timeline.period(path[:length]), 'path': list(path[:length])}
+            for length in range(1, len(path) + 1)
+        ]
+
+    return _convert_dasha_dates_to_strings({
+        'date': date,
+        'periods': periods,
+        'current_period': '-'.join(period['planet_name'] for period in periods),
+    })
+
+
+@router.get("/periods/{birth_data_id}")
+async def get_dasha_periods(
+    birth_data_id: str,
+    level: str = "antardasha",
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    ayanamsa: str = "lahiri",
+    db=Depends(get_db)
+):
+    """
+    Get every period of one Dasha level, optionally within a date range.
+
+    Only periods overlapping [start, end) are subdivided, so deep levels
+    are cheap over short ranges.
+    """
+    depth = _level_depth(level)
+
+    birth_data = db.query(BirthData).filter(BirthData.id == birth_data_id).first()
+    if not birth_data:
+        raise HTTPException(status_code=404, detail="Birth data not found")
+
+    start = VimshottariDashaCalculator.local_datetime(start, birth_data)
+    end = VimshottariDashaCalculator.local_datetime(end, birth_data)
+    if start and end and end <= start:
+        raise HTTPException(status_code=400, detail="end must be after start")
+
+    timeline = VimshottariDashaCalculator.timeline_for_birth_data(birth_data, ayanamsa)
+    periods = timeline.level(depth, start, end)
+    if len(periods) > MAX_PERIODS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"{len(periods)} {level} periods in range (max {MAX_PERIODS}); narrow the date range"
+        )
+
+    return _convert_dasha_dates_to_strings({
+        'level': level,
+        'periods': timeline.period_dicts(periods, include_path=True),
+    })
+
+
+def _level_depth(level: str) -> int:
+    """Depth of a Dasha level name, or 400"""
+    if level not in DASHA_LEVELS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Level must be one of: {', '.join(DASHA_LEVELS)}"
+        )
+    return DASHA_LEVELS.index(level)
 
 
 @router.get("/nakshatra-info/{longitude}")
@@ -266,7 +306,7 @@ async def get_nakshatra_info(longitude: float):
     if not 0 <= longitude < 360:
         raise HTTPException(status_code=400, detail="Longitude must be between 0 and 360")
 
-    nakshatra_info = VimshottariDashaCalculator._get_nakshatra_info(longitude)
+    nakshatra_info = nakshatra.nakshatra_info(longitude)
 
     return {
         'longitude': longitude,
@@ -5,17 +5,25 @@ Provides endpoints for Human Design chart calculations, reference data,
 and AI-powered interpretations.
 """
 
-from datetime import datetime, date, time
-from typing import Optional
+import asyncio
+import json
+from datetime import datetime, date, time, timezone
+from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query, Body
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.core.database_sqlite import get_db
 from app.models import BirthData
 from app.models.app_config import AppConfig
 from app.services.human_design_calculator import HumanDesignCalculator
+from app.services.natal_cache_service import NatalCacheService
+from app.services.calculation_executor import get_calculation_executor
+from app.services.human_design_bulk_service import HumanDesignBulkService
+from app.services.hd_transit_service import HumanDesignTransitService
 from app.schemas.human_design import (
     HDCalculationRequest,
+    HDBulkCalculationRequest,
     HDChartResponse,
     HDInterpretationRequest,
     GateActivation,
@@ -37,6 +45,13 @@ from app.schemas.human_design import (
     HDChannelInterpretationResponse,
     HDGateInterpretationResponse,
     HDFullReadingResponse,
+    HDTransitIntervalInfo,
+    HDTransitIntervalsResponse,
+    HDGateIngress,
+    HDTransitIngressesResponse,
+    HDTransitChannelWindow,
+    HDTransitChannelsResponse,
+    HDTransitActivationsResponse,
     ZodiacType,
     SiderealMethod,
 )
@@ -122,35 +137,98 @@ async def calculate_human_design_chart(
                 detail=f"Birth data not found: {request.birth_data_id}"
             )
 
-        # Build datetime from birth data
-        birth_datetime = _parse_birth_datetime(birth_data)
-        timezone_offset = _get_timezone_offset(birth_data)
-
-        # Calculate chart
-        chart_data = HumanDesignCalculator.calculate_chart(
-            birth_datetime=birth_datetime,
-            latitude=float(birth_data.latitude),
-            longitude=float(birth_data.longitude),
-            timezone_offset_minutes=timezone_offset,
+        # Calculate chart (served from the natal cache when possible)
+        return await _get_cached_chart_response(
+            db,
+            birth_data,
             zodiac_type=request.zodiac_type.value,
             sidereal_method=request.sidereal_method.value,
             ayanamsa=request.ayanamsa,
             include_variables=request.include_variables
         )
 
-        # Build response
-        return _build_chart_response(
-            chart_data,
-            request.birth_data_id,
-            request.chart_name
-        )
-
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/calculate/bulk")
+async def calculate_human_design_charts_bulk(
+    request: HDBulkCalculationRequest,
+    db: Session = Depends(get_db)
+):
+    """
+    Calculate Human Design charts for many birth records.
+
+    Streams newline-delimited JSON, one line per requested record as soon
+    as it is available (cached charts first, then computed ones as their
+    worker chunk finishes):
+    - {"index": i, "birth_data_id": id, "chart": HDChartResponse}
+    - {"index": i, "birth_data_id": id, "error": message}
+
+    "index" is the record's position in birth_data_ids. Misses are
+    computed in shared ephemeris batches across all calculation workers
+    and stored in the natal cache.
+    """
+    calc_params = {
+        'zodiac_type': request.zodiac_type.value,
+        'sidereal_method': request.sidereal_method.value,
+        'ayanamsa': request.ayanamsa,
+        'include_variables': request.include_variables,
+    }
+
+    records = {
+        record.id: record
+        for record in db.query(BirthData).filter(
+            BirthData.id.in_(set(request.birth_data_ids))
+        ).all()
+    }
+
+    # Resolve missing records and cache hits before streaming starts
+    ready: List[dict] = []
+    misses: List[tuple] = []
+    for index, birth_data_id in enumerate(request.birth_data_ids):
+        birth_data = records.get(birth_data_id)
+        if birth_data is None:
+            ready.append({'index': index, 'birth_data_id': birth_data_id,
+                          'error': f"Birth data not found: {birth_data_id}"})
+            continue
+
+        cached = NatalCacheService.lookup(db, birth_data, 'human_design', **calc_params)
+        if cached is not None:
+            ready.append({'index': index, 'birth_data_id': birth_data_id,
+                          'chart': _stamp_chart_response(cached, birth_data_id)})
+        else:
+            misses.append((index, birth_data))
+
+    births = [{
+        'birth_data_id': birth_data.id,
+        'birth_datetime': _parse_birth_datetime(birth_data),
+        'latitude': float(birth_data.latitude),
+        'longitude': float(birth_data.longitude),
+        'timezone_offset_minutes': _get_timezone_offset(birth_data),
+    } for _, birth_data in misses]
+
+    async def generate_lines():
+        for line in ready:
+            yield json.dumps(line) + "\n"
+
+        async for position, response, error in HumanDesignBulkService.stream_charts(
+            births, calculate=_calculate_chart_responses, **calc_params
+        ):
+            index, birth_data = misses[position]
+            if error is not None:
+                line = {'index': index, 'birth_data_id': birth_data.id, 'error': error}
+            else:
+                NatalCacheService.store(db, birth_data, 'human_design', response, **calc_params)
+                line = {'index': index, 'birth_data_id': birth_data.id,
+                        'chart': _stamp_chart_response(response, birth_data.id)}
+            yield json.dumps(line) + "\n"
+
+    return StreamingResponse(generate_lines(), media_type="application/x-ndjson")
+
+
 @router.get("/calculate/{birth_data_id}", response_model=HDChartResponse)
 async def calculate_human_design_chart_simple(
     birth_data_id: str,
@@ -177,30 +255,157 @@ async def calculate_human_design_chart_simple(
                 detail=f"Birth data not found: {birth_data_id}"
             )
 
-        # Build datetime
-        birth_datetime = _parse_birth_datetime(birth_data)
-        timezone_offset = _get_timezone_offset(birth_data)
-
-        # Calculate chart
-        chart_data = HumanDesignCalculator.calculate_chart(
-            birth_datetime=birth_datetime,
-            latitude=float(birth_data.latitude),
-            longitude=float(birth_data.longitude),
-            timezone_offset_minutes=timezone_offset,
+        # Calculate chart (served from the natal cache when possible)
+        return await _get_cached_chart_response(
+            db,
+            birth_data,
             zodiac_type=zodiac,
             sidereal_method=sidereal_method,
             ayanamsa=ayanamsa,
             include_variables=include_variables
         )
 
-        return _build_chart_response(chart_data, birth_data_id)
-
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# ==============================================================================
+# TRANSIT CALENDAR ENDPOINTS
+# ==============================================================================
+
+@router.get("/transits/intervals", response_model=HDTransitIntervalsResponse)
+async def get_transit_intervals(
+    start_date: date = Query(..., description="First day (UTC)"),
+    end_date: date = Query(..., description="Last day, inclusive (UTC)"),
+    level: str = Query("gate", description="gate or line"),
+    gates: Optional[str] = Query(None, description="Comma-separated gates"),
+    bodies: Optional[str] = Query(None, description="Comma-separated HD bodies (e.g., sun,earth,moon)"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get the gates (or lines) each transiting HD body occupies over a date range.
+
+    Read from the stored transit interval table (tropical, UT); months not
+    yet stored are computed on first request.
+    """
+    # Months not stored yet are computed off the event loop
+    try:
+        intervals = await asyncio.to_thread(
+            HumanDesignTransitService.intervals_between,
+            db, start_date, end_date,
+            gates=_parse_gate_list(gates),
+            bodies=_parse_body_list(bodies),
+            level=level
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return HDTransitIntervalsResponse(
+        start_date=start_date.isoformat(),
+        end_date=end_date.isoformat(),
+        level=level,
+        intervals=[HDTransitIntervalInfo(**interval) for interval in intervals]
+    )
+
+
+@router.get("/transits/activations", response_model=HDTransitActivationsResponse)
+async def get_transit_activations(
+    at: Optional[datetime] = Query(None, description="UTC datetime (defaults to now)"),
+    db: Session = Depends(get_db)
+):
+    """Get the gate and line of every transiting HD body at a moment."""
+    if at is None:
+        moment = datetime.utcnow()
+    elif at.tzinfo is not None:
+        moment = at.astimezone(timezone.utc).replace(tzinfo=None)
+    else:
+        moment = at
+    moment = moment.replace(microsecond=0)
+    return HDTransitActivationsResponse(
+        at=moment.isoformat(),
+        activations=HumanDesignTransitService.activations_at(db, moment)
+    )
+
+
+@router.get("/transits/ingresses", response_model=HDTransitIngressesResponse)
+async def get_transit_ingresses(
+    start_date: date = Query(..., description="First day (UTC)"),
+    end_date: date = Query(..., description="Last day, inclusive (UTC)"),
+    level: str = Query("gate", description="gate or line"),
+    bodies: Optional[str] = Query(None, description="Comma-separated HD bodies"),
+    db: Session = Depends(get_db)
+):
+    """Get the exact times transiting HD bodies enter new gates or lines."""
+    if level not in ("gate", "line"):
+        raise HTTPException(status_code=400, detail="level must be 'gate' or 'line'")
+
+    try:
+        ingresses = HumanDesignTransitService.ingresses(
+            db, start_date, end_date, level=level, bodies=_parse_body_list(bodies)
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return HDTransitIngressesResponse(
+        start_date=start_date.isoformat(),
+        end_date=end_date.isoformat(),
+        level=level,
+        ingresses=[HDGateIngress(**ingress) for ingress in ingresses]
+    )
+
+
+@router.get("/transits/channels/{birth_data_id}", response_model=HDTransitChannelsResponse)
+async def get_transit_channels(
+    birth_data_id: str,
+    start_date: date = Query(..., description="First day (UTC)"),
+    end_date: date = Query(..., description="Last day, inclusive (UTC)"),
+    include_moon: bool = Query(True, description="Include the fast-moving Moon"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get when transits temporarily define channels open in a natal chart.
+
+    A channel is completed when transits sit in its missing gate, or in
+    both gates of a channel with no natal gate.
+    """
+    birth_data = db.query(BirthData).filter(BirthData.id == birth_data_id).first()
+    if not birth_data:
+        raise HTTPException(status_code=404, detail=f"Birth data not found: {birth_data_id}")
+
+    chart = await _get_cached_chart_response(
+        db,
+        birth_data,
+        zodiac_type="tropical",
+        sidereal_method="shift_positions",
+        ayanamsa="lahiri",
+        include_variables=True
+    )
+    natal_gates = sorted(
+        {act.gate for act in chart.personality_activations.values()}
+        | {act.gate for act in chart.design_activations.values()}
+    )
+    bodies = None if include_moon else [
+        body for body in HumanDesignTransitService.BODIES if body != 'moon'
+    ]
+
+    try:
+        windows = HumanDesignTransitService.channel_windows(
+            db, natal_gates, start_date, end_date, bodies=bodies
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return HDTransitChannelsResponse(
+        birth_data_id=birth_data_id,
+        start_date=start_date.isoformat(),
+        end_date=end_date.isoformat(),
+        natal_gates=natal_gates,
+        windows=[HDTransitChannelWindow(**window) for window in windows]
+    )
+
+
 # ==============================================================================
 # REFERENCE DATA ENDPOINTS
 # ==============================================================================
@@ -586,6 +791,89 @@ async def generate_full_reading(
 # HELPER FUNCTIONS
 # ==============================================================================
 
+def _parse_gate_list(gates: Optional[str]) -> Optional[List[int]]:
+    """Parse a comma-separated gate list query parameter."""
+    if not gates:
+        return None
+    try:
+        parsed = [int(gate) for gate in gates.split(",") if gate.strip()]
+    except ValueError:
+        raise ValueError("gates must be comma-separated numbers")
+    if any(not 1 <= gate <= 64 for gate in parsed):
+        raise ValueError("gates must be between 1 and 64")
+    return parsed
+
+
+def _parse_body_list(bodies: Optional[str]) -> Optional[List[str]]:
+    """Parse a comma-separated HD body list query parameter."""
+    if not bodies:
+        return None
+    return [body.strip().lower().replace(" ", "_") for body in bodies.split(",") if body.strip()]
+
+
+async def _get_cached_chart_response(
+    db: Session,
+    birth_data: BirthData,
+    **calc_params
+) -> HDChartResponse:
+    """Calculate an HD chart response for birth data via the natal cache."""
+
+    response = await NatalCacheService.get_or_compute_async(
+        db,
+        birth_data,
+        'human_design',
+        lambda: get_calculation_executor().run(
+            _calculate_chart_response,
+            birth_data.id,
+            _parse_birth_datetime(birth_data),
+            float(birth_data.latitude),
+            float(birth_data.longitude),
+            _get_timezone_offset(birth_data),
+            **calc_params
+        ),
+        **calc_params
+    )
+    # Entries are content-addressed; stamp the requesting record and time
+    response['birth_data_id'] = birth_data.id
+    response['created_at'] = datetime.utcnow()
+    return HDChartResponse(**response)
+
+
+def _calculate_chart_response(
+    birth_data_id: str,
+    birth_datetime: datetime,
+    latitude: float,
+    longitude: float,
+    timezone_offset_minutes: int,
+    **calc_params
+) -> dict:
+    """Calculate an HD chart as response JSON (runs in a calculation worker)."""
+    chart_data = HumanDesignCalculator.calculate_chart(
+        birth_datetime=birth_datetime,
+        latitude=latitude,
+        longitude=longitude,
+        timezone_offset_minutes=timezone_offset_minutes,
+        **calc_params
+    )
+    return _build_chart_response(chart_data, birth_data_id).model_dump(mode='json')
+
+
+def _calculate_chart_responses(births: List[dict], **calc_params) -> List[dict]:
+    """Calculate HD chart responses for a chunk of births (runs in a calculation worker)."""
+    charts = HumanDesignCalculator.calculate_charts(births, **calc_params)
+    return [
+        _build_chart_response(chart_data, birth['birth_data_id']).model_dump(mode='json')
+        for birth, chart_data in zip(births, charts)
+    ]
+
+
+def _stamp_chart_response(response: dict, birth_data_id: str) -> dict:
+    """Stamp a cached (content-addressed) response JSON with its record and time."""
+    response['birth_data_id'] = birth_data_id
+    response['created_at'] = datetime.utcnow().isoformat()
+    return response
+
+
 def _build_chart_response(
     chart_data: dict,
     birth_data_id: str,
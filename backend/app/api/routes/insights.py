@@ -4,7 +4,7 @@ Insights API Routes
 Provides endpoints for proactive AI-generated insights.
 Part of Phase 3: AI Proactive Intelligence
 """
-from typing import Optional
+from typing import List, Optional, Tuple
 from datetime import date
 from fastapi import APIRouter, HTTPException, Depends, Query
 from sqlalchemy.orm import Session
@@ -62,7 +62,8 @@ async def get_daily_insights(
         insights = insights_service.generate_daily_insights(
             natal_chart=chart.chart_data,
             birth_data=birth_info,
-            target_date=parsed_date
+            target_date=parsed_date,
+            db=db
         )
         return insights
     except Exception as e:
@@ -82,53 +83,61 @@ async def get_week_preview(
 
     Returns energy levels and key transits for the next 7 days.
     """
-    # Get birth data
-    birth_data = db.query(BirthData).filter(BirthData.id == birth_data_id).first()
-    if not birth_data:
-        raise HTTPException(status_code=404, detail="Birth data not found")
+    name, preview = _energy_preview(birth_data_id, 7, None, db)
+    return {
+        "name": name,
+        "week_preview": preview
+    }
 
-    # Get natal chart
-    chart = db.query(Chart).filter(Chart.birth_data_id == birth_data_id).first()
-    if not chart or not chart.chart_data:
-        raise HTTPException(
-            status_code=404,
-            detail="No calculated chart found. Please calculate chart first."
-        )
 
-    # Prepare birth data dict
-    birth_info = {
-        "name": birth_data.name,
-        "birth_date": birth_data.birth_date.isoformat() if birth_data.birth_date else None,
+@router.get("/month-preview/{birth_data_id}")
+async def get_month_preview(
+    birth_data_id: str,
+    start_date: Optional[str] = Query(default=None, description="First day in YYYY-MM-DD format (defaults to today)"),
+    days: int = Query(default=30, ge=28, le=31, description="Number of days"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get day energy levels for the coming month.
+
+    Read from the precomputed daily energy table; only days not yet
+    scored are calculated.
+    """
+    name, preview = _energy_preview(birth_data_id, days, start_date, db)
+    return {
+        "name": name,
+        "month_preview": preview
     }
 
-    # Generate week preview
-    insights_service = get_daily_insights_service()
 
-    try:
-        preview = insights_service.get_week_preview(
-            natal_chart=chart.chart_data,
-            birth_data=birth_info
-        )
-        return {
-            "name": birth_data.name,
-            "week_preview": preview
-        }
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to generate week preview: {str(e)}"
-        )
+@router.get("/year-preview/{birth_data_id}")
+async def get_year_preview(
+    birth_data_id: str,
+    start_date: Optional[str] = Query(default=None, description="First day in YYYY-MM-DD format (defaults to today)"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get day energy levels for the coming year (365 days).
+
+    Read from the precomputed daily energy table; only days not yet
+    scored are calculated.
+    """
+    name, preview = _energy_preview(birth_data_id, 365, start_date, db)
+    return {
+        "name": name,
+        "year_preview": preview
+    }
 
 
 @router.get("/moon-phase")
-async def get_current_moon_phase():
+async def get_current_moon_phase(db: Session = Depends(get_db)):
     """
     Get the current moon phase information.
     """
     from app.services.daily_insights_service import DailyInsightsService
 
     service = DailyInsightsService()
-    moon_phase = service._get_moon_phase(date.today())
+    moon_phase = service._get_moon_phase(date.today(), db)
 
     return {
         "date": date.today().isoformat(),
@@ -150,7 +159,7 @@ async def get_today_summary(db: Session = Depends(get_db)):
     today = date.today()
 
     # Moon phase
-    moon_phase = service._get_moon_phase(today)
+    moon_phase = service._get_moon_phase(today, db)
 
     # Get current planetary positions (simplified)
     from app.services.transit_calculator import get_transit_calculator
@@ -254,7 +263,7 @@ async def get_insights_dashboard(
         }
 
         try:
-            daily = insights_service.generate_daily_insights(chart.chart_data, birth_info)
+            daily = insights_service.generate_daily_insights(chart.chart_data, birth_info, db=db)
             dashboard["daily_insights"] = {
                 "day_energy": daily["day_energy"],
                 "moon_phase": daily["moon_phase"],
@@ -295,6 +304,57 @@ async def get_insights_dashboard(
     return dashboard
 
 
+def _energy_preview(
+    birth_data_id: str,
+    days: int,
+    start_date: Optional[str],
+    db: Session
+) -> Tuple[str, List[dict]]:
+    """Load a chart and read its day energy previews from the precomputed table."""
+    # Get birth data
+    birth_data = db.query(BirthData).filter(BirthData.id == birth_data_id).first()
+    if not birth_data:
+        raise HTTPException(status_code=404, detail="Birth data not found")
+
+    # Get natal chart
+    chart = db.query(Chart).filter(Chart.birth_data_id == birth_data_id).first()
+    if not chart or not chart.chart_data:
+        raise HTTPException(
+            status_code=404,
+            detail="No calculated chart found. Please calculate chart first."
+        )
+
+    start = None
+    if start_date:
+        try:
+            start = date.fromisoformat(start_date)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+
+    birth_info = {
+        "id": birth_data.id,
+        "name": birth_data.name,
+    }
+
+    insights_service = get_daily_insights_service()
+
+    try:
+        preview = insights_service.get_preview(
+            natal_chart=chart.chart_data,
+            birth_data=birth_info,
+            days=days,
+            start=start,
+            db=db
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to generate preview: {str(e)}"
+        )
+
+    return birth_data.name, preview
+
+
 def _get_universal_guidance(moon_phase: dict, today: date) -> str:
     """Generate universal guidance based on moon phase and day."""
     phase = moon_phase.get("phase", "")
@@ -0,0 +1,107 @@
+"""
+Shadbala API Routes
+
+Endpoints for calculating Shadbala (six-fold planetary strength) in Vedic
+astrology, for the natal chart and across dasha periods.
+"""
+
+from datetime import datetime, timedelta
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Depends
+from sqlalchemy.orm import Session
+
+from app.core.database_sqlite import get_db
+from app.models.birth_data import BirthData
+from app.services.shadbala_calculator import ShadbalaCalculator
+from app.services.vedic_chart_service import VedicChartService
+from app.services.dasha_calculator import DASHA_LEVELS, VimshottariDashaCalculator
+from app.services.calculation_executor import get_calculation_executor
+
+router = APIRouter()
+
+
+@router.get("/birth-data/{birth_data_id}")
+async def get_shadbala_for_birth_data(
+    birth_data_id: str,
+    ayanamsa: str = "lahiri",
+    db: Session = Depends(get_db)
+):
+    """
+    Get natal Shadbala for a birth data record.
+
+    Returns each planet's six balas, sthana and kala bala parts, total in
+    rupas and ratio to its required strength.
+    """
+    birth_data = db.query(BirthData).filter(BirthData.id == birth_data_id).first()
+    if not birth_data:
+        raise HTTPException(status_code=404, detail="Birth data not found")
+
+    try:
+        chart_data = VedicChartService.chart_data(db, birth_data, ayanamsa)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to calculate chart: {str(e)}")
+
+    try:
+        return ShadbalaCalculator.calculate(chart_data)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/dasha-series/{birth_data_id}")
+async def get_shadbala_dasha_series(
+    birth_data_id: str,
+    level: str = "mahadasha",
+    at: Optional[datetime] = None,
+    step_days: float = 1.0,
+    ayanamsa: str = "lahiri",
+    db: Session = Depends(get_db)
+):
+    """
+    Get Shadbala of all 7 planets across a dasha period.
+
+    The period is the one of the given level running at `at` (default:
+    now). Strengths are sampled every step_days at the birth place and
+    returned as sample-by-planet arrays in rupas.
+    """
+    if level not in DASHA_LEVELS:
+        raise HTTPException(status_code=400, detail=f"level must be one of {', '.join(DASHA_LEVELS)}")
+    if step_days <= 0:
+        raise HTTPException(status_code=400, detail="step_days must be positive")
+
+    birth_data = db.query(BirthData).filter(BirthData.id == birth_data_id).first()
+    if not birth_data:
+        raise HTTPException(status_code=404, detail="Birth data not found")
+
+    utc_offset = birth_data.utc_offset or 0
+    timeline = VimshottariDashaCalculator.timeline_for_birth_data(birth_data, ayanamsa)
+    when = VimshottariDashaCalculator.local_datetime(at, birth_data)
+    if when is None:
+        when = datetime.utcnow() + timedelta(minutes=utc_offset)
+    path = timeline.path_at(when, DASHA_LEVELS.index(level))
+    if path is None:
+        raise HTTPException(status_code=400, detail="Date is outside the dasha timeline")
+
+    period = timeline.period(path)
+    samples = (period['end_date'] - period['start_date']).total_seconds() / 86400 / step_days
+    if samples > VedicChartService.MAX_SERIES_SAMPLES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"{int(samples)} samples in period (max {VedicChartService.MAX_SERIES_SAMPLES}); increase step_days"
+        )
+
+    series = await get_calculation_executor().run(
+        ShadbalaCalculator.strength_series,
+        period['start_date'], period['end_date'], birth_data.latitude, birth_data.longitude,
+        step_days, ayanamsa, utc_offset
+    )
+
+    return {
+        'period': {
+            **period,
+            'start_date': period['start_date'].isoformat(),
+            'end_date': period['end_date'].isoformat(),
+        },
+        'step_days': step_days,
+        **series.to_dict(),
+    }
@@ -0,0 +1,105 @@
+"""
+Synastry API Routes
+
+Endpoints for comparing charts: inter-chart aspects, house overlays,
+midpoint composites and ranking a person against a contact list.
+"""
+
+from fastapi import APIRouter, HTTPException, Depends
+from sqlalchemy.orm import Session
+
+from app.core.database_sqlite import get_db
+from app.models.birth_data import BirthData
+from app.services.synastry_calculator import SynastryCalculator
+from app.services.calculation_executor import get_calculation_executor
+from app.schemas.synastry import SynastryRequest, SynastryRankRequest
+
+router = APIRouter()
+
+
+@router.post("/calculate")
+async def calculate_synastry(request: SynastryRequest, db: Session = Depends(get_db)):
+    """
+    Compare every pair in a group of people.
+
+    For each pair (person1 < person2, as indices into birth_data_ids)
+    returns the inter-chart aspects, house overlays in both directions,
+    the midpoint composite chart and a synastry score. Overlays and
+    composite houses are null when a birth time is unknown.
+    """
+    records = {
+        record.id: record
+        for record in db.query(BirthData).filter(
+            BirthData.id.in_(set(request.birth_data_ids))
+        ).all()
+    }
+    missing = [birth_data_id for birth_data_id in request.birth_data_ids if birth_data_id not in records]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Birth data not found: {', '.join(missing)}")
+
+    people = [records[birth_data_id] for birth_data_id in request.birth_data_ids]
+
+    try:
+        result = await get_calculation_executor().run(
+            SynastryCalculator.calculate_synastry,
+            [SynastryCalculator.birth_from_record(person) for person in people],
+            zodiac=request.zodiac_type,
+            ayanamsa=request.ayanamsa,
+            house_system=request.house_system,
+            include_minor_aspects=request.include_minor_aspects,
+            custom_orbs=request.custom_orbs
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Synastry calculation failed: {str(e)}")
+
+    result['people'] = [
+        {'index': index, 'birth_data_id': person.id, 'name': person.name}
+        for index, person in enumerate(people)
+    ]
+    return result
+
+
+@router.post("/rank")
+async def rank_synastry(request: SynastryRankRequest, db: Session = Depends(get_db)):
+    """
+    Rank people by the strength of their synastry with one person.
+
+    All candidates (candidate_ids, or every other saved birth data) are
+    calculated in one ephemeris batch and scored together.
+    """
+    subject = db.query(BirthData).filter(BirthData.id == request.birth_data_id).first()
+    if not subject:
+        raise HTTPException(status_code=404, detail="Birth data not found")
+
+    query = db.query(BirthData).filter(BirthData.id != subject.id)
+    if request.candidate_ids is not None:
+        query = query.filter(BirthData.id.in_(set(request.candidate_ids)))
+    candidates = query.order_by(BirthData.id).all()
+
+    try:
+        ranking = await get_calculation_executor().run(
+            SynastryCalculator.rank_against,
+            SynastryCalculator.birth_from_record(subject),
+            [SynastryCalculator.birth_from_record(candidate) for candidate in candidates],
+            zodiac=request.zodiac_type,
+            ayanamsa=request.ayanamsa,
+            house_system=request.house_system,
+            include_minor_aspects=request.include_minor_aspects,
+            custom_orbs=request.custom_orbs,
+            limit=request.limit
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Synastry ranking failed: {str(e)}")
+
+    results = []
+    for entry in ranking:
+        candidate = candidates[entry.pop('index')]
+        results.append({'birth_data_id': candidate.id, 'name': candidate.name, **entry})
+
+    return {
+        'birth_data_id': subject.id,
+        'candidate_count': len(candidates),
+        'results': results,
+    }
@@ -4,6 +4,7 @@ Timeline management endpoints (single-user mode)
 User events and transit context for timeline visualization.
 Part of Phase 2: Transit Timeline.
 """
+import asyncio
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
@@ -25,6 +26,7 @@ from app.schemas.timeline import (
     TimelineDataPoint,
 )
 from app.schemas.common import Message
+from app.services.event_calendar_service import EventCalendarService
 
 router = APIRouter()
 
@@ -456,10 +458,21 @@ async def get_timeline_range(
             detail="Birth data not found"
         )
 
+    # Moon phase and sky events for every day from one calendar range query;
+    # longer spans are served without them rather than computing years of events
+    calendar = {}
+    if 0 <= (request.end_date - request.start_date).days < EventCalendarService.MAX_CALENDAR_DAYS:
+        days = await asyncio.to_thread(
+            EventCalendarService.calendar_days, db, request.start_date, request.end_date
+        )
+        calendar = {day['date']: day for day in days}
+
     data_points = []
     current_date = request.start_date
 
     while current_date <= request.end_date:
+        sky_day = calendar.get(current_date.isoformat())
+
         # Get events for this date
         events = []
         if request.include_events:
@@ -485,7 +498,8 @@ async def get_timeline_range(
             events=events,
             transit_context=transit_context,
             significant_transits=transit_context.significant_transits if transit_context and transit_context.significant_transits else [],
-            lunar_phase=None  # Would be calculated by transit service
+            lunar_phase=sky_day['moon_phase'] if sky_day else None,
+            sky_events=sky_day['events'] if sky_day else []
         )
         data_points.append(data_point)
 
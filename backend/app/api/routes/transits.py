@@ -2,8 +2,9 @@
 Transit API Routes
 Provides endpoints for transit calculations and analysis
 """
+import asyncio
 from datetime import datetime, timedelta
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, Field
@@ -14,6 +15,10 @@ from app.models.chart import Chart
 from app.models.app_config import AppConfig
 from app.services.transit_calculator import TransitCalculator, TransitInterpreter
 from app.services.chart_calculator import NatalChartCalculator
+from app.services.natal_cache_service import NatalCacheService
+from app.services.calculation_executor import get_calculation_executor
+from app.services.event_calendar_service import EventCalendarService
+from app.services.electional_service import ElectionalSearchService
 
 router = APIRouter()
 
@@ -44,6 +49,16 @@ class ExactTransitRequest(BaseModel):
     zodiac: str = "tropical"
 
 
+class ElectionalSearchRequest(BaseModel):
+    start_date: str  # YYYY-MM-DD (UTC)
+    end_date: str    # YYYY-MM-DD (UTC), inclusive
+    constraints: List[Dict[str, Any]]  # See ElectionalSearchService
+    latitude: Optional[float] = Field(default=None, ge=-90, le=90)
+    longitude: Optional[float] = Field(default=None, ge=-180, le=180)
+    min_duration_minutes: float = Field(default=0, ge=0)
+    limit: int = Field(default=20, ge=1, le=200)
+
+
 class TransitAspect(BaseModel):
     transit_planet: str
     natal_planet: str
@@ -75,8 +90,8 @@ class TransitResponse(BaseModel):
     summary: TransitSummary
 
 
-def get_natal_chart_data(birth_data_id: str, db: Session, zodiac: str = "tropical") -> dict:
-    """Helper to get natal chart data for transit calculations."""
+def _load_birth_data(birth_data_id: str, db: Session):
+    """Fetch birth data and its birth datetime, or raise 404."""
     birth_data = db.query(BirthData).filter(BirthData.id == birth_data_id).first()
     if not birth_data:
         raise HTTPException(status_code=404, detail="Birth data not found")
@@ -86,19 +101,84 @@ def get_natal_chart_data(birth_data_id: str, db: Session, zodiac: str = "tropica
         f"{birth_data.birth_date} {birth_data.birth_time or '12:00:00'}",
         "%Y-%m-%d %H:%M:%S"
     )
+    return birth_data, birth_dt
 
-    # Calculate natal chart
-    chart_data = NatalChartCalculator.calculate_natal_chart(
-        birth_datetime=birth_dt,
-        latitude=birth_data.latitude,
-        longitude=birth_data.longitude,
-        timezone_offset_minutes=birth_data.utc_offset or 0,
-        zodiac=zodiac
+
+def get_natal_chart_data(birth_data_id: str, db: Session, zodiac: str = "tropical") -> dict:
+    """Helper to get natal chart data for transit calculations."""
+    birth_data, birth_dt = _load_birth_data(birth_data_id, db)
+
+    # Calculate natal chart (served from the natal cache when possible)
+    chart_data = NatalCacheService.get_or_compute(
+        db,
+        birth_data,
+        'western',
+        lambda: NatalChartCalculator.calculate_natal_chart(
+            birth_datetime=birth_dt,
+            latitude=birth_data.latitude,
+            longitude=birth_data.longitude,
+            timezone_offset_minutes=birth_data.utc_offset or 0,
+            zodiac=zodiac
+        ),
+        zodiac=zodiac,
+        house_system='placidus',
+        ayanamsa='lahiri',
+        default_time='12:00:00'
     )
 
     return chart_data
 
 
+async def get_natal_chart_data_async(birth_data_id: str, db: Session, zodiac: str = "tropical") -> dict:
+    """get_natal_chart_data with cache misses computed on the calculation executor."""
+    birth_data, birth_dt = _load_birth_data(birth_data_id, db)
+
+    return await NatalCacheService.get_or_compute_async(
+        db,
+        birth_data,
+        'western',
+        lambda: get_calculation_executor().run(
+            NatalChartCalculator.calculate_natal_chart,
+            birth_datetime=birth_dt,
+            latitude=birth_data.latitude,
+            longitude=birth_data.longitude,
+            timezone_offset_minutes=birth_data.utc_offset or 0,
+            zodiac=zodiac
+        ),
+        zodiac=zodiac,
+        house_system='placidus',
+        ayanamsa='lahiri',
+        default_time='12:00:00'
+    )
+
+
+def _calculate_timeline(
+    natal_planets: dict,
+    start: datetime,
+    end: datetime,
+    zodiac: str,
+    interval_days: int
+) -> tuple:
+    """Transit intervals and the daily timeline built from them (runs in a calculation worker)."""
+    intervals = TransitCalculator.calculate_transit_intervals(
+        natal_planets=natal_planets,
+        start_date=start,
+        end_date=end,
+        zodiac=zodiac,
+        orb_multiplier=0.8
+    )
+
+    timeline = TransitCalculator.calculate_transit_timeline(
+        natal_planets=natal_planets,
+        start_date=start,
+        end_date=end,
+        zodiac=zodiac,
+        interval_days=interval_days,
+        intervals=intervals
+    )
+    return timeline, intervals
+
+
 @router.post("/current", response_model=TransitResponse)
 async def get_current_transits(
     request: TransitRequest,
@@ -155,9 +235,10 @@ async def get_transit_timeline(
     Get transit timeline over a date range.
 
     Returns significant transits for each day in the range,
-    useful for visualization and planning.
+    useful for visualization and planning, plus the underlying
+    entry/exact/exit intervals for each transit.
     """
-    chart_data = get_natal_chart_data(request.birth_data_id, db, request.zodiac)
+    chart_data = await get_natal_chart_data_async(request.birth_data_id, db, request.zodiac)
 
     start = datetime.fromisoformat(request.start_date.replace('Z', '+00:00'))
     end = datetime.fromisoformat(request.end_date.replace('Z', '+00:00'))
@@ -169,19 +250,24 @@ async def get_transit_timeline(
             detail="Date range cannot exceed 365 days"
         )
 
-    timeline = TransitCalculator.calculate_transit_timeline(
-        natal_planets=chart_data['planets'],
-        start_date=start,
-        end_date=end,
-        zodiac=request.zodiac,
-        interval_days=request.interval_days
+    timeline, intervals = await get_calculation_executor().run(
+        _calculate_timeline,
+        chart_data['planets'],
+        start,
+        end,
+        request.zodiac,
+        request.interval_days
     )
 
     return {
         "start_date": request.start_date,
         "end_date": request.end_date,
         "timeline": timeline,
-        "total_days": len(timeline)
+        "total_days": len(timeline),
+        "intervals": [
+            iv for iv in intervals
+            if iv['significance'] in ['major', 'significant', 'moderate']
+        ]
     }
 
 
@@ -224,7 +310,7 @@ async def find_exact_transit_dates(
     Useful for planning around significant transits
     like Saturn conjunct Sun, etc.
     """
-    chart_data = get_natal_chart_data(request.birth_data_id, db, request.zodiac)
+    chart_data = await get_natal_chart_data_async(request.birth_data_id, db, request.zodiac)
 
     start = datetime.fromisoformat(request.start_date.replace('Z', '+00:00'))
     end = datetime.fromisoformat(request.end_date.replace('Z', '+00:00'))
@@ -236,15 +322,18 @@ async def find_exact_transit_dates(
             detail="Date range cannot exceed 2 years"
         )
 
-    exact_dates = TransitCalculator.find_exact_transit_dates(
-        natal_planets=chart_data['planets'],
-        transit_planet=request.transit_planet,
-        natal_planet=request.natal_planet,
-        aspect=request.aspect,
-        start_date=start,
-        end_date=end,
-        zodiac=request.zodiac
-    )
+    try:
+        exact_dates = TransitCalculator.find_exact_transit_dates(
+            natal_planets=chart_data['planets'],
+            transit_planet=request.transit_planet,
+            natal_planet=request.natal_planet,
+            aspect=request.aspect,
+            start_date=start,
+            end_date=end,
+            zodiac=request.zodiac
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     return {
         "transit_planet": request.transit_planet,
@@ -327,38 +416,109 @@ async def get_daily_transit_snapshot(
         zodiac=zodiac
     )
 
-    # Get Moon phase (simplified)
-    moon_lon = transits['current_positions'].get('Moon', {}).get('longitude', 0)
-    sun_lon = transits['current_positions'].get('Sun', {}).get('longitude', 0)
-    moon_phase_angle = (moon_lon - sun_lon) % 360
-
-    moon_phase = "New Moon"
-    if 45 < moon_phase_angle <= 90:
-        moon_phase = "Waxing Crescent"
-    elif 90 < moon_phase_angle <= 135:
-        moon_phase = "First Quarter"
-    elif 135 < moon_phase_angle <= 180:
-        moon_phase = "Waxing Gibbous"
-    elif 180 < moon_phase_angle <= 225:
-        moon_phase = "Full Moon"
-    elif 225 < moon_phase_angle <= 270:
-        moon_phase = "Waning Gibbous"
-    elif 270 < moon_phase_angle <= 315:
-        moon_phase = "Last Quarter"
-    elif 315 < moon_phase_angle <= 360:
-        moon_phase = "Waning Crescent"
+    # Moon phase and sky events of the day from the event calendar
+    days = await asyncio.to_thread(EventCalendarService.calendar_days, db, transit_dt.date(), transit_dt.date())
+    day = days[0]
 
     return {
         "date": transit_dt.date().isoformat(),
-        "moon_phase": moon_phase,
+        "moon_phase": day['moon_phase'],
         "moon_sign": transits['current_positions'].get('Moon', {}).get('sign_name', ''),
         "sun_sign": transits['current_positions'].get('Sun', {}).get('sign_name', ''),
         "active_transits": transits['transits'][:10],  # Top 10
         "themes": transits['summary']['themes'],
-        "major_transit": transits['summary']['most_significant']
+        "major_transit": transits['summary']['most_significant'],
+        "sky_events": day['events']
     }
 
 
+@router.get("/sky-events")
+async def get_sky_events(
+    start_date: str = Query(..., description="First day (YYYY-MM-DD, UTC)"),
+    end_date: str = Query(..., description="Last day, inclusive (YYYY-MM-DD, UTC)"),
+    types: Optional[str] = Query(default=None, description="Comma-separated event types"),
+    by_day: bool = Query(default=False, description="Group events by day with the Moon phase"),
+    db: Session = Depends(get_db)
+):
+    """
+    Get exact sky events for a date range.
+
+    Sign ingresses, stations, lunations, eclipses and void-of-course
+    Moon windows (tropical, UT), read from the stored event calendar.
+    Months not yet in the calendar are computed on first request.
+    """
+    try:
+        start = datetime.fromisoformat(start_date).date()
+        end = datetime.fromisoformat(end_date).date()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+
+    event_types = [t.strip() for t in types.split(',') if t.strip()] if types else None
+
+    # Months not stored yet are computed off the event loop
+    try:
+        if by_day:
+            if event_types:
+                raise ValueError("types cannot be combined with by_day")
+            return {
+                "start_date": start.isoformat(),
+                "end_date": end.isoformat(),
+                "days": await asyncio.to_thread(EventCalendarService.calendar_days, db, start, end)
+            }
+
+        events = await asyncio.to_thread(EventCalendarService.events_between, db, start, end, event_types)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return {
+        "start_date": start.isoformat(),
+        "end_date": end.isoformat(),
+        "events": [EventCalendarService.event_dict(event) for event in events]
+    }
+
+
+@router.post("/electional")
+async def electional_search(request: ElectionalSearchRequest, db: Session = Depends(get_db)):
+    """
+    Find time windows satisfying electional constraints.
+
+    Each constraint is a dict with a "type" (moon_phase, event, retrograde,
+    sign, aspect, angular), its own keys, and optional "negate",
+    "required" and "weight". For example, "Moon waxing, not void of
+    course, Venus unafflicted, Jupiter angular, no Mercury station within
+    3 days":
+
+        [{"type": "moon_phase", "phase": "waxing"},
+         {"type": "event", "event_type": "void_of_course", "negate": true},
+         {"type": "aspect", "body": "venus", "targets": ["mars", "saturn"], "negate": true},
+         {"type": "angular", "body": "jupiter"},
+         {"type": "event", "event_type": "station", "body": "mercury",
+          "within_days": 3, "negate": true}]
+
+    Angular constraints need latitude and longitude. Windows satisfy every
+    required constraint and are ranked by the weighted share of each
+    window covered by the optional ones, then by length.
+    """
+    try:
+        start = datetime.fromisoformat(request.start_date).date()
+        end = datetime.fromisoformat(request.end_date).date()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+
+    # The search may compute calendar months first; keep it off the event loop
+    try:
+        return await asyncio.to_thread(
+            ElectionalSearchService.search,
+            db, start, end, request.constraints,
+            latitude=request.latitude,
+            longitude=request.longitude,
+            min_duration_minutes=request.min_duration_minutes,
+            limit=request.limit
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 # ==================== AI Transit Interpretation Endpoints ====================
 
 @router.post("/ai/interpret-transit")
@@ -419,35 +579,19 @@ async def ai_daily_forecast(
         zodiac=zodiac
     )
 
-    # Calculate moon phase
-    moon_lon = transits['current_positions'].get('Moon', {}).get('longitude', 0)
-    sun_lon = transits['current_positions'].get('Sun', {}).get('longitude', 0)
-    moon_phase_angle = (moon_lon - sun_lon) % 360
-
-    moon_phase = "New Moon"
-    if 45 < moon_phase_angle <= 90:
-        moon_phase = "Waxing Crescent"
-    elif 90 < moon_phase_angle <= 135:
-        moon_phase = "First Quarter"
-    elif 135 < moon_phase_angle <= 180:
-        moon_phase = "Waxing Gibbous"
-    elif 180 < moon_phase_angle <= 225:
-        moon_phase = "Full Moon"
-    elif 225 < moon_phase_angle <= 270:
-        moon_phase = "Waning Gibbous"
-    elif 270 < moon_phase_angle <= 315:
-        moon_phase = "Last Quarter"
-    elif 315 < moon_phase_angle <= 360:
-        moon_phase = "Waning Crescent"
+    # Moon phase and sky events of the day from the event calendar
+    days = await asyncio.to_thread(EventCalendarService.calendar_days, db, transit_dt.date(), transit_dt.date())
+    day = days[0]
 
     daily_snapshot = {
         "date": transit_dt.date().isoformat(),
-        "moon_phase": moon_phase,
+        "moon_phase": day['moon_phase'],
         "moon_sign": transits['current_positions'].get('Moon', {}).get('sign_name', ''),
         "sun_sign": transits['current_positions'].get('Sun', {}).get('sign_name', ''),
         "active_transits": transits['transits'][:10],
         "themes": transits['summary']['themes'],
-        "major_transit": transits['summary']['most_significant']
+        "major_transit": transits['summary']['most_significant'],
+        "sky_events": day['events']
     }
 
     try:
@@ -458,7 +602,7 @@ async def ai_daily_forecast(
 
         return {
             "date": daily_snapshot["date"],
-            "moon_phase": moon_phase,
+            "moon_phase": daily_snapshot["moon_phase"],
             "moon_sign": daily_snapshot["moon_sign"],
             "sun_sign": daily_snapshot["sun_sign"],
             "themes": daily_snapshot["themes"],
@@ -12,6 +12,7 @@ from app.models.birth_data import BirthData
 from app.models.chart import Chart
 from app.services.yogas_calculator import YogasCalculator
 from app.services.vedic_calculator import VedicChartCalculator
+from app.services.natal_cache_service import NatalCacheService
 from app.schemas.yogas import (
     YogasRequest,
     YogasFromChartRequest,
@@ -21,6 +22,35 @@ from app.schemas.yogas import (
 router = APIRouter()
 
 
+def _detect_yogas(chart_data: dict, division: int, include_weak: bool) -> dict:
+    """Detect yogas in the D-1 chart or in one divisional chart derived from it"""
+    d1_data = chart_data.get('d1', chart_data)
+    planets = d1_data.get('planets', {})
+    houses = d1_data.get('houses', {})
+
+    if division != 1 and not {'ascendant', 'mc'} <= houses.keys():
+        raise HTTPException(
+            status_code=400,
+            detail="Chart has no ascendant and MC to derive divisional charts from"
+        )
+
+    try:
+        if division == 1:
+            return YogasCalculator.detect_all_yogas(
+                planets=planets,
+                ascendant=houses.get('ascendant', 0),
+                include_weak=include_weak
+            )
+        return YogasCalculator.detect_divisional_yogas(
+            planets, houses, [division], include_weak=include_weak
+        )[f'd{division}']
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to detect yogas: {str(e)}"
+        )
+
+
 @router.post("/calculate", response_model=YogasResponse)
 async def calculate_yogas(request: YogasRequest, db: Session = Depends(get_db)):
     """
@@ -61,12 +91,20 @@ async def calculate_yogas(request: YogasRequest, db: Session = Depends(get_db)):
 
             birth_datetime = datetime.combine(bd, bt)
 
-            calculator = VedicChartCalculator()
-            chart_data = calculator.calculate_vedic_chart(
-                birth_datetime=birth_datetime,
-                latitude=birth_data.latitude,
-                longitude=birth_data.longitude,
-                ayanamsa=request.ayanamsa
+            chart_data = NatalCacheService.get_or_compute(
+                db,
+                birth_data,
+                'vedic',
+                lambda: VedicChartCalculator.calculate_vedic_chart(
+                    birth_datetime=birth_datetime,
+                    latitude=birth_data.latitude,
+                    longitude=birth_data.longitude,
+                    timezone_offset_minutes=birth_data.utc_offset or 0,
+                    ayanamsa=request.ayanamsa
+                ),
+                ayanamsa=request.ayanamsa,
+                house_system='whole_sign',
+                include_divisional=None
             )
         except Exception as e:
             raise HTTPException(
@@ -74,26 +112,7 @@ async def calculate_yogas(request: YogasRequest, db: Session = Depends(get_db)):
                 detail=f"Failed to calculate chart: {str(e)}"
             )
 
-    # Extract planet and ascendant data
-    d1_data = chart_data.get('d1', chart_data)
-    planets = d1_data.get('planets', {})
-    ascendant = d1_data.get('houses', {}).get('ascendant', 0)
-    dignities = d1_data.get('dignities', {})
-
-    # Detect yogas
-    try:
-        result = YogasCalculator.detect_all_yogas(
-            planets=planets,
-            ascendant=ascendant,
-            dignities=dignities,
-            include_weak=request.include_weak
-        )
-        return result
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to detect yogas: {str(e)}"
-        )
+    return _detect_yogas(chart_data, request.division, request.include_weak)
 
 
 @router.post("/calculate-from-chart", response_model=YogasResponse)
@@ -109,27 +128,7 @@ async def calculate_yogas_from_chart(request: YogasFromChartRequest, db: Session
     if not chart.chart_data:
         raise HTTPException(status_code=400, detail="Chart has no calculation data")
 
-    # Extract planet and ascendant data
-    chart_data = chart.chart_data
-    d1_data = chart_data.get('d1', chart_data)
-    planets = d1_data.get('planets', {})
-    ascendant = d1_data.get('houses', {}).get('ascendant', 0)
-    dignities = d1_data.get('dignities', {})
-
-    # Detect yogas
-    try:
-        result = YogasCalculator.detect_all_yogas(
-            planets=planets,
-            ascendant=ascendant,
-            dignities=dignities,
-            include_weak=request.include_weak
-        )
-        return result
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to detect yogas: {str(e)}"
-        )
+    return _detect_yogas(chart.chart_data, request.division, request.include_weak)
 
 
 @router.get("/birth-data/{birth_data_id}")
@@ -137,14 +136,19 @@ async def get_yogas_for_birth_data(
     birth_data_id: str,
     ayanamsa: str = "lahiri",
     include_weak: bool = False,
+    division: int = 1,
     db: Session = Depends(get_db)
 ):
     """
     Get yogas for a birth data record (convenience GET endpoint).
     """
-    request = YogasRequest(
-        birth_data_id=birth_data_id,
-        ayanamsa=ayanamsa,
-        include_weak=include_weak
-    )
+    try:
+        request = YogasRequest(
+            birth_data_id=birth_data_id,
+            ayanamsa=ayanamsa,
+            include_weak=include_weak,
+            division=division
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     return await calculate_yogas(request, db)
@@ -124,6 +124,11 @@ class Settings(BaseSettings):
 
     # Human Design
     HD_DESIGN_CALCULATION_DAYS: int = 88
+    HD_SUN_TABLE_PATH: str = "./data/ephemeris/sun_longitude_daily.npy"  # Design date first guess
+
+    # Chebyshev ephemeris cache (used by batch position calculations when built)
+    EPHEMERIS_CACHE_PATH: str = "./data/ephemeris/chebyshev_positions.npy"
+    EPHEMERIS_CACHE_TOLERANCE_ARCSEC: float = 10.0  # Largest fit error accepted at build time
 
     # Interpretations
     INTERPRETATIONS_ENABLED: bool = True
@@ -133,6 +138,9 @@ class Settings(BaseSettings):
     ENABLE_GZIP: bool = True
     ENABLE_CACHE: bool = True
     CACHE_BACKEND: str = "redis"
+    NATAL_CACHE_SIZE: int = 256  # In-process LRU entries for natal computations
+    CALC_EXECUTOR_MODE: str = "process"  # process, thread or inline
+    CALC_EXECUTOR_WORKERS: int = 0  # Calculation worker processes (0 = per core, max 4)
 
     # Development
     ENABLE_PROFILING: bool = False
@@ -163,6 +171,7 @@ if getattr(sys, 'frozen', False):
     
     # Update paths to point to the bundled data
     settings.EPHEMERIS_PATH = os.path.join(bundle_dir, 'data', 'ephemeris')
+    settings.HD_SUN_TABLE_PATH = os.path.join(bundle_dir, 'data', 'ephemeris', 'sun_longitude_daily.npy')
     settings.TIMEZONE_DATA_PATH = os.path.join(bundle_dir, 'data', 'timezones')
     
     # For writable data (database, logs), we should use the user data directory
@@ -4,13 +4,14 @@ SQLite database connection and session management
 Handles SQLite-specific configuration including foreign keys,
 WAL mode, and proper session management for FastAPI.
 """
-from typing import Generator, List
+from typing import Dict, Generator, List, Optional
 from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.orm import sessionmaker, Session, SessionTransaction
+from sqlalchemy.pool import NullPool, StaticPool
 import logging
+import threading
 
 from app.core.config_sqlite import sqlite_settings
 
@@ -299,6 +300,83 @@ class DatabaseSession:
         self.db.close()
 
 
+# Engines with connections of their own for cache writes, by database URL
+_cache_engines: Dict[str, Engine] = {}
+_cache_engines_lock = threading.Lock()
+
+
+def _cache_engine(bind: Engine) -> Engine:
+    """
+    Engine opening a new connection to the database of bind for each session
+
+    An in-memory database exists only on its one connection, so its
+    engine is returned as is.
+    """
+    url = bind.url
+    if url.database in (None, '', ':memory:') or url.query.get('mode') == 'memory':
+        return bind
+
+    key = url.render_as_string(hide_password=False)
+    with _cache_engines_lock:
+        if key not in _cache_engines:
+            _cache_engines[key] = create_engine(
+                url,
+                connect_args={"check_same_thread": False},
+                poolclass=NullPool,
+                echo=bind.echo,
+            )
+        return _cache_engines[key]
+
+
+class CacheSession:
+    """
+    Context manager for storing computed cache rows while a session is in use
+
+    The rows are committed on a connection of their own, so nothing the
+    caller has flushed is committed with them. SQLite has one writer at a
+    time: when the caller's connection already holds a write transaction,
+    the rows go into a savepoint of the caller's session instead and are
+    kept or discarded with its transaction.
+
+    Usage:
+        with CacheSession(db) as session:
+            session.add(row)
+
+    The rows are committed on leaving the block. An exception, such as
+    the IntegrityError of a concurrent insert, rolls them back and is
+    raised again.
+    """
+
+    def __init__(self, db: Session):
+        self.caller = db
+        self.db: Optional[Session] = None
+        self.savepoint: Optional[SessionTransaction] = None
+
+    def __enter__(self) -> Session:
+        """Open a session of its own, or a savepoint of the caller's"""
+        if self.caller.connection().connection.driver_connection.in_transaction:
+            self.savepoint = self.caller.begin_nested()
+            return self.caller
+
+        self.db = SessionLocal(bind=_cache_engine(self.caller.get_bind().engine))
+        return self.db
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Commit the rows, or roll them back on exception"""
+        transaction = self.savepoint if self.savepoint is not None else self.db
+        try:
+            if exc_type is None:
+                transaction.commit()
+            else:
+                transaction.rollback()
+        except Exception:
+            transaction.rollback()
+            raise
+        finally:
+            if self.db is not None:
+                self.db.close()
+
+
 # Utility functions
 def get_session() -> Session:
     """
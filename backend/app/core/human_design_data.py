@@ -1198,6 +1198,14 @@ def get_cross_variation(personality_sun_gate: int) -> int:
 # HELPER FUNCTIONS
 # ==============================================================================
 
+# HD wheel offset: Gate 41 starts at 302° (2° Aquarius)
+HD_WHEEL_START = 302.0
+
+# Arc of one gate (360° / 64) and of one line (gate / 6)
+GATE_ARC = 5.625
+LINE_ARC = 0.9375
+
+
 def get_gate_at_degree(longitude: float) -> int:
     """
     Get the gate number at a given ecliptic longitude.
@@ -1205,14 +1213,11 @@ def get_gate_at_degree(longitude: float) -> int:
     The Human Design mandala starts Gate 41 at 2°00' Aquarius (302°).
     We need to offset the longitude to account for this wheel position.
     """
-    # HD wheel offset: Gate 41 starts at 302° (2° Aquarius)
-    HD_WHEEL_START = 302.0
-
     # Offset the longitude to align with the wheel
     offset_longitude = (longitude - HD_WHEEL_START) % 360
 
     # Calculate gate index
-    index = int(offset_longitude / 5.625)
+    index = int(offset_longitude / GATE_ARC)
     return GATE_WHEEL[index % 64]
 
 
@@ -1224,17 +1229,14 @@ def get_line_at_degree(longitude: float) -> int:
     accounting for the HD wheel offset (Gate 41 starts at 302°).
     Each line spans 0.9375° (5.625° / 6 lines).
     """
-    # HD wheel offset: Gate 41 starts at 302° (2° Aquarius)
-    HD_WHEEL_START = 302.0
-
     # Offset the longitude to align with the HD wheel
     offset_longitude = (longitude - HD_WHEEL_START) % 360
 
     # Calculate position within the current gate
-    position_in_gate = offset_longitude % 5.625
+    position_in_gate = offset_longitude % GATE_ARC
 
     # Calculate line (1-6)
-    line = int(position_in_gate / 0.9375) + 1
+    line = int(position_in_gate / LINE_ARC) + 1
     return min(line, 6)  # Ensure max is 6
 
 
@@ -1246,10 +1248,9 @@ def get_color_at_degree(longitude: float) -> int:
     Each line spans 0.9375°, so each color spans 0.15625° (0.9375/6).
     Accounts for HD wheel offset (Gate 41 starts at 302°).
     """
-    HD_WHEEL_START = 302.0
     offset_longitude = (longitude - HD_WHEEL_START) % 360
-    position_in_gate = offset_longitude % 5.625
-    position_in_line = position_in_gate % 0.9375
+    position_in_gate = offset_longitude % GATE_ARC
+    position_in_line = position_in_gate % LINE_ARC
     color = int(position_in_line / 0.15625) + 1
     return min(color, 6)
 
@@ -1262,10 +1263,9 @@ def get_tone_at_degree(longitude: float) -> int:
     Each color spans 0.15625°, so each tone spans ~0.026042° (0.15625/6).
     Accounts for HD wheel offset (Gate 41 starts at 302°).
     """
-    HD_WHEEL_START = 302.0
     offset_longitude = (longitude - HD_WHEEL_START) % 360
-    position_in_gate = offset_longitude % 5.625
-    position_in_line = position_in_gate % 0.9375
+    position_in_gate = offset_longitude % GATE_ARC
+    position_in_line = position_in_gate % LINE_ARC
     position_in_color = position_in_line % 0.15625
     tone = int(position_in_color / 0.026041667) + 1
     return min(tone, 6)
@@ -1279,10 +1279,9 @@ def get_base_at_degree(longitude: float) -> int:
     Each tone spans ~0.026042°, so each base spans ~0.005208° (0.026042/5).
     Accounts for HD wheel offset (Gate 41 starts at 302°).
     """
-    HD_WHEEL_START = 302.0
     offset_longitude = (longitude - HD_WHEEL_START) % 360
-    position_in_gate = offset_longitude % 5.625
-    position_in_line = position_in_gate % 0.9375
+    position_in_gate = offset_longitude % GATE_ARC
+    position_in_line = position_in_gate % LINE_ARC
     position_in_color = position_in_line % 0.15625
     position_in_tone = position_in_color % 0.026041667
     base = int(position_in_tone / 0.005208333) + 1
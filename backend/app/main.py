@@ -1,6 +1,7 @@
 """
 Main FastAPI application entry point
 """
+import threading
 import warnings
 # Suppress passlib warning about bcrypt version detection (harmless compatibility issue)
 warnings.filterwarnings("ignore", message=".*error reading bcrypt version.*")
@@ -184,6 +185,11 @@ async def startup_event():
     except Exception as e:
         logger.error(f"Swiss Ephemeris initialization error: {e}")
 
+    # Generated data: the daily Sun table for Human Design design dates
+    # takes a few seconds to build, so it is built off the startup path
+    from app.utils.sun_table import SunLongitudeTable
+    threading.Thread(target=SunLongitudeTable.ensure_built, daemon=True).start()
+
     logger.info("Application startup complete")
 
 
@@ -192,6 +198,10 @@ async def startup_event():
 async def shutdown_event():
     """Cleanup on shutdown"""
     logger.info("Shutting down application")
+
+    from app.services.calculation_executor import shutdown_calculation_executor
+    shutdown_calculation_executor()
+
     # TODO: Close database connections
     # TODO: Close Redis connection
     logger.info("Application shutdown complete")
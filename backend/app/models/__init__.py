@@ -24,8 +24,12 @@ from app.models.aspect_pattern import AspectPattern
 from app.models.transit_event import TransitEvent
 # from app.models.session_note import SessionNote  # Removed for single-user mode
 
-# Cache table
+# Cache tables
 from app.models.location_cache import LocationCache
+from app.models.natal_chart_cache import NatalChartCache
+from app.models.daily_energy_score import DailyEnergyScore
+from app.models.sky_event import SkyEvent, SkyEventMonth
+from app.models.hd_transit_interval import HDTransitInterval, HDTransitMonth
 
 # Phase 2: Journal System
 from app.models.journal_entry import JournalEntry
@@ -81,6 +85,12 @@ __all__ = [
 
     # Cache
     'LocationCache',
+    'NatalChartCache',
+    'DailyEnergyScore',
+    'SkyEvent',
+    'SkyEventMonth',
+    'HDTransitInterval',
+    'HDTransitMonth',
 
     # Phase 2: Journal System
     'JournalEntry',
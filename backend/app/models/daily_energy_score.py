@@ -0,0 +1,72 @@
+"""
+DailyEnergyScore model for precomputed daily insight scores
+
+Rolling per-chart table of day energy scores so week, month and year
+previews read stored rows instead of recalculating transits every time.
+"""
+from sqlalchemy import Column, String, Integer, Float, ForeignKey, Index, UniqueConstraint
+
+from app.models.base import BaseModel
+
+
+class DailyEnergyScore(BaseModel):
+    """
+    Daily energy score model
+
+    One row per birth chart per day, filled in batches by
+    DailyInsightsService. Rows carry a key of the natal positions they were
+    scored against, so a recalculated chart never reads stale scores, and
+    are deleted when the owning birth data is updated or removed.
+
+    Fields:
+        id: UUID primary key (inherited)
+        birth_data_id: Birth data the scores belong to
+        day: Date scored (ISO 8601: YYYY-MM-DD)
+        chart_key: Hash of the natal positions scored against
+        energy_level: highly_positive, positive, mixed, challenging, intense or neutral
+        energy_score: Share of harmonious aspect weight (0-100)
+        positive_score: Weight of harmonious transits among the top ten
+        challenging_score: Weight of challenging transits among the top ten
+        transit_count: Number of active transits
+        moon_phase: Moon phase name
+        moon_day: Day of the lunar cycle (0-29.53)
+        created_at: Creation timestamp (inherited)
+        updated_at: Update timestamp (inherited)
+    """
+    __tablename__ = 'daily_energy_scores'
+
+    birth_data_id = Column(
+        String,
+        ForeignKey('birth_data.id', ondelete='CASCADE'),
+        nullable=False,
+        comment="Birth data the scores belong to"
+    )
+
+    day = Column(
+        String,
+        nullable=False,
+        comment="Date scored (YYYY-MM-DD)"
+    )
+
+    chart_key = Column(
+        String,
+        nullable=False,
+        comment="Hash of the natal positions scored against"
+    )
+
+    energy_level = Column(String, nullable=False, comment="Day energy level")
+    energy_score = Column(Integer, nullable=False, comment="Harmonious share of aspect weight (0-100)")
+    positive_score = Column(Float, nullable=False, default=0.0)
+    challenging_score = Column(Float, nullable=False, default=0.0)
+    transit_count = Column(Integer, nullable=False, default=0)
+    moon_phase = Column(String, nullable=False, comment="Moon phase name")
+    moon_day = Column(Float, nullable=False, comment="Day of the lunar cycle")
+
+    __table_args__ = (
+        UniqueConstraint('birth_data_id', 'day', name='uq_daily_energy_scores_day'),
+        Index('idx_daily_energy_scores_birth_data', 'birth_data_id', 'day'),
+    )
+
+    def __repr__(self):
+        """String representation"""
+        return f"<DailyEnergyScore(day={self.day}, level={self.energy_level}, score={self.energy_score})>"
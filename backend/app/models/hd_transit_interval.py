@@ -0,0 +1,77 @@
+"""
+HDTransitInterval models for the Human Design transit calendar
+
+Time intervals during which each transiting HD body sits in one gate and
+line, computed once per month so "which gates and channels are activated
+when" is an interval query instead of a dense scan of positions.
+"""
+from sqlalchemy import Column, String, Integer, Float, Boolean, Index
+
+from app.models.base import BaseModel
+
+
+class HDTransitInterval(BaseModel):
+    """
+    Human Design transit interval model
+
+    One row per body per gate/line stay, split at calendar month
+    boundaries (a stay crossing a month is stored as consecutive pieces;
+    start_exact is False on the continuing piece). Positions are tropical
+    and times are UT.
+
+    Fields:
+        id: UUID primary key (inherited)
+        body: HD body (sun, earth, moon, north_node, south_node, mercury ... pluto)
+        gate: Gate (1-64)
+        line: Line (1-6)
+        start_jd: Julian Day the piece starts
+        end_jd: Julian Day the piece ends (exclusive)
+        start_date: ISO 8601 UTC datetime of start_jd
+        end_date: ISO 8601 UTC datetime of end_jd
+        start_exact: True when start_jd is the exact moment the body
+            entered the line (False when the piece starts at a month boundary)
+        retrograde: True when the body entered the line moving backwards
+        created_at: Creation timestamp (inherited)
+        updated_at: Update timestamp (inherited)
+    """
+    __tablename__ = 'hd_transit_intervals'
+
+    body = Column(String, nullable=False, comment="HD body")
+    gate = Column(Integer, nullable=False, comment="Gate (1-64)")
+    line = Column(Integer, nullable=False, comment="Line (1-6)")
+
+    start_jd = Column(Float, nullable=False, comment="Julian Day (UT) the piece starts")
+    end_jd = Column(Float, nullable=False, comment="Julian Day (UT) the piece ends (exclusive)")
+    start_date = Column(String, nullable=False, comment="ISO 8601 UTC datetime")
+    end_date = Column(String, nullable=False, comment="ISO 8601 UTC datetime")
+
+    start_exact = Column(Boolean, nullable=False, default=True, comment="Starts at an exact line ingress")
+    retrograde = Column(Boolean, nullable=False, default=False, comment="Entered the line moving backwards")
+
+    __table_args__ = (
+        Index('idx_hd_transit_intervals_gate', 'gate', 'start_jd'),
+        Index('idx_hd_transit_intervals_start', 'start_jd'),
+    )
+
+    def __repr__(self):
+        """String representation"""
+        return f"<HDTransitInterval({self.body} {self.gate}.{self.line}: {self.start_date} - {self.end_date})>"
+
+
+class HDTransitMonth(BaseModel):
+    """
+    Calendar month whose HD transit intervals have been computed
+
+    Fields:
+        id: UUID primary key (inherited)
+        month: UTC calendar month (YYYY-MM, unique)
+        created_at: Creation timestamp (inherited)
+        updated_at: Update timestamp (inherited)
+    """
+    __tablename__ = 'hd_transit_months'
+
+    month = Column(String(7), nullable=False, unique=True, comment="UTC calendar month (YYYY-MM)")
+
+    def __repr__(self):
+        """String representation"""
+        return f"<HDTransitMonth({self.month})>"
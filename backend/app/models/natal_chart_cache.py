@@ -0,0 +1,72 @@
+"""
+NatalChartCache model for persisted natal computations
+
+Content-addressed store of calculated natal data so repeated loads of the
+same birth data never touch Swiss Ephemeris.
+"""
+from sqlalchemy import Column, String, ForeignKey, Index
+
+from app.models.base import BaseModel
+from app.core.json_helpers import JSONEncodedDict
+
+
+class NatalChartCache(BaseModel):
+    """
+    Natal computation cache model
+
+    Backing (SQLite) tier of NatalCacheService. Rows are keyed by a hash of
+    the birth data content and every calculation parameter, and are deleted
+    when the owning birth data is updated or removed.
+
+    Fields:
+        id: UUID primary key (inherited)
+        cache_key: SHA-256 of birth data + calculation parameters (unique)
+        birth_data_id: Birth data the entry was computed from
+        chart_kind: Calculation kind (western, vedic, human_design, ...)
+        params: Calculation parameters used (JSON, for inspection)
+        chart_data: Calculated data (JSON)
+        created_at: Creation timestamp (inherited)
+        updated_at: Update timestamp (inherited)
+    """
+    __tablename__ = 'natal_chart_cache'
+
+    cache_key = Column(
+        String,
+        nullable=False,
+        unique=True,
+        comment="SHA-256 of birth data content and calculation parameters"
+    )
+
+    birth_data_id = Column(
+        String,
+        ForeignKey('birth_data.id', ondelete='CASCADE'),
+        nullable=False,
+        comment="Birth data the entry was computed from"
+    )
+
+    chart_kind = Column(
+        String,
+        nullable=False,
+        comment="Calculation kind: western, vedic, human_design, ..."
+    )
+
+    params = Column(
+        JSONEncodedDict,
+        nullable=True,
+        comment="Calculation parameters used for this entry"
+    )
+
+    chart_data = Column(
+        JSONEncodedDict,
+        nullable=False,
+        comment="Calculated chart data"
+    )
+
+    __table_args__ = (
+        Index('idx_natal_chart_cache_key', 'cache_key'),
+        Index('idx_natal_chart_cache_birth_data', 'birth_data_id'),
+    )
+
+    def __repr__(self):
+        """String representation"""
+        return f"<NatalChartCache(kind={self.chart_kind}, key={self.cache_key[:12]}...)>"
@@ -0,0 +1,80 @@
+"""
+SkyEvent models for the astronomical event calendar
+
+Exact sign ingresses, stations, lunar phases, eclipses and void-of-course
+Moon windows, computed once per month and kept so any date range is
+answered with a single indexed query.
+"""
+from sqlalchemy import Column, String, Float, Index, Integer
+
+from app.models.base import BaseModel
+from app.core.json_helpers import JSONEncodedDict
+
+
+class SkyEvent(BaseModel):
+    """
+    Astronomical event model
+
+    Events are collective (not tied to a birth chart) and use the tropical
+    zodiac. Times are UT.
+
+    Fields:
+        id: UUID primary key (inherited)
+        event_type: ingress, station, lunation, eclipse or void_of_course
+        body: Body the event belongs to (the Moon for lunations and
+            void-of-course windows, the Sun or Moon for eclipses)
+        name: Short label (e.g., 'Full Moon', 'stations retrograde')
+        description: Readable sentence (e.g., 'Mars enters Leo')
+        jd: Julian Day of the exact moment (window start for void-of-course)
+        event_date: ISO 8601 UTC datetime of jd
+        end_jd: Julian Day the window ends (void-of-course only)
+        end_date: ISO 8601 UTC datetime of end_jd
+        sign: Sign the event takes place in (entered sign for ingresses)
+        details: Event specifics (JSON)
+        created_at: Creation timestamp (inherited)
+        updated_at: Update timestamp (inherited)
+    """
+    __tablename__ = 'sky_events'
+
+    event_type = Column(String, nullable=False, comment="ingress, station, lunation, eclipse or void_of_course")
+    body = Column(String, nullable=False, comment="Body the event belongs to")
+    name = Column(String, nullable=False, comment="Short label")
+    description = Column(String, nullable=False, comment="Readable sentence")
+
+    jd = Column(Float, nullable=False, comment="Julian Day (UT) of the exact moment or window start")
+    event_date = Column(String, nullable=False, comment="ISO 8601 UTC datetime")
+    end_jd = Column(Float, nullable=True, comment="Julian Day (UT) the window ends")
+    end_date = Column(String, nullable=True, comment="ISO 8601 UTC datetime the window ends")
+
+    sign = Column(String, nullable=True, comment="Sign the event takes place in")
+    details = Column(JSONEncodedDict, nullable=True, comment="Event specifics")
+
+    __table_args__ = (
+        Index('idx_sky_events_jd', 'jd'),
+        Index('idx_sky_events_type_jd', 'event_type', 'jd'),
+    )
+
+    def __repr__(self):
+        """String representation"""
+        return f"<SkyEvent({self.event_date}: {self.description})>"
+
+
+class SkyEventMonth(BaseModel):
+    """
+    Calendar month whose events have been computed
+
+    Fields:
+        id: UUID primary key (inherited)
+        month: UTC calendar month (YYYY-MM, unique)
+        version: EventCalendarService.CALENDAR_VERSION the month was computed with
+        created_at: Creation timestamp (inherited)
+        updated_at: Update timestamp (inherited)
+    """
+    __tablename__ = 'sky_event_months'
+
+    month = Column(String(7), nullable=False, unique=True, comment="UTC calendar month (YYYY-MM)")
+    version = Column(Integer, nullable=False, default=1, comment="Calendar version the month was computed with")
+
+    def __repr__(self):
+        """String representation"""
+        return f"<SkyEventMonth({self.month})>"
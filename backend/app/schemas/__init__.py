@@ -18,7 +18,9 @@ from app.schemas.chart import (
     ChartResponse,
     ChartWithRelations,
     ChartCalculationRequest,
-    ChartCalculationResponse
+    ChartCalculationResponse,
+    ReturnSeriesRequest,
+    RectificationRequest
 )
 from app.schemas.chart_interpretation import (
     ChartInterpretationCreate,
@@ -117,6 +119,8 @@ __all__ = [
     'ChartWithRelations',
     'ChartCalculationRequest',
     'ChartCalculationResponse',
+    'ReturnSeriesRequest',
+    'RectificationRequest',
 
     # Chart Interpretation
     'ChartInterpretationCreate',
@@ -156,6 +160,7 @@ __all__ = [
 
     # Phase 3: Human Design
     'HDCalculationRequest',
+    'HDBulkCalculationRequest',
     'HDChartResponse',
     'HDInterpretationRequest',
     'GateActivation',
@@ -3,11 +3,13 @@ Chart-related Pydantic schemas (single-user mode)
 
 No user_id in responses - all charts belong to "the user"
 """
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from pydantic import BaseModel, Field, validator
 from datetime import datetime
 from uuid import UUID
 
+from app.services.varga_engine import VargaEngine
+
 
 class ChartBase(BaseModel):
     """Base chart schema with common fields"""
@@ -102,6 +104,11 @@ class ChartCalculationRequest(BaseModel):
     # Progressed-specific fields
     progressed_date: Optional[datetime] = Field(None, description="Date for progressed chart")
 
+    # Return-specific fields (solar_return, lunar_return)
+    return_date: Optional[datetime] = Field(None, description="Find the first return on or after this date (UTC)")
+    return_latitude: Optional[float] = Field(None, ge=-90, le=90, description="Return location latitude (default: birth place)")
+    return_longitude: Optional[float] = Field(None, ge=-180, le=180, description="Return location longitude (default: birth place)")
+
     # Secondary chart for synastry/composite
     secondary_birth_data_id: Optional[UUID] = Field(None, description="Second birth data for synastry/composite")
 
@@ -111,6 +118,11 @@ class ChartCalculationRequest(BaseModel):
     include_arabic_parts: bool = Field(False, description="Include Arabic parts")
     custom_orbs: Optional[Dict[str, float]] = Field(None, description="Custom aspect orbs")
 
+    # Vedic options
+    include_divisional: Optional[List[int]] = Field(
+        None, description="Divisional charts for Vedic charts, any of the 16 Shodashavarga (default: D-1 and D-9)"
+    )
+
     # Hybrid chart options
     include_nakshatras: bool = Field(False, description="Include Vedic nakshatras in Western charts")
     include_western_aspects: bool = Field(False, description="Include Western-style aspects in Vedic charts")
@@ -135,6 +147,53 @@ class ChartCalculationRequest(BaseModel):
             raise ValueError(f"Astro system must be one of: {', '.join(valid_systems)}")
         return v.lower()
 
+    @validator("include_divisional")
+    def validate_include_divisional(cls, v):
+        """Validate divisional charts"""
+        if v is None:
+            return v
+        return sorted(set(VargaEngine.validate_divisions(v)))
+
+
+class ReturnSeriesRequest(BaseModel):
+    """Schema for requesting every solar or lunar return in a date range"""
+    birth_data_id: UUID = Field(..., description="Birth data ID to use for calculation")
+    body: str = Field("sun", description="'sun' for solar returns, 'moon' for lunar returns")
+    start_date: datetime = Field(..., description="Start of range (UTC)")
+    end_date: datetime = Field(..., description="End of range (UTC)")
+    zodiac_type: str = Field("tropical", description="Zodiac type (tropical or sidereal)")
+    ayanamsa: Optional[str] = Field("lahiri", description="Ayanamsa (for sidereal)")
+    house_system: Optional[str] = Field("placidus", description="House system")
+    return_latitude: Optional[float] = Field(None, ge=-90, le=90, description="Return location latitude (default: birth place)")
+    return_longitude: Optional[float] = Field(None, ge=-180, le=180, description="Return location longitude (default: birth place)")
+    include_charts: bool = Field(False, description="Include planets and houses for every return")
+
+    @validator("body")
+    def validate_body(cls, v):
+        """Validate return body"""
+        if v.lower() not in ("sun", "moon"):
+            raise ValueError("Body must be 'sun' or 'moon'")
+        return v.lower()
+
+    @validator("end_date")
+    def validate_range(cls, v, values):
+        """Validate date range (at most 100 years)"""
+        start = values.get("start_date")
+        if start and v <= start:
+            raise ValueError("end_date must be after start_date")
+        if start and (v - start).days > 100 * 366:
+            raise ValueError("Date range must not exceed 100 years")
+        return v
+
+
+class RectificationRequest(BaseModel):
+    """Schema for ranking candidate birth times against recorded life events"""
+    birth_data_id: UUID = Field(..., description="Birth data ID whose birth day is searched")
+    event_ids: Optional[List[UUID]] = Field(None, description="Timeline events to use (default: all events of the birth data)")
+    step_minutes: int = Field(1, ge=1, le=60, description="Minutes between candidate birth times")
+    top: int = Field(5, ge=1, le=20, description="Number of ranked candidates to return")
+    house_system: Optional[str] = Field("placidus", description="House system for candidate cusps")
+
 
 class ChartCalculationResponse(ChartResponse):
     """Response after calculating a chart (includes full chart data)"""
@@ -224,6 +224,46 @@ class HDCalculationRequest(BaseModel):
         }
 
 
+class HDBulkCalculationRequest(BaseModel):
+    """Request to calculate Human Design charts for many birth records."""
+    birth_data_ids: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=10000,
+        description="UUIDs of the birth data records"
+    )
+
+    zodiac_type: ZodiacType = Field(
+        default=ZodiacType.TROPICAL,
+        description="Zodiac system to use"
+    )
+    sidereal_method: SiderealMethod = Field(
+        default=SiderealMethod.SHIFT_POSITIONS,
+        description="Method for sidereal calculation (only used if zodiac_type is sidereal)"
+    )
+    ayanamsa: str = Field(
+        default="lahiri",
+        description="Ayanamsa to use for sidereal calculations"
+    )
+
+    include_variables: bool = Field(
+        default=True,
+        description="Whether to include Variables (arrows) calculation"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "birth_data_ids": [
+                    "123e4567-e89b-12d3-a456-426614174000",
+                    "123e4567-e89b-12d3-a456-426614174001"
+                ],
+                "zodiac_type": "tropical",
+                "include_variables": False
+            }
+        }
+
+
 class HDInterpretationRequest(BaseModel):
     """Request for AI interpretation of HD element."""
     chart_id: Optional[str] = Field(None, description="Chart ID for context")
@@ -448,3 +488,77 @@ class HDTypesListResponse(BaseModel):
     """Response for listing all types."""
     types: List[HDTypeInfo]
     count: int = 5
+
+
+# ==============================================================================
+# TRANSIT CALENDAR SCHEMAS
+# ==============================================================================
+
+class HDTransitIntervalInfo(BaseModel):
+    """A transiting body's stay in one gate (and line)."""
+    body: str
+    gate: int
+    line: Optional[int] = Field(None, description="Line (None for gate-level intervals)")
+    start_jd: float
+    end_jd: float
+    start: str = Field(..., description="UTC start (ISO 8601)")
+    end: str = Field(..., description="UTC end, exclusive (ISO 8601)")
+    start_exact: bool = Field(..., description="False when the stay began before the stored range")
+    retrograde: bool = Field(..., description="Entered moving backwards")
+
+
+class HDTransitIntervalsResponse(BaseModel):
+    """Response for transit gate/line intervals over a date range."""
+    start_date: str
+    end_date: str
+    level: str
+    intervals: List[HDTransitIntervalInfo]
+
+
+class HDTransitActivationsResponse(BaseModel):
+    """Response for the transit gates and lines at a moment."""
+    at: str = Field(..., description="UTC time (ISO 8601)")
+    activations: Dict[str, Dict[str, Any]] = Field(..., description="Body -> gate, line, until")
+
+
+class HDGateIngress(BaseModel):
+    """Exact moment a transiting body enters a gate or line."""
+    body: str
+    gate: int
+    line: int
+    jd: float
+    date: str = Field(..., description="UTC time (ISO 8601)")
+    retrograde: bool
+
+
+class HDTransitIngressesResponse(BaseModel):
+    """Response for transit gate/line ingresses over a date range."""
+    start_date: str
+    end_date: str
+    level: str
+    ingresses: List[HDGateIngress]
+
+
+class HDTransitChannelWindow(BaseModel):
+    """A window during which transits complete a channel open in the natal chart."""
+    channel: str = Field(..., description="Channel ID (e.g., '34-20')")
+    name: str
+    gates: List[int]
+    natal_gates: List[int] = Field(..., description="Gates of the channel defined natally")
+    transit_gates: List[int] = Field(..., description="Gates supplied by transits")
+    start_jd: float
+    end_jd: float
+    start: str
+    end: str
+    bodies: List[str] = Field(..., description="Transiting bodies in the transit gates")
+    begins_before_range: bool
+    ends_after_range: bool
+
+
+class HDTransitChannelsResponse(BaseModel):
+    """Response for transit-completed channels of a natal chart."""
+    birth_data_id: str
+    start_date: str
+    end_date: str
+    natal_gates: List[int]
+    windows: List[HDTransitChannelWindow]
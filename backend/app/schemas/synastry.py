@@ -0,0 +1,58 @@
+"""
+Synastry API Schemas
+
+Pydantic schemas for synastry, composite and compatibility ranking endpoints.
+"""
+
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field
+
+
+class SynastryOptions(BaseModel):
+    """Calculation options shared by synastry requests"""
+    zodiac_type: str = Field(default='tropical', description="Zodiac type (tropical or sidereal)")
+    ayanamsa: str = Field(default='lahiri', description="Ayanamsa for sidereal calculations")
+    house_system: str = Field(default='placidus', description="House system for overlays and composites")
+    include_minor_aspects: bool = Field(default=False)
+    custom_orbs: Optional[Dict[str, float]] = Field(default=None, description="Orb overrides by aspect type")
+
+
+class SynastryRequest(SynastryOptions):
+    """Request to compare every pair in a group of people"""
+    birth_data_ids: List[str] = Field(
+        ...,
+        min_length=2,
+        max_length=12,
+        description="UUIDs of the birth data records to compare"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "birth_data_ids": [
+                    "123e4567-e89b-12d3-a456-426614174000",
+                    "123e4567-e89b-12d3-a456-426614174001"
+                ],
+                "zodiac_type": "tropical",
+                "house_system": "placidus"
+            }
+        }
+
+
+class SynastryRankRequest(SynastryOptions):
+    """Request to rank many people by their synastry with one person"""
+    birth_data_id: str = Field(..., description="UUID of the person to compare against")
+    candidate_ids: Optional[List[str]] = Field(
+        default=None,
+        max_length=10000,
+        description="UUIDs to rank; all other saved birth data if omitted"
+    )
+    limit: Optional[int] = Field(default=None, ge=1, description="Return only the best this many")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "birth_data_id": "123e4567-e89b-12d3-a456-426614174000",
+                "limit": 20
+            }
+        }
@@ -176,6 +176,7 @@ class TimelineDataPoint(BaseModel):
     transit_context: Optional[Dict[str, Any]] = Field(None, description="Transit context")
     significant_transits: List[Dict[str, Any]] = Field(default_factory=list, description="Significant transits")
     lunar_phase: Optional[str] = Field(None, description="Moon phase")
+    sky_events: List[Dict[str, Any]] = Field(default_factory=list, description="Ingresses, stations, lunations, eclipses and void-of-course Moon windows")
 
     class Config:
         populate_by_name = True
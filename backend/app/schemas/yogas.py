@@ -5,7 +5,9 @@ Pydantic schemas for Yogas detection endpoints.
 """
 
 from typing import Dict, List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, validator
+
+from app.services.varga_engine import VargaEngine
 
 
 class YogaInfo(BaseModel):
@@ -36,17 +38,27 @@ class YogasCalculationInfo(BaseModel):
     house_lords: Dict[int, str]
 
 
-class YogasRequest(BaseModel):
+class YogasRequestBase(BaseModel):
+    """Options shared by yoga requests"""
+    include_weak: bool = Field(default=False)
+    division: int = Field(default=1, description="Divisional chart to check (1 = Rasi, 9 = Navamsa, ...)")
+
+    @validator("division")
+    def validate_division(cls, v):
+        """Validate divisional chart"""
+        VargaEngine.validate_divisions([v])
+        return v
+
+
+class YogasRequest(YogasRequestBase):
     """Request to calculate yogas from birth data"""
     birth_data_id: str
     ayanamsa: str = Field(default='lahiri')
-    include_weak: bool = Field(default=False)
 
 
-class YogasFromChartRequest(BaseModel):
+class YogasFromChartRequest(YogasRequestBase):
     """Request to calculate yogas from existing chart"""
     chart_id: str
-    include_weak: bool = Field(default=False)
 
 
 class YogasResponse(BaseModel):
@@ -287,6 +287,23 @@ INFORMATION_TOOLS = [
             "type": "object",
             "properties": {}
         }
+    },
+    {
+        "name": "get_dasha_periods",
+        "description": "Get the user's Vimshottari dasha periods (Vedic planetary periods) running on a date, from the mahadasha down to the requested level, optionally with the next periods at that level.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "date": {"type": "string", "description": "Date to look up (YYYY-MM-DD); defaults to today"},
+                "level": {
+                    "type": "string",
+                    "enum": ["mahadasha", "antardasha", "pratyantardasha", "sookshmadasha", "pranadasha"],
+                    "default": "pratyantardasha",
+                    "description": "Deepest level to return"
+                },
+                "upcoming": {"type": "integer", "minimum": 0, "maximum": 20, "default": 0, "description": "Number of following periods at that level to include"}
+            }
+        }
     }
 ]
 
@@ -469,13 +486,17 @@ TIMELINE_NAVIGATION_TOOLS = [
     },
     {
         "name": "describe_day_transits",
-        "description": "Provide an astrological interpretation of the transits for a specific day in relation to the user's natal chart.",
+        "description": "Describe the sky for a day or date range: moon phase, exact sign ingresses, retrograde/direct stations, new/full/quarter moons, eclipses and void-of-course Moon windows. Use date_to to answer questions like 'what happens this month'.",
         "input_schema": {
             "type": "object",
             "properties": {
                 "date": {
                     "type": "string",
-                    "description": "Date to describe in YYYY-MM-DD format"
+                    "description": "Date to describe in YYYY-MM-DD format (first day of a range)"
+                },
+                "date_to": {
+                    "type": "string",
+                    "description": "Optional last day of a range in YYYY-MM-DD format (inclusive)"
                 },
                 "focus_planets": {
                     "type": "array",
@@ -723,6 +744,7 @@ ASYNC_FRONTEND_TOOLS = {
 # Tools that execute on backend (return data)
 BACKEND_TOOLS = {
     "get_chart_data", "get_planet_info", "get_house_info", "list_available_charts", "get_human_design_chart",
+    "get_dasha_periods",
     # Phase 2 backend tools (Journal)
     "create_journal_entry", "search_journal", "get_recent_journal_entries", "get_journal_moods",
     # Phase 2 backend tools (Timeline)
@@ -1495,6 +1517,61 @@ class AgentService:
                     logger.error(f"Error getting Human Design chart: {e}")
                     return {"success": False, "error": str(e)}
 
+            elif tool_name == "get_dasha_periods":
+                if not db_session:
+                    return {"success": False, "error": "Database not available"}
+
+                try:
+                    from app.models.birth_data import BirthData
+                    from app.services.dasha_calculator import DASHA_LEVELS, VimshottariDashaCalculator
+                    from datetime import datetime
+
+                    birth_data = db_session.query(BirthData).order_by(
+                        BirthData.updated_at.desc()
+                    ).first()
+                    if not birth_data:
+                        return {"success": False, "error": "No birth data found"}
+
+                    level = tool_input.get("level", "pratyantardasha")
+                    if level not in DASHA_LEVELS:
+                        return {"success": False, "error": f"Unknown dasha level '{level}'"}
+                    depth = DASHA_LEVELS.index(level)
+
+                    date_str = tool_input.get("date")
+                    target = datetime.strptime(date_str, "%Y-%m-%d") if date_str else datetime.now()
+
+                    timeline = VimshottariDashaCalculator.timeline_for_birth_data(birth_data)
+                    path = timeline.path_at(target, depth)
+                    if path is None:
+                        return {"success": False, "error": "Date is outside the dasha timeline"}
+
+                    def describe(period):
+                        return {
+                            "level": period["level"],
+                            "planet": period["planet_name"],
+                            "start_date": period["start_date"].date().isoformat(),
+                            "end_date": period["end_date"].date().isoformat(),
+                        }
+
+                    periods = [timeline.period(path[:length]) for length in range(1, len(path) + 1)]
+                    result = {
+                        "success": True,
+                        "date": target.date().isoformat(),
+                        "current_period": "-".join(period["planet_name"] for period in periods),
+                        "periods": [describe(period) for period in periods],
+                    }
+
+                    upcoming = min(max(int(tool_input.get("upcoming", 0)), 0), 20)
+                    if upcoming:
+                        # First row is the period running on the date
+                        following = timeline.level(depth, target).select(slice(1, upcoming + 1))
+                        result["upcoming"] = [describe(period) for period in timeline.period_dicts(following)]
+
+                    return result
+                except Exception as e:
+                    logger.error(f"Error getting dasha periods: {e}")
+                    return {"success": False, "error": str(e)}
+
             # ============================================
             # Phase 2: Journal Tools
             # ============================================
@@ -1873,16 +1950,38 @@ class AgentService:
                     return {"success": False, "error": str(e)}
 
             elif tool_name == "describe_day_transits":
-                target_date = tool_input.get("date")
-                focus_planets = tool_input.get("focus_planets", [])
+                if not db_session:
+                    return {"success": False, "error": "Database not available"}
 
-                return {
-                    "success": True,
-                    "date": target_date,
-                    "message": "Transit interpretation would analyze planetary positions for this date",
-                    "note": "Full implementation requires transit calculator and natal chart context",
-                    "focus_planets": focus_planets
-                }
+                try:
+                    from datetime import date as date_cls
+                    from app.services.event_calendar_service import EventCalendarService
+
+                    start = date_cls.fromisoformat(tool_input.get("date"))
+                    end = date_cls.fromisoformat(tool_input["date_to"]) if tool_input.get("date_to") else start
+                    focus_planets = [p.lower().replace(' ', '_') for p in tool_input.get("focus_planets", [])]
+
+                    days = EventCalendarService.calendar_days(db_session, start, end)
+                    for day in days:
+                        if focus_planets:
+                            day["events"] = [e for e in day["events"] if e["body"] in focus_planets]
+                        day["events"] = [
+                            {"time": e["date"], "description": e["description"], "type": e["type"]}
+                            for e in day["events"]
+                        ]
+
+                    return {
+                        "success": True,
+                        "date": start.isoformat(),
+                        "date_to": end.isoformat(),
+                        "focus_planets": focus_planets,
+                        "note": "Times are UTC; positions are tropical",
+                        "days": days
+                    }
+
+                except Exception as e:
+                    logger.error(f"Error describing day transits: {e}")
+                    return {"success": False, "error": str(e)}
 
             elif tool_name == "write_journal_for_date":
                 if not db_session:
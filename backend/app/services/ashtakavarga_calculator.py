@@ -9,11 +9,116 @@ The Sarvashtakavarga (combined total) is particularly useful for:
 - Transit analysis (planets transiting signs with high points give better results)
 - Determining favorable signs for activities
 - Overall strength assessment of houses
+
+Transit strength over a date range is scored from the chart's bindu
+matrices, precomputed once: each sample of a single batched ephemeris
+call is looked up by (planet, sign, kakshya) instead of re-deriving the
+tables per moment.
 """
 
+from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 
+import numpy as np
+
+from app.utils.ephemeris import EphemerisCalculator
+
+# Kakshya (1/8 sign, 3°45') lords in order from 0° of every sign
+KAKSHYA_LORDS = ('saturn', 'jupiter', 'mars', 'sun', 'venus', 'mercury', 'moon', 'ascendant')
+KAKSHYA_SPAN = 30.0 / 8
+
+
+@dataclass
+class AshtakavargaMatrices:
+    """
+    Bindu matrices of one chart
+
+    Attributes:
+        prastara: (7, 8, 12) bool, planet x contributor x sign; True where the
+            contributor gives that planet a bindu in the sign
+        bhinna: (7, 12) Bhinnashtakavarga bindus per planet and sign
+        sarva: (12,) Sarvashtakavarga bindus per sign
+    """
+    prastara: np.ndarray
+    bhinna: np.ndarray
+    sarva: np.ndarray
+
+
+@dataclass
+class TransitStrengthSeries:
+    """
+    Ashtakavarga transit strength of the 7 planets over sampled moments
+
+    All score arrays are shaped (n_samples, 7), columns in
+    AshtakavargaCalculator.PLANETS order.
+
+    Attributes:
+        jds: Sample Julian Days (UT)
+        signs: Transit sign (0=Aries)
+        kakshyas: Kakshya within the sign (0-7, see KAKSHYA_LORDS)
+        bhinna: Planet's own bindus in its transit sign (0-8)
+        sarva: Sarvashtakavarga bindus of the transit sign (0-56)
+        kakshya_bindus: 1 where the kakshya lord contributed a bindu
+    """
+    jds: np.ndarray
+    signs: np.ndarray
+    kakshyas: np.ndarray
+    bhinna: np.ndarray
+    sarva: np.ndarray
+    kakshya_bindus: np.ndarray
+
+    def periods(self, planet: str, by_kakshya: bool = False) -> List[Dict]:
+        """
+        Run-length periods of one planet's transit
+
+        Boundaries fall on sample moments, so they are as precise as the
+        sampling step.
+
+        Args:
+            planet: Planet name (sun through saturn)
+            by_kakshya: Split at kakshya changes as well as sign changes
+
+        Returns:
+            List of dicts with start/end Julian Days, sign and scores
+        """
+        col = AshtakavargaCalculator.PLANETS.index(planet)
+        if not len(self.jds):
+            return []
+        keys = self.signs[:, col] * 8 + self.kakshyas[:, col] if by_kakshya else self.signs[:, col]
+        starts = np.concatenate([[0], np.flatnonzero(np.diff(keys)) + 1])
+        ends = np.append(starts[1:], len(keys) - 1)
+
+        periods = []
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            sign = int(self.signs[start, col])
+            period = {
+                'start_jd': float(self.jds[start]),
+                'end_jd': float(self.jds[end]),
+                'sign': sign,
+                'sign_name': AshtakavargaCalculator.SIGN_NAMES[sign],
+                'bhinna_bindus': int(self.bhinna[start, col]),
+                'sarva_bindus': int(self.sarva[start, col]),
+            }
+            if by_kakshya:
+                period['kakshya'] = int(self.kakshyas[start, col])
+                period['kakshya_lord'] = KAKSHYA_LORDS[period['kakshya']]
+                period['kakshya_bindu'] = bool(self.kakshya_bindus[start, col])
+            periods.append(period)
+        return periods
+
+    def to_dict(self) -> Dict:
+        """Compact sample-by-planet layout for API responses"""
+        return {
+            'planets': list(AshtakavargaCalculator.PLANETS),
+            'dates': [EphemerisCalculator.julian_day_to_datetime(jd).isoformat() for jd in self.jds.tolist()],
+            'signs': self.signs.tolist(),
+            'kakshyas': self.kakshyas.tolist(),
+            'bhinna_bindus': self.bhinna.tolist(),
+            'sarva_bindus': self.sarva.tolist(),
+            'kakshya_bindus': self.kakshya_bindus.tolist(),
+        }
+
 
 class AshtakavargaCalculator:
     """
@@ -148,10 +253,11 @@ class AshtakavargaCalculator:
         planet_signs = cls._get_planet_signs(planets)
         planet_signs['ascendant'] = asc_sign
 
-        # Calculate Bhinnashtakavarga for each planet
+        matrices = cls.calculate_matrices(planet_signs)
+
+        # Bhinnashtakavarga for each planet
         bhinna = {}
-        for planet in cls.PLANETS:
-            bindus = cls._calculate_bhinna_for_planet(planet, planet_signs)
+        for planet, bindus in zip(cls.PLANETS, matrices.bhinna.tolist()):
             total = sum(bindus)
             strongest = cls._get_strongest_signs(bindus)
             weakest = cls._get_weakest_signs(bindus)
@@ -197,44 +303,99 @@ class AshtakavargaCalculator:
         return result
 
     @classmethod
-    def _calculate_bhinna_for_planet(
-        cls,
-        planet: str,
-        planet_signs: Dict[str, int]
-    ) -> List[int]:
+    def calculate_matrices(cls, planet_signs: Dict[str, int]) -> AshtakavargaMatrices:
         """
-        Calculate Bhinnashtakavarga for a single planet.
+        Prastara, Bhinna and Sarva bindu matrices for a chart
 
-        Returns list of 12 integers (0-8) representing bindus in each sign.
+        Args:
+            planet_signs: Sign (0-11) of each contributor (the 7 planets and
+                'ascendant'); missing contributors give no bindus
+
+        Returns:
+            AshtakavargaMatrices
         """
-        bindus = [0] * 12
+        contributor_signs = np.array([planet_signs.get(name, -1) for name in _CONTRIBUTORS])
+        present = contributor_signs >= 0
 
-        benefic_rules = cls.BENEFIC_POSITIONS.get(planet, {})
+        # House (0-11) of every sign counted from every contributor: (8, 12)
+        houses = (np.arange(12)[None, :] - contributor_signs[:, None]) % 12
+        prastara = _BENEFIC_RULES[:, np.arange(8)[:, None], houses] & present[None, :, None]
 
-        for ref_key, positions in benefic_rules.items():
-            # ref_key is like "from_sun", "from_moon", etc.
-            ref_planet = ref_key.replace('from_', '')
+        bhinna = prastara.sum(axis=1)
+        return AshtakavargaMatrices(prastara=prastara, bhinna=bhinna, sarva=bhinna.sum(axis=0))
 
-            if ref_planet not in planet_signs:
-                continue
+    @classmethod
+    def transit_strength_series(
+        cls,
+        matrices: AshtakavargaMatrices,
+        start: datetime,
+        end: datetime,
+        step_days: float = 1.0,
+        ayanamsa: str = 'lahiri'
+    ) -> TransitStrengthSeries:
+        """
+        Score the 7 planets' transits against a chart over a date range
 
-            ref_sign = planet_signs[ref_planet]
+        Sidereal positions for every sample come from one batched ephemeris
+        call; the scores are then plain lookups into the chart's matrices.
 
-            # For each benefic position, add a bindu to that sign
-            for pos in positions:
-                target_sign = (ref_sign + pos - 1) % 12
-                bindus[target_sign] += 1
+        Args:
+            matrices: Chart matrices from calculate_matrices
+            start: Start of range (UTC)
+            end: End of range (UTC, exclusive)
+            step_days: Sampling step in days
+            ayanamsa: Ayanamsa system (should match the natal chart)
+
+        Returns:
+            TransitStrengthSeries
+        """
+        if step_days <= 0:
+            raise ValueError("step_days must be positive")
+        jd_start = EphemerisCalculator.datetime_to_julian_day(start, 0)
+        jd_end = EphemerisCalculator.datetime_to_julian_day(end, 0)
+        jds = jd_start + step_days * np.arange(max(int(np.ceil((jd_end - jd_start) / step_days)), 0))
 
-        return bindus
+        batch = EphemerisCalculator.calculate_positions_batch(
+            jds, cls.PLANETS, zodiac='sidereal', ayanamsa=ayanamsa
+        )
+        return cls.score_positions(matrices, batch.jds, batch.longitude)
+
+    @classmethod
+    def score_positions(
+        cls,
+        matrices: AshtakavargaMatrices,
+        jds: np.ndarray,
+        longitudes: np.ndarray
+    ) -> TransitStrengthSeries:
+        """
+        Score sidereal longitudes of the 7 planets, shaped (n_samples, 7)
+
+        Args:
+            matrices: Chart matrices from calculate_matrices
+            jds: Julian Days of the samples
+            longitudes: Sidereal longitudes, columns in PLANETS order
+
+        Returns:
+            TransitStrengthSeries
+        """
+        longitudes = np.mod(np.asarray(longitudes, dtype=np.float64), 360.0)
+        signs = (longitudes // 30.0).astype(np.int64)
+        kakshyas = np.minimum((longitudes - signs * 30.0) // KAKSHYA_SPAN, 7).astype(np.int64)
+
+        planet = np.arange(len(cls.PLANETS))[None, :]
+        return TransitStrengthSeries(
+            jds=np.asarray(jds, dtype=np.float64),
+            signs=signs,
+            kakshyas=kakshyas,
+            bhinna=matrices.bhinna[planet, signs],
+            sarva=matrices.sarva[signs],
+            kakshya_bindus=matrices.prastara[planet, _KAKSHYA_CONTRIBUTORS[kakshyas], signs].astype(np.int64),
+        )
 
     @classmethod
     def _calculate_sarvashtakavarga(cls, bhinna: Dict) -> Dict:
         """Calculate Sarvashtakavarga (sum of all Bhinnas)"""
-        sarva = [0] * 12
-
-        for planet_data in bhinna.values():
-            for i, bindu in enumerate(planet_data['bindus_by_sign']):
-                sarva[i] += bindu
+        sarva = np.sum([planet_data['bindus_by_sign'] for planet_data in bhinna.values()], axis=0).tolist()
 
         total = sum(sarva)
         average = total / 12
@@ -361,3 +522,18 @@ class AshtakavargaCalculator:
             'quality': quality,
             'description': description,
         }
+
+
+def _build_benefic_rules() -> np.ndarray:
+    """(7, 8, 12) bool: planet x contributor x house counted from the contributor"""
+    rules = np.zeros((len(AshtakavargaCalculator.PLANETS), len(_CONTRIBUTORS), 12), dtype=bool)
+    for row, planet in enumerate(AshtakavargaCalculator.PLANETS):
+        for col, contributor in enumerate(_CONTRIBUTORS):
+            houses = AshtakavargaCalculator.BENEFIC_POSITIONS[planet].get(f'from_{contributor}', [])
+            rules[row, col, [house - 1 for house in houses]] = True
+    return rules
+
+
+_CONTRIBUTORS = AshtakavargaCalculator.PLANETS + ['ascendant']
+_BENEFIC_RULES = _build_benefic_rules()
+_KAKSHYA_CONTRIBUTORS = np.array([_CONTRIBUTORS.index(lord) for lord in KAKSHYA_LORDS])
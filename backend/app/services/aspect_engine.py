@@ -0,0 +1,235 @@
+"""
+Aspect Engine
+
+Finds every aspect between a set of points in one pass over NumPy arrays:
+the pairwise angular separation matrix is computed at once and compared
+against all aspect angles and orbs together, instead of testing each
+pair against each aspect type in Python. Results come back as a
+structured array plus a per-aspect-type adjacency matrix, so pattern
+detection can ask "are A and B in trine?" in O(1).
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+
+# One row per aspect found: point indices (i < j), aspect type index,
+# separation (0-180°) and signed/absolute orb from exact
+ASPECT_DTYPE = np.dtype([
+    ('i', np.int32),
+    ('j', np.int32),
+    ('type', np.int32),
+    ('separation', np.float64),
+    ('orb', np.float64),
+    ('orb_abs', np.float64),
+])
+
+
+@dataclass
+class AspectTable:
+    """
+    Aspects between a set of points.
+
+    Attributes:
+        points: Point names; indices into this list identify points
+        longitudes: Point longitudes (0-360°), shaped (n_points,)
+        aspect_types: Aspect names; indices into this list identify types
+        angles: Exact angle per aspect type, as given in the aspect set
+        records: ASPECT_DTYPE array, ordered by pair (i, then j) and then
+            by aspect type
+        adjacency: Per aspect name, a symmetric boolean (n_points, n_points)
+            matrix, True where the two points form that aspect
+    """
+    points: List[str]
+    longitudes: np.ndarray
+    aspect_types: List[str]
+    angles: List[float]
+    records: np.ndarray
+    adjacency: Dict[str, np.ndarray]
+
+    def index_of(self, point: str) -> int:
+        """Index of a point name"""
+        return self.points.index(point)
+
+    def has(self, aspect_type: str, i: int, j: int) -> bool:
+        """Whether points i and j form an aspect of the given type"""
+        matrix = self.adjacency.get(aspect_type)
+        return matrix is not None and bool(matrix[i, j])
+
+    def pairs(self, aspect_type: str) -> np.ndarray:
+        """
+        Point index pairs forming an aspect type
+
+        Returns:
+            Array shaped (n, 2) of (i, j) with i < j, in record order
+        """
+        if aspect_type not in self.adjacency:
+            return np.empty((0, 2), dtype=np.int32)
+        type_index = self.aspect_types.index(aspect_type)
+        rows = self.records[self.records['type'] == type_index]
+        return np.column_stack([rows['i'], rows['j']])
+
+    def to_dicts(self) -> List[Dict]:
+        """
+        Aspects in the dict layout of NatalChartCalculator charts
+
+        Returns:
+            List of dicts with planet1, planet2, aspect_type, angle, orb,
+            orb_abs and applying (None: speeds are not considered)
+        """
+        records = self.records
+        return [
+            {
+                'planet1': self.points[i],
+                'planet2': self.points[j],
+                'aspect_type': self.aspect_types[type_index],
+                'angle': self.angles[type_index],
+                'orb': orb,
+                'orb_abs': orb_abs,
+                'applying': None,
+            }
+            for i, j, type_index, orb, orb_abs in zip(
+                records['i'].tolist(), records['j'].tolist(), records['type'].tolist(),
+                records['orb'].tolist(), records['orb_abs'].tolist()
+            )
+        ]
+
+
+class AspectEngine:
+    """
+    Vectorized aspect detection.
+    """
+
+    @staticmethod
+    def separation_matrix(longitudes: np.ndarray) -> np.ndarray:
+        """
+        Shortest angular distance between every pair of longitudes
+
+        Args:
+            longitudes: Longitudes in degrees, shaped (n,)
+
+        Returns:
+            Symmetric (n, n) matrix of separations in [0, 180]
+        """
+        diff = np.mod(longitudes[None, :] - longitudes[:, None], 360.0)
+        diff = np.where(diff > 180.0, diff - 360.0, diff)
+        return np.abs(diff)
+
+    @staticmethod
+    def cross_separation(longitudes_a: np.ndarray, longitudes_b: np.ndarray) -> np.ndarray:
+        """
+        Shortest angular distance from every point of one set to every
+        point of another
+
+        Args:
+            longitudes_a: Longitudes shaped (..., n_a)
+            longitudes_b: Longitudes shaped (..., n_b); leading dimensions
+                broadcast against longitudes_a
+
+        Returns:
+            Separations in [0, 180] shaped (..., n_a, n_b); NaN where either
+            longitude is NaN
+        """
+        a = np.asarray(longitudes_a, dtype=np.float64)
+        b = np.asarray(longitudes_b, dtype=np.float64)
+        diff = np.mod(b[..., None, :] - a[..., :, None], 360.0)
+        diff = np.where(diff > 180.0, diff - 360.0, diff)
+        return np.abs(diff)
+
+    @staticmethod
+    def find_cross_aspects(
+        longitudes_a: Sequence[float],
+        longitudes_b: Sequence[float],
+        aspect_set: Dict[str, Dict]
+    ) -> np.ndarray:
+        """
+        Find all aspects between the points of two charts
+
+        Args:
+            longitudes_a: Longitudes of the first chart's points
+            longitudes_b: Longitudes of the second chart's points
+            aspect_set: Aspect name -> {'angle': exact angle, 'orb': max orb}
+
+        Returns:
+            ASPECT_DTYPE array where i indexes the first chart's points and
+            j the second's, ordered by i, then j, then aspect type (order of
+            aspect_set). NaN longitudes never aspect.
+        """
+        aspect_types = list(aspect_set)
+        exact = np.array([aspect_set[name]['angle'] for name in aspect_types], dtype=np.float64)
+        orbs = np.array([aspect_set[name]['orb'] for name in aspect_types], dtype=np.float64)
+
+        separation = AspectEngine.cross_separation(longitudes_a, longitudes_b)
+        deviation = separation[:, :, None] - exact[None, None, :]
+        deviation_abs = np.abs(deviation)
+        first, second, type_index = np.nonzero(deviation_abs <= orbs[None, None, :])
+
+        records = np.empty(len(first), dtype=ASPECT_DTYPE)
+        records['i'] = first
+        records['j'] = second
+        records['type'] = type_index
+        records['separation'] = separation[first, second]
+        records['orb'] = deviation[first, second, type_index]
+        records['orb_abs'] = deviation_abs[first, second, type_index]
+        return records
+
+    @staticmethod
+    def find_aspects(
+        points: Sequence[str],
+        longitudes: Sequence[float],
+        aspect_set: Dict[str, Dict]
+    ) -> AspectTable:
+        """
+        Find all aspects between points
+
+        Args:
+            points: Point names
+            longitudes: Longitude of each point (degrees)
+            aspect_set: Aspect name -> {'angle': exact angle, 'orb': max orb}
+
+        Returns:
+            AspectTable of every (pair, aspect type) within orb
+        """
+        names = list(points)
+        lons = np.asarray(longitudes, dtype=np.float64)
+        aspect_types = list(aspect_set)
+        angles = [aspect_set[name]['angle'] for name in aspect_types]
+        n = len(names)
+
+        exact = np.array(angles, dtype=np.float64)
+        orbs = np.array([aspect_set[name]['orb'] for name in aspect_types], dtype=np.float64)
+
+        first, second = np.triu_indices(n, 1)
+        separation = AspectEngine.separation_matrix(lons)[first, second]
+
+        # (pair, aspect type) deviation from exact; row-major nonzero keeps
+        # the pair-then-type order of a nested loop
+        deviation = separation[:, None] - exact[None, :]
+        deviation_abs = np.abs(deviation)
+        pair_index, type_index = np.nonzero(deviation_abs <= orbs[None, :])
+
+        records = np.empty(len(pair_index), dtype=ASPECT_DTYPE)
+        records['i'] = first[pair_index]
+        records['j'] = second[pair_index]
+        records['type'] = type_index
+        records['separation'] = separation[pair_index]
+        records['orb'] = deviation[pair_index, type_index]
+        records['orb_abs'] = deviation_abs[pair_index, type_index]
+
+        adjacency = {}
+        for index, name in enumerate(aspect_types):
+            matrix = np.zeros((n, n), dtype=bool)
+            rows = records[records['type'] == index]
+            matrix[rows['i'], rows['j']] = True
+            matrix[rows['j'], rows['i']] = True
+            adjacency[name] = matrix
+
+        return AspectTable(
+            points=names,
+            longitudes=lons,
+            aspect_types=aspect_types,
+            angles=angles,
+            records=records,
+            adjacency=adjacency,
+        )
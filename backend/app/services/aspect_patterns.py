@@ -0,0 +1,172 @@
+"""
+Aspect Pattern Engine
+
+Finds aspect configurations by motif matching over adjacency bitsets.
+For each aspect type, point i's neighbors are packed into one integer
+(bit j set when i and j form that aspect), built once per chart from an
+AspectTable. A configuration is then a handful of AND operations, e.g.
+the apexes of a T-square on opposition (a, b) are squares[a] & squares[b],
+so detection stays fast with asteroids and fixed stars in the chart.
+
+Configurations (point indices into the AspectTable):
+- Grand Trine: three points mutually in trine
+- T-Square: an opposition with a third point square to both ends
+- Grand Cross: two oppositions whose four points are joined by squares
+- Yod: a sextile with a third point quincunx to both ends (needs the
+  quincunx, i.e. minor aspects, in the aspect set)
+- Kite: a Grand Trine plus a point opposite one corner and sextile to
+  the other two
+- Mystic Rectangle: two oppositions joined by alternating sextiles and trines
+"""
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from app.services.aspect_engine import AspectTable
+
+
+def _bits(mask: int) -> Iterator[int]:
+    """Indices of the set bits of a mask, lowest first"""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class AspectPatternEngine:
+    """
+    Per-aspect-type adjacency bitsets for one chart, with motif queries.
+    """
+
+    def __init__(self, aspect_table: AspectTable):
+        """
+        Args:
+            aspect_table: Aspects of the chart
+        """
+        self.points = aspect_table.points
+        count = len(self.points)
+        self._bitsets: Dict[str, List[int]] = {name: [0] * count for name in aspect_table.aspect_types}
+
+        records = aspect_table.records
+        for i, j, type_index in zip(
+            records['i'].tolist(), records['j'].tolist(), records['type'].tolist()
+        ):
+            rows = self._bitsets[aspect_table.aspect_types[type_index]]
+            rows[i] |= 1 << j
+            rows[j] |= 1 << i
+
+        self._empty = [0] * count
+
+    def neighbors(self, aspect_type: str) -> List[int]:
+        """Per point, the bitset of points it forms the aspect type with"""
+        return self._bitsets.get(aspect_type, self._empty)
+
+    def grand_trines(self) -> List[Tuple[int, int, int]]:
+        """Triangles of trines, as ascending (a, b, c)"""
+        trines = self.neighbors('trine')
+        found = []
+        for a, row in enumerate(trines):
+            above_a = row >> (a + 1) << (a + 1)
+            for b in _bits(above_a):
+                for c in _bits(above_a & trines[b] >> (b + 1) << (b + 1)):
+                    found.append((a, b, c))
+        return found
+
+    def t_squares(self) -> List[Tuple[int, int, int]]:
+        """T-squares as (opposition end, opposition end, apex)"""
+        squares = self.neighbors('square')
+        found = []
+        for a, b in self._pairs('opposition'):
+            for apex in _bits(squares[a] & squares[b]):
+                found.append((a, b, apex))
+        return found
+
+    def grand_crosses(self) -> List[Tuple[int, int, int, int]]:
+        """
+        Grand crosses as (a, b, c, d) in order around the cross
+
+        a-c and b-d are the oppositions; a is the lowest index, b < d.
+        """
+        squares = self.neighbors('square')
+        oppositions = self.neighbors('opposition')
+        found = []
+        for a, c in self._pairs('opposition'):
+            # Corners square to both ends of a-c, above a so each cross is
+            # found from its lowest point only
+            corners = (squares[a] & squares[c]) >> (a + 1) << (a + 1)
+            for b in _bits(corners):
+                for d in _bits(oppositions[b] & corners >> (b + 1) << (b + 1)):
+                    found.append((a, b, c, d))
+        return found
+
+    def yods(self) -> List[Tuple[int, int, int]]:
+        """Yods as (sextile end, sextile end, apex)"""
+        quincunxes = self.neighbors('quincunx')
+        found = []
+        for a, b in self._pairs('sextile'):
+            for apex in _bits(quincunxes[a] & quincunxes[b]):
+                found.append((a, b, apex))
+        return found
+
+    def kites(self) -> List[Tuple[int, int, int, int]]:
+        """
+        Kites as (head, wing, wing, tail)
+
+        head, wing, wing form the Grand Trine; the tail opposes the head
+        and is sextile to both wings.
+        """
+        oppositions = self.neighbors('opposition')
+        sextiles = self.neighbors('sextile')
+        found = []
+        for triangle in self.grand_trines():
+            for corner in range(3):
+                head = triangle[corner]
+                wing1, wing2 = (triangle[k] for k in range(3) if k != corner)
+                for tail in _bits(oppositions[head] & sextiles[wing1] & sextiles[wing2]):
+                    found.append((head, wing1, wing2, tail))
+        return found
+
+    def mystic_rectangles(self) -> List[Tuple[int, int, int, int]]:
+        """
+        Mystic rectangles as (a, b, c, d) in order around the rectangle
+
+        a-c and b-d are the oppositions; a-b and c-d are sextiles, b-c and
+        d-a trines; a is the lowest index.
+        """
+        oppositions = self.neighbors('opposition')
+        sextiles = self.neighbors('sextile')
+        trines = self.neighbors('trine')
+        found = []
+        for a, c in self._pairs('opposition'):
+            # b and d above a, so each rectangle is found from its lowest
+            # point only
+            above_a = ~((1 << (a + 1)) - 1)
+            for b in _bits(sextiles[a] & trines[c] & above_a):
+                for d in _bits(oppositions[b] & trines[a] & sextiles[c] & above_a):
+                    found.append((a, b, c, d))
+        return found
+
+    def _pairs(self, aspect_type: str) -> Iterator[Tuple[int, int]]:
+        """Point index pairs (i < j) forming an aspect type"""
+        for i, row in enumerate(self.neighbors(aspect_type)):
+            for j in _bits(row >> (i + 1) << (i + 1)):
+                yield i, j
+
+    @staticmethod
+    def house_positions(longitudes: Sequence[float], cusps: Sequence[float]) -> np.ndarray:
+        """
+        House (1-12) of each longitude
+
+        Args:
+            longitudes: Longitudes in degrees
+            cusps: The 12 house cusp longitudes, house 1 first
+
+        Returns:
+            Integer array of house numbers
+        """
+        lons = np.asarray(longitudes, dtype=np.float64)
+        starts = np.asarray(cusps, dtype=np.float64)
+        spans = np.mod(np.roll(starts, -1) - starts, 360.0)
+        offsets = np.mod(lons[:, None] - starts[None, :], 360.0)
+        # Exactly one house contains each longitude
+        return np.argmax(offsets < spans[None, :], axis=1) + 1
@@ -0,0 +1,302 @@
+"""
+Bodygraph Bitset Engine
+
+Bitmask form of the Human Design bodygraph tables, for computing channel
+and center definition without building sets and dicts per chart:
+- Gates: a 64-bit integer, bit (gate - 1) set when the gate is activated
+- Channels: one bit per entry of CHANNELS (in table order); a channel is
+  complete when its two-gate mask is contained in the gate mask
+- Centers: one bit per CenterType (in enum order), defined by OR-ing the
+  center masks of the complete channels
+- Connectivity: a union-find over the 9 centers joined by the complete
+  channels gives the connected groups of defined centers, from which
+  Type (motor/Sacral to Throat) and Definition (number of groups) follow
+
+Analyzing a gate mask takes a few microseconds, so it can sit in the
+inner loop of transit bodygraphs and bulk jobs.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Tuple
+
+from app.core.human_design_data import CENTERS, CHANNELS, CenterType, Definition, HumanDesignType
+
+
+def _bit_indices(mask: int) -> List[int]:
+    """Positions of the set bits of a mask, lowest first"""
+    indices = []
+    while mask:
+        low = mask & -mask
+        indices.append(low.bit_length() - 1)
+        mask ^= low
+    return indices
+
+
+def _byte_tables(values: List[int]) -> List[List[int]]:
+    """
+    Lookup tables for OR-ing per-bit values over a mask, a byte at a time
+
+    Args:
+        values: Value for each bit position of the mask
+
+    Returns:
+        One 256-entry table per byte of the mask: table[byte] is the OR of
+        the values of the bits set in that byte
+    """
+    tables = []
+    for offset in range(0, len(values), 8):
+        table = [0] * 256
+        for byte in range(1, 256):
+            low = byte & -byte
+            bit = offset + low.bit_length() - 1
+            table[byte] = table[byte ^ low] | (values[bit] if bit < len(values) else 0)
+        tables.append(table)
+    return tables
+
+
+_CENTER_ORDER: List[CenterType] = list(CenterType)
+_CENTER_BITS: Dict[CenterType, int] = {
+    center: 1 << index for index, center in enumerate(_CENTER_ORDER)
+}
+_CHANNEL_KEYS: List[Tuple[int, int]] = list(CHANNELS)
+
+# Per gate bit: the channels having that gate as their first / second gate
+_FIRST_GATE_CHANNELS = [0] * 64
+_SECOND_GATE_CHANNELS = [0] * 64
+for _index, (_gate1, _gate2) in enumerate(_CHANNEL_KEYS):
+    _FIRST_GATE_CHANNELS[_gate1 - 1] |= 1 << _index
+    _SECOND_GATE_CHANNELS[_gate2 - 1] |= 1 << _index
+
+# A channel is complete when both its first and its second gate are set
+_GATE_BYTE_TABLES = list(zip(_byte_tables(_FIRST_GATE_CHANNELS), _byte_tables(_SECOND_GATE_CHANNELS)))
+
+# Per channel bit: the two centers it joins
+_CHANNEL_CENTER_MASKS = [
+    _CENTER_BITS[CHANNELS[key][1]] | _CENTER_BITS[CHANNELS[key][2]] for key in _CHANNEL_KEYS
+]
+_CHANNEL_BYTE_TABLES = _byte_tables(_CHANNEL_CENTER_MASKS)
+
+# Connected groups of defined centers -> Definition
+_DEFINITIONS_BY_GROUPS = {
+    0: Definition.NONE,
+    1: Definition.SINGLE,
+    2: Definition.SPLIT,
+    3: Definition.TRIPLE_SPLIT,
+}
+
+
+@dataclass(frozen=True)
+class Bodygraph:
+    """
+    Bitmask summary of a bodygraph.
+
+    Attributes:
+        gate_mask: Activated gates (bit gate - 1)
+        channel_mask: Complete channels (bit i = BodygraphEngine.CHANNEL_KEYS[i])
+        center_mask: Defined centers (bit i = BodygraphEngine.CENTER_ORDER[i])
+        components: Center mask of each connected group of defined centers
+    """
+    gate_mask: int
+    channel_mask: int
+    center_mask: int
+    components: Tuple[int, ...]
+
+
+class BodygraphEngine:
+    """
+    Precomputed bitmask tables for gates, channels and centers.
+    """
+
+    # Bit order of the center mask
+    CENTER_ORDER = _CENTER_ORDER
+    CENTER_BITS = _CENTER_BITS
+
+    # Bit order of the channel mask
+    CHANNEL_KEYS = _CHANNEL_KEYS
+
+    # Per channel: mask of its two gates, and mask of the two centers it joins
+    CHANNEL_GATE_MASKS: List[int] = [
+        (1 << (gate1 - 1)) | (1 << (gate2 - 1)) for gate1, gate2 in _CHANNEL_KEYS
+    ]
+    CHANNEL_CENTER_MASKS = _CHANNEL_CENTER_MASKS
+
+    # Per channel: indices into CENTER_ORDER of the two centers it joins
+    CHANNEL_CENTER_INDICES: List[Tuple[int, int]] = [
+        (_CENTER_ORDER.index(CHANNELS[key][1]), _CENTER_ORDER.index(CHANNELS[key][2]))
+        for key in _CHANNEL_KEYS
+    ]
+
+    # Motors that make a Manifestor when connected to the Throat (the
+    # Sacral is handled separately: it makes a Generator type)
+    MANIFESTING_MOTORS_MASK = (
+        _CENTER_BITS[CenterType.SOLAR_PLEXUS] | _CENTER_BITS[CenterType.HEART] | _CENTER_BITS[CenterType.ROOT]
+    )
+
+    # Per center: mask of the gates it holds
+    CENTER_GATE_MASKS: Dict[CenterType, int] = {
+        center: sum(1 << (gate - 1) for gate in data['gates']) for center, data in CENTERS.items()
+    }
+
+    @staticmethod
+    def gate_mask(gates: Iterable[int]) -> int:
+        """
+        Pack gate numbers (1-64) into a gate mask
+
+        Args:
+            gates: Activated gate numbers (duplicates are fine)
+
+        Returns:
+            64-bit gate mask
+        """
+        mask = 0
+        for gate in gates:
+            mask |= 1 << (gate - 1)
+        return mask
+
+    @staticmethod
+    def gates_of(gate_mask: int) -> List[int]:
+        """Gate numbers in a gate mask, ascending"""
+        return [index + 1 for index in _bit_indices(gate_mask)]
+
+    @staticmethod
+    def channel_mask(gate_mask: int) -> int:
+        """
+        Complete channels for a gate mask
+
+        Args:
+            gate_mask: Activated gates
+
+        Returns:
+            Channel mask (bit i = CHANNEL_KEYS[i] is complete)
+        """
+        first = second = 0
+        for first_table, second_table in _GATE_BYTE_TABLES:
+            byte = gate_mask & 0xFF
+            first |= first_table[byte]
+            second |= second_table[byte]
+            gate_mask >>= 8
+        return first & second
+
+    @staticmethod
+    def channel_indices(channel_mask: int) -> List[int]:
+        """Indices into CHANNEL_KEYS of the channels in a channel mask"""
+        return _bit_indices(channel_mask)
+
+    @staticmethod
+    def center_mask(channel_mask: int) -> int:
+        """
+        Defined centers for a set of complete channels
+
+        Args:
+            channel_mask: Complete channels
+
+        Returns:
+            Center mask (bit i = CENTER_ORDER[i] is defined)
+        """
+        mask = 0
+        for table in _CHANNEL_BYTE_TABLES:
+            mask |= table[channel_mask & 0xFF]
+            channel_mask >>= 8
+        return mask
+
+    @staticmethod
+    def is_defined(center_mask: int, center: CenterType) -> bool:
+        """Whether a center's bit is set in a center mask"""
+        return bool(center_mask & BodygraphEngine.CENTER_BITS[center])
+
+    @staticmethod
+    def components(channel_mask: int) -> Tuple[int, ...]:
+        """
+        Connected groups of centers joined by complete channels
+
+        Union-find over the 9 centers; centers with no complete channel
+        are undefined and belong to no group.
+
+        Args:
+            channel_mask: Complete channels
+
+        Returns:
+            Center mask of each group, ordered by lowest center bit
+        """
+        # Union by lowest index; with 9 nodes finds need no path compression
+        parent = list(range(len(_CENTER_ORDER)))
+        center_indices = BodygraphEngine.CHANNEL_CENTER_INDICES
+        for index in _bit_indices(channel_mask):
+            a, b = center_indices[index]
+            while parent[a] != a:
+                a = parent[a]
+            while parent[b] != b:
+                b = parent[b]
+            if a < b:
+                parent[b] = a
+            elif b < a:
+                parent[a] = b
+
+        groups: Dict[int, int] = {}
+        for node in _bit_indices(BodygraphEngine.center_mask(channel_mask)):
+            root = node
+            while parent[root] != root:
+                root = parent[root]
+            groups[root] = groups.get(root, 0) | (1 << node)
+        return tuple(groups.values())
+
+    @staticmethod
+    def analyze(gate_mask: int) -> Bodygraph:
+        """
+        Channels, defined centers and connectivity for a gate mask
+
+        Args:
+            gate_mask: Activated gates
+
+        Returns:
+            Bodygraph summary
+        """
+        channel_mask = BodygraphEngine.channel_mask(gate_mask)
+        return Bodygraph(
+            gate_mask=gate_mask,
+            channel_mask=channel_mask,
+            center_mask=BodygraphEngine.center_mask(channel_mask),
+            components=BodygraphEngine.components(channel_mask),
+        )
+
+    @staticmethod
+    def connected(bodygraph: Bodygraph, first: CenterType, second: CenterType) -> bool:
+        """Whether two defined centers are in the same group"""
+        pair = BodygraphEngine.CENTER_BITS[first] | BodygraphEngine.CENTER_BITS[second]
+        return any(group & pair == pair for group in bodygraph.components)
+
+    @staticmethod
+    def motor_to_throat(bodygraph: Bodygraph) -> bool:
+        """Whether a Solar Plexus, Heart or Root motor connects to the Throat"""
+        throat = BodygraphEngine.CENTER_BITS[CenterType.THROAT]
+        motors = BodygraphEngine.MANIFESTING_MOTORS_MASK
+        return any(group & throat and group & motors for group in bodygraph.components)
+
+    @staticmethod
+    def hd_type(bodygraph: Bodygraph) -> HumanDesignType:
+        """
+        Type from center definition and connectivity
+
+        1. Reflector: No defined centers
+        2. Manifesting Generator: Sacral defined and connected to the Throat
+        3. Generator: Sacral defined, no Throat connection
+        4. Manifestor: Motor to Throat, Sacral NOT defined
+        5. Projector: Everything else
+        """
+        if not bodygraph.center_mask:
+            return HumanDesignType.REFLECTOR
+
+        if BodygraphEngine.is_defined(bodygraph.center_mask, CenterType.SACRAL):
+            if BodygraphEngine.connected(bodygraph, CenterType.SACRAL, CenterType.THROAT):
+                return HumanDesignType.MANIFESTING_GENERATOR
+            return HumanDesignType.GENERATOR
+
+        if BodygraphEngine.motor_to_throat(bodygraph):
+            return HumanDesignType.MANIFESTOR
+
+        return HumanDesignType.PROJECTOR
+
+    @staticmethod
+    def definition(bodygraph: Bodygraph) -> Definition:
+        """Definition from the number of connected groups of defined centers"""
+        return _DEFINITIONS_BY_GROUPS.get(len(bodygraph.components), Definition.QUADRUPLE_SPLIT)
@@ -0,0 +1,214 @@
+"""
+Calculation Executor
+
+Runs CPU-bound chart calculations off the asyncio event loop. Work goes to
+a process pool whose workers set up the Swiss Ephemeris once at startup;
+pyswisseph keeps the ephemeris path and sidereal mode in process globals,
+so every worker has its own isolated copy (within a process, sidereal mode
+switches are serialized by SiderealContext). Identical calculations that
+are already in flight are coalesced and share one result.
+"""
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import swisseph as swe
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def _init_worker(ephemeris_path: str) -> None:
+    """Pool initializer: import the calculators and load the ephemeris once"""
+    from app.utils.ephemeris import EphemerisCalculator
+
+    swe.set_ephe_path(ephemeris_path)
+    # First call opens the ephemeris files (or falls back to Moshier)
+    EphemerisCalculator.calculate_planet_position('sun', 2451545.0)
+
+
+def _run_task(func: Callable[..., Any], args: tuple, kwargs: Dict[str, Any]) -> Any:
+    """Run one task (module-level so it pickles into process workers)"""
+    return func(*args, **kwargs)
+
+
+class CalculationExecutor:
+    """
+    Dispatches synchronous calculations to a worker pool.
+
+    Modes:
+    - process: ProcessPoolExecutor (spawned workers, parallel across cores)
+    - thread: a single worker thread; keeps the event loop free while
+      swe's global state stays serialized
+    - inline: run on the calling thread (no pool)
+
+    In process mode the callable and its arguments must be picklable, i.e.
+    module-level functions or class/static methods called with plain data.
+    """
+
+    MODES = ('process', 'thread', 'inline')
+
+    def __init__(
+        self,
+        mode: str = 'process',
+        max_workers: int = 0,
+        ephemeris_path: Optional[str] = None
+    ):
+        """
+        Args:
+            mode: 'process', 'thread' or 'inline'
+            max_workers: Process pool size (0 = one per core, at most 4)
+            ephemeris_path: Ephemeris directory loaded by each worker
+                (defaults to settings.EPHEMERIS_PATH)
+        """
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown calculation executor mode: {mode}")
+
+        self.mode = mode
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.ephemeris_path = settings.EPHEMERIS_PATH if ephemeris_path is None else ephemeris_path
+        self.coalesced = 0
+
+        self._pool: Optional[Executor] = None
+        self._pool_lock = threading.Lock()
+        self._inflight: Dict[str, Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = {}
+
+    @staticmethod
+    def make_key(func: Callable[..., Any], *args: Any, **kwargs: Any) -> str:
+        """
+        Build the coalescing key for a call
+
+        Args:
+            func: Callable to run
+            *args, **kwargs: Call arguments (hashed via their JSON form)
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        payload = {
+            'func': f"{func.__module__}.{func.__qualname__}",
+            'args': args,
+            'kwargs': kwargs,
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str, separators=(',', ':'))
+        return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+    async def run(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        key: Optional[str] = None,
+        **kwargs: Any
+    ) -> Any:
+        """
+        Run a calculation in the pool and await its result
+
+        If a call with the same key is already running, its result is
+        shared instead of starting another calculation.
+
+        Args:
+            func: Synchronous callable
+            *args: Positional arguments for func
+            key: Coalescing key (defaults to make_key(func, *args, **kwargs))
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            The value returned by func
+        """
+        if self.mode == 'inline':
+            return _run_task(func, args, kwargs)
+
+        loop = asyncio.get_running_loop()
+        if key is None:
+            key = self.make_key(func, *args, **kwargs)
+
+        entry = self._inflight.get(key)
+        if entry is not None and entry[0] is loop:
+            self.coalesced += 1
+            # Followers get their own copy; the first caller may mutate its result
+            return copy.deepcopy(await asyncio.shield(entry[1]))
+
+        future = self._submit(loop, func, args, kwargs)
+        self._inflight[key] = (loop, future)
+        future.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(future)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker pool (it is recreated on next use)"""
+        with self._pool_lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
+
+    def _get_pool(self) -> Executor:
+        """Create the worker pool on first use"""
+        with self._pool_lock:
+            if self._pool is None:
+                if self.mode == 'process':
+                    # spawn: forking a threaded server process is unsafe
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context('spawn'),
+                        initializer=_init_worker,
+                        initargs=(self.ephemeris_path,),
+                    )
+                else:
+                    self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='calc')
+                logger.info(f"Calculation executor started ({self.mode}, "
+                            f"{self.max_workers if self.mode == 'process' else 1} workers)")
+            return self._pool
+
+    def _submit(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        func: Callable[..., Any],
+        args: tuple,
+        kwargs: Dict[str, Any]
+    ) -> asyncio.Future:
+        """Submit to the pool, replacing it once if a worker has died"""
+        try:
+            return loop.run_in_executor(self._get_pool(), _run_task, func, args, kwargs)
+        except BrokenProcessPool:
+            logger.warning("Calculation worker pool broken; restarting")
+            self.shutdown(wait=False)
+            return loop.run_in_executor(self._get_pool(), _run_task, func, args, kwargs)
+
+    def _finish(self, key: str, future: asyncio.Future) -> None:
+        """Drop a completed call from the in-flight table"""
+        entry = self._inflight.get(key)
+        if entry is not None and entry[1] is future:
+            del self._inflight[key]
+        if not future.cancelled() and isinstance(future.exception(), BrokenProcessPool):
+            self.shutdown(wait=False)
+
+
+# Singleton instance
+_calculation_executor: Optional[CalculationExecutor] = None
+
+
+def get_calculation_executor() -> CalculationExecutor:
+    """Get the singleton CalculationExecutor configured from settings."""
+    global _calculation_executor
+    if _calculation_executor is None:
+        _calculation_executor = CalculationExecutor(
+            mode=settings.CALC_EXECUTOR_MODE,
+            max_workers=settings.CALC_EXECUTOR_WORKERS,
+        )
+    return _calculation_executor
+
+
+def shutdown_calculation_executor() -> None:
+    """Stop the singleton executor's workers, if any were started."""
+    global _calculation_executor
+    if _calculation_executor is not None:
+        _calculation_executor.shutdown()
+        _calculation_executor = None
@@ -5,6 +5,9 @@ Assembles complete natal charts from birth data
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 from app.utils.ephemeris import EphemerisCalculator
+from app.utils.nakshatra import calculate_nakshatras
+from app.services.aspect_engine import AspectEngine, AspectTable
+from app.services.aspect_patterns import AspectPatternEngine
 
 
 class NatalChartCalculator:
@@ -70,7 +73,7 @@ class NatalChartCalculator:
         )
 
         # Calculate all planetary positions
-        planets = EphemerisCalculator.calculate_all_planets(jd, zodiac=zodiac)
+        planets = EphemerisCalculator.calculate_all_planets(jd, zodiac=zodiac, ayanamsa=ayanamsa)
 
         # Calculate houses
         houses = EphemerisCalculator.calculate_houses(
@@ -78,28 +81,19 @@ class NatalChartCalculator:
         )
 
         # Calculate aspects
-        aspect_set = {**NatalChartCalculator.MAJOR_ASPECTS}
-        if include_minor_aspects:
-            aspect_set.update(NatalChartCalculator.MINOR_ASPECTS)
-
-        # Override with custom orbs if provided
-        if custom_orbs:
-            for aspect_name, orb_value in custom_orbs.items():
-                if aspect_name in aspect_set:
-                    aspect_set[aspect_name]['orb'] = orb_value
-
-        aspects = NatalChartCalculator._calculate_all_aspects(
+        aspect_set = NatalChartCalculator._build_aspect_set(include_minor_aspects, custom_orbs)
+        aspect_table = NatalChartCalculator._calculate_all_aspects(
             planets, houses, aspect_set
         )
 
         # Detect aspect patterns
-        patterns = NatalChartCalculator._detect_aspect_patterns(aspects, planets)
+        patterns = NatalChartCalculator._detect_aspect_patterns(aspect_table, planets, houses)
 
         # Build complete chart data
         chart_data = {
             'planets': planets,
             'houses': houses,
-            'aspects': aspects,
+            'aspects': aspect_table.to_dicts(),
             'patterns': patterns,
             'calculation_info': {
                 'julian_day': jd,
@@ -120,31 +114,58 @@ class NatalChartCalculator:
 
         # Add nakshatras if requested (hybrid chart feature)
         if include_nakshatras:
-            # Lazy import to avoid circular dependency
-            from app.services.vedic_calculator import VedicChartCalculator
-
             # For tropical charts, we need to convert to sidereal first
             if zodiac == 'tropical':
-                # Calculate sidereal positions for nakshatra calculation
-                sidereal_planets = EphemerisCalculator.calculate_all_planets(
-                    jd, zodiac='sidereal', ayanamsa=ayanamsa
-                )
-                chart_data['nakshatras'] = VedicChartCalculator._calculate_nakshatras(sidereal_planets)
+                # Shift the tropical positions by the ayanamsa (no second ephemeris pass)
+                sidereal_planets = EphemerisCalculator.get_sidereal_context(
+                    ayanamsa
+                ).planets_to_sidereal(planets, jd)
+                chart_data['nakshatras'] = calculate_nakshatras(sidereal_planets)
             else:
                 # Already sidereal, use the existing positions
-                chart_data['nakshatras'] = VedicChartCalculator._calculate_nakshatras(planets)
+                chart_data['nakshatras'] = calculate_nakshatras(planets)
 
             chart_data['calculation_info']['include_nakshatras'] = True
             chart_data['calculation_info']['nakshatra_ayanamsa'] = ayanamsa
 
         return chart_data
 
+    @staticmethod
+    def _build_aspect_set(
+        include_minor_aspects: bool = False,
+        custom_orbs: Optional[Dict[str, float]] = None
+    ) -> Dict[str, Dict]:
+        """
+        Aspects to check, with custom orbs applied
+
+        Args:
+            include_minor_aspects: Include minor aspects
+            custom_orbs: Custom orb values for aspects
+
+        Returns:
+            Dictionary of aspect name -> {'angle', 'orb'} (a private copy;
+            the class defaults are never modified)
+        """
+        aspect_set = {name: dict(info) for name, info in NatalChartCalculator.MAJOR_ASPECTS.items()}
+        if include_minor_aspects:
+            aspect_set.update(
+                {name: dict(info) for name, info in NatalChartCalculator.MINOR_ASPECTS.items()}
+            )
+
+        # Override with custom orbs if provided
+        if custom_orbs:
+            for aspect_name, orb_value in custom_orbs.items():
+                if aspect_name in aspect_set:
+                    aspect_set[aspect_name]['orb'] = orb_value
+
+        return aspect_set
+
     @staticmethod
     def _calculate_all_aspects(
         planets: Dict[str, Dict],
         houses: Dict,
         aspect_set: Dict[str, Dict]
-    ) -> List[Dict]:
+    ) -> AspectTable:
         """
         Calculate all aspects between planets and angles
 
@@ -154,10 +175,8 @@ class NatalChartCalculator:
             aspect_set: Dictionary of aspects to check
 
         Returns:
-            List of aspect dictionaries
+            AspectTable (to_dicts() gives the list of aspect dictionaries)
         """
-        aspects = []
-
         # Get all points to check (planets + angles)
         points = {}
 
@@ -170,178 +189,163 @@ class NatalChartCalculator:
         points['ascendant'] = houses['ascendant']
         points['mc'] = houses['mc']
 
-        # Calculate aspects between all pairs
-        point_names = list(points.keys())
-        for i, point1_name in enumerate(point_names):
-            for point2_name in point_names[i+1:]:
-                long1 = points[point1_name]
-                long2 = points[point2_name]
-
-                # Check each aspect type
-                for aspect_name, aspect_info in aspect_set.items():
-                    aspect_result = EphemerisCalculator.calculate_aspect(
-                        long1, long2,
-                        aspect_info['angle'],
-                        aspect_info['orb']
-                    )
-
-                    if aspect_result:
-                        aspects.append({
-                            'planet1': point1_name,
-                            'planet2': point2_name,
-                            'aspect_type': aspect_name,
-                            'angle': aspect_info['angle'],
-                            'orb': aspect_result['orb'],
-                            'orb_abs': aspect_result['orb_abs'],
-                            'applying': aspect_result['applying'],
-                        })
-
-        return aspects
+        return AspectEngine.find_aspects(list(points), list(points.values()), aspect_set)
 
     @staticmethod
     def _detect_aspect_patterns(
-        aspects: List[Dict],
-        planets: Dict[str, Dict]
+        aspect_table: AspectTable,
+        planets: Dict[str, Dict],
+        houses: Optional[Dict] = None
     ) -> List[Dict]:
         """
         Detect major aspect patterns (Grand Trine, T-Square, Yod, etc.)
 
         Args:
-            aspects: List of aspects
+            aspect_table: Aspects of the chart
             planets: Dictionary of planet positions
+            houses: House data with 'cusps'; enables stelliums by house
 
         Returns:
             List of detected patterns
         """
         patterns = []
 
+        # Adjacency bitsets are built once and shared by every detector
+        engine = AspectPatternEngine(aspect_table)
+
         # Grand Trine: 3 planets all in trine (120°) to each other
-        patterns.extend(NatalChartCalculator._detect_grand_trines(aspects))
+        patterns.extend(NatalChartCalculator._detect_grand_trines(engine))
 
         # T-Square: 3 planets forming 2 squares and 1 opposition
-        patterns.extend(NatalChartCalculator._detect_t_squares(aspects))
+        patterns.extend(NatalChartCalculator._detect_t_squares(engine))
 
         # Grand Cross: 4 planets forming 4 squares and 2 oppositions
-        patterns.extend(NatalChartCalculator._detect_grand_crosses(aspects))
+        patterns.extend(NatalChartCalculator._detect_grand_crosses(engine))
 
         # Yod (Finger of God): 2 planets in sextile with both quincunx to a 3rd
-        patterns.extend(NatalChartCalculator._detect_yods(aspects))
+        patterns.extend(NatalChartCalculator._detect_yods(engine))
+
+        # Kite: Grand Trine with a 4th planet opposite one corner
+        patterns.extend(NatalChartCalculator._detect_kites(engine))
 
-        # Stellium: 3+ planets in the same sign
-        patterns.extend(NatalChartCalculator._detect_stelliums(planets))
+        # Mystic Rectangle: 2 oppositions joined by sextiles and trines
+        patterns.extend(NatalChartCalculator._detect_mystic_rectangles(engine))
+
+        # Stellium: 3+ planets in the same sign (and house, when known)
+        patterns.extend(NatalChartCalculator._detect_stelliums(planets, houses))
 
         return patterns
 
     @staticmethod
-    def _detect_grand_trines(aspects: List[Dict]) -> List[Dict]:
+    def _detect_grand_trines(engine: AspectPatternEngine) -> List[Dict]:
         """Detect Grand Trine patterns"""
         grand_trines = []
+        names = engine.points
 
-        # Get all trine aspects
-        trines = [a for a in aspects if a['aspect_type'] == 'trine']
-
-        # Find groups of 3 planets where all are in trine
-        planets_in_trines = set()
-        for aspect in trines:
-            planets_in_trines.add(aspect['planet1'])
-            planets_in_trines.add(aspect['planet2'])
-
-        # Check each combination of 3 planets
-        planet_list = list(planets_in_trines)
-        for i, p1 in enumerate(planet_list):
-            for j, p2 in enumerate(planet_list[i+1:], i+1):
-                for p3 in planet_list[j+1:]:
-                    # Check if all three are in trine with each other
-                    has_trine_12 = any(
-                        (a['planet1'] == p1 and a['planet2'] == p2) or
-                        (a['planet1'] == p2 and a['planet2'] == p1)
-                        for a in trines
-                    )
-                    has_trine_23 = any(
-                        (a['planet1'] == p2 and a['planet2'] == p3) or
-                        (a['planet1'] == p3 and a['planet2'] == p2)
-                        for a in trines
-                    )
-                    has_trine_13 = any(
-                        (a['planet1'] == p1 and a['planet2'] == p3) or
-                        (a['planet1'] == p3 and a['planet2'] == p1)
-                        for a in trines
-                    )
-
-                    if has_trine_12 and has_trine_23 and has_trine_13:
-                        grand_trines.append({
-                            'pattern_type': 'grand_trine',
-                            'planets': [p1, p2, p3],
-                            'description': f'Grand Trine: {p1}, {p2}, {p3}'
-                        })
+        for i, j, k in engine.grand_trines():
+            p1, p2, p3 = names[i], names[j], names[k]
+            grand_trines.append({
+                'pattern_type': 'grand_trine',
+                'planets': [p1, p2, p3],
+                'description': f'Grand Trine: {p1}, {p2}, {p3}'
+            })
 
         return grand_trines
 
     @staticmethod
-    def _detect_t_squares(aspects: List[Dict]) -> List[Dict]:
+    def _detect_t_squares(engine: AspectPatternEngine) -> List[Dict]:
         """Detect T-Square patterns"""
         t_squares = []
+        names = engine.points
 
-        # Get squares and oppositions
-        squares = [a for a in aspects if a['aspect_type'] == 'square']
-        oppositions = [a for a in aspects if a['aspect_type'] == 'opposition']
-
-        # For each opposition, look for a planet square to both ends
-        for opp in oppositions:
-            p1, p2 = opp['planet1'], opp['planet2']
-
-            # Find planets that square both ends of the opposition
-            for sq in squares:
-                apex = None
-                if sq['planet1'] == p1 or sq['planet1'] == p2:
-                    apex = sq['planet2']
-                elif sq['planet2'] == p1 or sq['planet2'] == p2:
-                    apex = sq['planet1']
-
-                if apex:
-                    # Check if apex squares the other end of opposition
-                    other_end = p2 if (sq['planet1'] == p1 or sq['planet2'] == p1) else p1
-                    has_second_square = any(
-                        (a['planet1'] == apex and a['planet2'] == other_end) or
-                        (a['planet1'] == other_end and a['planet2'] == apex)
-                        for a in squares
-                    )
-
-                    if has_second_square:
-                        # Avoid duplicates
-                        planets_set = frozenset([p1, p2, apex])
-                        if not any(frozenset(ts['planets']) == planets_set for ts in t_squares):
-                            t_squares.append({
-                                'pattern_type': 't_square',
-                                'planets': [p1, p2, apex],
-                                'apex': apex,
-                                'description': f'T-Square with apex at {apex}'
-                            })
+        for i, j, k in engine.t_squares():
+            p1, p2, apex = names[i], names[j], names[k]
+            t_squares.append({
+                'pattern_type': 't_square',
+                'planets': [p1, p2, apex],
+                'apex': apex,
+                'description': f'T-Square with apex at {apex}'
+            })
 
         return t_squares
 
     @staticmethod
-    def _detect_grand_crosses(aspects: List[Dict]) -> List[Dict]:
+    def _detect_grand_crosses(engine: AspectPatternEngine) -> List[Dict]:
         """Detect Grand Cross patterns"""
-        # TODO: Implement grand cross detection
-        return []
+        grand_crosses = []
+        names = engine.points
+
+        for cross in engine.grand_crosses():
+            planet_list = [names[i] for i in cross]
+            grand_crosses.append({
+                'pattern_type': 'grand_cross',
+                'planets': planet_list,
+                'description': f'Grand Cross: {", ".join(planet_list)}'
+            })
+
+        return grand_crosses
 
     @staticmethod
-    def _detect_yods(aspects: List[Dict]) -> List[Dict]:
-        """Detect Yod (Finger of God) patterns"""
-        # TODO: Implement yod detection
-        return []
+    def _detect_yods(engine: AspectPatternEngine) -> List[Dict]:
+        """Detect Yod (Finger of God) patterns (needs minor aspects for quincunxes)"""
+        yods = []
+        names = engine.points
+
+        for i, j, k in engine.yods():
+            p1, p2, apex = names[i], names[j], names[k]
+            yods.append({
+                'pattern_type': 'yod',
+                'planets': [p1, p2, apex],
+                'apex': apex,
+                'description': f'Yod with apex at {apex}'
+            })
+
+        return yods
 
     @staticmethod
-    def _detect_stelliums(planets: Dict[str, Dict]) -> List[Dict]:
+    def _detect_kites(engine: AspectPatternEngine) -> List[Dict]:
+        """Detect Kite patterns"""
+        kites = []
+        names = engine.points
+
+        for head, wing1, wing2, tail in engine.kites():
+            planet_list = [names[head], names[wing1], names[wing2], names[tail]]
+            kites.append({
+                'pattern_type': 'kite',
+                'planets': planet_list,
+                'apex': names[head],
+                'description': f'Kite with head at {names[head]}, tail at {names[tail]}'
+            })
+
+        return kites
+
+    @staticmethod
+    def _detect_mystic_rectangles(engine: AspectPatternEngine) -> List[Dict]:
+        """Detect Mystic Rectangle patterns"""
+        rectangles = []
+        names = engine.points
+
+        for rectangle in engine.mystic_rectangles():
+            planet_list = [names[i] for i in rectangle]
+            rectangles.append({
+                'pattern_type': 'mystic_rectangle',
+                'planets': planet_list,
+                'description': f'Mystic Rectangle: {", ".join(planet_list)}'
+            })
+
+        return rectangles
+
+    @staticmethod
+    def _detect_stelliums(planets: Dict[str, Dict], houses: Optional[Dict] = None) -> List[Dict]:
         """
-        Detect stelliums (3+ planets in the same sign)
+        Detect stelliums (3+ planets in the same sign or house)
 
         Args:
             planets: Dictionary of planet positions
+            houses: House data with 'cusps'; without it only signs are checked
 
         Returns:
-            List of stellium patterns
+            List of stellium patterns (house stelliums carry 'house' instead of 'sign')
         """
         stelliums = []
 
@@ -366,4 +370,31 @@ class NatalChartCalculator:
                     'description': f'Stellium in {sign_name}: {", ".join(planet_list)}'
                 })
 
+        if not houses or len(houses.get('cusps') or []) != 12:
+            return stelliums
+
+        # Group planets by house
+        placed = [
+            (planet_name, planet_data['longitude'])
+            for planet_name, planet_data in planets.items()
+            if planet_data and 'longitude' in planet_data
+        ]
+        house_numbers = AspectPatternEngine.house_positions(
+            [lon for _, lon in placed], houses['cusps']
+        ).tolist()
+        planets_by_house = {}
+        for (planet_name, _), house in zip(placed, house_numbers):
+            planets_by_house.setdefault(house, []).append(planet_name)
+
+        # Find houses with 3+ planets
+        for house in sorted(planets_by_house):
+            planet_list = planets_by_house[house]
+            if len(planet_list) >= 3:
+                stelliums.append({
+                    'pattern_type': 'stellium',
+                    'planets': planet_list,
+                    'house': house,
+                    'description': f'Stellium in house {house}: {", ".join(planet_list)}'
+                })
+
         return stelliums
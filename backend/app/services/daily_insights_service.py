@@ -5,12 +5,48 @@ Provides proactive daily astrological insights by analyzing current transits
 against the user's natal chart.
 Part of Phase 3: AI Proactive Intelligence
 """
-from typing import Dict, List, Optional, Any
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Sequence
 from datetime import date, datetime, timedelta
 from functools import lru_cache
 
+import numpy as np
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.celestial_registry import CelestialRegistry
+from app.core.database_sqlite import CacheSession
+from app.models.daily_energy_score import DailyEnergyScore
+from app.services.aspect_engine import AspectEngine
+from app.services.event_calendar_service import EventCalendarService
 from app.services.transit_calculator import TransitCalculator
 from app.services.ai_interpreter import AIInterpreter
+from app.utils.ephemeris import EphemerisCalculator
+
+
+@dataclass
+class DailyEnergySeries:
+    """
+    Day energy of a natal chart over many days
+
+    Attributes:
+        days: Dates scored
+        scores: Harmonious share of aspect weight per day (0-100)
+        levels: Energy level per day
+        positive: Harmonious weight among each day's top ten transits
+        challenging: Challenging weight among each day's top ten transits
+        transit_counts: Active transits per day
+        moon_days: Day of the lunar cycle per day
+    """
+    days: List[date]
+    scores: np.ndarray
+    levels: List[str]
+    positive: np.ndarray
+    challenging: np.ndarray
+    transit_counts: np.ndarray
+    moon_days: np.ndarray
 
 
 class DailyInsightsService:
@@ -42,6 +78,46 @@ class DailyInsightsService:
         'quincunx': 3,
     }
 
+    HARMONIOUS_ASPECTS = ('trine', 'sextile', 'conjunction')
+    CHALLENGING_ASPECTS = ('square', 'opposition', 'quincunx')
+
+    # (minimum balance, level, description), checked in order
+    ENERGY_LEVELS = (
+        (70, "highly_positive", "An excellent day with strong supportive cosmic energies."),
+        (55, "positive", "A favorable day with more harmonious than challenging aspects."),
+        (45, "mixed", "A day of balance between opportunities and challenges."),
+        (30, "challenging", "A day requiring patience and careful navigation."),
+        (0, "intense", "An intense day with significant growth opportunities through challenges."),
+    )
+
+    # Transits counted toward the day's energy balance
+    ENERGY_TOP_TRANSITS = 10
+
+    # Transit positions for precomputed scores are taken at noon UTC
+    ENERGY_HOUR_UTC = 12.0
+
+    # Stored scores older than this many days are pruned as new days are added
+    ENERGY_RETENTION_DAYS = 30
+
+    # Longest range scored per preview request
+    MAX_PREVIEW_DAYS = 366
+
+    # New moon reference for the mean lunar cycle
+    NEW_MOON_REFERENCE = date(2000, 1, 6)
+    LUNAR_CYCLE = 29.53
+
+    # (upper day of cycle, phase, description), checked in order
+    MOON_PHASES = (
+        (1.85, "New Moon", "Time for new beginnings and setting intentions."),
+        (7.38, "Waxing Crescent", "Building momentum, taking initial steps."),
+        (9.23, "First Quarter", "Time for action and overcoming obstacles."),
+        (14.77, "Waxing Gibbous", "Refining and adjusting your approach."),
+        (16.61, "Full Moon", "Culmination, clarity, and heightened emotions."),
+        (22.15, "Waning Gibbous", "Time for gratitude and sharing wisdom."),
+        (24.00, "Last Quarter", "Release, forgiveness, and letting go."),
+        (float('inf'), "Waning Crescent", "Rest, reflection, and preparation for new cycle."),
+    )
+
     def __init__(self):
         self.transit_calc = TransitCalculator()
         self.ai_interpreter = AIInterpreter()
@@ -50,7 +126,8 @@ class DailyInsightsService:
         self,
         natal_chart: Dict[str, Any],
         birth_data: Dict[str, Any],
-        target_date: Optional[date] = None
+        target_date: Optional[date] = None,
+        db: Optional[Session] = None
     ) -> Dict[str, Any]:
         """
         Generate comprehensive daily insights based on current transits.
@@ -59,6 +136,7 @@ class DailyInsightsService:
             natal_chart: The user's natal chart data
             birth_data: Birth information (name, date, etc.)
             target_date: Date to generate insights for (defaults to today)
+            db: Database session for the event calendar's exact moon phase
 
         Returns:
             Dictionary containing daily insights, key transits, and recommendations
@@ -80,7 +158,7 @@ class DailyInsightsService:
         day_energy = self._calculate_day_energy(scored_transits)
 
         # Get moon phase info
-        moon_phase = self._get_moon_phase(target_date)
+        moon_phase = self._get_moon_phase(target_date, db)
 
         # Generate AI interpretation if available
         ai_insight = None
@@ -143,20 +221,16 @@ class DailyInsightsService:
                 "description": "A balanced day with no major planetary influences."
             }
 
-        # Categorize aspects
-        harmonious = ['trine', 'sextile', 'conjunction']
-        challenging = ['square', 'opposition', 'quincunx']
-
         positive_score = 0
         challenging_score = 0
 
-        for transit in scored_transits[:10]:  # Top 10 transits
+        for transit in scored_transits[:self.ENERGY_TOP_TRANSITS]:
             aspect = transit.get('aspect_name', '').lower()
             weight = transit.get('significance_score', 1)
 
-            if aspect in harmonious:
+            if aspect in self.HARMONIOUS_ASPECTS:
                 positive_score += weight
-            elif aspect in challenging:
+            elif aspect in self.CHALLENGING_ASPECTS:
                 challenging_score += weight
 
         total = positive_score + challenging_score
@@ -165,21 +239,7 @@ class DailyInsightsService:
         else:
             balance = int((positive_score / total) * 100)
 
-        if balance >= 70:
-            level = "highly_positive"
-            description = "An excellent day with strong supportive cosmic energies."
-        elif balance >= 55:
-            level = "positive"
-            description = "A favorable day with more harmonious than challenging aspects."
-        elif balance >= 45:
-            level = "mixed"
-            description = "A day of balance between opportunities and challenges."
-        elif balance >= 30:
-            level = "challenging"
-            description = "A day requiring patience and careful navigation."
-        else:
-            level = "intense"
-            description = "An intense day with significant growth opportunities through challenges."
+        level, description = self._energy_level(balance)
 
         return {
             "level": level,
@@ -189,39 +249,34 @@ class DailyInsightsService:
             "challenging_score": round(challenging_score, 1)
         }
 
-    def _get_moon_phase(self, target_date: date) -> Dict:
-        """Get the current moon phase."""
+    @classmethod
+    def _energy_level(cls, balance: int) -> tuple:
+        """Level and description for an energy balance (0-100)."""
+        for threshold, level, description in cls.ENERGY_LEVELS:
+            if balance >= threshold:
+                return level, description
+        return cls.ENERGY_LEVELS[-1][1:]
+
+    def _get_moon_phase(self, target_date: date, db: Optional[Session] = None) -> Dict:
+        """
+        Get the moon phase of a day.
+
+        With a database session the phase comes from the exact lunations of
+        the event calendar; otherwise from the mean lunar cycle.
+        """
+        if db is not None:
+            day = EventCalendarService.calendar_days(db, target_date, target_date)[0]
+            descriptions = {phase: description for _, phase, description in self.MOON_PHASES}
+            return {
+                "phase": day['moon_phase'],
+                "description": descriptions.get(day['moon_phase'], ""),
+                "day_of_cycle": round(day['lunar_day'], 1) if day['lunar_day'] is not None else None,
+                "events": [event for event in day['events'] if event['type'] in ('lunation', 'eclipse')],
+            }
+
         # Simple moon phase calculation
-        # New moon reference: January 6, 2000
-        reference = date(2000, 1, 6)
-        days_since_new = (target_date - reference).days
-        lunar_cycle = 29.53
-        phase_day = days_since_new % lunar_cycle
-
-        if phase_day < 1.85:
-            phase = "New Moon"
-            description = "Time for new beginnings and setting intentions."
-        elif phase_day < 7.38:
-            phase = "Waxing Crescent"
-            description = "Building momentum, taking initial steps."
-        elif phase_day < 9.23:
-            phase = "First Quarter"
-            description = "Time for action and overcoming obstacles."
-        elif phase_day < 14.77:
-            phase = "Waxing Gibbous"
-            description = "Refining and adjusting your approach."
-        elif phase_day < 16.61:
-            phase = "Full Moon"
-            description = "Culmination, clarity, and heightened emotions."
-        elif phase_day < 22.15:
-            phase = "Waning Gibbous"
-            description = "Time for gratitude and sharing wisdom."
-        elif phase_day < 24.00:
-            phase = "Last Quarter"
-            description = "Release, forgiveness, and letting go."
-        else:
-            phase = "Waning Crescent"
-            description = "Rest, reflection, and preparation for new cycle."
+        phase_day = (target_date - self.NEW_MOON_REFERENCE).days % self.LUNAR_CYCLE
+        phase, description = self._moon_phase_for_day(phase_day)
 
         return {
             "phase": phase,
@@ -229,6 +284,14 @@ class DailyInsightsService:
             "day_of_cycle": round(phase_day, 1)
         }
 
+    @classmethod
+    def _moon_phase_for_day(cls, phase_day: float) -> tuple:
+        """Phase name and description for a day of the lunar cycle."""
+        for upper, phase, description in cls.MOON_PHASES:
+            if phase_day < upper:
+                return phase, description
+        return cls.MOON_PHASES[-1][1:]
+
     def _generate_ai_insight(
         self,
         key_transits: List[Dict],
@@ -368,26 +431,301 @@ Provide a warm, encouraging 2-3 sentence insight that:
     def get_week_preview(
         self,
         natal_chart: Dict[str, Any],
-        birth_data: Dict[str, Any]
+        birth_data: Dict[str, Any],
+        db: Optional[Session] = None
     ) -> List[Dict]:
         """Generate a preview for the coming week."""
-        preview = []
-        today = date.today()
-
-        for i in range(7):
-            target = today + timedelta(days=i)
-            insights = self.generate_daily_insights(natal_chart, birth_data, target)
-
-            preview.append({
-                "date": target.isoformat(),
-                "day_name": target.strftime("%A"),
-                "energy_level": insights["day_energy"]["level"],
-                "energy_score": insights["day_energy"]["score"],
-                "key_transit_count": len(insights["key_transits"]),
-                "moon_phase": insights["moon_phase"]["phase"],
-            })
+        return self.get_preview(natal_chart, birth_data, days=7, db=db)
+
+    def get_preview(
+        self,
+        natal_chart: Dict[str, Any],
+        birth_data: Dict[str, Any],
+        days: int,
+        start: Optional[date] = None,
+        db: Optional[Session] = None
+    ) -> List[Dict]:
+        """
+        Generate day energy previews for a range of days.
+
+        With a database session and a birth data 'id', previews are read
+        from the precomputed daily energy table and only days not yet
+        stored are calculated; otherwise the range is scored directly.
+        With a session, each day also gets its exact moon phase and sky
+        events from one event calendar range query.
+
+        Args:
+            natal_chart: The user's natal chart data
+            birth_data: Birth information (id, name, ...)
+            days: Number of days to preview
+            start: First day (defaults to today)
+            db: Database session for the precomputed table
+
+        Returns:
+            One preview dict per day (date, day_name, energy_level,
+            energy_score, key_transit_count, moon_phase, plus sky_events
+            with a session)
+        """
+        if not 1 <= days <= self.MAX_PREVIEW_DAYS:
+            raise ValueError(f"days must be between 1 and {self.MAX_PREVIEW_DAYS}")
+        if start is None:
+            start = date.today()
+
+        if db is not None and birth_data.get('id'):
+            previews = self.energy_range(db, birth_data['id'], natal_chart, start, days)
+        else:
+            series = self.score_days(
+                natal_chart.get('planets', {}),
+                [start + timedelta(days=i) for i in range(days)]
+            )
+            previews = self._series_previews(series)
+
+        if db is not None:
+            calendar = EventCalendarService.calendar_days(db, start, start + timedelta(days=days - 1))
+            for preview, sky_day in zip(previews, calendar):
+                preview["moon_phase"] = sky_day['moon_phase']
+                preview["sky_events"] = sky_day['events']
+
+        return previews
+
+    @classmethod
+    def score_days(
+        cls,
+        natal_planets: Dict[str, Optional[Dict]],
+        days: Sequence[date]
+    ) -> DailyEnergySeries:
+        """
+        Score the day energy of a natal chart for many days at once.
+
+        Transit positions for every day come from one ephemeris batch and
+        every transit-to-natal aspect is scored in array form, with the
+        orbs of TransitCalculator and the weights and levels of
+        _score_transits / _calculate_day_energy.
+
+        Args:
+            natal_planets: Natal planet name -> position dict with 'longitude'
+            days: Dates to score (transits taken at noon UTC)
+
+        Returns:
+            DailyEnergySeries in the order of days
+        """
+        days = list(days)
+        natal = [
+            (name, float(data['longitude']))
+            for name, data in natal_planets.items()
+            if data and data.get('longitude') is not None
+        ]
+        natal_names = [name for name, _ in natal]
+        natal_longitudes = np.array([longitude for _, longitude in natal], dtype=np.float64)
+
+        bodies = [
+            body for body in CelestialRegistry.get_planets_for_calculation()
+            if body not in TransitCalculator.NON_TRANSITING_POINTS
+        ]
+        jds = np.array([cls._julian_day(day) for day in days], dtype=np.float64)
+        positions = EphemerisCalculator.calculate_positions_batch(jds, bodies)
+
+        # (day, transiting body, natal planet); failed bodies are NaN and never aspect
+        separation = AspectEngine.cross_separation(positions.longitude, natal_longitudes)
+        # Same-body pairs are skipped except for the Moon, as in TransitCalculator
+        allowed = np.array(
+            [[body != name or body == 'moon' for name in natal_names] for body in bodies],
+            dtype=bool
+        ).reshape(len(bodies), len(natal_names))
+        planet_weights = np.array([cls.PLANET_WEIGHTS.get(body, 1) for body in bodies], dtype=np.float64)
+
+        scores = []
+        kinds = []
+        for aspect, info in TransitCalculator.TRANSIT_ASPECTS.items():
+            deviation = np.abs(separation - info['angle'])
+            hit = (deviation <= info['orb']) & allowed
+            orb_factor = np.maximum(0.1, 1 - np.round(deviation, 2) / 10)
+            weight = planet_weights[:, None] * cls.ASPECT_SIGNIFICANCE.get(aspect, 1) * orb_factor
+            scores.append(np.where(hit, np.round(weight, 2), np.nan))
+            kind = 1 if aspect in cls.HARMONIOUS_ASPECTS else -1 if aspect in cls.CHALLENGING_ASPECTS else 0
+            kinds.append(np.where(hit, kind, 0))
+
+        # Flattened in transit, natal, aspect order so ties rank as in the loop
+        scores = np.stack(scores, axis=-1).reshape(len(days), -1)
+        kinds = np.stack(kinds, axis=-1).reshape(len(days), -1)
+        transit_counts = np.count_nonzero(~np.isnan(scores), axis=1)
+
+        ranked = np.nan_to_num(scores, nan=-1.0)
+        top = np.argsort(-ranked, axis=1, kind='stable')[:, :cls.ENERGY_TOP_TRANSITS]
+        top_scores = np.maximum(np.take_along_axis(ranked, top, axis=1), 0.0)
+        top_kinds = np.take_along_axis(kinds, top, axis=1)
+        positive = np.sum(np.where(top_kinds == 1, top_scores, 0.0), axis=1)
+        challenging = np.sum(np.where(top_kinds == -1, top_scores, 0.0), axis=1)
+
+        total = positive + challenging
+        with np.errstate(divide='ignore', invalid='ignore'):
+            balance = np.where(total > 0, np.floor(positive / total * 100), 50).astype(np.int64)
+
+        levels = [
+            cls._energy_level(int(score))[0] if count else "neutral"
+            for score, count in zip(balance, transit_counts)
+        ]
+        elapsed = np.array([(day - cls.NEW_MOON_REFERENCE).days for day in days], dtype=np.float64)
+
+        return DailyEnergySeries(
+            days=days,
+            scores=balance,
+            levels=levels,
+            positive=np.round(positive, 1),
+            challenging=np.round(challenging, 1),
+            transit_counts=transit_counts,
+            moon_days=np.mod(elapsed, cls.LUNAR_CYCLE),
+        )
+
+    @classmethod
+    def energy_range(
+        cls,
+        db: Session,
+        birth_data_id: str,
+        natal_chart: Dict[str, Any],
+        start: date,
+        days: int
+    ) -> List[Dict]:
+        """
+        Day energy previews read from the precomputed table.
+
+        Days missing from the table (or scored against an older version of
+        the chart) are scored in one batch and stored, so as days roll over
+        only the new ones are calculated.
+
+        Args:
+            db: Database session
+            birth_data_id: Birth data the chart belongs to
+            natal_chart: Natal chart data with 'planets'
+            start: First day
+            days: Number of days
+
+        Returns:
+            One preview dict per day
+        """
+        natal_planets = natal_chart.get('planets', {})
+        key = cls.chart_key(natal_planets)
+        wanted = [start + timedelta(days=i) for i in range(days)]
+
+        rows = db.query(DailyEnergyScore).filter(
+            DailyEnergyScore.birth_data_id == birth_data_id,
+            DailyEnergyScore.day >= wanted[0].isoformat(),
+            DailyEnergyScore.day <= wanted[-1].isoformat(),
+        ).all()
+        previews = {
+            row.day: cls._preview(
+                date.fromisoformat(row.day), row.energy_level, row.energy_score,
+                row.transit_count, row.moon_phase
+            )
+            for row in rows if row.chart_key == key
+        }
+
+        missing = [day for day in wanted if day.isoformat() not in previews]
+        if missing:
+            series = cls.score_days(natal_planets, missing)
+            for preview in cls._series_previews(series):
+                previews[preview['date']] = preview
+            cls._store_energy(db, birth_data_id, key, series)
+
+        return [previews[day.isoformat()] for day in wanted]
+
+    @classmethod
+    def invalidate_energy(cls, birth_data_id: str, db: Session) -> int:
+        """
+        Drop the precomputed energy rows of a birth record (the caller commits).
+
+        Returns:
+            Number of rows deleted
+        """
+        return db.query(DailyEnergyScore).filter(
+            DailyEnergyScore.birth_data_id == birth_data_id
+        ).delete(synchronize_session=False)
+
+    @staticmethod
+    def chart_key(natal_planets: Dict[str, Optional[Dict]]) -> str:
+        """Hash of the natal positions energy scores are computed against."""
+        positions = sorted(
+            (name, round(float(data['longitude']), 6))
+            for name, data in natal_planets.items()
+            if data and data.get('longitude') is not None
+        )
+        encoded = json.dumps(positions, separators=(',', ':'))
+        return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+    @classmethod
+    def _store_energy(
+        cls,
+        db: Session,
+        birth_data_id: str,
+        key: str,
+        series: DailyEnergySeries
+    ) -> None:
+        """Upsert scored days and prune rows that fell out of the window (via CacheSession)."""
+        cutoff = (date.today() - timedelta(days=cls.ENERGY_RETENTION_DAYS)).isoformat()
+        days = [day.isoformat() for day in series.days]
+
+        try:
+            with CacheSession(db) as session:
+                session.query(DailyEnergyScore).filter(
+                    DailyEnergyScore.birth_data_id == birth_data_id,
+                    (DailyEnergyScore.day < cutoff) | DailyEnergyScore.day.in_(days),
+                ).delete(synchronize_session=False)
+
+                for row, day in enumerate(days):
+                    if day < cutoff:
+                        continue
+                    session.add(DailyEnergyScore(
+                        birth_data_id=birth_data_id,
+                        day=day,
+                        chart_key=key,
+                        energy_level=series.levels[row],
+                        energy_score=int(series.scores[row]),
+                        positive_score=float(series.positive[row]),
+                        challenging_score=float(series.challenging[row]),
+                        transit_count=int(series.transit_counts[row]),
+                        moon_phase=cls._moon_phase_for_day(series.moon_days[row])[0],
+                        moon_day=float(series.moon_days[row]),
+                    ))
+        except IntegrityError:
+            # A concurrent request stored the same days first
+            pass
+
+    @classmethod
+    def _series_previews(cls, series: DailyEnergySeries) -> List[Dict]:
+        """Preview dicts of a scored series."""
+        return [
+            cls._preview(
+                day, series.levels[row], int(series.scores[row]),
+                int(series.transit_counts[row]),
+                cls._moon_phase_for_day(series.moon_days[row])[0]
+            )
+            for row, day in enumerate(series.days)
+        ]
+
+    @staticmethod
+    def _preview(
+        day: date,
+        energy_level: str,
+        energy_score: int,
+        transit_count: int,
+        moon_phase: str
+    ) -> Dict:
+        """Preview dict of one day."""
+        return {
+            "date": day.isoformat(),
+            "day_name": day.strftime("%A"),
+            "energy_level": energy_level,
+            "energy_score": energy_score,
+            "key_transit_count": min(transit_count, 5),
+            "moon_phase": moon_phase,
+        }
 
-        return preview
+    @classmethod
+    def _julian_day(cls, day: date) -> float:
+        """Julian Day of a date at the energy sampling hour (UTC)."""
+        return EphemerisCalculator.datetime_to_julian_day(
+            datetime(day.year, day.month, day.day) + timedelta(hours=cls.ENERGY_HOUR_UTC)
+        )
 
 
 # Singleton instance
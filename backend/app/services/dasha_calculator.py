@@ -8,12 +8,33 @@ by different planets, based on the Moon's nakshatra position at birth.
 The sequence of planetary periods:
 Ketu (7) → Venus (20) → Sun (6) → Moon (10) → Mars (7) →
 Rahu (18) → Jupiter (16) → Saturn (19) → Mercury (17) = 120 years
+
+Each period divides into nine sub-periods in the same proportions, starting
+with its own lord, down to five levels (Mahadasha, Antardasha,
+Pratyantardasha, Sookshmadasha, Pranadasha). DashaTimeline keeps the
+boundaries of each level as flat float arrays and derives sub-levels only
+when they are asked for.
 """
 
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
 from dataclasses import dataclass
 
+import numpy as np
+
+from app.utils import nakshatra
+from app.utils.ephemeris import EphemerisCalculator
+
+
+# Dasha levels, outermost first; a level's depth is its index here
+DASHA_LEVELS = ('mahadasha', 'antardasha', 'pratyantardasha', 'sookshmadasha', 'pranadasha')
+
+# Dasha years are Julian years
+DAYS_PER_YEAR = 365.25
+
+# Safety limit - don't generate more than 10 cycles (1200 years)
+MAX_MAHADASHAS = 91
+
 
 @dataclass
 class DashaPeriod:
@@ -22,7 +43,7 @@ class DashaPeriod:
     start_date: datetime
     end_date: datetime
     duration_years: float
-    level: str  # 'mahadasha', 'antardasha', 'pratyantardasha'
+    level: str  # one of DASHA_LEVELS
     parent_planet: Optional[str] = None
 
 
@@ -57,36 +78,7 @@ class VimshottariDashaCalculator:
     DASHA_SEQUENCE = ['ketu', 'venus', 'sun', 'moon', 'mars', 'rahu', 'jupiter', 'saturn', 'mercury']
 
     # Nakshatra lords in sequence (27 nakshatras, each ruled by one of 9 planets)
-    # This cycles through the 9 planets 3 times
-    NAKSHATRA_LORDS = [
-        'ketu',     # 1. Ashwini
-        'venus',    # 2. Bharani
-        'sun',      # 3. Krittika
-        'moon',     # 4. Rohini
-        'mars',     # 5. Mrigashira
-        'rahu',     # 6. Ardra
-        'jupiter',  # 7. Punarvasu
-        'saturn',   # 8. Pushya
-        'mercury',  # 9. Ashlesha
-        'ketu',     # 10. Magha
-        'venus',    # 11. Purva Phalguni
-        'sun',      # 12. Uttara Phalguni
-        'moon',     # 13. Hasta
-        'mars',     # 14. Chitra
-        'rahu',     # 15. Swati
-        'jupiter',  # 16. Vishakha
-        'saturn',   # 17. Anuradha
-        'mercury',  # 18. Jyeshtha
-        'ketu',     # 19. Mula
-        'venus',    # 20. Purva Ashadha
-        'sun',      # 21. Uttara Ashadha
-        'moon',     # 22. Shravana
-        'mars',     # 23. Dhanishta
-        'rahu',     # 24. Shatabhisha
-        'jupiter',  # 25. Purva Bhadrapada
-        'saturn',   # 26. Uttara Bhadrapada
-        'mercury',  # 27. Revati
-    ]
+    NAKSHATRA_LORDS = nakshatra.NAKSHATRA_LORDS
 
     # Planet display names and colors for UI
     PLANET_INFO = {
@@ -127,57 +119,34 @@ class VimshottariDashaCalculator:
             - current_antardasha: Currently active Antardasha (if applicable)
             - calculation_info: Metadata about the calculation
         """
-        # Calculate nakshatra and dasha starting point
-        nakshatra_info = cls._get_nakshatra_info(moon_longitude)
-        starting_planet = cls.NAKSHATRA_LORDS[nakshatra_info['number'] - 1]
-
-        # Calculate elapsed portion of first Dasha
-        elapsed_fraction = nakshatra_info['degrees_in_nakshatra'] / 13.333333
+        timeline = cls.calculate_timeline(moon_longitude, birth_datetime, calculate_to_date)
+        nakshatra_info, starting_planet, remaining_years = cls._dasha_start(moon_longitude)
         first_dasha_years = cls.MAHADASHA_YEARS[starting_planet]
-        remaining_years = first_dasha_years * (1 - elapsed_fraction)
 
-        # End date for calculations
-        if calculate_to_date is None:
-            calculate_to_date = birth_datetime + timedelta(days=365.25 * cls.CYCLE_DURATION)
-
-        # Generate all mahadashas
-        mahadashas = cls._generate_mahadashas(
-            birth_datetime,
-            starting_planet,
-            remaining_years,
-            calculate_to_date
-        )
-
-        # Add antardashas if requested
+        # Whole levels at once; children of each period are consecutive rows
+        mahadashas = timeline.period_dicts(timeline.level(0))
         if include_antardashas:
-            for maha in mahadashas:
-                maha['antardashas'] = cls._calculate_antardashas(
-                    maha['planet'],
-                    maha['start_date'],
-                    maha['end_date']
-                )
-
-                # Add pratyantardashas if requested
-                if include_pratyantardashas:
-                    for antar in maha['antardashas']:
-                        antar['pratyantardashas'] = cls._calculate_pratyantardashas(
-                            maha['planet'],
-                            antar['planet'],
-                            antar['start_date'],
-                            antar['end_date']
-                        )
+            antardashas = timeline.period_dicts(timeline.level(1))
+            for row, maha in enumerate(mahadashas):
+                maha['antardashas'] = antardashas[9 * row:9 * row + 9]
+
+            if include_pratyantardashas:
+                pratyantardashas = timeline.period_dicts(timeline.level(2))
+                for row, antar in enumerate(antardashas):
+                    antar['pratyantardashas'] = pratyantardashas[9 * row:9 * row + 9]
 
         # Find current periods
-        now = datetime.now()
-        current_maha = cls._find_current_period(mahadashas, now)
+        depth = 2 if include_antardashas and include_pratyantardashas else int(include_antardashas)
+        path = timeline.path_at(datetime.now(), depth)
+        current_maha = mahadashas[path[0]] if path else None
         current_antar = None
         current_pratyantar = None
 
-        if current_maha and include_antardashas and 'antardashas' in current_maha:
-            current_antar = cls._find_current_period(current_maha['antardashas'], now)
+        if current_maha and len(path) > 1:
+            current_antar = current_maha['antardashas'][path[1]]
 
-            if current_antar and include_pratyantardashas and 'pratyantardashas' in current_antar:
-                current_pratyantar = cls._find_current_period(current_antar['pratyantardashas'], now)
+            if len(path) > 2:
+                current_pratyantar = current_antar['pratyantardashas'][path[2]]
 
         return {
             'mahadashas': mahadashas,
@@ -195,193 +164,110 @@ class VimshottariDashaCalculator:
         }
 
     @classmethod
-    def _get_nakshatra_info(cls, longitude: float) -> Dict:
-        """Get nakshatra details for a given longitude"""
-        nakshatra_span = 13.333333
-        nakshatra_index = int(longitude / nakshatra_span)
-        degrees_in_nakshatra = longitude % nakshatra_span
-        pada = int(degrees_in_nakshatra / (nakshatra_span / 4)) + 1
-
-        nakshatra_names = [
-            'Ashwini', 'Bharani', 'Krittika', 'Rohini', 'Mrigashira',
-            'Ardra', 'Punarvasu', 'Pushya', 'Ashlesha', 'Magha',
-            'Purva Phalguni', 'Uttara Phalguni', 'Hasta', 'Chitra', 'Swati',
-            'Vishakha', 'Anuradha', 'Jyeshtha', 'Mula', 'Purva Ashadha',
-            'Uttara Ashadha', 'Shravana', 'Dhanishta', 'Shatabhisha',
-            'Purva Bhadrapada', 'Uttara Bhadrapada', 'Revati'
-        ]
-
-        return {
-            'number': nakshatra_index + 1,
-            'name': nakshatra_names[nakshatra_index],
-            'lord': cls.NAKSHATRA_LORDS[nakshatra_index],
-            'pada': pada,
-            'degrees_in_nakshatra': degrees_in_nakshatra,
-        }
-
-    @classmethod
-    def _generate_mahadashas(
+    def calculate_timeline(
         cls,
+        moon_longitude: float,
         birth_datetime: datetime,
-        starting_planet: str,
-        remaining_years: float,
-        calculate_to_date: datetime
-    ) -> List[Dict]:
-        """Generate all Mahadasha periods"""
-        mahadashas = []
-        current_date = birth_datetime
-
-        # Find starting position in sequence
-        start_idx = cls.DASHA_SEQUENCE.index(starting_planet)
-
-        # Generate periods until we reach the end date
-        period_num = 0
-        while current_date < calculate_to_date:
-            idx = (start_idx + period_num) % len(cls.DASHA_SEQUENCE)
-            planet = cls.DASHA_SEQUENCE[idx]
-
-            # First period uses remaining years, subsequent use full duration
-            if period_num == 0:
-                duration_years = remaining_years
-            else:
-                duration_years = cls.MAHADASHA_YEARS[planet]
-
-            end_date = current_date + timedelta(days=duration_years * 365.25)
+        calculate_to_date: Optional[datetime] = None
+    ) -> 'DashaTimeline':
+        """
+        Build a lazy Dasha timeline from birth.
 
-            planet_info = cls.PLANET_INFO[planet]
+        Only the Mahadasha boundaries are computed up front; sub-periods down
+        to Pranadasha are derived on demand, so looking up the periods at a
+        date never builds the whole tree.
 
-            mahadashas.append({
-                'planet': planet,
-                'planet_name': planet_info['name'],
-                'symbol': planet_info['symbol'],
-                'color': planet_info['color'],
-                'start_date': current_date,
-                'end_date': end_date,
-                'duration_years': duration_years,
-                'level': 'mahadasha',
-                'period_number': period_num + 1,
-            })
+        Args:
+            moon_longitude: Moon's sidereal longitude at birth (0-360°)
+            birth_datetime: Birth date and time
+            calculate_to_date: Cover up to this date (default: 120 years from birth)
 
-            current_date = end_date
-            period_num += 1
+        Returns:
+            DashaTimeline for the birth
+        """
+        _, starting_planet, remaining_years = cls._dasha_start(moon_longitude)
 
-            # Safety limit - don't generate more than 10 cycles (1200 years)
-            if period_num > 90:
-                break
+        if calculate_to_date is None:
+            calculate_to_date = birth_datetime + timedelta(days=DAYS_PER_YEAR * cls.CYCLE_DURATION)
 
-        return mahadashas
+        return DashaTimeline(
+            birth_datetime,
+            cls.DASHA_SEQUENCE.index(starting_planet),
+            remaining_years,
+            (calculate_to_date - birth_datetime).total_seconds() / 86400.0
+        )
 
     @classmethod
-    def _calculate_antardashas(
+    def timeline_for_birth_data(
         cls,
-        mahadasha_planet: str,
-        maha_start: datetime,
-        maha_end: datetime
-    ) -> List[Dict]:
+        birth_data,
+        ayanamsa: str = 'lahiri',
+        calculate_years: int = CYCLE_DURATION
+    ) -> 'DashaTimeline':
         """
-        Calculate Antardasha (sub-periods) within a Mahadasha.
-
-        The antardasha sequence always starts with the mahadasha lord,
-        then follows the normal dasha sequence.
-        """
-        antardashas = []
-        maha_duration = (maha_end - maha_start).total_seconds()
-
-        # Find starting position (same as mahadasha planet)
-        start_idx = cls.DASHA_SEQUENCE.index(mahadasha_planet)
-        current_date = maha_start
-
-        for i in range(9):  # 9 sub-periods
-            idx = (start_idx + i) % len(cls.DASHA_SEQUENCE)
-            planet = cls.DASHA_SEQUENCE[idx]
-
-            # Antardasha duration is proportional to mahadasha years of each planet
-            proportion = cls.MAHADASHA_YEARS[planet] / cls.CYCLE_DURATION
-            duration_seconds = maha_duration * proportion
-            duration_years = duration_seconds / (365.25 * 24 * 3600)
-
-            end_date = current_date + timedelta(seconds=duration_seconds)
-            planet_info = cls.PLANET_INFO[planet]
-
-            antardashas.append({
-                'planet': planet,
-                'planet_name': planet_info['name'],
-                'symbol': planet_info['symbol'],
-                'color': planet_info['color'],
-                'start_date': current_date,
-                'end_date': end_date,
-                'duration_years': duration_years,
-                'level': 'antardasha',
-                'parent_planet': mahadasha_planet,
-            })
+        Build a Dasha timeline for a BirthData record.
 
-            current_date = end_date
-
-        return antardashas
+        Args:
+            birth_data: BirthData row (birth_date, birth_time, utc_offset)
+            ayanamsa: Ayanamsa system for the Moon's sidereal position
+            calculate_years: Years to cover from birth
 
-    @classmethod
-    def _calculate_pratyantardashas(
-        cls,
-        mahadasha_planet: str,
-        antardasha_planet: str,
-        antar_start: datetime,
-        antar_end: datetime
-    ) -> List[Dict]:
+        Returns:
+            DashaTimeline for the birth
         """
-        Calculate Pratyantardasha (sub-sub-periods) within an Antardasha.
+        birth_datetime, moon_longitude = cls.birth_moon(birth_data, ayanamsa)
+        return cls.calculate_timeline(
+            moon_longitude,
+            birth_datetime,
+            birth_datetime + timedelta(days=DAYS_PER_YEAR * calculate_years)
+        )
 
-        Starts with the antardasha lord, then follows normal sequence.
+    @staticmethod
+    def birth_moon(birth_data, ayanamsa: str = 'lahiri') -> Tuple[datetime, float]:
         """
-        pratyantardashas = []
-        antar_duration = (antar_end - antar_start).total_seconds()
-
-        start_idx = cls.DASHA_SEQUENCE.index(antardasha_planet)
-        current_date = antar_start
-
-        for i in range(9):
-            idx = (start_idx + i) % len(cls.DASHA_SEQUENCE)
-            planet = cls.DASHA_SEQUENCE[idx]
+        Local birth datetime and the Moon's sidereal longitude for a BirthData record
 
-            proportion = cls.MAHADASHA_YEARS[planet] / cls.CYCLE_DURATION
-            duration_seconds = antar_duration * proportion
-            duration_years = duration_seconds / (365.25 * 24 * 3600)
-
-            end_date = current_date + timedelta(seconds=duration_seconds)
-            planet_info = cls.PLANET_INFO[planet]
+        Unknown birth times use midnight.
+        """
+        birth_date = datetime.strptime(birth_data.birth_date, "%Y-%m-%d").date()
+        birth_time = (
+            datetime.strptime(birth_data.birth_time, "%H:%M:%S").time()
+            if birth_data.birth_time
+            else datetime.min.time()
+        )
+        birth_datetime = datetime.combine(birth_date, birth_time)
 
-            pratyantardashas.append({
-                'planet': planet,
-                'planet_name': planet_info['name'],
-                'symbol': planet_info['symbol'],
-                'color': planet_info['color'],
-                'start_date': current_date,
-                'end_date': end_date,
-                'duration_years': duration_years,
-                'level': 'pratyantardasha',
-                'parent_planet': antardasha_planet,
-            })
+        jd = EphemerisCalculator.datetime_to_julian_day(birth_datetime, birth_data.utc_offset or 0)
+        moon_position = EphemerisCalculator.calculate_planet_position(
+            'moon', jd, zodiac='sidereal', ayanamsa=ayanamsa
+        )
+        return birth_datetime, moon_position['longitude']
 
-            current_date = end_date
+    @staticmethod
+    def local_datetime(value: Optional[datetime], birth_data) -> Optional[datetime]:
+        """
+        A datetime as the naive birth-place time Dasha timelines use
 
-        return pratyantardashas
+        Naive values are taken as birth-place time already; aware values
+        are converted with the record's UTC offset.
+        """
+        if value is None or value.tzinfo is None:
+            return value
+        offset = timezone(timedelta(minutes=birth_data.utc_offset or 0))
+        return value.astimezone(offset).replace(tzinfo=None)
 
     @classmethod
-    def _find_current_period(cls, periods: List[Dict], target_date: datetime) -> Optional[Dict]:
-        """Find the period containing the target date"""
-        for period in periods:
-            start = period['start_date']
-            end = period['end_date']
+    def _dasha_start(cls, moon_longitude: float) -> Tuple[Dict, str, float]:
+        """Moon's nakshatra, first Dasha lord and years of it left at birth"""
+        position = nakshatra.locate(moon_longitude)
+        nakshatra_info = position.info()
+        starting_planet = nakshatra_info['lord']
 
-            # Handle both datetime objects and strings
-            if isinstance(start, str):
-                start = datetime.fromisoformat(start)
-            if isinstance(end, str):
-                end = datetime.fromisoformat(end)
-
-            if start <= target_date < end:
-                return period
+        # Calculate elapsed portion of first Dasha
+        elapsed_fraction = float(position.fraction)
+        remaining_years = cls.MAHADASHA_YEARS[starting_planet] * (1 - elapsed_fraction)
 
-        return None
+        return nakshatra_info, starting_planet, remaining_years
 
     @classmethod
     def format_dasha_string(
@@ -443,6 +329,294 @@ class VimshottariDashaCalculator:
         return summary
 
 
+_LORD_YEARS = np.array(
+    [VimshottariDashaCalculator.MAHADASHA_YEARS[planet] for planet in VimshottariDashaCalculator.DASHA_SEQUENCE],
+    dtype=np.float64
+)
+
+# Row l: lords of the nine sub-periods of a period ruled by lord l (a
+# sub-sequence starts with the parent's own lord)
+_SUB_LORDS = (np.arange(9)[:, None] + np.arange(9)[None, :]) % 9
+
+# Row l: sub-period boundaries as fractions of a period ruled by lord l
+_SUB_BOUNDS = np.concatenate(
+    [np.zeros((9, 1)), np.cumsum(_LORD_YEARS[_SUB_LORDS], axis=1) / VimshottariDashaCalculator.CYCLE_DURATION],
+    axis=1
+)
+
+
+@dataclass
+class DashaLevel:
+    """
+    Periods of one Dasha level as flat arrays
+
+    Rows are in time order. When a level is derived from the one above, the
+    nine children of each parent are consecutive rows.
+
+    Attributes:
+        depth: Index into DASHA_LEVELS
+        starts: Period starts in days from birth
+        ends: Period ends in days from birth
+        lords: Period lords as indices into DASHA_SEQUENCE
+        parents: Parent period lords (-1 for Mahadashas)
+        paths: Row index at every level down to this one, shaped (n, depth + 1)
+    """
+    depth: int
+    starts: np.ndarray
+    ends: np.ndarray
+    lords: np.ndarray
+    parents: np.ndarray
+    paths: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def select(self, rows) -> 'DashaLevel':
+        """Subset of the periods (boolean mask, index array or slice)"""
+        return DashaLevel(
+            depth=self.depth,
+            starts=self.starts[rows],
+            ends=self.ends[rows],
+            lords=self.lords[rows],
+            parents=self.parents[rows],
+            paths=self.paths[rows],
+        )
+
+
+class DashaTimeline:
+    """
+    Lazy Vimshottari Dasha tree
+
+    Mahadasha boundaries are computed when the timeline is built. The nine
+    children of a period are derived from its boundaries and lord the first
+    time they are needed and then cached, so a lookup at any depth only
+    touches the periods on its path. Lookups bisect the boundary arrays one
+    level at a time.
+
+    A period is addressed by its path: the row index at each level, e.g.
+    (3, 0, 5) is the sixth Pratyantardasha of the first Antardasha of the
+    fourth Mahadasha.
+    """
+
+    def __init__(
+        self,
+        birth_datetime: datetime,
+        starting_lord: int,
+        first_dasha_years: float,
+        span_days: float
+    ):
+        """
+        Args:
+            birth_datetime: Birth date and time
+            starting_lord: First Dasha lord as an index into DASHA_SEQUENCE
+            first_dasha_years: Years of the first Dasha left at birth
+            span_days: Generate Mahadashas until this many days after birth
+        """
+        self.birth_datetime = birth_datetime
+
+        # First period uses remaining years, subsequent use full duration
+        years = []
+        elapsed = 0.0
+        while elapsed < span_days and len(years) < MAX_MAHADASHAS:
+            lord = (starting_lord + len(years)) % 9
+            duration = first_dasha_years if not years else float(_LORD_YEARS[lord])
+            years.append(duration)
+            elapsed += duration * DAYS_PER_YEAR
+
+        count = len(years)
+        bounds = np.concatenate([[0.0], np.cumsum(years) * DAYS_PER_YEAR])
+        self.mahadashas = DashaLevel(
+            depth=0,
+            starts=bounds[:-1],
+            ends=bounds[1:],
+            lords=(starting_lord + np.arange(count)) % 9,
+            parents=np.full(count, -1),
+            paths=np.arange(count)[:, None],
+        )
+        self._children: Dict[Tuple[int, ...], DashaLevel] = {}
+
+    def days_from_birth(self, when: datetime) -> float:
+        """Days from birth to a date"""
+        return (when - self.birth_datetime).total_seconds() / 86400.0
+
+    def to_datetime(self, days: float) -> datetime:
+        """Date a number of days after birth"""
+        return self.birth_datetime + timedelta(days=days)
+
+    def to_datetimes(self, days: np.ndarray) -> List[datetime]:
+        """Dates for an array of days after birth (to the microsecond)"""
+        birth = np.datetime64(self.birth_datetime.replace(tzinfo=None), 'us')
+        offsets = np.rint(np.asarray(days, dtype=np.float64) * 86400e6).astype('timedelta64[us]')
+        dates = (birth + offsets).tolist()
+        if self.birth_datetime.tzinfo is not None:
+            dates = [date.replace(tzinfo=self.birth_datetime.tzinfo) for date in dates]
+        return dates
+
+    def children(self, path: Sequence[int]) -> DashaLevel:
+        """
+        The nine sub-periods of a period, derived on first use
+
+        Args:
+            path: Path of the parent period (1 to 4 indices)
+
+        Returns:
+            DashaLevel one level below the parent
+        """
+        path = tuple(path)
+        if not 1 <= len(path) < len(DASHA_LEVELS):
+            raise ValueError(f"Path must have 1 to {len(DASHA_LEVELS) - 1} levels")
+
+        level = self._children.get(path)
+        if level is None:
+            parent = self.mahadashas if len(path) == 1 else self.children(path[:-1])
+            if not 0 <= path[-1] < len(parent):
+                raise IndexError(f"No Dasha period at path {path}")
+            level = self._subdivide(parent.select(slice(path[-1], path[-1] + 1)))
+            self._children[path] = level
+        return level
+
+    def path_at(self, when: datetime, depth: int = len(DASHA_LEVELS) - 1) -> Optional[Tuple[int, ...]]:
+        """
+        Path of the periods containing a date
+
+        Args:
+            when: Date to look up
+            depth: Deepest level to descend to (index into DASHA_LEVELS)
+
+        Returns:
+            Path with depth + 1 indices, or None if the date is outside the
+            timeline
+        """
+        days = self.days_from_birth(when)
+        level = self.mahadashas
+        path = ()
+        while True:
+            # First period ending after the date; periods are [start, end)
+            index = int(np.searchsorted(level.ends, days, side='right'))
+            if index >= len(level) or days < level.starts[index]:
+                return None
+            path += (index,)
+            if len(path) > depth:
+                return path
+            level = self.children(path)
+
+    def periods_at(self, when: datetime, depth: int = len(DASHA_LEVELS) - 1) -> List[Dict]:
+        """
+        Periods containing a date, Mahadasha first
+
+        Returns:
+            One period dict per level down to depth, or an empty list if the
+            date is outside the timeline
+        """
+        path = self.path_at(when, depth)
+        if path is None:
+            return []
+        return [self.period(path[:length]) for length in range(1, len(path) + 1)]
+
+    def period(self, path: Sequence[int]) -> Dict:
+        """Period dict for a path"""
+        path = tuple(path)
+        level = self.mahadashas if len(path) == 1 else self.children(path[:-1])
+        if not 0 <= path[-1] < len(level):
+            raise IndexError(f"No Dasha period at path {path}")
+        return self.period_dicts(level.select(slice(path[-1], path[-1] + 1)))[0]
+
+    def level(
+        self,
+        depth: int,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None
+    ) -> DashaLevel:
+        """
+        Every period of one level, optionally only those overlapping a range
+
+        Levels are subdivided as whole arrays, pruning periods outside the
+        range before each step, so a narrow range stays cheap at any depth.
+
+        Args:
+            depth: Level to return (index into DASHA_LEVELS)
+            start: Keep periods ending after this date
+            end: Keep periods starting before this date
+
+        Returns:
+            DashaLevel of the periods in time order
+        """
+        if not 0 <= depth < len(DASHA_LEVELS):
+            raise ValueError(f"Depth must be 0 to {len(DASHA_LEVELS) - 1}")
+
+        low = -np.inf if start is None else self.days_from_birth(start)
+        high = np.inf if end is None else self.days_from_birth(end)
+
+        level = self.mahadashas
+        while True:
+            level = level.select((level.ends > low) & (level.starts < high))
+            if level.depth == depth:
+                return level
+            level = self._subdivide(level)
+
+    def period_dicts(self, level: DashaLevel, include_path: bool = False) -> List[Dict]:
+        """
+        Period dicts (as returned by VimshottariDashaCalculator.calculate)
+
+        Args:
+            level: Periods to convert
+            include_path: Add each period's path under 'path'
+
+        Returns:
+            List of period dicts with datetime start and end dates
+        """
+        sequence = VimshottariDashaCalculator.DASHA_SEQUENCE
+        level_name = DASHA_LEVELS[level.depth]
+
+        periods = []
+        for start, end, start_date, end_date, lord, parent, path in zip(
+            level.starts.tolist(), level.ends.tolist(),
+            self.to_datetimes(level.starts), self.to_datetimes(level.ends),
+            level.lords.tolist(), level.parents.tolist(), level.paths.tolist()
+        ):
+            planet = sequence[lord]
+            planet_info = VimshottariDashaCalculator.PLANET_INFO[planet]
+            period = {
+                'planet': planet,
+                'planet_name': planet_info['name'],
+                'symbol': planet_info['symbol'],
+                'color': planet_info['color'],
+                'start_date': start_date,
+                'end_date': end_date,
+                'duration_years': (end - start) / DAYS_PER_YEAR,
+                'level': level_name,
+            }
+            if level.depth == 0:
+                period['period_number'] = path[0] + 1
+            else:
+                period['parent_planet'] = sequence[parent]
+            if include_path:
+                period['path'] = path
+            periods.append(period)
+
+        return periods
+
+    @staticmethod
+    def _subdivide(level: DashaLevel) -> DashaLevel:
+        """Split every period of a level into its nine sub-periods"""
+        durations = level.ends - level.starts
+        bounds = level.starts[:, None] + durations[:, None] * _SUB_BOUNDS[level.lords]
+        # Last child ends exactly where its parent does
+        bounds[:, -1] = level.ends
+
+        return DashaLevel(
+            depth=level.depth + 1,
+            starts=bounds[:, :-1].ravel(),
+            ends=bounds[:, 1:].ravel(),
+            lords=_SUB_LORDS[level.lords].ravel(),
+            parents=np.repeat(level.lords, 9),
+            paths=np.concatenate(
+                [np.repeat(level.paths, 9, axis=0), np.tile(np.arange(9), len(level))[:, None]],
+                axis=1
+            ),
+        )
+
+
 # Example usage and testing
 if __name__ == "__main__":
     # Test calculation for a birth chart
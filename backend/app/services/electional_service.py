@@ -0,0 +1,643 @@
+"""
+Electional search
+Finds time windows that satisfy a set of astrological constraints
+
+Every constraint compiles to a sorted list of disjoint (start_jd, end_jd)
+intervals, and a search is a chain of interval intersections:
+
+- moon_phase, event, retrograde and sign constraints are read from the
+  stored event calendar (lunations, stations, ingresses, eclipses and
+  void-of-course windows), with no ephemeris sampling at all
+- aspect and angular constraints are threshold crossings of a continuous
+  orb function, sampled with the batched ephemeris at a step derived from
+  the bodies' maximum speeds and refined to the exact crossing
+
+Required constraints are applied cheapest first, and sampled constraints
+are only evaluated inside the windows that survive the earlier ones, so a
+long search never scans minute by minute. Optional constraints then score
+the surviving windows by how much of each window they cover.
+"""
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import swisseph as swe
+from sqlalchemy.orm import Session
+
+from app.services.event_calendar_service import EventCalendarService
+from app.services.exact_event_calculator import ExactEventCalculator
+from app.utils.ephemeris import EphemerisCalculator, SIGN_NAMES
+
+Interval = Tuple[float, float]
+
+
+class ElectionalSearchService:
+    """
+    Service for constraint-based searches of the sky
+
+    Constraints are dicts with a 'type' and type-specific keys, plus:
+    - negate: match when the condition does not hold (default False)
+    - required: windows must satisfy it; otherwise it only scores (default True)
+    - weight: score weight of an optional constraint (default 1.0)
+    - label: display name (default built from the constraint)
+
+    Types:
+    - moon_phase: phase 'waxing' (New to Full Moon) or 'waning'
+    - event: event_type from the event calendar, optional body, and
+      within_days of padding around each event (e.g., no Mercury station
+      within 3 days: event_type 'station', body 'mercury', within_days 3,
+      negate True; not void of course: event_type 'void_of_course', negate True)
+    - retrograde: body is retrograde
+    - sign: body is in one of signs
+    - aspect: body within orb of any of aspects to any of targets
+      (e.g., Venus unafflicted: body 'venus', targets ['mars', 'saturn'],
+      aspects ['conjunction', 'square', 'opposition'], negate True)
+    - angular: body within orb of the Ascendant, MC, Descendant or IC
+      (or the listed angles) at the search location
+    """
+
+    CONSTRAINT_TYPES = ('moon_phase', 'event', 'retrograde', 'sign', 'aspect', 'angular')
+
+    # Constraints read from the calendar cost nothing to apply; sampled
+    # ones are applied last, inside the windows that are left
+    CONSTRAINT_COST = {
+        'moon_phase': 0,
+        'event': 0,
+        'retrograde': 0,
+        'sign': 0,
+        'aspect': 1,
+        'angular': 2,
+    }
+
+    ASPECT_ANGLES = {
+        'conjunction': 0.0,
+        'sextile': 60.0,
+        'square': 90.0,
+        'trine': 120.0,
+        'opposition': 180.0,
+    }
+
+    ANGLES = ('ascendant', 'mc', 'descendant', 'ic')
+
+    DEFAULT_ORBS = {
+        'aspect': 3.0,
+        'angular': 5.0,
+    }
+
+    MAX_ORB = 15.0
+
+    MAX_WITHIN_DAYS = 30.0
+
+    # Upper bound on the angles' motion along the ecliptic, degrees per
+    # day (about three times the mean rate, reached below the polar circles)
+    MAX_ANGLE_SPEED = 1080.0
+
+    # Longest sample step in days for sampled constraints
+    MAX_SAMPLE_DAYS = 0.5
+
+    # Body sampling for angular constraints, interpolated between samples
+    # (off by under 0.02 degree for the Moon)
+    BODY_SAMPLE_DAYS = 0.25
+
+    MAX_RANGE_DAYS = 366
+
+    MAX_CONSTRAINTS = 20
+
+    @classmethod
+    def search(
+        cls,
+        db: Session,
+        start: date,
+        end: date,
+        constraints: Sequence[Dict[str, Any]],
+        latitude: Optional[float] = None,
+        longitude: Optional[float] = None,
+        min_duration_minutes: float = 0.0,
+        limit: int = 20
+    ) -> Dict[str, Any]:
+        """
+        Find and rank the windows of a date range that satisfy the constraints
+
+        Args:
+            db: Database session (event calendar)
+            start: First day (UTC)
+            end: Last day, inclusive (UTC)
+            constraints: Constraint dicts (see class docstring)
+            latitude: Search location latitude (angular constraints)
+            longitude: Search location longitude (angular constraints)
+            min_duration_minutes: Drop shorter windows
+            limit: Number of ranked windows to return
+
+        Returns:
+            Dict with:
+            - window_count: windows satisfying every required constraint
+            - total_minutes: their combined length
+            - windows: the best `limit` windows, ranked by optional
+              constraint score then length, each with start/end dates and
+              Julian Days, duration_minutes, score and per-constraint coverage
+        """
+        if end < start:
+            raise ValueError("end must not be before start")
+        if (end - start).days >= cls.MAX_RANGE_DAYS:
+            raise ValueError(f"Range must be at most {cls.MAX_RANGE_DAYS} days")
+        if not constraints:
+            raise ValueError("At least one constraint is required")
+        if len(constraints) > cls.MAX_CONSTRAINTS:
+            raise ValueError(f"At most {cls.MAX_CONSTRAINTS} constraints can be used")
+
+        constraints = [cls.normalize_constraint(c, latitude, longitude) for c in constraints]
+        jd_start = cls._julian_day(start)
+        jd_end = cls._julian_day(end + timedelta(days=1))
+
+        required = sorted(
+            (c for c in constraints if c['required']), key=lambda c: cls.CONSTRAINT_COST[c['type']]
+        )
+        optional = [c for c in constraints if not c['required']]
+
+        windows: List[Interval] = [(jd_start, jd_end)]
+        for constraint in required:
+            windows = cls.intersect(windows, cls.compile_constraint(
+                db, constraint, windows, latitude, longitude
+            ))
+            if not windows:
+                break
+
+        min_days = max(0.0, min_duration_minutes) / 1440.0
+        windows = [(low, high) for low, high in windows if high - low >= min_days]
+
+        coverage = []
+        for constraint in optional:
+            matched = cls.compile_constraint(db, constraint, windows, latitude, longitude)
+            coverage.append(cls._coverage(windows, matched))
+
+        ranked = []
+        for index, (low, high) in enumerate(windows):
+            covered = [
+                {'label': constraint['label'], 'coverage': round(float(share[index]), 4)}
+                for constraint, share in zip(optional, coverage)
+            ]
+            score = sum(constraint['weight'] * share[index] for constraint, share in zip(optional, coverage))
+            ranked.append((score, high - low, low, high, covered))
+        ranked.sort(key=lambda window: (-window[0], -window[1], window[2]))
+
+        return {
+            'start_date': start.isoformat(),
+            'end_date': end.isoformat(),
+            'constraints': constraints,
+            'window_count': len(windows),
+            'total_minutes': round(sum(high - low for low, high in windows) * 1440.0, 1),
+            'windows': [
+                {
+                    'start': EphemerisCalculator.julian_day_to_datetime(low).isoformat(),
+                    'end': EphemerisCalculator.julian_day_to_datetime(high).isoformat(),
+                    'start_jd': low,
+                    'end_jd': high,
+                    'duration_minutes': round((high - low) * 1440.0, 1),
+                    'score': round(float(score), 4),
+                    'optional': covered,
+                }
+                for score, _, low, high, covered in ranked[:limit]
+            ],
+        }
+
+    @classmethod
+    def normalize_constraint(
+        cls,
+        constraint: Dict[str, Any],
+        latitude: Optional[float] = None,
+        longitude: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Validate a constraint and fill in its defaults
+
+        Raises:
+            ValueError: Unknown type, body, phase, event type, sign,
+                aspect or angle, an out-of-range orb, or an angular
+                constraint without a location
+        """
+        kind = constraint.get('type')
+        if kind not in cls.CONSTRAINT_TYPES:
+            raise ValueError(f"Unknown constraint type: {kind}")
+
+        result = {
+            'type': kind,
+            'negate': bool(constraint.get('negate', False)),
+            'required': bool(constraint.get('required', True)),
+            'weight': float(constraint.get('weight', 1.0)),
+        }
+
+        if kind == 'moon_phase':
+            phase = str(constraint.get('phase', '')).lower()
+            if phase not in ('waxing', 'waning'):
+                raise ValueError("moon_phase phase must be 'waxing' or 'waning'")
+            result['phase'] = phase
+        elif kind == 'event':
+            event_type = constraint.get('event_type')
+            if event_type not in EventCalendarService.EVENT_TYPES:
+                raise ValueError(f"Unknown event type: {event_type}")
+            within_days = float(constraint.get('within_days', 0.0))
+            if not 0.0 <= within_days <= cls.MAX_WITHIN_DAYS:
+                raise ValueError(f"within_days must be between 0 and {cls.MAX_WITHIN_DAYS:g}")
+            result.update(event_type=event_type, within_days=within_days,
+                          body=cls._body(constraint.get('body')) if constraint.get('body') else None)
+        elif kind == 'retrograde':
+            body = cls._body(constraint.get('body'))
+            if body not in EventCalendarService.STATION_BODIES:
+                raise ValueError(f"{body} never stations retrograde")
+            result['body'] = body
+        elif kind == 'sign':
+            body = cls._body(constraint.get('body'))
+            if body not in EventCalendarService.INGRESS_BODIES:
+                raise ValueError(f"Sign ingresses are not tracked for {body}")
+            signs = [str(sign).title() for sign in constraint.get('signs') or []]
+            if not signs or set(signs) - set(SIGN_NAMES):
+                raise ValueError(f"signs must be a non-empty list of: {', '.join(SIGN_NAMES)}")
+            result.update(body=body, signs=signs)
+        elif kind == 'aspect':
+            aspects = [str(a).lower() for a in constraint.get('aspects') or ['conjunction', 'square', 'opposition']]
+            unknown = set(aspects) - set(cls.ASPECT_ANGLES)
+            if unknown:
+                raise ValueError(f"Unknown aspects: {', '.join(sorted(unknown))}")
+            targets = [cls._body(target) for target in constraint.get('targets') or []]
+            if not targets:
+                raise ValueError("aspect constraints need at least one target body")
+            result.update(body=cls._body(constraint.get('body')), targets=targets,
+                          aspects=aspects, orb=cls._orb(constraint, kind))
+        elif kind == 'angular':
+            if latitude is None or longitude is None:
+                raise ValueError("angular constraints need a latitude and longitude")
+            if not -66.0 < latitude < 66.0:
+                raise ValueError("angular constraints need a latitude between -66 and +66 degrees")
+            angles = [str(angle).lower() for angle in constraint.get('angles') or cls.ANGLES]
+            unknown = set(angles) - set(cls.ANGLES)
+            if unknown:
+                raise ValueError(f"Unknown angles: {', '.join(sorted(unknown))}")
+            result.update(body=cls._body(constraint.get('body')), angles=angles,
+                          orb=cls._orb(constraint, kind))
+
+        result['label'] = constraint.get('label') or cls._label(result)
+        return result
+
+    @classmethod
+    def compile_constraint(
+        cls,
+        db: Session,
+        constraint: Dict[str, Any],
+        windows: List[Interval],
+        latitude: Optional[float] = None,
+        longitude: Optional[float] = None
+    ) -> List[Interval]:
+        """
+        Intervals inside the windows where a normalized constraint holds
+
+        Args:
+            db: Database session (event calendar)
+            constraint: Constraint from normalize_constraint
+            windows: Sorted, disjoint intervals to evaluate within
+
+        Returns:
+            Sorted, disjoint intervals (negation applied)
+        """
+        if not windows:
+            return []
+
+        kind = constraint['type']
+        if kind == 'moon_phase':
+            intervals = cls._moon_phase_intervals(db, constraint, windows)
+        elif kind == 'event':
+            intervals = cls._event_intervals(db, constraint, windows)
+        elif kind == 'retrograde':
+            intervals = cls._retrograde_intervals(db, constraint, windows)
+        elif kind == 'sign':
+            intervals = cls._sign_intervals(db, constraint, windows)
+        elif kind == 'aspect':
+            intervals = cls._aspect_intervals(constraint, windows)
+        else:
+            intervals = cls._angular_intervals(constraint, windows, latitude, longitude)
+
+        if constraint['negate']:
+            intervals = cls.complement(intervals, windows)
+        return cls.intersect(cls.union(intervals), windows)
+
+    # -------------------------------------------------------------------------
+    # Interval sets
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def union(intervals: Sequence[Interval]) -> List[Interval]:
+        """Merge overlapping or touching intervals into a sorted, disjoint list."""
+        merged: List[Interval] = []
+        for low, high in sorted(intervals):
+            if high <= low:
+                continue
+            if merged and low <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], high))
+            else:
+                merged.append((low, high))
+        return merged
+
+    @staticmethod
+    def intersect(first: Sequence[Interval], second: Sequence[Interval]) -> List[Interval]:
+        """Overlaps of two sorted, disjoint interval lists."""
+        result = []
+        i = j = 0
+        while i < len(first) and j < len(second):
+            low = max(first[i][0], second[j][0])
+            high = min(first[i][1], second[j][1])
+            if low < high:
+                result.append((low, high))
+            if first[i][1] < second[j][1]:
+                i += 1
+            else:
+                j += 1
+        return result
+
+    @classmethod
+    def complement(cls, intervals: Sequence[Interval], windows: Sequence[Interval]) -> List[Interval]:
+        """Parts of the windows not covered by the intervals."""
+        gaps = []
+        for low, high in windows:
+            cursor = low
+            for start, end in cls.intersect(cls.union(intervals), [(low, high)]):
+                if start > cursor:
+                    gaps.append((cursor, start))
+                cursor = max(cursor, end)
+            if cursor < high:
+                gaps.append((cursor, high))
+        return gaps
+
+    # -------------------------------------------------------------------------
+    # Calendar constraints
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def _moon_phase_intervals(cls, db: Session, constraint: Dict, windows: List[Interval]) -> List[Interval]:
+        """Waxing runs from each New Moon to the next Full Moon, waning the other half."""
+        lunations = [
+            event for event in cls._calendar_events(db, windows, ['lunation'])
+            if event.details['phase'] in (0, 2)
+        ]
+        waxing = constraint['phase'] == 'waxing'
+        moon = ExactEventCalculator.state_function('moon')(windows[0][0])[0]
+        sun = ExactEventCalculator.state_function('sun')(windows[0][0])[0]
+        return cls._state_runs(
+            lunations,
+            lambda event: (event.details['phase'] == 0) == waxing,
+            ((moon - sun) % 360.0 < 180.0) == waxing,
+            windows,
+        )
+
+    @classmethod
+    def _event_intervals(cls, db: Session, constraint: Dict, windows: List[Interval]) -> List[Interval]:
+        """Each event (or window event) padded by within_days on both sides."""
+        padding = constraint['within_days']
+        events = cls._calendar_events(db, windows, [constraint['event_type']], padding)
+        return [
+            (event.jd - padding, (event.end_jd or event.jd) + padding)
+            for event in events
+            if constraint['body'] is None or event.body == constraint['body']
+        ]
+
+    @classmethod
+    def _retrograde_intervals(cls, db: Session, constraint: Dict, windows: List[Interval]) -> List[Interval]:
+        """From each retrograde station to the following direct station."""
+        body = constraint['body']
+        stations = [event for event in cls._calendar_events(db, windows, ['station']) if event.body == body]
+        return cls._state_runs(
+            stations,
+            lambda event: event.details['direction'] == 'retrograde',
+            ExactEventCalculator.state_function(body)(windows[0][0])[1] < 0,
+            windows,
+        )
+
+    @classmethod
+    def _sign_intervals(cls, db: Session, constraint: Dict, windows: List[Interval]) -> List[Interval]:
+        """Stays between the body's ingresses into and out of the listed signs."""
+        body = constraint['body']
+        signs = set(constraint['signs'])
+        ingresses = [event for event in cls._calendar_events(db, windows, ['ingress']) if event.body == body]
+        longitude = ExactEventCalculator.state_function(body)(windows[0][0])[0]
+        return cls._state_runs(
+            ingresses,
+            lambda event: event.sign in signs,
+            SIGN_NAMES[int(longitude // 30) % 12] in signs,
+            windows,
+        )
+
+    @staticmethod
+    def _state_runs(events, holds: Callable, holds_at_start: bool, windows: List[Interval]) -> List[Interval]:
+        """
+        Intervals where a state holds, given its state at the start of the
+        windows and the events that set it afterwards
+        """
+        jd_start, jd_end = windows[0][0], windows[-1][1]
+        runs = []
+        opened = jd_start if holds_at_start else None
+        for event in events:
+            if event.jd <= jd_start:
+                continue
+            if holds(event) and opened is None:
+                opened = event.jd
+            elif not holds(event) and opened is not None:
+                runs.append((opened, event.jd))
+                opened = None
+        if opened is not None:
+            runs.append((opened, jd_end))
+        return runs
+
+    @classmethod
+    def _calendar_events(
+        cls,
+        db: Session,
+        windows: List[Interval],
+        event_types: List[str],
+        padding_days: float = 0.0
+    ):
+        """Calendar events covering the windows, padded on both sides."""
+        start = EphemerisCalculator.julian_day_to_datetime(windows[0][0] - padding_days).date()
+        end = EphemerisCalculator.julian_day_to_datetime(windows[-1][1] + padding_days).date()
+        return EventCalendarService.events_between(db, start, end, event_types)
+
+    # -------------------------------------------------------------------------
+    # Sampled constraints
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def _aspect_intervals(cls, constraint: Dict, windows: List[Interval]) -> List[Interval]:
+        """Where the body is within orb of any listed aspect to any target."""
+        body = constraint['body']
+        targets = constraint['targets']
+        angles = np.array([cls.ASPECT_ANGLES[aspect] for aspect in constraint['aspects']])
+        orb = constraint['orb']
+
+        speeds = ExactEventCalculator.MAX_DAILY_SPEED
+        default = ExactEventCalculator.DEFAULT_MAX_SPEED
+        relative_speed = max(speeds.get(body, default) + speeds.get(target, default) for target in targets)
+        step = min(cls.MAX_SAMPLE_DAYS, orb / relative_speed)
+
+        states = {name: ExactEventCalculator.state_function(name) for name in [body, *targets]}
+        bodies = list(states)
+
+        def excess(longitudes: np.ndarray) -> np.ndarray:
+            # (..., n_bodies) longitudes -> degrees beyond the orb of the closest aspect
+            separation = np.abs(ExactEventCalculator.wrap180(
+                longitudes[..., 1:] - longitudes[..., :1]
+            ))
+            return np.min(np.abs(separation[..., None] - angles), axis=(-2, -1)) - orb
+
+        def sampled(jds: np.ndarray) -> np.ndarray:
+            return excess(EphemerisCalculator.calculate_positions_batch(jds, bodies, use_cache=True).longitude)
+
+        def exact(jd: float) -> float:
+            return float(excess(np.array([states[name](jd)[0] for name in bodies])))
+
+        return cls._threshold_intervals(sampled, exact, windows, step)
+
+    @classmethod
+    def _angular_intervals(
+        cls,
+        constraint: Dict,
+        windows: List[Interval],
+        latitude: float,
+        longitude: float
+    ) -> List[Interval]:
+        """Where the body is within orb of one of the listed angles at the location."""
+        body = constraint['body']
+        orb = constraint['orb']
+        offsets = np.array([
+            {'ascendant': 0.0, 'descendant': 180.0, 'mc': 0.0, 'ic': 180.0}[angle]
+            for angle in constraint['angles']
+        ])
+        on_mc = np.array([angle in ('mc', 'ic') for angle in constraint['angles']])
+        step = min(cls.MAX_SAMPLE_DAYS, orb / cls.MAX_ANGLE_SPEED)
+
+        jd0 = windows[0][0]
+        obliquity = swe.calc_ut(0.5 * (jd0 + windows[-1][1]), swe.ECL_NUT)[0][0]
+        state = ExactEventCalculator.state_function(body)
+
+        def excess(jds: np.ndarray, body_longitudes: np.ndarray) -> np.ndarray:
+            # ARMC from one reference instant so sampled and exact values agree
+            armc = EphemerisCalculator.armc_at(np.concatenate([[jd0], jds]), longitude)[1:]
+            asc, mc = EphemerisCalculator.angles_from_armc(armc, latitude, obliquity)
+            points = np.where(on_mc, mc[:, None], asc[:, None]) + offsets
+            separation = np.abs(ExactEventCalculator.wrap180(body_longitudes[:, None] - points))
+            return separation.min(axis=1) - orb
+
+        def sampled(jds: np.ndarray) -> np.ndarray:
+            # The body is slow next to the angles: sample it coarsely and interpolate
+            grid = np.arange(jds[0], jds[-1] + 2 * cls.BODY_SAMPLE_DAYS, cls.BODY_SAMPLE_DAYS)
+            track = EphemerisCalculator.calculate_positions_batch(grid, [body], use_cache=True).longitude[:, 0]
+            track = np.degrees(np.unwrap(np.radians(track)))
+            return excess(jds, np.mod(np.interp(jds, grid, track), 360.0))
+
+        def exact(jd: float) -> float:
+            return float(excess(np.array([jd]), np.array([state(jd)[0]]))[0])
+
+        return cls._threshold_intervals(sampled, exact, windows, step)
+
+    @classmethod
+    def _threshold_intervals(
+        cls,
+        sampled: Callable[[np.ndarray], np.ndarray],
+        exact: Callable[[float], float],
+        windows: List[Interval],
+        step: float
+    ) -> List[Interval]:
+        """
+        Intervals inside the windows where a continuous function is negative
+
+        The function is sampled once over all windows (one batch) and each
+        sign change is refined to the exact crossing; stays shorter than
+        the step can be missed.
+        """
+        edges = [0]
+        pieces = []
+        for low, high in windows:
+            count = max(1, int(np.ceil((high - low) / step)))
+            pieces.append(np.linspace(low, high, count + 1))
+            edges.append(edges[-1] + count + 1)
+        jds = np.concatenate(pieces)
+        inside = np.nan_to_num(sampled(jds), nan=1.0) < 0.0
+
+        margin = step / 8.0
+        intervals = []
+        for index, (low, high) in enumerate(windows):
+            first, last = edges[index], edges[index + 1]
+            opened = low if inside[first] else None
+            for i in first + np.flatnonzero(inside[first + 1:last] != inside[first:last - 1]):
+                crossing = ExactEventCalculator.refine_bracket(exact, jds[i], jds[i + 1], margin)
+                if crossing is None:
+                    crossing = 0.5 * (jds[i] + jds[i + 1])
+                crossing = min(max(crossing, low), high)
+                if inside[i + 1]:
+                    opened = crossing
+                elif opened is not None:
+                    intervals.append((opened, crossing))
+                    opened = None
+            if opened is not None:
+                intervals.append((opened, high))
+        return intervals
+
+    # -------------------------------------------------------------------------
+    # Helpers
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _coverage(windows: List[Interval], matched: List[Interval]) -> np.ndarray:
+        """Share of each window covered by the matched intervals."""
+        shares = np.zeros(len(windows))
+        j = 0
+        for index, (low, high) in enumerate(windows):
+            while j < len(matched) and matched[j][1] <= low:
+                j += 1
+            k = j
+            covered = 0.0
+            while k < len(matched) and matched[k][0] < high:
+                covered += min(high, matched[k][1]) - max(low, matched[k][0])
+                k += 1
+            shares[index] = covered / (high - low)
+        return shares
+
+    @staticmethod
+    def _body(name: Optional[str]) -> str:
+        """Validated body name."""
+        body = str(name or '').lower()
+        if body not in EphemerisCalculator.PLANETS:
+            raise ValueError(f"Unknown body: {name}")
+        return body
+
+    @classmethod
+    def _orb(cls, constraint: Dict, kind: str) -> float:
+        """Validated orb, defaulting per constraint type."""
+        orb = float(constraint.get('orb', cls.DEFAULT_ORBS[kind]))
+        if not 0.0 < orb <= cls.MAX_ORB:
+            raise ValueError(f"orb must be greater than 0 and at most {cls.MAX_ORB:g}")
+        return orb
+
+    @staticmethod
+    def _label(constraint: Dict) -> str:
+        """Readable description of a normalized constraint."""
+        kind = constraint['type']
+        if kind == 'moon_phase':
+            text = f"Moon {constraint['phase']}"
+        elif kind == 'event':
+            text = constraint['event_type'].replace('_', ' ')
+            if constraint['body']:
+                text = f"{constraint['body']} {text}"
+            if constraint['within_days']:
+                text += f" within {constraint['within_days']:g} days"
+        elif kind == 'retrograde':
+            text = f"{constraint['body']} retrograde"
+        elif kind == 'sign':
+            text = f"{constraint['body']} in {'/'.join(constraint['signs'])}"
+        elif kind == 'aspect':
+            text = (f"{constraint['body']} {'/'.join(constraint['aspects'])} "
+                    f"{'/'.join(constraint['targets'])} (orb {constraint['orb']:g})")
+        else:
+            text = f"{constraint['body']} on {'/'.join(constraint['angles'])} (orb {constraint['orb']:g})"
+        return f"not {text}" if constraint['negate'] else text
+
+    @staticmethod
+    def _julian_day(day: date) -> float:
+        """Julian Day of midnight UTC starting a day."""
+        return EphemerisCalculator.datetime_to_julian_day(datetime(day.year, day.month, day.day))
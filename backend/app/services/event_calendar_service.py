@@ -0,0 +1,569 @@
+"""
+Event Calendar Service
+Exact astronomical events, stored per month and read with range queries
+
+Sign ingresses, retrograde and direct stations, new, quarter and full
+moons, void-of-course Moon windows and eclipses are found for a whole
+span from one batch of sampled positions, refined to the second with
+Brent's method, and kept in the sky_events table. Months are computed the
+first time a range touches them, so moving the horizon only computes the
+months that are new.
+
+Events are geocentric and use the tropical zodiac.
+"""
+import bisect
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import swisseph as swe
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.database_sqlite import CacheSession
+from app.models.sky_event import SkyEvent, SkyEventMonth
+from app.services.exact_event_calculator import ExactEventCalculator
+from app.utils.ephemeris import EphemerisCalculator, SIGN_NAMES
+
+
+class EventCalendarService:
+    """
+    Finds exact sky events and serves them from the database.
+
+    All public ranges are UTC calendar days with an inclusive end.
+    """
+
+    EVENT_TYPES = ('ingress', 'station', 'lunation', 'eclipse', 'void_of_course')
+
+    # Bodies whose sign ingresses are tracked
+    INGRESS_BODIES = (
+        'sun', 'moon', 'mercury', 'venus', 'mars', 'jupiter', 'saturn',
+        'uranus', 'neptune', 'pluto', 'north_node', 'chiron',
+    )
+
+    # Bodies that station (the luminaries never do; the node's wobble is not a station)
+    STATION_BODIES = (
+        'mercury', 'venus', 'mars', 'jupiter', 'saturn',
+        'uranus', 'neptune', 'pluto', 'chiron',
+    )
+
+    # Bodies the Moon's last aspect before going void of course is taken to
+    VOID_ASPECT_BODIES = (
+        'sun', 'mercury', 'venus', 'mars', 'jupiter', 'saturn',
+        'uranus', 'neptune', 'pluto',
+    )
+
+    # Ptolemaic aspects by multiple of 30° of Moon-body separation
+    PTOLEMAIC_ASPECTS = {
+        0: 'conjunction', 2: 'sextile', 3: 'square', 4: 'trine',
+        6: 'opposition', 8: 'trine', 9: 'square', 10: 'sextile',
+    }
+
+    # By multiple of 90° of Moon-Sun elongation
+    LUNATIONS = ('New Moon', 'First Quarter', 'Full Moon', 'Last Quarter')
+    # Phase after each lunation until the next one
+    INTERMEDIATE_PHASES = ('Waxing Crescent', 'Waxing Gibbous', 'Waning Gibbous', 'Waning Crescent')
+
+    # Sampling step in days; the Moon moves at most ~4.2° per step, so a
+    # step never spans two ingresses, quarters or aspect levels of one body
+    SAMPLE_DAYS = 0.25
+
+    # Widening of a sample bracket that misses its root (cached positions
+    # can be a few arcseconds off; the Moon moves ~0.5° in this time)
+    BRACKET_MARGIN_DAYS = SAMPLE_DAYS / 8
+
+    # Days sampled beyond each end so windows crossing the edge are complete
+    PADDING_DAYS = 3.0
+
+    # Longest void-of-course window (the Moon crosses a sign in under 2.8 days)
+    MAX_WINDOW_DAYS = 3.0
+
+    # Extra days read before a range so every day has a preceding New Moon
+    LUNATION_MARGIN_DAYS = 30
+
+    # Longest range served per request
+    MAX_RANGE_DAYS = 732
+
+    # Bump whenever computed events change, so months stored by older code
+    # are recomputed (2: sample brackets widened for cached positions)
+    CALENDAR_VERSION = 2
+
+    # Longest range calendar_days serves (its reads start a lunation margin early)
+    MAX_CALENDAR_DAYS = MAX_RANGE_DAYS - LUNATION_MARGIN_DAYS
+
+    @classmethod
+    def compute_events(cls, jd_start: float, jd_end: float) -> List[Dict]:
+        """
+        Find every event starting in [jd_start, jd_end)
+
+        Args:
+            jd_start: Start of range (Julian Day, UT)
+            jd_end: End of range (Julian Day, UT)
+
+        Returns:
+            Event dicts (SkyEvent column values) sorted by time
+        """
+        if jd_end <= jd_start:
+            return []
+
+        jds = np.arange(
+            jd_start - cls.PADDING_DAYS,
+            jd_end + cls.PADDING_DAYS + cls.SAMPLE_DAYS,
+            cls.SAMPLE_DAYS
+        )
+        bodies = list(dict.fromkeys(cls.INGRESS_BODIES + cls.STATION_BODIES + cls.VOID_ASPECT_BODIES))
+        batch = EphemerisCalculator.calculate_positions_batch(jds, bodies, use_cache=True)
+        columns = {body: col for col, body in enumerate(batch.bodies)}
+        states = {body: ExactEventCalculator.state_function(body) for body in bodies}
+
+        ingresses = cls._ingresses(jds, batch, columns, states)
+        events = [event for event in ingresses if jd_start <= event['jd'] < jd_end]
+        events += cls._stations(jds, batch, columns, states, jd_start, jd_end)
+        events += cls._lunations(jds, batch, columns, states, jd_start, jd_end)
+        events += cls._void_of_course(
+            jds, batch, columns, states,
+            [event for event in ingresses if event['body'] == 'moon'],
+            jd_start, jd_end
+        )
+        events += cls._eclipses(states, jd_start, jd_end)
+
+        for event in events:
+            event.pop('bracket', None)
+        events.sort(key=lambda event: event['jd'])
+        return events
+
+    @classmethod
+    def ensure_range(cls, db: Session, start: date, end: date) -> int:
+        """
+        Compute and store the months of a range that are not stored yet,
+        or were stored by an older CALENDAR_VERSION
+
+        Consecutive missing months are computed together from one batch.
+
+        Args:
+            db: Database session
+            start: First day
+            end: Last day (inclusive)
+
+        Returns:
+            Number of months computed
+        """
+        months = cls._months(start, end)
+        stored = {
+            month for (month,) in db.query(SkyEventMonth.month).filter(
+                SkyEventMonth.month.in_([cls._month_key(month) for month in months]),
+                SkyEventMonth.version >= cls.CALENDAR_VERSION,
+            )
+        }
+        missing = [month for month in months if cls._month_key(month) not in stored]
+        if not missing:
+            return 0
+
+        # Group consecutive months into runs
+        runs: List[List[date]] = []
+        for month in missing:
+            if runs and cls._next_month(runs[-1][-1]) == month:
+                runs[-1].append(month)
+            else:
+                runs.append([month])
+
+        # Computed before writing, so the write lock is held only briefly
+        computed = []
+        for run in runs:
+            jd_start = cls._julian_day(run[0])
+            jd_end = cls._julian_day(cls._next_month(run[-1]))
+            computed.append((run, jd_start, jd_end, cls.compute_events(jd_start, jd_end)))
+
+        try:
+            with CacheSession(db) as session:
+                # Months stored by an older calendar version are replaced
+                session.query(SkyEventMonth).filter(
+                    SkyEventMonth.month.in_([cls._month_key(month) for month in missing])
+                ).delete(synchronize_session=False)
+                for run, jd_start, jd_end, events in computed:
+                    session.query(SkyEvent).filter(
+                        SkyEvent.jd >= jd_start, SkyEvent.jd < jd_end
+                    ).delete(synchronize_session=False)
+                    session.add_all(
+                        SkyEventMonth(month=cls._month_key(month), version=cls.CALENDAR_VERSION)
+                        for month in run
+                    )
+                    session.add_all(SkyEvent(**event) for event in events)
+        except IntegrityError:
+            # A concurrent request stored the same months first
+            pass
+
+        return len(missing)
+
+    @classmethod
+    def events_between(
+        cls,
+        db: Session,
+        start: date,
+        end: date,
+        event_types: Optional[Sequence[str]] = None
+    ) -> List[SkyEvent]:
+        """
+        Events taking place on the days of a range, computing months as needed
+
+        Void-of-course windows are included on every day they overlap.
+
+        Args:
+            db: Database session
+            start: First day
+            end: Last day (inclusive)
+            event_types: Optional subset of EVENT_TYPES
+
+        Returns:
+            SkyEvent rows sorted by time
+        """
+        if end < start:
+            raise ValueError("end must not be before start")
+        if (end - start).days >= cls.MAX_RANGE_DAYS:
+            raise ValueError(f"Range must be at most {cls.MAX_RANGE_DAYS} days")
+        unknown = set(event_types or ()) - set(cls.EVENT_TYPES)
+        if unknown:
+            raise ValueError(f"Unknown event types: {', '.join(sorted(unknown))}")
+
+        # Windows starting in the previous month can reach into the range
+        cls.ensure_range(db, start - timedelta(days=cls.MAX_WINDOW_DAYS), end)
+
+        jd_start = cls._julian_day(start)
+        jd_end = cls._julian_day(end + timedelta(days=1))
+        query = db.query(SkyEvent).filter(
+            SkyEvent.jd >= jd_start - cls.MAX_WINDOW_DAYS,
+            SkyEvent.jd < jd_end,
+            func.coalesce(SkyEvent.end_jd, SkyEvent.jd) >= jd_start,
+        )
+        if event_types:
+            query = query.filter(SkyEvent.event_type.in_(list(event_types)))
+
+        return query.order_by(SkyEvent.jd).all()
+
+    @classmethod
+    def calendar_days(cls, db: Session, start: date, end: date) -> List[Dict]:
+        """
+        Moon phase and events of each day of a range, from one range query
+
+        A day on which a New, quarter or Full Moon is exact takes that
+        lunation's name; other days take the phase following the last one.
+
+        Args:
+            db: Database session
+            start: First day
+            end: Last day (inclusive)
+
+        Returns:
+            One dict per day: date, moon_phase, lunar_day (days since the
+            last New Moon at noon UTC, None when out of reach) and events
+        """
+        events = cls.events_between(db, start - timedelta(days=cls.LUNATION_MARGIN_DAYS), end)
+        lunations = [event for event in events if event.event_type == 'lunation']
+        lunation_jds = [event.jd for event in lunations]
+        new_moon_jds = [event.jd for event in lunations if event.details['phase'] == 0]
+
+        days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+        by_day: Dict[date, List[Dict]] = {day: [] for day in days}
+        jd_first = cls._julian_day(start)
+        for event in events:
+            if (event.end_jd or event.jd) < jd_first:
+                continue
+            first = EphemerisCalculator.julian_day_to_datetime(event.jd).date()
+            last = EphemerisCalculator.julian_day_to_datetime(event.end_jd or event.jd).date()
+            day = max(first, start)
+            while day <= min(last, end):
+                by_day[day].append(cls.event_dict(event))
+                day += timedelta(days=1)
+
+        calendar = []
+        for day in days:
+            jd0 = cls._julian_day(day)
+            jd1 = jd0 + 1.0
+            lo = bisect.bisect_left(lunation_jds, jd0)
+            if lo < len(lunations) and lunation_jds[lo] < jd1:
+                phase = cls.LUNATIONS[lunations[lo].details['phase']]
+            elif lo > 0:
+                phase = cls.INTERMEDIATE_PHASES[lunations[lo - 1].details['phase']]
+            else:
+                phase = None
+
+            noon = jd0 + 0.5
+            previous_new = bisect.bisect_right(new_moon_jds, noon)
+            lunar_day = round(noon - new_moon_jds[previous_new - 1], 2) if previous_new else None
+
+            calendar.append({
+                'date': day.isoformat(),
+                'moon_phase': phase,
+                'lunar_day': lunar_day,
+                'events': by_day[day],
+            })
+
+        return calendar
+
+    @staticmethod
+    def event_dict(event: SkyEvent) -> Dict:
+        """Serializable form of a stored event."""
+        return {
+            'type': event.event_type,
+            'body': event.body,
+            'name': event.name,
+            'description': event.description,
+            'date': event.event_date,
+            'end_date': event.end_date,
+            'sign': event.sign,
+            'details': event.details or {},
+        }
+
+    # -------------------------------------------------------------------------
+    # Event search
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def _ingresses(cls, jds, batch, columns, states) -> List[Dict]:
+        """Sign ingresses over the whole sampled span (padding included)."""
+        events = []
+        for body in cls.INGRESS_BODIES:
+            longitude = batch.longitude[:, columns[body]]
+            if np.isnan(longitude).any():
+                continue
+            signs = np.floor(longitude / 30.0).astype(np.int64) % 12
+            state = states[body]
+            for i in np.flatnonzero(signs[1:] != signs[:-1]):
+                before, after = int(signs[i]), int(signs[i + 1])
+                retrograde = (before - after) % 12 == 1
+                cusp = 30.0 * (before if retrograde else after)
+                jd = cls._refine(lambda t: ExactEventCalculator.wrap180(state(t)[0] - cusp), jds[i], jds[i + 1])
+                if jd is None:
+                    continue
+                name = cls._display_name(body)
+                events.append(cls._event(
+                    'ingress', body, jd,
+                    name=f"enters {SIGN_NAMES[after]}",
+                    description=f"{name} enters {SIGN_NAMES[after]}" + (" (retrograde)" if retrograde else ""),
+                    sign=SIGN_NAMES[after],
+                    details={'from_sign': SIGN_NAMES[before], 'retrograde': retrograde},
+                    bracket=int(i),
+                ))
+        return events
+
+    @classmethod
+    def _stations(cls, jds, batch, columns, states, jd_start, jd_end) -> List[Dict]:
+        """Retrograde and direct stations (daily motion changes sign)."""
+        events = []
+        for body in cls.STATION_BODIES:
+            speed = batch.speed_longitude[:, columns[body]]
+            if np.isnan(speed).any():
+                continue
+            state = states[body]
+            for i in np.flatnonzero(np.signbit(speed[1:]) != np.signbit(speed[:-1])):
+                jd = cls._refine(lambda t: state(t)[1], jds[i], jds[i + 1])
+                if jd is None or not jd_start <= jd < jd_end:
+                    continue
+                direction = 'retrograde' if speed[i] > 0 else 'direct'
+                longitude = state(jd)[0]
+                sign = SIGN_NAMES[int(longitude // 30) % 12]
+                events.append(cls._event(
+                    'station', body, jd,
+                    name=f"stations {direction}",
+                    description=f"{cls._display_name(body)} stations {direction} in {sign}",
+                    sign=sign,
+                    details={'direction': direction, 'longitude': round(longitude, 4)},
+                ))
+        return events
+
+    @classmethod
+    def _lunations(cls, jds, batch, columns, states, jd_start, jd_end) -> List[Dict]:
+        """New Moons, quarters and Full Moons (elongation crosses 90° multiples)."""
+        moon, sun = states['moon'], states['sun']
+        elongation = np.unwrap(
+            batch.longitude[:, columns['moon']] - batch.longitude[:, columns['sun']], period=360.0
+        )
+        quarters = np.floor(elongation / 90.0).astype(np.int64)
+
+        events = []
+        for i in np.flatnonzero(quarters[1:] != quarters[:-1]):
+            phase = int(quarters[i + 1]) % 4
+            level = 90.0 * phase
+            jd = cls._refine(
+                lambda t: ExactEventCalculator.wrap180(moon(t)[0] - sun(t)[0] - level), jds[i], jds[i + 1]
+            )
+            if jd is None or not jd_start <= jd < jd_end:
+                continue
+            longitude = moon(jd)[0]
+            sign = SIGN_NAMES[int(longitude // 30) % 12]
+            events.append(cls._event(
+                'lunation', 'moon', jd,
+                name=cls.LUNATIONS[phase],
+                description=f"{cls.LUNATIONS[phase]} in {sign}",
+                sign=sign,
+                details={'phase': phase, 'angle': level, 'longitude': round(longitude, 4)},
+            ))
+        return events
+
+    @classmethod
+    def _void_of_course(cls, jds, batch, columns, states, moon_ingresses, jd_start, jd_end) -> List[Dict]:
+        """
+        Void-of-course Moon windows
+
+        A window runs from the Moon's last exact Ptolemaic aspect to a planet
+        until it enters the next sign. Aspect crossings are bracketed for all
+        planets at once, and only the latest brackets before each ingress are
+        refined.
+        """
+        moon_longitude = batch.longitude[:, columns['moon']]
+        brackets: Dict[int, List] = {}
+        for body in cls.VOID_ASPECT_BODIES:
+            separation = np.unwrap(moon_longitude - batch.longitude[:, columns[body]], period=360.0)
+            levels = np.floor(separation / 30.0).astype(np.int64)
+            for i in np.flatnonzero(levels[1:] != levels[:-1]):
+                multiple = int(levels[i + 1]) % 12
+                if multiple in cls.PTOLEMAIC_ASPECTS:
+                    brackets.setdefault(int(i), []).append((body, multiple))
+
+        moon = states['moon']
+        events = []
+        for previous, ingress in zip(moon_ingresses, moon_ingresses[1:]):
+            last = None
+            for i in range(ingress['bracket'], previous['bracket'] - 1, -1):
+                hits = []
+                for body, multiple in brackets.get(i, ()):
+                    other = states[body]
+                    angle = 30.0 * multiple
+                    jd = cls._refine(
+                        lambda t: ExactEventCalculator.wrap180(moon(t)[0] - other(t)[0] - angle),
+                        jds[i], jds[i + 1]
+                    )
+                    if jd is not None and previous['jd'] < jd < ingress['jd']:
+                        hits.append((jd, body, multiple))
+                if hits:
+                    last = max(hits)
+                    break
+
+            if last is None or not jd_start <= last[0] < jd_end:
+                continue
+            jd, body, multiple = last
+            aspect = cls.PTOLEMAIC_ASPECTS[multiple]
+            sign = previous['sign']
+            events.append(cls._event(
+                'void_of_course', 'moon', jd,
+                name='Moon void of course',
+                description=f"Moon void of course in {sign} until it enters {ingress['sign']}",
+                sign=sign,
+                details={
+                    'last_aspect': aspect,
+                    'aspect_body': body,
+                    'next_sign': ingress['sign'],
+                    'duration_hours': round((ingress['jd'] - jd) * 24.0, 2),
+                },
+                end_jd=ingress['jd'],
+            ))
+        return events
+
+    @classmethod
+    def _eclipses(cls, states, jd_start, jd_end) -> List[Dict]:
+        """Solar and lunar eclipses (times of maximum)."""
+        flags = swe.FLG_SWIEPH
+        events = []
+
+        jd = jd_start
+        while True:
+            kind_flags, times = swe.sol_eclipse_when_glob(jd, flags)
+            if times[0] >= jd_end:
+                break
+            if kind_flags & swe.ECL_ANNULAR_TOTAL == swe.ECL_ANNULAR_TOTAL:
+                kind = 'hybrid'
+            elif kind_flags & swe.ECL_TOTAL:
+                kind = 'total'
+            elif kind_flags & swe.ECL_ANNULAR:
+                kind = 'annular'
+            else:
+                kind = 'partial'
+            events.append(cls._eclipse_event('sun', 'Solar', kind, times[0], times[2], times[3], states))
+            jd = times[0] + 1.0
+
+        jd = jd_start
+        while True:
+            kind_flags, times = swe.lun_eclipse_when(jd, flags)
+            if times[0] >= jd_end:
+                break
+            if kind_flags & swe.ECL_TOTAL:
+                kind = 'total'
+            elif kind_flags & swe.ECL_PARTIAL:
+                kind = 'partial'
+            else:
+                kind = 'penumbral'
+            events.append(cls._eclipse_event('moon', 'Lunar', kind, times[0], times[6], times[7], states))
+            jd = times[0] + 1.0
+
+        return events
+
+    @classmethod
+    def _eclipse_event(cls, body, family, kind, jd, begin, end, states) -> Dict:
+        """Event dict of an eclipse at its maximum."""
+        longitude = states[body](jd)[0]
+        sign = SIGN_NAMES[int(longitude // 30) % 12]
+        name = f"{kind.title()} {family} Eclipse"
+        details = {'kind': kind, 'longitude': round(longitude, 4)}
+        if begin and end:
+            details['begin'] = EphemerisCalculator.julian_day_to_datetime(begin).isoformat()
+            details['end'] = EphemerisCalculator.julian_day_to_datetime(end).isoformat()
+        return cls._event('eclipse', body, jd, name=name, description=f"{name} in {sign}",
+                          sign=sign, details=details)
+
+    # -------------------------------------------------------------------------
+    # Helpers
+    # -------------------------------------------------------------------------
+
+    @classmethod
+    def _refine(cls, f, a: float, b: float) -> Optional[float]:
+        """Root of f in [a, b], or None when the samples do not bracket one."""
+        return ExactEventCalculator.refine_bracket(f, a, b, cls.BRACKET_MARGIN_DAYS)
+
+    @staticmethod
+    def _event(event_type, body, jd, name, description, sign, details, end_jd=None, bracket=None) -> Dict:
+        """Event dict with its dates filled in."""
+        event = {
+            'event_type': event_type,
+            'body': body,
+            'name': name,
+            'description': description,
+            'jd': float(jd),
+            'event_date': EphemerisCalculator.julian_day_to_datetime(jd).isoformat(),
+            'end_jd': float(end_jd) if end_jd is not None else None,
+            'end_date': EphemerisCalculator.julian_day_to_datetime(end_jd).isoformat() if end_jd is not None else None,
+            'sign': sign,
+            'details': details,
+        }
+        if bracket is not None:
+            # Sample index of the ingress, used by the void-of-course search
+            event['bracket'] = bracket
+        return event
+
+    @staticmethod
+    def _display_name(body: str) -> str:
+        """Human-readable body name (e.g., 'north_node' -> 'North Node')"""
+        return body.replace('_', ' ').title()
+
+    @staticmethod
+    def _julian_day(day: date) -> float:
+        """Julian Day of midnight UTC starting a day."""
+        return EphemerisCalculator.datetime_to_julian_day(datetime(day.year, day.month, day.day))
+
+    @staticmethod
+    def _month_key(month: date) -> str:
+        return month.strftime('%Y-%m')
+
+    @staticmethod
+    def _next_month(month: date) -> date:
+        return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+    @classmethod
+    def _months(cls, start: date, end: date) -> List[date]:
+        """First days of the months a range touches."""
+        months = []
+        month = start.replace(day=1)
+        while month <= end:
+            months.append(month)
+            month = cls._next_month(month)
+        return months
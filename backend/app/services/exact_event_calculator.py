@@ -0,0 +1,368 @@
+"""
+Exact Event Calculator Service
+Root-finding search for the exact moments a body reaches a longitude
+
+Used for exact transit aspects, ingresses and returns. Candidate windows
+are bracketed from each body's maximum daily speed, so a slow planet far
+from its target is skipped in a few large steps, and crossings are then
+refined with Brent's method on that single body.
+"""
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+import swisseph as swe
+
+from app.utils.ephemeris import EphemerisCalculator
+
+
+class ExactEventCalculator:
+    """
+    Finds exact longitude crossings for a single body.
+
+    The search follows the body's unwrapped distance to the target, so
+    every pass is reported, including all three hits of a retrograde loop.
+    """
+
+    # Upper bounds on |daily motion| in degrees (observed 1900-2100, +10%)
+    MAX_DAILY_SPEED = {
+        'sun': 1.13,
+        'moon': 16.9,
+        'mercury': 2.43,
+        'venus': 1.39,
+        'mars': 0.88,
+        'jupiter': 0.27,
+        'saturn': 0.15,
+        'uranus': 0.072,
+        'neptune': 0.045,
+        'pluto': 0.045,
+        'north_node': 0.29,
+        'true_node': 0.29,
+        'mean_node': 0.06,
+        'south_node': 0.29,
+        'chiron': 0.16,
+        'lilith': 0.13,
+        'lilith_mean': 0.13,
+        'lilith_true': 7.1,
+        'ceres': 0.5,
+        'pallas': 0.9,
+        'juno': 0.6,
+        'vesta': 0.6,
+    }
+
+    # Fallback bound for bodies without a measured limit
+    DEFAULT_MAX_SPEED = 17.0
+
+    # Smallest scan step in days (roots closer than this may merge)
+    MIN_STEP_DAYS = 0.1
+
+    # Refinement tolerance in days (~0.1 second)
+    TOLERANCE_DAYS = 1e-6
+
+    @staticmethod
+    def wrap180(angle: float) -> float:
+        """Normalize an angle to [-180, 180)"""
+        return (angle + 180.0) % 360.0 - 180.0
+
+    @classmethod
+    def state_function(
+        cls,
+        body: str,
+        zodiac: str = 'tropical',
+        ayanamsa: str = 'lahiri'
+    ) -> Callable[[float], Tuple[float, float]]:
+        """
+        Build a (longitude, speed) evaluator for one body
+
+        Flags are resolved once for the whole search; sidereal states are
+        tropical ones shifted by the ayanamsa of a SiderealContext.
+        """
+        body = body.lower()
+        offset = 180.0 if body == 'south_node' else 0.0
+        planet_id = EphemerisCalculator.PLANETS.get('north_node' if offset else body)
+        if planet_id is None:
+            raise ValueError(f"Unknown planet: {body}")
+
+        flags = EphemerisCalculator.get_calc_flags('tropical')
+        calc_ut = swe.calc_ut
+
+        if zodiac == 'sidereal':
+            ayanamsa_state = EphemerisCalculator.get_sidereal_context(ayanamsa).ayanamsa_state
+
+            def state(jd: float) -> Tuple[float, float]:
+                result = calc_ut(jd, planet_id, flags)[0]
+                value, rate = ayanamsa_state(jd)
+                return (result[0] + offset - value) % 360.0, result[3] - rate
+
+            return state
+
+        def state(jd: float) -> Tuple[float, float]:
+            result = calc_ut(jd, planet_id, flags)[0]
+            return (result[0] + offset) % 360.0, result[3]
+
+        return state
+
+    @classmethod
+    def refine_root(
+        cls,
+        f: Callable[[float], float],
+        a: float,
+        b: float,
+        fa: float,
+        fb: float,
+        max_iterations: int = 60
+    ) -> float:
+        """
+        Brent's method root refinement on a bracketing interval
+
+        Args:
+            f: Continuous function with f(a) and f(b) of opposite sign
+            a, b: Bracket endpoints
+            fa, fb: Function values at the endpoints
+            max_iterations: Iteration cap
+
+        Returns:
+            Root location
+        """
+        if fa == 0.0:
+            return a
+        if fb == 0.0:
+            return b
+
+        c, fc = a, fa
+        d = e = b - a
+        for _ in range(max_iterations):
+            if (fb > 0) == (fc > 0):
+                c, fc = a, fa
+                d = e = b - a
+            if abs(fc) < abs(fb):
+                a, b, c = b, c, b
+                fa, fb, fc = fb, fc, fb
+
+            tol = 2e-16 * abs(b) + 0.5 * cls.TOLERANCE_DAYS
+            m = 0.5 * (c - b)
+            if abs(m) <= tol or fb == 0.0:
+                return b
+
+            if abs(e) >= tol and abs(fa) > abs(fb):
+                # Attempt inverse quadratic interpolation / secant
+                s = fb / fa
+                if a == c:
+                    p = 2.0 * m * s
+                    q = 1.0 - s
+                else:
+                    q = fa / fc
+                    r = fb / fc
+                    p = s * (2.0 * m * q * (q - r) - (b - a) * (r - 1.0))
+                    q = (q - 1.0) * (r - 1.0) * (s - 1.0)
+                if p > 0:
+                    q = -q
+                p = abs(p)
+                if 2.0 * p < min(3.0 * m * q - abs(tol * q), abs(e * q)):
+                    e, d = d, p / q
+                else:
+                    d = e = m
+            else:
+                d = e = m
+
+            a, fa = b, fb
+            b += d if abs(d) > tol else (tol if m > 0 else -tol)
+            fb = f(b)
+
+        return b
+
+    @classmethod
+    def refine_bracket(
+        cls,
+        f: Callable[[float], float],
+        a: float,
+        b: float,
+        margin: float = 0.0
+    ) -> Optional[float]:
+        """
+        Refine a root bracketed by sampled positions
+
+        Samples from a batch (or the Chebyshev cache) can put a crossing on
+        the wrong side of an endpoint by a few arcseconds; when f does not
+        change sign over [a, b], the bracket is widened by margin on each
+        side before giving up. f must have a single root in the widened
+        bracket.
+
+        Args:
+            f: Continuous function
+            a, b: Sampled bracket endpoints
+            margin: Days to widen the bracket by when it does not bracket a root
+
+        Returns:
+            Root location, or None when no root is bracketed
+        """
+        fa, fb = f(a), f(b)
+        if (fa > 0) == (fb > 0) and fa != 0.0 and fb != 0.0:
+            if margin <= 0.0:
+                return None
+            a, b = a - margin, b + margin
+            fa, fb = f(a), f(b)
+            if (fa > 0) == (fb > 0) and fa != 0.0 and fb != 0.0:
+                return None
+        return cls.refine_root(f, a, b, fa, fb)
+
+    @classmethod
+    def find_longitude_crossings(
+        cls,
+        body: str,
+        target_longitude: float,
+        jd_start: float,
+        jd_end: float,
+        zodiac: str = 'tropical',
+        ayanamsa: str = 'lahiri'
+    ) -> List[Dict]:
+        """
+        Find every moment a body's longitude equals the target
+
+        Args:
+            body: Body name (e.g., 'saturn', 'moon', 'south_node')
+            target_longitude: Target ecliptic longitude (0-360°)
+            jd_start: Start of search range (Julian Day, UT)
+            jd_end: End of search range (Julian Day, UT)
+            zodiac: 'tropical' or 'sidereal'
+            ayanamsa: Ayanamsa system for sidereal searches
+
+        Returns:
+            List of crossings sorted by time, each with:
+            - jd: Julian Day of the exact crossing
+            - speed: Daily motion at the crossing
+            - retrograde: True if crossed while retrograde
+            - cycle: Revolution counter; passes of one retrograde loop
+              share the same cycle value
+        """
+        if jd_end <= jd_start:
+            return []
+
+        state = cls.state_function(body, zodiac, ayanamsa)
+        max_speed = cls.MAX_DAILY_SPEED.get(body.lower(), cls.DEFAULT_MAX_SPEED)
+        target = target_longitude % 360.0
+
+        def distance(jd: float) -> float:
+            return cls.wrap180(state(jd)[0] - target)
+
+        crossings = []
+        t = jd_start
+        g = distance(t)
+        # Continuous (unwrapped) separation from the target
+        unwrapped = g
+
+        while t < jd_end:
+            nearest = 360.0 * round(unwrapped / 360.0)
+            gap = abs(unwrapped - nearest)
+            # The body cannot close `gap` degrees faster than max_speed allows
+            step = max(cls.MIN_STEP_DAYS, 0.9 * gap / max_speed)
+            t_next = min(t + step, jd_end)
+            g_next = distance(t_next)
+            unwrapped_next = unwrapped + cls.wrap180(g_next - g)
+
+            low, high = sorted((unwrapped, unwrapped_next))
+            k = int(high // 360.0)
+            root_level = 360.0 * k
+            if low < root_level <= high and unwrapped != root_level:
+                # Roots only fall inside minimum-size steps, where the
+                # wrapped distance is small and continuous
+                jd_exact = cls.refine_root(distance, t, t_next, g, g_next)
+                speed = state(jd_exact)[1]
+                crossings.append({
+                    'jd': jd_exact,
+                    'speed': speed,
+                    'retrograde': speed < 0,
+                    'cycle': k,
+                })
+
+            t, g, unwrapped = t_next, g_next, unwrapped_next
+
+        return crossings
+
+    @classmethod
+    def find_aspect_hits(
+        cls,
+        body: str,
+        natal_longitude: float,
+        aspect_angle: float,
+        jd_start: float,
+        jd_end: float,
+        zodiac: str = 'tropical',
+        ayanamsa: str = 'lahiri'
+    ) -> List[Dict]:
+        """
+        Find every exact hit of an aspect from a moving body to a fixed point
+
+        Both sides of the aspect are searched (e.g., waxing and waning
+        squares). Hits are grouped into passes: the hits of one retrograde
+        loop over the same point share a group and are numbered 1..n.
+
+        Args:
+            body: Transiting body name
+            natal_longitude: Longitude of the fixed (natal) point
+            aspect_angle: Aspect angle in degrees (0, 60, 90, 120, 150, 180...)
+            jd_start: Start of search range (Julian Day, UT)
+            jd_end: End of search range (Julian Day, UT)
+            zodiac: 'tropical' or 'sidereal'
+            ayanamsa: Ayanamsa system for sidereal searches
+
+        Returns:
+            List of hits sorted by time; each crossing dict additionally has
+            exact_longitude, pass_number and total_passes
+        """
+        targets = {round((natal_longitude + aspect_angle) % 360.0, 10),
+                   round((natal_longitude - aspect_angle) % 360.0, 10)}
+
+        hits = []
+        for target in sorted(targets):
+            crossings = cls.find_longitude_crossings(
+                body, target, jd_start, jd_end, zodiac, ayanamsa
+            )
+            groups: Dict[int, List[Dict]] = {}
+            for crossing in crossings:
+                crossing['exact_longitude'] = target
+                groups.setdefault(crossing['cycle'], []).append(crossing)
+            for group in groups.values():
+                for number, crossing in enumerate(group, start=1):
+                    crossing['pass_number'] = number
+                    crossing['total_passes'] = len(group)
+            hits.extend(crossings)
+
+        hits.sort(key=lambda hit: hit['jd'])
+        return hits
+
+    @classmethod
+    def find_exact_aspect_dates(
+        cls,
+        transit_planet: str,
+        natal_longitude: float,
+        aspect_angle: float,
+        start_date: datetime,
+        end_date: datetime,
+        zodiac: str = 'tropical',
+        ayanamsa: str = 'lahiri'
+    ) -> List[Dict]:
+        """
+        Datetime wrapper around find_aspect_hits
+
+        Args:
+            transit_planet: Transiting body name
+            natal_longitude: Longitude of the natal point
+            aspect_angle: Aspect angle in degrees
+            start_date: Start of range (UTC)
+            end_date: End of range (UTC)
+            zodiac: 'tropical' or 'sidereal'
+            ayanamsa: Ayanamsa system for sidereal searches
+
+        Returns:
+            find_aspect_hits results with an added ISO 'date' (UTC)
+        """
+        jd_start = EphemerisCalculator.datetime_to_julian_day(start_date, 0)
+        jd_end = EphemerisCalculator.datetime_to_julian_day(end_date, 0)
+
+        hits = cls.find_aspect_hits(
+            transit_planet, natal_longitude, aspect_angle,
+            jd_start, jd_end, zodiac, ayanamsa
+        )
+        for hit in hits:
+            hit['date'] = EphemerisCalculator.julian_day_to_datetime(hit['jd']).isoformat()
+        return hits
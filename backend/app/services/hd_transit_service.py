@@ -0,0 +1,470 @@
+"""
+Human Design Transit Service
+Exact gate and line ingresses of the transiting HD bodies, stored as intervals
+
+Each of the 13 HD bodies moves through the 384 lines of the mandala
+(64 gates of 5.625°, 6 lines of 0.9375°, starting at HD_WHEEL_START).
+For every month the line boundaries crossed are found from one batch of
+sampled positions and refined with Brent's method, and the stays between
+them are stored in hd_transit_intervals. Gate activity, ingresses and
+channels completed against a natal chart are then interval queries and
+joins over those rows.
+
+Positions are geocentric and tropical.
+"""
+from datetime import date, datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.database_sqlite import CacheSession
+from app.core.human_design_data import (
+    CHANNELS,
+    GATE_WHEEL,
+    HD_WHEEL_START,
+    LINE_ARC,
+)
+from app.models.hd_transit_interval import HDTransitInterval, HDTransitMonth
+from app.services.exact_event_calculator import ExactEventCalculator
+from app.utils.ephemeris import EphemerisCalculator
+
+
+class HumanDesignTransitService:
+    """
+    Stores and queries the gate/line intervals of the transiting HD bodies.
+
+    All public ranges are UTC calendar days with an inclusive end.
+    """
+
+    # The 13 HD bodies
+    BODIES = (
+        'sun', 'earth', 'moon', 'north_node', 'south_node', 'mercury', 'venus',
+        'mars', 'jupiter', 'saturn', 'uranus', 'neptune', 'pluto',
+    )
+
+    # Bodies derived from another body: (source, longitude offset)
+    DERIVED_BODIES = {
+        'earth': ('sun', 180.0),
+        'south_node': ('north_node', 180.0),
+    }
+
+    # Lines around the wheel (64 gates x 6 lines)
+    LINE_COUNT = 384
+
+    # Sampling step in days; the Moon crosses up to ~4.5 lines per step,
+    # each refined separately against its own boundary
+    SAMPLE_DAYS = 0.25
+
+    # Widening of a sample bracket that misses its root
+    BRACKET_MARGIN_DAYS = SAMPLE_DAYS / 8
+
+    # Longest stored piece (pieces are split at month boundaries)
+    MAX_PIECE_DAYS = 31.0
+
+    # Longest range served per request
+    MAX_RANGE_DAYS = 732
+
+    @classmethod
+    def compute_intervals(cls, jd_start: float, jd_end: float) -> List[Dict]:
+        """
+        Gate/line intervals of every HD body over [jd_start, jd_end)
+
+        Intervals are clipped to the range; a clipped start has
+        start_exact False.
+
+        Args:
+            jd_start: Start of range (Julian Day, UT)
+            jd_end: End of range (Julian Day, UT)
+
+        Returns:
+            Interval dicts (HDTransitInterval column values) sorted by
+            body and start
+        """
+        if jd_end <= jd_start:
+            return []
+
+        jds = np.append(np.arange(jd_start, jd_end, cls.SAMPLE_DAYS), jd_end)
+        sources = [body for body in cls.BODIES if body not in cls.DERIVED_BODIES]
+        batch = EphemerisCalculator.calculate_positions_batch(jds, sources, use_cache=True)
+        columns = {body: col for col, body in enumerate(batch.bodies)}
+
+        intervals = []
+        for body in cls.BODIES:
+            source, offset = cls.DERIVED_BODIES.get(body, (body, 0.0))
+            state = ExactEventCalculator.state_function(source)
+
+            def wheel(t: float, state=state, offset=offset) -> float:
+                """Longitude from the start of the wheel (0-360)"""
+                return (state(t)[0] + offset - HD_WHEEL_START) % 360.0
+
+            position = np.unwrap(
+                (batch.longitude[:, columns[source]] + offset - HD_WHEEL_START) % 360.0, period=360.0
+            )
+            index = np.floor(position / LINE_ARC).astype(np.int64)
+
+            crossings = []
+            for i in np.flatnonzero(index[1:] != index[:-1]):
+                before, after = int(index[i]), int(index[i + 1])
+                retrograde = after < before
+                levels = range(before, after, -1) if retrograde else range(before + 1, after + 1)
+                for level in levels:
+                    boundary = (level * LINE_ARC) % 360.0
+                    jd = ExactEventCalculator.refine_bracket(
+                        lambda t: ExactEventCalculator.wrap180(wheel(t) - boundary),
+                        jds[i], jds[i + 1], cls.BRACKET_MARGIN_DAYS
+                    )
+                    if jd is not None:
+                        entered = (level - 1 if retrograde else level) % cls.LINE_COUNT
+                        crossings.append((jd, entered, retrograde))
+
+            current = int(wheel(jd_start) // LINE_ARC) % cls.LINE_COUNT
+            start, exact, entered_retrograde = jd_start, False, False
+            for jd, entered, retrograde in sorted(crossings):
+                if entered == current or not jd_start < jd < jd_end:
+                    continue
+                intervals.append(cls._interval(body, current, start, jd, exact, entered_retrograde))
+                current, start, exact, entered_retrograde = entered, jd, True, retrograde
+            intervals.append(cls._interval(body, current, start, jd_end, exact, entered_retrograde))
+
+        return intervals
+
+    @classmethod
+    def ensure_range(cls, db: Session, start: date, end: date) -> int:
+        """
+        Compute and store the months of a range that are not stored yet
+
+        Args:
+            db: Database session
+            start: First day
+            end: Last day (inclusive)
+
+        Returns:
+            Number of months computed
+        """
+        months = cls._months(start, end)
+        keys = [month.strftime('%Y-%m') for month in months]
+        stored = {
+            month for (month,) in db.query(HDTransitMonth.month).filter(HDTransitMonth.month.in_(keys))
+        }
+        missing = [(month, key) for month, key in zip(months, keys) if key not in stored]
+        if not missing:
+            return 0
+
+        # Computed before writing, so the write lock is held only briefly
+        computed = [
+            (key, cls.compute_intervals(cls._julian_day(month), cls._julian_day(cls._next_month(month))))
+            for month, key in missing
+        ]
+
+        try:
+            with CacheSession(db) as session:
+                for key, intervals in computed:
+                    session.add(HDTransitMonth(month=key))
+                    session.add_all(HDTransitInterval(**interval) for interval in intervals)
+        except IntegrityError:
+            # A concurrent request stored the same months first
+            pass
+
+        return len(missing)
+
+    @classmethod
+    def intervals_between(
+        cls,
+        db: Session,
+        start: date,
+        end: date,
+        gates: Optional[Iterable[int]] = None,
+        bodies: Optional[Iterable[str]] = None,
+        level: str = 'line'
+    ) -> List[Dict]:
+        """
+        Gate or line stays overlapping the days of a range
+
+        Stored month pieces are joined back into whole stays; a stay that
+        began before the first month read has start_exact False.
+
+        Args:
+            db: Database session
+            start: First day
+            end: Last day (inclusive)
+            gates: Optional gates to restrict to
+            bodies: Optional HD bodies to restrict to
+            level: 'line' (one interval per line) or 'gate' (lines of one
+                gate joined)
+
+        Returns:
+            Interval dicts sorted by start: body, gate, line (None for gate
+            level), start_jd, end_jd, start, end, start_exact, retrograde
+        """
+        if level not in ('line', 'gate'):
+            raise ValueError("level must be 'line' or 'gate'")
+        if bodies is not None:
+            bodies = list(bodies)
+            unknown = set(bodies) - set(cls.BODIES)
+            if unknown:
+                raise ValueError(f"Unknown HD bodies: {', '.join(sorted(unknown))}")
+        jd_start, jd_end = cls._range(db, start, end)
+
+        query = db.query(HDTransitInterval).filter(
+            HDTransitInterval.start_jd >= jd_start - cls.MAX_PIECE_DAYS,
+            HDTransitInterval.start_jd < jd_end,
+            HDTransitInterval.end_jd > jd_start,
+        )
+        if gates is not None:
+            query = query.filter(HDTransitInterval.gate.in_(list(gates)))
+        if bodies is not None:
+            query = query.filter(HDTransitInterval.body.in_(bodies))
+
+        merged: List[Dict] = []
+        open_by_body: Dict[str, Dict] = {}
+        for row in query.order_by(HDTransitInterval.start_jd):
+            line = row.line if level == 'line' else None
+            previous = open_by_body.get(row.body)
+            if (
+                previous is not None and previous['end_jd'] == row.start_jd
+                and previous['gate'] == row.gate and previous['line'] == line
+            ):
+                previous['end_jd'] = row.end_jd
+                previous['end'] = row.end_date
+                continue
+            interval = {
+                'body': row.body,
+                'gate': row.gate,
+                'line': line,
+                'start_jd': row.start_jd,
+                'end_jd': row.end_jd,
+                'start': row.start_date,
+                'end': row.end_date,
+                'start_exact': row.start_exact,
+                'retrograde': row.retrograde,
+            }
+            merged.append(interval)
+            open_by_body[row.body] = interval
+
+        return merged
+
+    @classmethod
+    def ingresses(
+        cls,
+        db: Session,
+        start: date,
+        end: date,
+        level: str = 'gate',
+        bodies: Optional[Iterable[str]] = None
+    ) -> List[Dict]:
+        """
+        Exact moments bodies enter a new gate or line during a range
+
+        Args:
+            db: Database session
+            start: First day
+            end: Last day (inclusive)
+            level: 'gate' or 'line'
+            bodies: Optional HD bodies to restrict to
+
+        Returns:
+            Ingress dicts sorted by time: body, gate, line, jd, date,
+            retrograde
+        """
+        intervals = cls.intervals_between(db, start, end, bodies=bodies, level='line')
+        jd_start = cls._julian_day(start)
+        jd_end = cls._julian_day(end + timedelta(days=1))
+
+        events = []
+        for interval in intervals:
+            if not interval['start_exact'] or not jd_start <= interval['start_jd'] < jd_end:
+                continue
+            # A gate is entered through line 1 moving forwards, line 6 moving back
+            if level == 'gate' and interval['line'] != (6 if interval['retrograde'] else 1):
+                continue
+            events.append({
+                'body': interval['body'],
+                'gate': interval['gate'],
+                'line': interval['line'],
+                'jd': interval['start_jd'],
+                'date': interval['start'],
+                'retrograde': interval['retrograde'],
+            })
+        return events
+
+    @classmethod
+    def activations_at(cls, db: Session, when: datetime) -> Dict[str, Dict]:
+        """
+        Gate and line of every HD body at a moment
+
+        Args:
+            db: Database session
+            when: UTC datetime
+
+        Returns:
+            Body -> {gate, line, until}
+        """
+        jd = EphemerisCalculator.datetime_to_julian_day(when)
+        cls.ensure_range(db, when.date(), when.date())
+        rows = db.query(HDTransitInterval).filter(
+            HDTransitInterval.start_jd >= jd - cls.MAX_PIECE_DAYS,
+            HDTransitInterval.start_jd <= jd,
+            HDTransitInterval.end_jd > jd,
+        )
+        activations = {
+            row.body: {'gate': row.gate, 'line': row.line, 'until': row.end_date}
+            for row in rows
+        }
+        return {body: activations[body] for body in cls.BODIES if body in activations}
+
+    @classmethod
+    def channel_windows(
+        cls,
+        db: Session,
+        natal_gates: Iterable[int],
+        start: date,
+        end: date,
+        bodies: Optional[Sequence[str]] = None
+    ) -> List[Dict]:
+        """
+        When transits complete channels that are open in a natal chart
+
+        A channel is completed when transits sit in its missing gate (one
+        natal gate), or in both of its gates at once (no natal gate). Only
+        the intervals of the gates involved are read, and windows are
+        found by joining them, not by stepping through time.
+
+        Args:
+            db: Database session
+            natal_gates: Gates activated in the natal chart (Personality and Design)
+            start: First day
+            end: Last day (inclusive)
+            bodies: Optional transiting HD bodies to consider (e.g., without the Moon)
+
+        Returns:
+            Window dicts sorted by start: channel, name, gates, natal_gates,
+            transit_gates, start_jd, end_jd, start, end, bodies,
+            begins_before_range, ends_after_range
+        """
+        natal = set(natal_gates)
+        channels = [key for key in CHANNELS if not (key[0] in natal and key[1] in natal)]
+        needed = {gate for key in channels for gate in key if gate not in natal}
+
+        jd_start = cls._julian_day(start)
+        jd_end = cls._julian_day(end + timedelta(days=1))
+        by_gate: Dict[int, List[Dict]] = {gate: [] for gate in needed}
+        for interval in cls.intervals_between(db, start, end, gates=needed, bodies=bodies, level='gate'):
+            by_gate[interval['gate']].append(interval)
+        occupied = {
+            gate: cls._union(intervals, jd_start, jd_end) for gate, intervals in by_gate.items()
+        }
+
+        windows = []
+        for gate1, gate2 in channels:
+            name = CHANNELS[(gate1, gate2)][0]
+            transit_gates = [gate for gate in (gate1, gate2) if gate not in natal]
+            spans = occupied[transit_gates[0]]
+            if len(transit_gates) == 2:
+                spans = cls._intersect(spans, occupied[transit_gates[1]])
+
+            for span_start, span_end, span_bodies in spans:
+                windows.append({
+                    'channel': f"{gate1}-{gate2}",
+                    'name': name,
+                    'gates': [gate1, gate2],
+                    'natal_gates': [gate for gate in (gate1, gate2) if gate in natal],
+                    'transit_gates': transit_gates,
+                    'start_jd': span_start,
+                    'end_jd': span_end,
+                    'start': EphemerisCalculator.julian_day_to_datetime(span_start).isoformat(),
+                    'end': EphemerisCalculator.julian_day_to_datetime(span_end).isoformat(),
+                    'bodies': sorted(span_bodies, key=cls.BODIES.index),
+                    'begins_before_range': span_start <= jd_start,
+                    'ends_after_range': span_end >= jd_end,
+                })
+
+        windows.sort(key=lambda window: (window['start_jd'], window['channel']))
+        return windows
+
+    # -------------------------------------------------------------------------
+    # Helpers
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _union(
+        intervals: List[Dict],
+        jd_start: float,
+        jd_end: float
+    ) -> List[Tuple[float, float, Set[str]]]:
+        """Merge overlapping intervals (clipped to the range), collecting their bodies."""
+        spans: List[Tuple[float, float, Set[str]]] = []
+        for interval in sorted(intervals, key=lambda i: i['start_jd']):
+            low, high = max(interval['start_jd'], jd_start), min(interval['end_jd'], jd_end)
+            if low >= high:
+                continue
+            if spans and low <= spans[-1][1]:
+                last_low, last_high, last_bodies = spans[-1]
+                spans[-1] = (last_low, max(last_high, high), last_bodies | {interval['body']})
+            else:
+                spans.append((low, high, {interval['body']}))
+        return spans
+
+    @staticmethod
+    def _intersect(
+        first: List[Tuple[float, float, Set[str]]],
+        second: List[Tuple[float, float, Set[str]]]
+    ) -> List[Tuple[float, float, Set[str]]]:
+        """Overlaps of two sorted, disjoint span lists."""
+        spans = []
+        i = j = 0
+        while i < len(first) and j < len(second):
+            low = max(first[i][0], second[j][0])
+            high = min(first[i][1], second[j][1])
+            if low < high:
+                spans.append((low, high, first[i][2] | second[j][2]))
+            if first[i][1] < second[j][1]:
+                i += 1
+            else:
+                j += 1
+        return spans
+
+    @classmethod
+    def _interval(cls, body, index, start_jd, end_jd, start_exact, retrograde) -> Dict:
+        """Interval dict for a line index (0-383 from the wheel start)."""
+        return {
+            'body': body,
+            'gate': GATE_WHEEL[index // 6],
+            'line': index % 6 + 1,
+            'start_jd': float(start_jd),
+            'end_jd': float(end_jd),
+            'start_date': EphemerisCalculator.julian_day_to_datetime(start_jd).isoformat(),
+            'end_date': EphemerisCalculator.julian_day_to_datetime(end_jd).isoformat(),
+            'start_exact': start_exact,
+            'retrograde': retrograde,
+        }
+
+    @classmethod
+    def _range(cls, db: Session, start: date, end: date) -> Tuple[float, float]:
+        """Validate a day range, make sure it is stored, and return its Julian Days."""
+        if end < start:
+            raise ValueError("end must not be before start")
+        if (end - start).days >= cls.MAX_RANGE_DAYS:
+            raise ValueError(f"Range must be at most {cls.MAX_RANGE_DAYS} days")
+        cls.ensure_range(db, start, end)
+        return cls._julian_day(start), cls._julian_day(end + timedelta(days=1))
+
+    @staticmethod
+    def _julian_day(day: date) -> float:
+        """Julian Day of midnight UTC starting a day."""
+        return EphemerisCalculator.datetime_to_julian_day(datetime(day.year, day.month, day.day))
+
+    @staticmethod
+    def _next_month(month: date) -> date:
+        return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+    @classmethod
+    def _months(cls, start: date, end: date) -> List[date]:
+        """First days of the months a range touches."""
+        months = []
+        month = start.replace(day=1)
+        while month <= end:
+            months.append(month)
+            month = cls._next_month(month)
+        return months
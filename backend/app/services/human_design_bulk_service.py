@@ -0,0 +1,99 @@
+"""
+Human Design Bulk Service
+
+Computes Human Design charts for many birth records (a contact list, a
+research dataset) by splitting them into chunks that run on the
+calculation executor's workers. Within a chunk the charts share their
+ephemeris batches (HumanDesignCalculator.calculate_charts); across chunks
+the work spreads over every worker process. Results are yielded as each
+chunk finishes, so callers can stream them instead of waiting for all.
+"""
+import asyncio
+import logging
+import math
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple
+
+from app.services.calculation_executor import get_calculation_executor
+from app.services.human_design_calculator import HumanDesignCalculator
+
+logger = logging.getLogger(__name__)
+
+
+class HumanDesignBulkService:
+    """
+    Chunked, parallel Human Design chart calculation.
+    """
+
+    # Upper bound on charts per worker task; smaller chunks stream sooner
+    MAX_CHUNK_SIZE = 64
+
+    # Chunks per worker, so early finishers pick up more work
+    CHUNKS_PER_WORKER = 4
+
+    @classmethod
+    def plan_chunks(cls, count: int, workers: int) -> List[Tuple[int, int]]:
+        """
+        Split a number of records into chunks for the workers
+
+        Args:
+            count: Number of records
+            workers: Number of parallel workers
+
+        Returns:
+            List of (start, stop) index ranges covering 0..count
+        """
+        if count <= 0:
+            return []
+        size = math.ceil(count / (max(1, workers) * cls.CHUNKS_PER_WORKER))
+        size = max(1, min(cls.MAX_CHUNK_SIZE, size))
+        return [(start, min(start + size, count)) for start in range(0, count, size)]
+
+    @classmethod
+    async def stream_charts(
+        cls,
+        births: Sequence[Dict[str, Any]],
+        calculate: Callable[..., List[Dict]] = HumanDesignCalculator.calculate_charts,
+        **calc_params: Any
+    ) -> AsyncIterator[Tuple[int, Optional[Dict], Optional[str]]]:
+        """
+        Calculate charts for many births, yielding each as its chunk finishes
+
+        Args:
+            births: Birth dicts as taken by HumanDesignCalculator.calculate_charts
+            calculate: Chunk function with the calculate_charts signature
+                (must be picklable for the process executor)
+            **calc_params: zodiac_type, sidereal_method, ayanamsa, include_variables
+
+        Yields:
+            (index into births, chart or None, error message or None);
+            order follows chunk completion, not input order
+        """
+        executor = get_calculation_executor()
+        births = list(births)
+
+        chunks = cls.plan_chunks(len(births), executor.max_workers)
+        ranges = {
+            asyncio.ensure_future(
+                executor.run(calculate, births[start:stop], **calc_params)
+            ): (start, stop)
+            for start, stop in chunks
+        }
+        pending = set(ranges)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    start, stop = ranges[task]
+                    try:
+                        charts = task.result()
+                    except Exception as e:
+                        logger.warning(f"HD bulk chunk {start}-{stop} failed: {e}")
+                        for index in range(start, stop):
+                            yield index, None, str(e)
+                        continue
+                    for offset, chart in enumerate(charts):
+                        yield start + offset, chart, None
+        finally:
+            # Consumer stopped early (e.g., client disconnected)
+            for task in pending:
+                task.cancel()
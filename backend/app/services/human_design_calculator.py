@@ -12,8 +12,14 @@ Core calculation engine for Human Design charts including:
 """
 
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple, Set
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
 from app.utils.ephemeris import EphemerisCalculator
+from app.utils.sun_table import SunLongitudeTable
+from app.services.exact_event_calculator import ExactEventCalculator
+from app.services.bodygraph_engine import Bodygraph, BodygraphEngine
 from app.core.human_design_data import (
     # Gate/Line helpers
     get_gate_at_degree,
@@ -73,6 +79,12 @@ class HumanDesignCalculator:
     # 88° solar arc for Design calculation
     DESIGN_SOLAR_ARC = 88.0
 
+    # Mean daily motion of the Sun, for the design date first guess
+    SUN_MEAN_SPEED = 0.985647
+
+    # Newton iteration cap for the design date
+    DESIGN_MAX_ITERATIONS = 10
+
     @staticmethod
     def calculate_chart(
         birth_datetime: datetime,
@@ -106,7 +118,7 @@ class HumanDesignCalculator:
         )
 
         # Find Design datetime (when Sun was 88° behind)
-        design_jd, design_datetime, days_before = HumanDesignCalculator._find_design_datetime(
+        design_jd, _, _ = HumanDesignCalculator._find_design_datetime(
             personality_jd, zodiac_type, ayanamsa
         )
 
@@ -125,6 +137,92 @@ class HumanDesignCalculator:
             design_jd, zodiac_type, sidereal_method, ayanamsa, ayanamsa_value
         )
 
+        return HumanDesignCalculator._assemble_chart(
+            birth_datetime, personality_jd, design_jd,
+            personality_planets, design_planets,
+            zodiac_type, sidereal_method, ayanamsa, ayanamsa_value, include_variables
+        )
+
+    @staticmethod
+    def calculate_charts(
+        births: Sequence[Dict],
+        zodiac_type: str = 'tropical',
+        sidereal_method: str = 'shift_positions',
+        ayanamsa: str = 'lahiri',
+        include_variables: bool = True
+    ) -> List[Dict]:
+        """
+        Calculate Human Design charts for many births at once.
+
+        Results match calculate_chart for each birth, but the ephemeris work
+        is shared: all design dates are solved together, and the positions
+        for every personality and design moment come from one batch each.
+
+        Args:
+            births: Dicts with 'birth_datetime' (datetime), 'latitude',
+                'longitude' and optional 'timezone_offset_minutes'
+            zodiac_type: 'tropical' or 'sidereal'
+            sidereal_method: 'shift_positions' or 'shift_wheel' (for sidereal only)
+            ayanamsa: Ayanamsa system for sidereal calculations
+            include_variables: Whether to calculate Variables (arrows)
+
+        Returns:
+            List of chart data dictionaries, in the order of births
+        """
+        if not births:
+            return []
+
+        personality_jds = np.array([
+            EphemerisCalculator.datetime_to_julian_day(
+                birth['birth_datetime'], birth.get('timezone_offset_minutes', 0)
+            )
+            for birth in births
+        ])
+        design_jds = HumanDesignCalculator._find_design_jds(personality_jds, zodiac_type, ayanamsa)
+
+        ayanamsa_values = np.zeros(len(births))
+        if zodiac_type == 'sidereal':
+            ayanamsa_values = EphemerisCalculator.get_sidereal_context(ayanamsa).ayanamsa_arrays(
+                personality_jds
+            )[0]
+
+        use_zodiac = HumanDesignCalculator._positions_zodiac(zodiac_type, sidereal_method)
+        personality_batch = EphemerisCalculator.calculate_positions_batch(
+            personality_jds, HumanDesignCalculator.PLANETS, zodiac=use_zodiac, ayanamsa=ayanamsa
+        )
+        design_batch = EphemerisCalculator.calculate_positions_batch(
+            design_jds, HumanDesignCalculator.PLANETS, zodiac=use_zodiac, ayanamsa=ayanamsa
+        )
+
+        charts = []
+        for row, birth in enumerate(births):
+            charts.append(HumanDesignCalculator._assemble_chart(
+                birth['birth_datetime'],
+                float(personality_jds[row]),
+                float(design_jds[row]),
+                HumanDesignCalculator._with_derived_points(personality_batch.positions_at(row)),
+                HumanDesignCalculator._with_derived_points(design_batch.positions_at(row)),
+                zodiac_type, sidereal_method, ayanamsa, float(ayanamsa_values[row]), include_variables
+            ))
+        return charts
+
+    @staticmethod
+    def _assemble_chart(
+        birth_datetime: datetime,
+        personality_jd: float,
+        design_jd: float,
+        personality_planets: Dict[str, Dict],
+        design_planets: Dict[str, Dict],
+        zodiac_type: str,
+        sidereal_method: str,
+        ayanamsa: str,
+        ayanamsa_value: float,
+        include_variables: bool
+    ) -> Dict:
+        """Build the chart data from Personality and Design positions."""
+        design_datetime = EphemerisCalculator.julian_day_to_datetime(design_jd)
+        days_before = personality_jd - design_jd
+
         # Calculate gate activations for both
         personality_activations = HumanDesignCalculator._calculate_activations(
             personality_planets, 'Personality', include_variables
@@ -133,31 +231,29 @@ class HumanDesignCalculator:
             design_planets, 'Design', include_variables
         )
 
-        # Collect all activated gates
-        all_gates = set()
-        personality_gates = set()
-        design_gates = set()
-
-        for planet, activation in personality_activations.items():
-            all_gates.add(activation['gate'])
-            personality_gates.add(activation['gate'])
+        # Collect all activated gates as gate masks
+        personality_mask = BodygraphEngine.gate_mask(
+            act['gate'] for act in personality_activations.values()
+        )
+        design_mask = BodygraphEngine.gate_mask(
+            act['gate'] for act in design_activations.values()
+        )
 
-        for planet, activation in design_activations.items():
-            all_gates.add(activation['gate'])
-            design_gates.add(activation['gate'])
+        # Complete channels, defined centers and their connectivity
+        bodygraph = BodygraphEngine.analyze(personality_mask | design_mask)
 
         # Calculate defined channels
         channels = HumanDesignCalculator._calculate_channels(
-            personality_activations, design_activations
+            personality_activations, design_activations, bodygraph, personality_mask, design_mask
         )
 
         # Calculate center definitions
-        centers = HumanDesignCalculator._calculate_centers(channels, all_gates)
+        centers = HumanDesignCalculator._calculate_centers(channels, bodygraph)
         defined_centers = [c for c, data in centers.items() if data['defined']]
         undefined_centers = [c for c, data in centers.items() if not data['defined']]
 
         # Determine Type
-        hd_type, strategy = HumanDesignCalculator._determine_type(centers, channels)
+        hd_type, strategy = HumanDesignCalculator._determine_type(bodygraph)
 
         # Determine Authority
         authority, authority_desc = HumanDesignCalculator._determine_authority(
@@ -170,9 +266,7 @@ class HumanDesignCalculator:
         )
 
         # Calculate Definition type
-        definition, definition_desc = HumanDesignCalculator._calculate_definition(
-            centers, channels
-        )
+        definition, definition_desc = HumanDesignCalculator._calculate_definition(bodygraph)
 
         # Calculate Incarnation Cross
         incarnation_cross = HumanDesignCalculator._calculate_incarnation_cross(
@@ -228,9 +322,9 @@ class HumanDesignCalculator:
             'channels': channels,
 
             # Gates
-            'all_activated_gates': sorted(list(all_gates)),
-            'personality_gates': sorted(list(personality_gates)),
-            'design_gates': sorted(list(design_gates)),
+            'all_activated_gates': BodygraphEngine.gates_of(bodygraph.gate_mask),
+            'personality_gates': BodygraphEngine.gates_of(personality_mask),
+            'design_gates': BodygraphEngine.gates_of(design_mask),
 
             # Incarnation Cross
             'incarnation_cross': incarnation_cross,
@@ -262,62 +356,107 @@ class HumanDesignCalculator:
     ) -> Tuple[float, datetime, float]:
         """
         Find the Design datetime when Sun was 88° behind birth Sun position.
-        Uses binary search for precision (Sun speed varies throughout year).
+
+        Newton iteration on the Sun's longitude using its speed from
+        calc_ut. The initial guess comes from the daily Sun longitude table
+        when it is available (then one or two steps suffice), otherwise
+        from the Sun's mean motion (three or four steps).
 
         Returns:
             Tuple of (design_jd, design_datetime, days_before)
         """
+        sun_state = ExactEventCalculator.state_function('sun', zodiac_type, ayanamsa)
+
         # Get birth Sun position
-        birth_sun = EphemerisCalculator.calculate_planet_position(
-            'sun', personality_jd,
-            zodiac=zodiac_type,
-            ayanamsa=ayanamsa
-        )
-        birth_sun_long = birth_sun['longitude']
+        birth_sun_long = sun_state(personality_jd)[0]
 
         # Target position is 88° behind (earlier in zodiac)
         target_long = (birth_sun_long - HumanDesignCalculator.DESIGN_SOLAR_ARC) % 360
 
-        # Initial estimate: ~88 days before (Sun moves ~1° per day)
-        # But we need to search because Sun speed varies
-        estimate_days = 89.0  # Slightly more than 88 due to average Sun speed
+        design_jd = HumanDesignCalculator._estimate_design_jd(
+            personality_jd, target_long, zodiac_type, ayanamsa
+        )
+
+        tolerance = 1e-7  # degrees (~0.01 seconds of time)
+        for _ in range(HumanDesignCalculator.DESIGN_MAX_ITERATIONS):
+            sun_long, sun_speed = sun_state(design_jd)
+            diff = HumanDesignCalculator._angle_difference(sun_long, target_long)
+            if abs(diff) < tolerance:
+                break
+            design_jd -= diff / sun_speed
 
-        # Binary search window
-        low_jd = personality_jd - estimate_days - 5
-        high_jd = personality_jd - estimate_days + 5
+        design_datetime = EphemerisCalculator.julian_day_to_datetime(design_jd)
+        days_before = personality_jd - design_jd
 
-        # Binary search for exact position
-        tolerance = 0.0001  # ~0.4 seconds of arc
-        max_iterations = 50
+        return design_jd, design_datetime, days_before
 
-        for _ in range(max_iterations):
-            mid_jd = (low_jd + high_jd) / 2
-            mid_sun = EphemerisCalculator.calculate_planet_position(
-                'sun', mid_jd,
-                zodiac=zodiac_type,
-                ayanamsa=ayanamsa
+    @staticmethod
+    def _estimate_design_jd(
+        personality_jd: float,
+        target_long: float,
+        zodiac_type: str,
+        ayanamsa: str
+    ) -> float:
+        """Initial guess for the design date (table lookup or mean motion)."""
+        table = SunLongitudeTable.get()
+        if table is not None:
+            tropical_target = target_long
+            if zodiac_type == 'sidereal':
+                # The ayanamsa changes by seconds of arc over 88 days
+                tropical_target = (target_long + EphemerisCalculator.calculate_ayanamsa(
+                    personality_jd, ayanamsa
+                )) % 360
+            # 88° of solar arc takes 86-92 days depending on the season
+            estimate = table.find_crossing(
+                tropical_target, personality_jd - 95.0, personality_jd - 84.0
             )
-            mid_long = mid_sun['longitude']
+            if estimate is not None:
+                return estimate
 
-            # Calculate difference from target
-            diff = HumanDesignCalculator._angle_difference(mid_long, target_long)
+        return personality_jd - HumanDesignCalculator.DESIGN_SOLAR_ARC / HumanDesignCalculator.SUN_MEAN_SPEED
 
-            if abs(diff) < tolerance:
-                break
+    @staticmethod
+    def _find_design_jds(
+        personality_jds: np.ndarray,
+        zodiac_type: str,
+        ayanamsa: str
+    ) -> np.ndarray:
+        """
+        Vectorized _find_design_datetime for an array of birth moments.
 
-            # Adjust search window
-            if diff > 0:
-                # Sun is ahead of target, need earlier time
-                high_jd = mid_jd
-            else:
-                # Sun is behind target, need later time
-                low_jd = mid_jd
+        Each Newton step evaluates the Sun for all births still iterating
+        in one ephemeris batch.
 
-        design_jd = mid_jd
-        design_datetime = EphemerisCalculator.julian_day_to_datetime(design_jd)
-        days_before = personality_jd - design_jd
+        Returns:
+            Design Julian Days, shaped like personality_jds
+        """
+        birth_sun = EphemerisCalculator.calculate_positions_batch(
+            personality_jds, ['sun'], zodiac=zodiac_type, ayanamsa=ayanamsa
+        ).longitude[:, 0]
+        targets = np.mod(birth_sun - HumanDesignCalculator.DESIGN_SOLAR_ARC, 360.0)
+
+        design_jds = np.array([
+            HumanDesignCalculator._estimate_design_jd(
+                float(jd), float(target), zodiac_type, ayanamsa
+            )
+            for jd, target in zip(personality_jds, targets)
+        ])
+
+        tolerance = 1e-7  # degrees, as in _find_design_datetime
+        active = np.arange(len(design_jds))
+        for _ in range(HumanDesignCalculator.DESIGN_MAX_ITERATIONS):
+            sun = EphemerisCalculator.calculate_positions_batch(
+                design_jds[active], ['sun'], zodiac=zodiac_type, ayanamsa=ayanamsa
+            )
+            diff = np.mod(sun.longitude[:, 0] - targets[active], 360.0)
+            diff = np.where(diff > 180.0, diff - 360.0, diff)
+            moving = np.abs(diff) >= tolerance
+            active = active[moving]
+            if len(active) == 0:
+                break
+            design_jds[active] -= diff[moving] / sun.speed_longitude[moving, 0]
 
-        return design_jd, design_datetime, days_before
+        return design_jds
 
     @staticmethod
     def _angle_difference(angle1: float, angle2: float) -> float:
@@ -339,50 +478,66 @@ class HumanDesignCalculator:
         Calculate planetary positions for all HD planets.
 
         Handles sidereal methods:
-        - shift_positions: Swiss Ephemeris handles sidereal natively
+        - shift_positions: Sidereal positions (derived from tropical)
         - shift_wheel: Use tropical positions (gate wheel will be shifted)
         """
-        use_zodiac = zodiac_type
+        batch = EphemerisCalculator.calculate_positions_batch(
+            [jd],
+            HumanDesignCalculator.PLANETS,
+            zodiac=HumanDesignCalculator._positions_zodiac(zodiac_type, sidereal_method),
+            ayanamsa=ayanamsa
+        )
+        return HumanDesignCalculator._with_derived_points(batch.positions_at(0))
+
+    @staticmethod
+    def _positions_zodiac(zodiac_type: str, sidereal_method: str) -> str:
+        """Zodiac the planet positions are calculated in."""
         if zodiac_type == 'sidereal' and sidereal_method == 'shift_wheel':
             # For shift_wheel method, get tropical positions
             # The ayanamsa will be applied when mapping to gates
-            use_zodiac = 'tropical'
+            return 'tropical'
+        return zodiac_type
 
+    @staticmethod
+    def _with_derived_points(planets: Dict[str, Optional[Dict]]) -> Dict[str, Optional[Dict]]:
+        """
+        Add Earth (opposite Sun) and South Node (opposite North Node).
+
+        Args:
+            planets: Positions of PLANETS (None where a calculation failed)
+
+        Returns:
+            Positions with 'earth' after 'sun' and 'south_node' after 'north_node'
+        """
         positions = {}
 
-        for planet in HumanDesignCalculator.PLANETS:
-            try:
-                pos = EphemerisCalculator.calculate_planet_position(
-                    planet, jd, zodiac=use_zodiac, ayanamsa=ayanamsa
-                )
-                positions[planet] = pos
-
-                # Calculate Earth (opposite Sun) and South Node (opposite North Node)
-                if planet == 'sun':
-                    earth_long = (pos['longitude'] + 180) % 360
-                    positions['earth'] = {
-                        'longitude': earth_long,
-                        'sign': int(earth_long / 30),
-                        'degree_in_sign': earth_long % 30,
-                        'sign_name': EphemerisCalculator.get_sign_name(int(earth_long / 30)),
-                        'retrograde': False,
-                        'latitude': 0,
-                        'speed_longitude': pos['speed_longitude'],
-                    }
-                elif planet == 'north_node':
-                    south_long = (pos['longitude'] + 180) % 360
-                    positions['south_node'] = {
-                        'longitude': south_long,
-                        'sign': int(south_long / 30),
-                        'degree_in_sign': south_long % 30,
-                        'sign_name': EphemerisCalculator.get_sign_name(int(south_long / 30)),
-                        'retrograde': pos.get('retrograde', True),
-                        'latitude': 0,
-                        'speed_longitude': pos.get('speed_longitude', 0),
-                    }
-            except Exception as e:
-                print(f"Error calculating {planet}: {e}")
-                positions[planet] = None
+        for planet, pos in planets.items():
+            positions[planet] = pos
+            if pos is None:
+                continue
+
+            if planet == 'sun':
+                earth_long = (pos['longitude'] + 180) % 360
+                positions['earth'] = {
+                    'longitude': earth_long,
+                    'sign': int(earth_long / 30),
+                    'degree_in_sign': earth_long % 30,
+                    'sign_name': EphemerisCalculator.get_sign_name(int(earth_long / 30)),
+                    'retrograde': False,
+                    'latitude': 0,
+                    'speed_longitude': pos['speed_longitude'],
+                }
+            elif planet == 'north_node':
+                south_long = (pos['longitude'] + 180) % 360
+                positions['south_node'] = {
+                    'longitude': south_long,
+                    'sign': int(south_long / 30),
+                    'degree_in_sign': south_long % 30,
+                    'sign_name': EphemerisCalculator.get_sign_name(int(south_long / 30)),
+                    'retrograde': pos.get('retrograde', True),
+                    'latitude': 0,
+                    'speed_longitude': pos.get('speed_longitude', 0),
+                }
 
         return positions
 
@@ -438,12 +593,22 @@ class HumanDesignCalculator:
     @staticmethod
     def _calculate_channels(
         personality_activations: Dict[str, Dict],
-        design_activations: Dict[str, Dict]
+        design_activations: Dict[str, Dict],
+        bodygraph: Bodygraph,
+        personality_mask: int,
+        design_mask: int
     ) -> List[Dict]:
         """
         Calculate defined channels.
         A channel is defined when both endpoint gates are activated
         (can be from Personality, Design, or both).
+
+        Args:
+            personality_activations: Personality gate activations
+            design_activations: Design gate activations
+            bodygraph: Bitmask summary of the combined gates
+            personality_mask: Personality gate mask
+            design_mask: Design gate mask
         """
         # Collect all activated gates with their sources
         gate_sources: Dict[int, Dict] = {}  # gate -> {personality: [planets], design: [planets]}
@@ -460,59 +625,50 @@ class HumanDesignCalculator:
                 gate_sources[gate] = {'personality': [], 'design': []}
             gate_sources[gate]['design'].append(act['planet'])
 
-        # Check each channel definition
         defined_channels = []
 
-        for (gate1, gate2), channel_data in CHANNELS.items():
-            name, center1, center2, circuit, description = channel_data
-
-            # Check if both gates are activated
-            if gate1 in gate_sources and gate2 in gate_sources:
-                source1 = gate_sources[gate1]
-                source2 = gate_sources[gate2]
-
-                # Determine activation type
-                g1_pers = len(source1['personality']) > 0
-                g1_des = len(source1['design']) > 0
-                g2_pers = len(source2['personality']) > 0
-                g2_des = len(source2['design']) > 0
-
-                # Channel activation type
-                if (g1_pers or g2_pers) and (g1_des or g2_des):
-                    activation_type = 'both'
-                elif g1_pers and g2_pers:
-                    activation_type = 'personality'
-                elif g1_des and g2_des:
-                    activation_type = 'design'
-                else:
-                    # Mixed: one gate from personality, one from design
-                    activation_type = 'both'
-
-                defined_channels.append({
-                    'gate1': gate1,
-                    'gate2': gate2,
-                    'name': name,
-                    'center1': center1.value,
-                    'center2': center2.value,
-                    'circuit': circuit,
-                    'description': description,
-                    'gate1_activations': source1['personality'] + source1['design'],
-                    'gate2_activations': source2['personality'] + source2['design'],
-                    'activation_type': activation_type,
-                })
+        for index in BodygraphEngine.channel_indices(bodygraph.channel_mask):
+            gate1, gate2 = BodygraphEngine.CHANNEL_KEYS[index]
+            pair = BodygraphEngine.CHANNEL_GATE_MASKS[index]
+            name, center1, center2, circuit, description = CHANNELS[(gate1, gate2)]
+            source1 = gate_sources[gate1]
+            source2 = gate_sources[gate2]
+
+            # Channel activation type: one side only, or both (including
+            # one gate from Personality and the other from Design)
+            if personality_mask & pair and design_mask & pair:
+                activation_type = 'both'
+            elif personality_mask & pair == pair:
+                activation_type = 'personality'
+            else:
+                activation_type = 'design'
+
+            defined_channels.append({
+                'gate1': gate1,
+                'gate2': gate2,
+                'name': name,
+                'center1': center1.value,
+                'center2': center2.value,
+                'circuit': circuit,
+                'description': description,
+                'gate1_activations': source1['personality'] + source1['design'],
+                'gate2_activations': source2['personality'] + source2['design'],
+                'activation_type': activation_type,
+            })
 
         return defined_channels
 
     @staticmethod
     def _calculate_centers(
         channels: List[Dict],
-        all_gates: Set[int]
+        bodygraph: Bodygraph
     ) -> Dict[CenterType, Dict]:
         """
         Calculate center definition status.
         A center is defined when it has at least one complete channel.
         """
         centers = {}
+        gate_mask = bodygraph.gate_mask
 
         # Track which channels define each center
         center_channels: Dict[CenterType, List[str]] = {ct: [] for ct in CenterType}
@@ -526,11 +682,11 @@ class HumanDesignCalculator:
         # Build center data
         for center_type, center_data in CENTERS.items():
             # Find activated gates in this center
-            activated_gates = [g for g in center_data['gates'] if g in all_gates]
+            activated_gates = [g for g in center_data['gates'] if gate_mask >> (g - 1) & 1]
 
-            # Center is defined if it has any defining channels
+            # Center is defined if it has any complete channel
             defining_channels = center_channels[center_type]
-            is_defined = len(defining_channels) > 0
+            is_defined = BodygraphEngine.is_defined(bodygraph.center_mask, center_type)
 
             centers[center_type] = {
                 'name': center_data['name'],
@@ -547,10 +703,7 @@ class HumanDesignCalculator:
         return centers
 
     @staticmethod
-    def _determine_type(
-        centers: Dict[CenterType, Dict],
-        channels: List[Dict]
-    ) -> Tuple[HumanDesignType, str]:
+    def _determine_type(bodygraph: Bodygraph) -> Tuple[HumanDesignType, str]:
         """
         Determine Human Design Type based on center definitions.
 
@@ -561,105 +714,8 @@ class HumanDesignCalculator:
         4. Generator: Sacral defined, no Throat connection
         5. Projector: Everything else
         """
-        sacral_defined = centers[CenterType.SACRAL]['defined']
-        throat_defined = centers[CenterType.THROAT]['defined']
-
-        # Count defined centers
-        defined_count = sum(1 for c in centers.values() if c['defined'])
-
-        # 1. Reflector - no defined centers
-        if defined_count == 0:
-            return (HumanDesignType.REFLECTOR,
-                    TYPES[HumanDesignType.REFLECTOR]['strategy'])
-
-        # Check motor to throat connections
-        motor_centers = [CenterType.SACRAL, CenterType.SOLAR_PLEXUS,
-                        CenterType.HEART, CenterType.ROOT]
-
-        # Build connectivity graph to check paths
-        motor_to_throat = HumanDesignCalculator._has_motor_to_throat_path(
-            centers, channels
-        )
-        sacral_to_throat = HumanDesignCalculator._has_path_between(
-            CenterType.SACRAL, CenterType.THROAT, centers, channels
-        )
-
-        # 2 & 3. Check Generator types (Sacral defined)
-        if sacral_defined:
-            if sacral_to_throat:
-                return (HumanDesignType.MANIFESTING_GENERATOR,
-                        TYPES[HumanDesignType.MANIFESTING_GENERATOR]['strategy'])
-            else:
-                return (HumanDesignType.GENERATOR,
-                        TYPES[HumanDesignType.GENERATOR]['strategy'])
-
-        # 4. Manifestor - motor to throat, no Sacral
-        if motor_to_throat:
-            return (HumanDesignType.MANIFESTOR,
-                    TYPES[HumanDesignType.MANIFESTOR]['strategy'])
-
-        # 5. Projector - everything else
-        return (HumanDesignType.PROJECTOR,
-                TYPES[HumanDesignType.PROJECTOR]['strategy'])
-
-    @staticmethod
-    def _has_motor_to_throat_path(
-        centers: Dict[CenterType, Dict],
-        channels: List[Dict]
-    ) -> bool:
-        """Check if any motor center has a path to the Throat."""
-        motor_centers = [CenterType.SOLAR_PLEXUS, CenterType.HEART, CenterType.ROOT]
-        # Note: Sacral is handled separately for Generator distinction
-
-        for motor in motor_centers:
-            if centers[motor]['defined']:
-                if HumanDesignCalculator._has_path_between(
-                    motor, CenterType.THROAT, centers, channels
-                ):
-                    return True
-        return False
-
-    @staticmethod
-    def _has_path_between(
-        start: CenterType,
-        end: CenterType,
-        centers: Dict[CenterType, Dict],
-        channels: List[Dict]
-    ) -> bool:
-        """BFS to check if there's a path between two centers via defined channels."""
-        if not centers[start]['defined'] or not centers[end]['defined']:
-            return False
-
-        if start == end:
-            return True
-
-        # Build adjacency from channels
-        adjacency: Dict[str, Set[str]] = {}
-        for channel in channels:
-            c1 = channel['center1']
-            c2 = channel['center2']
-            if c1 not in adjacency:
-                adjacency[c1] = set()
-            if c2 not in adjacency:
-                adjacency[c2] = set()
-            adjacency[c1].add(c2)
-            adjacency[c2].add(c1)
-
-        # BFS
-        visited = {start.value}
-        queue = [start.value]
-
-        while queue:
-            current = queue.pop(0)
-            if current == end.value:
-                return True
-
-            for neighbor in adjacency.get(current, []):
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append(neighbor)
-
-        return False
+        hd_type = BodygraphEngine.hd_type(bodygraph)
+        return hd_type, TYPES[hd_type]['strategy']
 
     @staticmethod
     def _determine_authority(
@@ -769,55 +825,11 @@ class HumanDesignCalculator:
         }
 
     @staticmethod
-    def _calculate_definition(
-        centers: Dict[CenterType, Dict],
-        channels: List[Dict]
-    ) -> Tuple[Definition, str]:
+    def _calculate_definition(bodygraph: Bodygraph) -> Tuple[Definition, str]:
         """
         Calculate Definition type (how defined centers are connected).
         """
-        defined_centers = [ct for ct, data in centers.items() if data['defined']]
-
-        if len(defined_centers) == 0:
-            return Definition.NONE, DEFINITIONS[Definition.NONE]['description']
-
-        # Build connectivity graph
-        adjacency: Dict[CenterType, Set[CenterType]] = {ct: set() for ct in defined_centers}
-
-        for channel in channels:
-            c1 = CenterType(channel['center1'])
-            c2 = CenterType(channel['center2'])
-            if c1 in adjacency and c2 in adjacency:
-                adjacency[c1].add(c2)
-                adjacency[c2].add(c1)
-
-        # Find connected components using BFS
-        visited = set()
-        components = 0
-
-        for center in defined_centers:
-            if center not in visited:
-                components += 1
-                queue = [center]
-                while queue:
-                    current = queue.pop(0)
-                    if current in visited:
-                        continue
-                    visited.add(current)
-                    for neighbor in adjacency[current]:
-                        if neighbor not in visited:
-                            queue.append(neighbor)
-
-        # Map component count to definition type
-        if components == 1:
-            definition = Definition.SINGLE
-        elif components == 2:
-            definition = Definition.SPLIT
-        elif components == 3:
-            definition = Definition.TRIPLE_SPLIT
-        else:
-            definition = Definition.QUADRUPLE_SPLIT
-
+        definition = BodygraphEngine.definition(bodygraph)
         return definition, DEFINITIONS[definition]['description']
 
     @staticmethod
@@ -0,0 +1,303 @@
+"""
+Natal Cache Service
+
+Content-addressed cache for natal computations. Keys are a hash of the
+birth data content plus every calculation parameter (zodiac, ayanamsa,
+house system, body set, ...). Entries live in an in-process LRU tier
+backed by the natal_chart_cache SQLite table, and are dropped whenever the
+owning BirthData record is updated or deleted.
+"""
+import copy
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from sqlalchemy.exc import IntegrityError, StatementError
+from sqlalchemy.orm import Session, object_session
+
+from app.core.config import settings
+from app.core.database_sqlite import CacheSession
+from app.core.celestial_registry import CelestialRegistry
+from app.models.birth_data import BirthData
+from app.models.natal_chart_cache import NatalChartCache
+
+logger = logging.getLogger(__name__)
+
+
+class NatalCacheService:
+    """
+    Two-tier (memory + SQLite) cache for natal chart computations.
+    """
+
+    # Bump whenever calculator output changes shape or values, so
+    # persisted entries from older code are never served
+    CACHE_VERSION = 6
+
+    # BirthData fields that affect a calculation
+    BIRTH_FIELDS = ('birth_date', 'birth_time', 'time_unknown', 'latitude', 'longitude',
+                    'timezone', 'utc_offset')
+
+    _lru: "OrderedDict[str, Tuple[str, Dict[str, Any]]]" = OrderedDict()
+    _lock = threading.Lock()
+
+    @classmethod
+    def make_key(cls, birth_data: BirthData, chart_kind: str, **params: Any) -> str:
+        """
+        Build the content hash for a birth record and calculation parameters
+
+        Args:
+            birth_data: BirthData record
+            chart_kind: Calculation kind (e.g., 'western', 'vedic', 'human_design')
+            **params: Calculation parameters (zodiac, ayanamsa, house_system, ...)
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        params.setdefault('bodies', CelestialRegistry.get_planets_for_calculation())
+        payload = {
+            'version': cls.CACHE_VERSION,
+            'kind': chart_kind,
+            'birth': {field: getattr(birth_data, field, None) for field in cls.BIRTH_FIELDS},
+            'params': params,
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str, separators=(',', ':'))
+        return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+    @classmethod
+    def get_or_compute(
+        cls,
+        db: Optional[Session],
+        birth_data: BirthData,
+        chart_kind: str,
+        compute: Callable[[], Dict[str, Any]],
+        **params: Any
+    ) -> Dict[str, Any]:
+        """
+        Return cached natal data, computing and storing it on a miss
+
+        Args:
+            db: Database session for the SQLite tier (defaults to the
+                session birth_data is attached to; memory only if none)
+            birth_data: BirthData record the calculation is based on
+            chart_kind: Calculation kind
+            compute: Zero-argument callable producing JSON-serializable data
+            **params: Calculation parameters that form part of the key
+
+        Returns:
+            A private copy of the chart data (callers may mutate it)
+        """
+        if not settings.ENABLE_CACHE:
+            return compute()
+
+        key = cls.make_key(birth_data, chart_kind, **params)
+        if db is None:
+            db = object_session(birth_data)
+
+        data = cls._lookup(db, key, birth_data.id)
+        if data is None:
+            data = compute()
+            cls._save(db, key, birth_data, chart_kind, params, data)
+        return copy.deepcopy(data)
+
+    @classmethod
+    async def get_or_compute_async(
+        cls,
+        db: Optional[Session],
+        birth_data: BirthData,
+        chart_kind: str,
+        compute: Callable[[], Awaitable[Dict[str, Any]]],
+        **params: Any
+    ) -> Dict[str, Any]:
+        """
+        Async variant of get_or_compute for calculations run off the event loop
+
+        Args:
+            db: Database session (see get_or_compute)
+            birth_data: BirthData record the calculation is based on
+            chart_kind: Calculation kind
+            compute: Zero-argument callable returning an awaitable of the
+                chart data (e.g., a CalculationExecutor.run call)
+            **params: Calculation parameters that form part of the key
+
+        Returns:
+            A private copy of the chart data (callers may mutate it)
+        """
+        if not settings.ENABLE_CACHE:
+            return await compute()
+
+        key = cls.make_key(birth_data, chart_kind, **params)
+        if db is None:
+            db = object_session(birth_data)
+
+        data = cls._lookup(db, key, birth_data.id)
+        if data is None:
+            data = await compute()
+            cls._save(db, key, birth_data, chart_kind, params, data)
+        return copy.deepcopy(data)
+
+    @classmethod
+    def lookup(
+        cls,
+        db: Optional[Session],
+        birth_data: BirthData,
+        chart_kind: str,
+        **params: Any
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return cached natal data without computing on a miss
+
+        For callers that compute misses themselves (e.g., in bulk) and
+        record them with store().
+
+        Args:
+            db: Database session (see get_or_compute)
+            birth_data: BirthData record the calculation is based on
+            chart_kind: Calculation kind
+            **params: Calculation parameters that form part of the key
+
+        Returns:
+            A private copy of the chart data, or None on a miss
+        """
+        if not settings.ENABLE_CACHE:
+            return None
+
+        key = cls.make_key(birth_data, chart_kind, **params)
+        if db is None:
+            db = object_session(birth_data)
+
+        data = cls._lookup(db, key, birth_data.id)
+        return copy.deepcopy(data) if data is not None else None
+
+    @classmethod
+    def store(
+        cls,
+        db: Optional[Session],
+        birth_data: BirthData,
+        chart_kind: str,
+        data: Dict[str, Any],
+        **params: Any
+    ) -> None:
+        """
+        Record natal data computed outside get_or_compute
+
+        A copy is stored, so the caller may keep modifying data.
+
+        Args:
+            db: Database session (see get_or_compute)
+            birth_data: BirthData record the calculation is based on
+            chart_kind: Calculation kind
+            data: JSON-serializable chart data
+            **params: Calculation parameters that form part of the key
+        """
+        if not settings.ENABLE_CACHE:
+            return
+
+        key = cls.make_key(birth_data, chart_kind, **params)
+        if db is None:
+            db = object_session(birth_data)
+        cls._save(db, key, birth_data, chart_kind, params, copy.deepcopy(data))
+
+    @classmethod
+    def invalidate(cls, birth_data_id: str, db: Optional[Session] = None) -> int:
+        """
+        Drop every cached entry computed from a birth record
+
+        Args:
+            birth_data_id: BirthData ID
+            db: Database session; when given, persisted rows are deleted too
+                (the caller commits)
+
+        Returns:
+            Number of entries removed from the memory tier
+        """
+        with cls._lock:
+            stale = [key for key, (owner, _) in cls._lru.items() if owner == birth_data_id]
+            for key in stale:
+                del cls._lru[key]
+
+        if db is not None:
+            db.query(NatalChartCache).filter(
+                NatalChartCache.birth_data_id == birth_data_id
+            ).delete(synchronize_session=False)
+
+        return len(stale)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Empty the in-process tier"""
+        with cls._lock:
+            cls._lru.clear()
+
+    @classmethod
+    def _lookup(cls, db: Optional[Session], key: str, birth_data_id: str) -> Optional[Dict[str, Any]]:
+        """Find an entry in the LRU tier, then the SQLite tier"""
+        with cls._lock:
+            entry = cls._lru.get(key)
+            if entry is not None:
+                cls._lru.move_to_end(key)
+                return entry[1]
+
+        if db is not None:
+            row = db.query(NatalChartCache).filter(NatalChartCache.cache_key == key).first()
+            if row is not None:
+                cls._remember(key, birth_data_id, row.chart_data)
+                return row.chart_data
+        return None
+
+    @classmethod
+    def _save(
+        cls,
+        db: Optional[Session],
+        key: str,
+        birth_data: BirthData,
+        chart_kind: str,
+        params: Dict[str, Any],
+        data: Dict[str, Any]
+    ) -> None:
+        """Record a freshly computed entry in both tiers"""
+        if db is not None:
+            cls._store(db, key, birth_data, chart_kind, params, data)
+        cls._remember(key, birth_data.id, data)
+
+    @classmethod
+    def _remember(cls, key: str, birth_data_id: str, data: Dict[str, Any]) -> None:
+        """Insert into the LRU tier, evicting the oldest entries"""
+        with cls._lock:
+            cls._lru[key] = (birth_data_id, data)
+            cls._lru.move_to_end(key)
+            while len(cls._lru) > settings.NATAL_CACHE_SIZE:
+                cls._lru.popitem(last=False)
+
+    @classmethod
+    def _store(
+        cls,
+        db: Session,
+        key: str,
+        birth_data: BirthData,
+        chart_kind: str,
+        params: Dict[str, Any],
+        data: Dict[str, Any]
+    ) -> None:
+        """
+        Persist an entry; a concurrent insert of the same key is harmless
+
+        Written through a CacheSession, so the caller's pending changes are
+        not committed with it.
+        """
+        try:
+            with CacheSession(db) as session:
+                session.add(NatalChartCache(
+                    cache_key=key,
+                    birth_data_id=birth_data.id,
+                    chart_kind=chart_kind,
+                    params=json.loads(json.dumps(params, default=str)),
+                    chart_data=data,
+                ))
+        except IntegrityError:
+            pass
+        except (StatementError, TypeError, ValueError) as e:
+            # Data that is not JSON-serializable stays memory-only
+            logger.warning(f"Natal cache entry for {chart_kind} not persisted: {e}")
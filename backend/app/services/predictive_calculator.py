@@ -0,0 +1,301 @@
+"""
+Predictive chart calculation
+Secondary progressions, solar arc directions and solar/lunar returns
+
+Progressions use the day-for-a-year key: the chart for age N years is the
+sky N days after birth. Solar arc directions move every natal point by the
+progressed Sun's arc. Returns are the moments the Sun or Moon comes back
+to its natal longitude; all returns of a range are solved together by
+Newton iteration, each iteration being one batched ephemeris call over
+every return still converging.
+"""
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import swisseph as swe
+
+from app.utils.ephemeris import EphemerisCalculator
+
+
+class PredictiveChartCalculator:
+    """
+    Service for progressed, directed and return charts
+    """
+
+    # Day-for-a-year key: days of ephemeris time per year of life
+    TROPICAL_YEAR = 365.242190
+
+    # Mean return periods in days; only used to seed the Newton search
+    RETURN_PERIODS = {
+        'sun': 365.242190,
+        'moon': 27.321582,
+    }
+
+    # Return time tolerance in days (~0.01 second)
+    TOLERANCE_DAYS = 1e-7
+
+    MAX_ITERATIONS = 20
+
+    @classmethod
+    def progressed_julian_days(cls, natal_jd: float, target_jds: Sequence[float]) -> np.ndarray:
+        """
+        Progressed Julian Days for target dates (one day per year of life)
+
+        Args:
+            natal_jd: Birth Julian Day (UT)
+            target_jds: Julian Days of the dates being progressed to
+
+        Returns:
+            Array of progressed Julian Days
+        """
+        targets = np.atleast_1d(np.asarray(target_jds, dtype=np.float64))
+        return natal_jd + (targets - natal_jd) / cls.TROPICAL_YEAR
+
+    @classmethod
+    def calculate_progressions(
+        cls,
+        birth_datetime: datetime,
+        latitude: float,
+        longitude: float,
+        timezone_offset_minutes: int,
+        target_dates: Sequence[datetime],
+        house_system: str = 'placidus',
+        zodiac: str = 'tropical',
+        ayanamsa: str = 'lahiri'
+    ) -> List[Dict[str, Any]]:
+        """
+        Secondary progressions and solar arc directions for many dates
+
+        The natal chart and every progressed chart come from one batched
+        ephemeris call. Progressed angles advance the natal ARMC by the
+        solar arc.
+
+        Args:
+            birth_datetime: Birth date and time (local)
+            latitude: Birth latitude
+            longitude: Birth longitude
+            timezone_offset_minutes: Birth timezone offset from UTC
+            target_dates: Dates to progress to (UTC)
+            house_system: House system for progressed houses
+            zodiac: 'tropical' or 'sidereal'
+            ayanamsa: Ayanamsa system for sidereal calculations
+
+        Returns:
+            One dict per target date with:
+            - target_date, progressed_julian_day, progressed_datetime
+            - planets: progressed positions (calculate_all_planets layout)
+            - houses: progressed cusps, ascendant and mc
+            - solar_arc: arc in degrees and 'directed' natal points
+        """
+        natal_jd = EphemerisCalculator.datetime_to_julian_day(birth_datetime, timezone_offset_minutes)
+        target_jds = [EphemerisCalculator.datetime_to_julian_day(date, 0) for date in target_dates]
+        progressed_jds = cls.progressed_julian_days(natal_jd, target_jds)
+
+        # Row 0 is the natal chart
+        batch = EphemerisCalculator.calculate_positions_batch(
+            np.concatenate([[natal_jd], progressed_jds]), zodiac=zodiac, ayanamsa=ayanamsa
+        )
+        sun = batch.body_index('sun')
+        arcs = np.mod(batch.longitude[1:, sun] - batch.longitude[0, sun], 360.0)
+
+        # Shifting to sidereal leaves the ARMC (an equatorial angle) as is
+        natal_houses = EphemerisCalculator.calculate_houses(natal_jd, latitude, longitude, house_system)
+        if zodiac == 'sidereal':
+            natal_houses = cls._houses_to_sidereal(natal_houses, natal_jd, ayanamsa)
+
+        natal_points = {
+            body: float(batch.longitude[0, col])
+            for col, body in enumerate(batch.bodies)
+            if not np.isnan(batch.longitude[0, col])
+        }
+        natal_points['ascendant'] = natal_houses['ascendant']
+        natal_points['mc'] = natal_houses['mc']
+        names = list(natal_points)
+        natal_longitudes = np.array([natal_points[name] for name in names])
+
+        # Every directed point for every date at once: (n_dates, n_points)
+        directed = np.mod(natal_longitudes[None, :] + arcs[:, None], 360.0)
+
+        results = []
+        for row, (target_date, progressed_jd, arc) in enumerate(
+            zip(target_dates, progressed_jds.tolist(), arcs.tolist())
+        ):
+            houses = cls._houses_from_armc(
+                natal_houses['armc'] + arc, progressed_jd, latitude, house_system
+            )
+            if zodiac == 'sidereal':
+                houses = cls._houses_to_sidereal(houses, progressed_jd, ayanamsa)
+
+            results.append({
+                'target_date': target_date.isoformat(),
+                'progressed_julian_day': progressed_jd,
+                'progressed_datetime': EphemerisCalculator.julian_day_to_datetime(progressed_jd).isoformat(),
+                'planets': batch.positions_at(row + 1),
+                'houses': houses,
+                'solar_arc': {
+                    'arc': arc,
+                    'directed': dict(zip(names, directed[row].tolist())),
+                },
+            })
+
+        return results
+
+    @classmethod
+    def find_returns(
+        cls,
+        body: str,
+        target_longitude: float,
+        jd_start: float,
+        jd_end: float,
+        zodiac: str = 'tropical',
+        ayanamsa: str = 'lahiri'
+    ) -> np.ndarray:
+        """
+        Every moment in a range when the Sun or Moon reaches a longitude
+
+        Each return is seeded from the mean period and refined by Newton
+        iteration on the body's longitude; all unconverged returns share
+        one ephemeris batch per iteration.
+
+        Args:
+            body: 'sun' or 'moon'
+            target_longitude: Longitude to return to (0-360°)
+            jd_start: Start of range (Julian Day, UT)
+            jd_end: End of range (Julian Day, UT)
+            zodiac: 'tropical' or 'sidereal'
+            ayanamsa: Ayanamsa system for sidereal searches
+
+        Returns:
+            Sorted array of return Julian Days within [jd_start, jd_end)
+        """
+        body = body.lower()
+        period = cls.RETURN_PERIODS.get(body)
+        if period is None:
+            raise ValueError(f"Returns are only supported for: {', '.join(cls.RETURN_PERIODS)}")
+        if jd_end <= jd_start:
+            return np.empty(0)
+
+        start = EphemerisCalculator.calculate_positions_batch([jd_start], [body], zodiac, ayanamsa)
+        ahead = np.mod(target_longitude - start.longitude[0, 0], 360.0)
+        first = jd_start + ahead / 360.0 * period
+
+        # One extra seed at each end absorbs errors in the mean-motion guess
+        count = int(np.ceil((jd_end - first) / period)) + 1
+        jds = first + period * np.arange(-1, count)
+
+        active = np.ones(len(jds), dtype=bool)
+        for _ in range(cls.MAX_ITERATIONS):
+            if not active.any():
+                break
+            positions = EphemerisCalculator.calculate_positions_batch(
+                jds[active], [body], zodiac, ayanamsa
+            )
+            offset = np.mod(positions.longitude[:, 0] - target_longitude + 180.0, 360.0) - 180.0
+            step = offset / positions.speed_longitude[:, 0]
+            jds[active] -= step
+            active[np.flatnonzero(active)[np.abs(step) < cls.TOLERANCE_DAYS]] = False
+
+        # Seeds that converged onto the same return are merged
+        jds = np.sort(jds[(jds >= jd_start) & (jds < jd_end)])
+        return jds[np.concatenate([[True], np.diff(jds) > period / 2])]
+
+    @classmethod
+    def calculate_returns(
+        cls,
+        birth_datetime: datetime,
+        latitude: float,
+        longitude: float,
+        timezone_offset_minutes: int,
+        body: str,
+        start_date: datetime,
+        end_date: datetime,
+        return_latitude: Optional[float] = None,
+        return_longitude: Optional[float] = None,
+        include_charts: bool = False,
+        house_system: str = 'placidus',
+        zodiac: str = 'tropical',
+        ayanamsa: str = 'lahiri'
+    ) -> List[Dict[str, Any]]:
+        """
+        Solar or lunar returns over a date range
+
+        Args:
+            birth_datetime: Birth date and time (local)
+            latitude: Birth latitude
+            longitude: Birth longitude
+            timezone_offset_minutes: Birth timezone offset from UTC
+            body: 'sun' (solar returns) or 'moon' (lunar returns)
+            start_date: Start of range (UTC)
+            end_date: End of range (UTC)
+            return_latitude: Location for return houses (default: birth place)
+            return_longitude: Location for return houses (default: birth place)
+            include_charts: Add planets and houses for every return, from
+                one batched ephemeris call
+            house_system: House system for return houses
+            zodiac: 'tropical' or 'sidereal'
+            ayanamsa: Ayanamsa system for sidereal calculations
+
+        Returns:
+            One dict per return with julian_day, datetime (UTC) and, with
+            include_charts, planets and houses
+        """
+        natal_jd = EphemerisCalculator.datetime_to_julian_day(birth_datetime, timezone_offset_minutes)
+        natal = EphemerisCalculator.calculate_positions_batch([natal_jd], [body.lower()], zodiac, ayanamsa)
+
+        return_jds = cls.find_returns(
+            body,
+            float(natal.longitude[0, 0]),
+            EphemerisCalculator.datetime_to_julian_day(start_date, 0),
+            EphemerisCalculator.datetime_to_julian_day(end_date, 0),
+            zodiac,
+            ayanamsa
+        )
+
+        results = [
+            {
+                'julian_day': jd,
+                'datetime': EphemerisCalculator.julian_day_to_datetime(jd).isoformat(),
+            }
+            for jd in return_jds.tolist()
+        ]
+        if not include_charts or not results:
+            return results
+
+        lat = latitude if return_latitude is None else return_latitude
+        lon = longitude if return_longitude is None else return_longitude
+        batch = EphemerisCalculator.calculate_positions_batch(return_jds, zodiac=zodiac, ayanamsa=ayanamsa)
+        for row, result in enumerate(results):
+            houses = EphemerisCalculator.calculate_houses(result['julian_day'], lat, lon, house_system)
+            if zodiac == 'sidereal':
+                houses = cls._houses_to_sidereal(houses, result['julian_day'], ayanamsa)
+            result['planets'] = batch.positions_at(row)
+            result['houses'] = houses
+
+        return results
+
+    @staticmethod
+    def _houses_from_armc(armc: float, jd: float, latitude: float, house_system: str) -> Dict:
+        """House cusps and angles for an ARMC (subset of the calculate_houses layout)"""
+        house_code = EphemerisCalculator.HOUSE_SYSTEMS.get(house_system.lower())
+        if house_code is None:
+            raise ValueError(f"Unknown house system: {house_system}")
+
+        obliquity = swe.calc_ut(jd, swe.ECL_NUT)[0][0]
+        cusps, ascmc = swe.houses_armc(armc % 360.0, latitude, obliquity, house_code)
+        return {
+            'cusps': list(cusps),
+            'ascendant': ascmc[0],
+            'mc': ascmc[1],
+            'armc': armc % 360.0,
+        }
+
+    @staticmethod
+    def _houses_to_sidereal(houses: Dict, jd: float, ayanamsa: str) -> Dict:
+        """Shift house cusps and angles to the sidereal zodiac"""
+        value = EphemerisCalculator.get_sidereal_context(ayanamsa).ayanamsa_at(jd)
+        shifted = dict(houses)
+        shifted['cusps'] = [(cusp - value) % 360.0 for cusp in houses['cusps']]
+        for key in ('ascendant', 'mc'):
+            shifted[key] = (houses[key] - value) % 360.0
+        return shifted
@@ -0,0 +1,427 @@
+"""
+Birth time rectification
+Ranks candidate birth times by how well their angles time a life's events
+
+Every minute of the birth day is a candidate. A candidate fixes the natal
+Ascendant and MC, and through them three families of contacts with the
+user's recorded events:
+
+- transits: slow transiting bodies on the event date aspecting the natal angles
+- progressed: the secondary-progressed Sun and Moon aspecting the natal angles
+- directed: the solar-arc Ascendant and MC aspecting natal planets
+
+All candidates are scored at once with NumPy. Candidate angles come from
+the ARMC in closed form (sidereal time is linear across one day), transit
+positions are computed once per event, and progressed positions are
+interpolated from one hourly batch of Sun and Moon positions, so only a
+handful of ephemeris calls are made however many candidates and events
+there are. Scoring runs over chunks of events and reports progress between
+chunks for streaming.
+"""
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+import numpy as np
+import swisseph as swe
+
+from app.utils.ephemeris import EphemerisCalculator
+from app.services.predictive_calculator import PredictiveChartCalculator
+
+
+@dataclass
+class RectificationGrid:
+    """
+    Candidate birth times with everything that does not depend on events
+
+    Arrays are indexed by candidate (n_c) and event (n_e).
+    """
+    local_start: datetime
+    step_minutes: int
+    latitude: float
+    obliquity: float
+    jds: np.ndarray             # (n_c,) candidate birth Julian Days (UT)
+    armc: np.ndarray            # (n_c,)
+    angles: np.ndarray          # (n_c, 2) natal ascendant, mc
+    natal: np.ndarray           # (n_c, n_natal) natal planet longitudes
+    natal_sun: np.ndarray       # (n_c,)
+    events: List[Dict[str, Any]]    # (n_e,) events used (after the birth date)
+    event_jds: np.ndarray       # (n_e,)
+    event_weights: np.ndarray   # (n_e,)
+    transits: np.ndarray        # (n_e, n_transit) transit longitudes on event dates
+    progression_jds: np.ndarray     # hourly sample times of the progressed bodies
+    progression_tracks: np.ndarray  # (n_samples, n_progressed) unwrapped longitudes
+
+    @property
+    def size(self) -> int:
+        return len(self.jds)
+
+
+class RectificationService:
+    """
+    Service for scoring and ranking candidate birth times
+    """
+
+    ANGLES = ['ascendant', 'mc']
+
+    NATAL_BODIES = ['sun', 'moon', 'mercury', 'venus', 'mars', 'jupiter',
+                    'saturn', 'uranus', 'neptune', 'pluto']
+    TRANSIT_BODIES = ['mars', 'jupiter', 'saturn', 'uranus', 'neptune', 'pluto']
+    PROGRESSED_BODIES = ['sun', 'moon']
+
+    TECHNIQUES = ['transits', 'progressed', 'directed']
+
+    # Orb in degrees per technique; a contact scores its technique weight
+    # when exact and falls linearly to 0 at the orb. Contacts are conjunction, square and opposition.
+    ORBS = {
+        'transits': 1.5,
+        'progressed': 1.0,
+        'directed': 1.0,
+    }
+
+    # Directed angles meet ten natal planets, so chance contacts are far
+    # more common than for the other techniques; each counts for less
+    TECHNIQUE_WEIGHTS = {
+        'transits': 1.0,
+        'progressed': 1.0,
+        'directed': 0.5,
+    }
+
+    IMPORTANCE_WEIGHTS = {
+        'minor': 1.0,
+        'moderate': 2.0,
+        'major': 3.0,
+        'transformative': 4.0,
+    }
+
+    # Sampling of the progressed Sun and Moon (linear interpolation error
+    # of the Moon stays under 0.001 degree)
+    PROGRESSION_SAMPLE_DAYS = 1.0 / 24.0
+
+    # Events scored per chunk (one progress update per chunk)
+    EVENT_CHUNK = 8
+
+    # Ranked candidates must be at least this far apart (minutes)
+    MIN_SEPARATION_MINUTES = 10
+
+    MAX_EVENTS = 500
+
+    @staticmethod
+    def hard_aspect_orb(separation: np.ndarray) -> np.ndarray:
+        """Distance in degrees to the nearest conjunction, square or opposition"""
+        return np.abs(np.mod(separation + 45.0, 90.0) - 45.0)
+
+    @classmethod
+    def build_grid(
+        cls,
+        birth_date: date,
+        latitude: float,
+        longitude: float,
+        timezone_offset_minutes: int,
+        events: Sequence[Dict[str, Any]],
+        step_minutes: int = 1
+    ) -> RectificationGrid:
+        """
+        Candidate times, their natal angles and planets, and event-date positions
+
+        Args:
+            birth_date: Local birth date
+            latitude: Birth latitude
+            longitude: Birth longitude
+            timezone_offset_minutes: Birth timezone offset from UTC
+            events: Dicts with 'date' (UTC datetime) and 'importance';
+                events before the birth date are ignored
+            step_minutes: Minutes between candidates
+
+        Returns:
+            RectificationGrid
+        """
+        if not -66.0 < latitude < 66.0:
+            raise ValueError("Rectification needs a birth latitude between -66 and +66 degrees")
+        if not 1 <= step_minutes <= 60:
+            raise ValueError("step_minutes must be between 1 and 60")
+
+        local_start = datetime.combine(birth_date, datetime.min.time())
+        jd0 = EphemerisCalculator.datetime_to_julian_day(local_start, timezone_offset_minutes)
+        offsets = np.arange(0, 1440, step_minutes, dtype=np.float64) / 1440.0
+        jds = jd0 + offsets
+
+        obliquity = swe.calc_ut(jd0 + 0.5, swe.ECL_NUT)[0][0]
+        armc = EphemerisCalculator.armc_at(jds, longitude)
+        asc, mc = EphemerisCalculator.angles_from_armc(armc, latitude, obliquity)
+
+        natal_batch = EphemerisCalculator.calculate_positions_batch(jds, cls.NATAL_BODIES)
+        natal = natal_batch.longitude
+        natal_sun = natal[:, natal_batch.body_index('sun')]
+
+        events = [event for event in events
+                  if EphemerisCalculator.datetime_to_julian_day(event['date'], 0) > jds[-1]]
+        if not events:
+            raise ValueError("At least one event after the birth date is required")
+        if len(events) > cls.MAX_EVENTS:
+            raise ValueError(f"At most {cls.MAX_EVENTS} events can be used")
+
+        event_jds = np.array([
+            EphemerisCalculator.datetime_to_julian_day(event['date'], 0) for event in events
+        ])
+        event_weights = np.array([
+            cls.IMPORTANCE_WEIGHTS.get((event.get('importance') or 'moderate').lower(), 2.0)
+            for event in events
+        ])
+        transits = EphemerisCalculator.calculate_positions_batch(
+            event_jds, cls.TRANSIT_BODIES
+        ).longitude
+
+        # Progressed times of every candidate/event pair fall between the
+        # first candidate and the last progressed date of the last candidate
+        last_progressed = PredictiveChartCalculator.progressed_julian_days(
+            jds[-1], [event_jds.max()]
+        )[0]
+        samples = int(np.ceil((last_progressed - jds[0]) / cls.PROGRESSION_SAMPLE_DAYS)) + 2
+        progression_jds = jds[0] + cls.PROGRESSION_SAMPLE_DAYS * np.arange(samples)
+        tracks = EphemerisCalculator.calculate_positions_batch(
+            progression_jds, cls.PROGRESSED_BODIES
+        ).longitude
+
+        return RectificationGrid(
+            local_start=local_start,
+            step_minutes=step_minutes,
+            latitude=latitude,
+            obliquity=obliquity,
+            jds=jds,
+            armc=armc,
+            angles=np.stack([asc, mc], axis=1),
+            natal=natal,
+            natal_sun=natal_sun,
+            events=events,
+            event_jds=event_jds,
+            event_weights=event_weights,
+            transits=transits,
+            progression_jds=progression_jds,
+            progression_tracks=np.degrees(np.unwrap(np.radians(tracks), axis=0)),
+        )
+
+    @classmethod
+    def contact_orbs(
+        cls,
+        grid: RectificationGrid,
+        technique: str,
+        candidates: slice = slice(None),
+        events: slice = slice(None)
+    ) -> Tuple[np.ndarray, List[str], List[str]]:
+        """
+        Orbs of one technique's contacts for a block of candidates and events
+
+        Args:
+            grid: Precomputed grid
+            technique: 'transits', 'progressed' or 'directed'
+            candidates: Candidate slice
+            events: Event slice
+
+        Returns:
+            (orbs shaped (n_c, n_e, n_moving, n_fixed), moving point names,
+            fixed point names)
+        """
+        angles = grid.angles[candidates]
+        event_jds = grid.event_jds[events]
+
+        if technique == 'transits':
+            moving = grid.transits[events][None, :, :]
+            fixed = angles
+            names = (cls.TRANSIT_BODIES, cls.ANGLES)
+        elif technique in ('progressed', 'directed'):
+            birth_jds = grid.jds[candidates]
+            # Day-for-a-year progressed time of every candidate/event pair
+            progressed_jds = birth_jds[:, None] + (
+                event_jds[None, :] - birth_jds[:, None]
+            ) / PredictiveChartCalculator.TROPICAL_YEAR
+            tracks = np.stack([
+                np.interp(progressed_jds, grid.progression_jds, grid.progression_tracks[:, col])
+                for col in range(len(cls.PROGRESSED_BODIES))
+            ], axis=-1)
+
+            if technique == 'progressed':
+                moving = tracks
+                fixed = angles
+                names = (cls.PROGRESSED_BODIES, cls.ANGLES)
+            else:
+                sun = cls.PROGRESSED_BODIES.index('sun')
+                arcs = tracks[:, :, sun] - grid.natal_sun[candidates][:, None]
+                directed_asc, directed_mc = EphemerisCalculator.angles_from_armc(
+                    grid.armc[candidates][:, None] + arcs, grid.latitude, grid.obliquity
+                )
+                moving = np.stack([directed_asc, directed_mc], axis=-1)
+                fixed = grid.natal[candidates]
+                names = (cls.ANGLES, cls.NATAL_BODIES)
+        else:
+            raise ValueError(f"Unknown technique: {technique}")
+
+        separation = moving[:, :, :, None] - fixed[:, None, None, :]
+        return cls.hard_aspect_orb(separation), list(names[0]), list(names[1])
+
+    @classmethod
+    def contact_scores(cls, orbs: np.ndarray, technique: str) -> np.ndarray:
+        """Linear orb kernel scaled by the technique weight (0 at or beyond the orb)"""
+        # NaN orbs (bodies without ephemeris data) never score
+        kernel = np.nan_to_num(np.clip(1.0 - orbs / cls.ORBS[technique], 0.0, None))
+        return cls.TECHNIQUE_WEIGHTS[technique] * kernel
+
+    @classmethod
+    def iter_rectification(
+        cls,
+        birth_date: date,
+        latitude: float,
+        longitude: float,
+        timezone_offset_minutes: int,
+        events: Sequence[Dict[str, Any]],
+        step_minutes: int = 1,
+        top: int = 5,
+        house_system: str = 'placidus'
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Score every candidate birth time, yielding progress as it goes
+
+        Args:
+            birth_date: Local birth date
+            latitude: Birth latitude
+            longitude: Birth longitude
+            timezone_offset_minutes: Birth timezone offset from UTC
+            events: Dicts with 'date' (UTC datetime), 'importance' and
+                optionally 'id' and 'title'
+            step_minutes: Minutes between candidates
+            top: Number of ranked candidates to return
+            house_system: House system for the ranked candidates' cusps
+
+        Yields:
+            {"stage": ..., "progress": 0..1} updates, then a final
+            {"stage": "done", "progress": 1.0, "result": ...} where result
+            is the rectify() dict
+        """
+        house_code = EphemerisCalculator.HOUSE_SYSTEMS.get(house_system.lower())
+        if house_code is None:
+            raise ValueError(f"Unknown house system: {house_system}")
+
+        grid = cls.build_grid(
+            birth_date, latitude, longitude, timezone_offset_minutes, events, step_minutes
+        )
+        yield {'stage': 'ephemeris', 'progress': 0.05}
+
+        n_events = len(grid.event_jds)
+        chunks = [slice(start, min(start + cls.EVENT_CHUNK, n_events))
+                  for start in range(0, n_events, cls.EVENT_CHUNK)]
+        total = len(chunks) * len(cls.TECHNIQUES)
+        done = 0
+
+        technique_scores = {}
+        for technique in cls.TECHNIQUES:
+            scores = np.zeros(grid.size)
+            for chunk in chunks:
+                orbs, _, _ = cls.contact_orbs(grid, technique, events=chunk)
+                per_event = cls.contact_scores(orbs, technique).sum(axis=(2, 3))
+                scores += per_event @ grid.event_weights[chunk]
+                done += 1
+                yield {'stage': technique, 'progress': round(0.05 + 0.9 * done / total, 4)}
+            technique_scores[technique] = scores
+
+        total_scores = sum(technique_scores.values())
+        ranked = cls.rank_candidates(total_scores, top, grid.step_minutes)
+        best = float(total_scores.max())
+
+        candidates = []
+        for index in ranked:
+            candidate = cls._describe_candidate(grid, int(index), house_code)
+            candidate['score'] = round(float(total_scores[index]), 4)
+            candidate['relative_score'] = round(float(total_scores[index]) / best, 4) if best > 0 else 0.0
+            candidate['technique_scores'] = {
+                technique: round(float(scores[index]), 4)
+                for technique, scores in technique_scores.items()
+            }
+            candidates.append(candidate)
+
+        yield {
+            'stage': 'done',
+            'progress': 1.0,
+            'result': {
+                'birth_date': birth_date.isoformat(),
+                'step_minutes': grid.step_minutes,
+                'candidate_count': grid.size,
+                'event_count': n_events,
+                'candidates': candidates,
+                'scores': [round(float(score), 3) for score in total_scores],
+            },
+        }
+
+    @classmethod
+    def rectify(cls, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """
+        Run iter_rectification to completion
+
+        Returns:
+            Dict with birth_date, step_minutes, candidate_count, event_count,
+            candidates (ranked, best first) and scores (one per candidate
+            time, in time order)
+        """
+        result = None
+        for update in cls.iter_rectification(*args, **kwargs):
+            result = update.get('result', result)
+        return result
+
+    @classmethod
+    def rank_candidates(cls, scores: np.ndarray, top: int, step_minutes: int = 1) -> List[int]:
+        """
+        Indices of the best candidates, at most one per score peak
+
+        Neighbouring minutes score almost alike, so a candidate is skipped
+        when a better one lies within MIN_SEPARATION_MINUTES of it.
+        """
+        separation = max(1, int(np.ceil(cls.MIN_SEPARATION_MINUTES / step_minutes)))
+        ranked: List[int] = []
+        for index in np.argsort(-scores, kind='stable'):
+            if len(ranked) >= top:
+                break
+            if all(abs(int(index) - other) >= separation for other in ranked):
+                ranked.append(int(index))
+        return ranked
+
+    @classmethod
+    def _describe_candidate(
+        cls,
+        grid: RectificationGrid,
+        index: int,
+        house_code: bytes
+    ) -> Dict[str, Any]:
+        """Time, angles, cusps and contributing contacts of one candidate"""
+        local_time = grid.local_start + timedelta(minutes=index * grid.step_minutes)
+        asc, mc = (float(value) for value in grid.angles[index])
+        cusps, _ = swe.houses_armc(float(grid.armc[index]), grid.latitude, grid.obliquity, house_code)
+
+        hits = []
+        for technique in cls.TECHNIQUES:
+            orbs, moving, fixed = cls.contact_orbs(grid, technique, candidates=slice(index, index + 1))
+            scores = cls.contact_scores(orbs, technique)[0]
+            for e, m, f in zip(*np.nonzero(scores)):
+                event = grid.events[e]
+                hits.append({
+                    'event_id': event.get('id'),
+                    'event_title': event.get('title'),
+                    'event_date': event['date'].date().isoformat(),
+                    'technique': technique,
+                    'point': moving[m],
+                    'target': fixed[f],
+                    'orb': round(float(orbs[0, e, m, f]), 3),
+                    'score': round(float(scores[e, m, f] * grid.event_weights[e]), 4),
+                })
+        hits.sort(key=lambda hit: -hit['score'])
+
+        return {
+            'time': local_time.strftime('%H:%M'),
+            'local_datetime': local_time.isoformat(),
+            'utc_datetime': EphemerisCalculator.julian_day_to_datetime(float(grid.jds[index])).isoformat(),
+            'julian_day': float(grid.jds[index]),
+            'ascendant': asc,
+            'ascendant_sign': EphemerisCalculator.get_sign_name(int(asc // 30)),
+            'mc': mc,
+            'mc_sign': EphemerisCalculator.get_sign_name(int(mc // 30)),
+            'cusps': list(cusps),
+            'hits': hits,
+        }
@@ -0,0 +1,579 @@
+"""
+Shadbala Calculator Service
+
+Calculates Shadbala (six-fold strength) of the seven planets per Parashara:
+
+- Sthana bala: positional strength (exaltation, dignity in seven vargas,
+  odd/even signs, angular houses, decanate)
+- Dig bala: directional strength from the angles
+- Kala bala: temporal strength (day/night, lunar phase, thirds of day and
+  night, lords of year, month, weekday and hour, declination, planetary war)
+- Chesta bala: motional strength from the cheshta kendra
+- Naisargika bala: fixed natural strength
+- Drik bala: aspects received from benefics less those from malefics
+
+Every component is computed on (n_samples, 7) arrays, so a natal chart is
+the one-sample case of the range mode: a day-by-day series over a dasha
+period is one batched ephemeris call followed by array arithmetic.
+Strengths are in virupas (60 virupas = 1 rupa).
+"""
+
+from datetime import datetime
+from itertools import combinations
+from typing import Dict
+from dataclasses import dataclass
+
+import numpy as np
+import swisseph as swe
+
+from app.services.varga_engine import SIGN_LORDS, VIMSHOPAKA_PLANETS, VargaEngine
+from app.utils.ephemeris import EphemerisCalculator
+
+
+# Planets scored, in column order (weekday order from Sunday)
+PLANETS = list(VIMSHOPAKA_PLANETS)
+
+# The six balas and the parts making up the composite ones
+BALAS = ('sthana', 'dig', 'kala', 'chesta', 'naisargika', 'drik')
+STHANA_PARTS = ('uchcha', 'saptavargaja', 'ojayugmarasyamsa', 'kendradi', 'drekkana')
+KALA_PARTS = ('natonnata', 'paksha', 'tribhaga', 'abda', 'masa', 'vara', 'hora', 'ayana', 'yuddha')
+
+# Minimum total strength (rupas) for a planet to count as strong
+REQUIRED_RUPAS = np.array([6.5, 6.0, 5.0, 7.0, 6.5, 5.5, 5.0])
+
+# Sidereal exaltation points; debilitation is opposite
+EXALTATION_POINTS = np.array([10.0, 33.0, 298.0, 165.0, 95.0, 357.0, 200.0])
+
+# Moolatrikona sign and degree range in it
+_MOOLATRIKONA_SIGNS = np.array([4, 1, 0, 5, 8, 6, 10])
+_MOOLATRIKONA_START = np.array([0.0, 3.0, 0.0, 15.0, 0.0, 0.0, 0.0])
+_MOOLATRIKONA_END = np.array([20.0, 30.0, 12.0, 20.0, 10.0, 15.0, 20.0])
+
+# Saptavargaja bala: the vargas scored, and virupas per varga by compound
+# relationship to the sign lord (indexed by relationship + 2: great enemy
+# to great friend); own sign and moolatrikona (rasi only) score more
+SAPTAVARGA = (1, 2, 3, 7, 9, 12, 30)
+SAPTAVARGAJA_POINTS = np.array([1.875, 3.75, 7.5, 15.0, 22.5])
+OWN_SIGN_VIRUPAS = 30.0
+MOOLATRIKONA_VIRUPAS = 45.0
+
+# Moon and Venus gain in even signs and navamsas, the rest in odd ones
+_EVEN_SIGN_PLANETS = np.array([False, True, False, False, False, True, False])
+
+# Drekkana bala: male planets in the 1st decanate, neutral in the 2nd,
+# female in the 3rd
+_DREKKANA = np.array([0, 2, 0, 1, 0, 2, 1])
+
+# Kendradi bala by house from the ascendant mod 3: kendra, panapara, apoklima
+_KENDRADI_VIRUPAS = np.array([60.0, 30.0, 15.0])
+
+# Dig bala: house of full directional strength, as a column of
+# (ascendant, IC, descendant, MC)
+_DIG_ANGLES = np.array([3, 1, 3, 0, 0, 1, 2])
+
+# Natonnata bala: +1 strong at noon, -1 strong at midnight, 0 always full
+_NATONNATA = np.array([1, -1, -1, 0, 1, 1, -1])
+
+# Natural benefics for paksha bala (Mercury taken as benefic)
+_BENEFICS = np.array([False, True, False, True, True, True, False])
+
+# Tribhaga bala lords of the three parts of the day and of the night
+_DAY_THIRDS = np.array([3, 0, 6])
+_NIGHT_THIRDS = np.array([1, 5, 2])
+_JUPITER = PLANETS.index('jupiter')
+
+# Planetary hours run Sun, Venus, Mercury, Moon, Saturn, Jupiter, Mars
+_HORA_ORDER = np.array([0, 5, 3, 1, 6, 4, 2])
+_HORA_POSITION = np.argsort(_HORA_ORDER)
+
+# Kali Yuga epoch (JD 588465.5, a Friday) as a civil day number; abda and
+# masa lords rule the weekdays starting its 360-day years and 30-day months
+KALI_EPOCH_DAY = 588466
+
+# Ayana bala: +1 gains with north declination, -1 with south, 0 either way
+_AYANA = np.array([1, -1, 1, 0, 1, 1, -1])
+
+# Planets that can be at war (Mars to Saturn), closer than this many degrees
+_YUDDHA_PLANETS = (2, 3, 4, 5, 6)
+YUDDHA_ORB = 1.0
+
+# Superior planets take the Sun as sighrochcha, inferior ones their own
+# heliocentric longitude
+_SUPERIOR = np.array([False, False, True, False, True, False, True])
+_INFERIOR = np.array([False, False, False, True, False, True, False])
+
+# Naisargika bala: Sun 7/7 of a rupa down to Saturn 1/7
+NAISARGIKA_VIRUPAS = 60.0 * np.array([7, 6, 2, 3, 4, 5, 1]) / 7.0
+
+# Sputa drishti (virupas) by arc from the aspecting to the aspected planet
+_DRISHTI_ARCS = np.array([0.0, 30.0, 60.0, 90.0, 120.0, 150.0, 180.0, 300.0, 360.0])
+_DRISHTI_VIRUPAS = np.array([0.0, 0.0, 15.0, 45.0, 30.0, 0.0, 60.0, 0.0, 0.0])
+
+# Special full aspects: Mars on the 4th and 8th, Jupiter on the 5th and
+# 9th, Saturn on the 3rd and 10th
+_SPECIAL_ASPECTS = {
+    2: ((90.0, 120.0), (210.0, 240.0)),
+    4: ((120.0, 150.0), (240.0, 270.0)),
+    6: ((60.0, 90.0), (270.0, 300.0)),
+}
+
+# Apparent altitude of the Sun's centre at rising and setting
+_SUNRISE_ALTITUDE = -0.833
+
+
+@dataclass
+class ShadbalaSeries:
+    """
+    Shadbala of the 7 planets over sampled moments
+
+    All arrays are shaped (n_samples, 7), columns in PLANETS order, in
+    virupas.
+
+    Attributes:
+        jds: Sample Julian Days (UT)
+        balas: The six balas, keyed as in BALAS
+        parts: Sthana and kala bala parts, keyed as in STHANA_PARTS and
+            KALA_PARTS
+    """
+    jds: np.ndarray
+    balas: Dict[str, np.ndarray]
+    parts: Dict[str, np.ndarray]
+
+    @property
+    def total(self) -> np.ndarray:
+        """Sum of the six balas (virupas)"""
+        return sum(self.balas[name] for name in BALAS)
+
+    @property
+    def rupas(self) -> np.ndarray:
+        """Total strength in rupas"""
+        return self.total / 60.0
+
+    @property
+    def strength_ratio(self) -> np.ndarray:
+        """Total strength relative to each planet's required minimum"""
+        return self.rupas / REQUIRED_RUPAS
+
+    def planets_at(self, row: int = 0) -> Dict[str, Dict]:
+        """
+        Per-planet breakdown of one sample
+
+        Args:
+            row: Index into jds
+
+        Returns:
+            Planet -> balas, parts, totals and rank (1 = strongest by ratio)
+        """
+        ratio = self.strength_ratio[row]
+        ranks = np.empty(len(PLANETS), dtype=np.int64)
+        ranks[np.argsort(-ratio, kind='stable')] = np.arange(1, len(PLANETS) + 1)
+
+        result = {}
+        for col, planet in enumerate(PLANETS):
+            result[planet] = {
+                **{f'{name}_bala': round(float(self.balas[name][row, col]), 2) for name in BALAS},
+                'sthana_parts': {name: round(float(self.parts[name][row, col]), 2) for name in STHANA_PARTS},
+                'kala_parts': {name: round(float(self.parts[name][row, col]), 2) for name in KALA_PARTS},
+                'total_virupas': round(float(self.total[row, col]), 2),
+                'total_rupas': round(float(self.rupas[row, col]), 2),
+                'required_rupas': float(REQUIRED_RUPAS[col]),
+                'strength_ratio': round(float(ratio[col]), 3),
+                'is_strong': bool(ratio[col] >= 1.0),
+                'rank': int(ranks[col]),
+            }
+        return result
+
+    def to_dict(self) -> Dict:
+        """Compact sample-by-planet layout for API responses (rupas)"""
+        return {
+            'planets': list(PLANETS),
+            'dates': [EphemerisCalculator.julian_day_to_datetime(jd).isoformat() for jd in self.jds.tolist()],
+            **{f'{name}_bala': np.round(self.balas[name] / 60.0, 3).tolist() for name in BALAS},
+            'total_rupas': np.round(self.rupas, 3).tolist(),
+            'strength_ratio': np.round(self.strength_ratio, 3).tolist(),
+        }
+
+
+class ShadbalaCalculator:
+    """
+    Calculates Shadbala for Vedic charts and over date ranges.
+
+    Natal strengths use the sidereal positions of a VedicChartCalculator
+    chart; range strengths take the seven planets from one batched
+    sidereal ephemeris call and derive the angles from sidereal time.
+    """
+
+    PLANETS = PLANETS
+
+    @classmethod
+    def calculate(cls, chart_data: Dict) -> Dict:
+        """
+        Calculate Shadbala of a natal chart.
+
+        Args:
+            chart_data: Vedic chart from VedicChartCalculator.calculate_vedic_chart
+
+        Returns:
+            Dict containing:
+            - planets: Per-planet balas, parts and totals
+            - strongest_planet / weakest_planet: By ratio to required strength
+            - calculation_info: Julian Day and location used
+        """
+        d1_data = chart_data.get('d1', chart_data)
+        planets = d1_data.get('planets', {})
+        houses = d1_data.get('houses', {})
+        info = chart_data.get('calculation_info', {})
+
+        missing = [planet for planet in PLANETS if not planets.get(planet)]
+        if missing:
+            raise ValueError(f"Chart has no position for: {', '.join(missing)}")
+        required = {'julian_day', 'ayanamsa_value', 'latitude', 'longitude'}
+        if not required <= info.keys() or not {'ascendant', 'mc', 'armc'} <= houses.keys():
+            raise ValueError("Chart lacks the calculation info or angles Shadbala needs")
+
+        def column(key: str) -> np.ndarray:
+            return np.array([[planets[planet][key] for planet in PLANETS]], dtype=np.float64)
+
+        series = cls.score_positions(
+            jds=[info['julian_day']],
+            longitudes=column('longitude'),
+            latitudes=column('latitude'),
+            distances=column('distance'),
+            ayanamsa=[info['ayanamsa_value']],
+            ascendant=[houses['ascendant']],
+            mc=[houses['mc']],
+            armc=[houses['armc']],
+            geo_latitude=info['latitude'],
+            geo_longitude=info['longitude'],
+        )
+        result = series.planets_at(0)
+        by_rank = sorted(result, key=lambda planet: result[planet]['rank'])
+
+        return {
+            'planets': result,
+            'strongest_planet': by_rank[0],
+            'weakest_planet': by_rank[-1],
+            'calculation_info': {
+                'julian_day': info['julian_day'],
+                'ayanamsa': info.get('ayanamsa'),
+                'latitude': info['latitude'],
+                'longitude': info['longitude'],
+            },
+        }
+
+    @classmethod
+    def strength_series(
+        cls,
+        start: datetime,
+        end: datetime,
+        latitude: float,
+        longitude: float,
+        step_days: float = 1.0,
+        ayanamsa: str = 'lahiri',
+        timezone_offset_minutes: int = 0
+    ) -> ShadbalaSeries:
+        """
+        Shadbala of the 7 planets over a date range at one location
+
+        Positions for every sample come from one batched ephemeris call;
+        the ascendant and MC follow from local sidereal time.
+
+        Args:
+            start: Start of range
+            end: End of range (exclusive)
+            latitude: Geographic latitude
+            longitude: Geographic longitude (east positive)
+            step_days: Sampling step in days
+            ayanamsa: Ayanamsa system (should match the natal chart)
+            timezone_offset_minutes: Offset of start and end from UTC
+
+        Returns:
+            ShadbalaSeries
+        """
+        if step_days <= 0:
+            raise ValueError("step_days must be positive")
+        jd_start = EphemerisCalculator.datetime_to_julian_day(start, timezone_offset_minutes)
+        jd_end = EphemerisCalculator.datetime_to_julian_day(end, timezone_offset_minutes)
+        jds = jd_start + step_days * np.arange(max(int(np.ceil((jd_end - jd_start) / step_days)), 0))
+
+        batch = EphemerisCalculator.calculate_positions_batch(
+            jds, PLANETS, zodiac='sidereal', ayanamsa=ayanamsa
+        )
+        values, _ = EphemerisCalculator.get_sidereal_context(ayanamsa).ayanamsa_arrays(batch.jds)
+        armc = EphemerisCalculator.armc_at(batch.jds, longitude)
+        ascendant, mc = EphemerisCalculator.angles_from_armc(armc, latitude, _obliquity(batch.jds))
+
+        return cls.score_positions(
+            jds=batch.jds,
+            longitudes=batch.longitude,
+            latitudes=batch.latitude,
+            distances=batch.distance,
+            ayanamsa=values,
+            ascendant=ascendant - values,
+            mc=mc - values,
+            armc=armc,
+            geo_latitude=latitude,
+            geo_longitude=longitude,
+        )
+
+    @classmethod
+    def score_positions(
+        cls,
+        jds,
+        longitudes,
+        latitudes,
+        distances,
+        ayanamsa,
+        ascendant,
+        mc,
+        armc,
+        geo_latitude: float,
+        geo_longitude: float
+    ) -> ShadbalaSeries:
+        """
+        Shadbala from sidereal positions, shaped (n_samples, 7)
+
+        Args:
+            jds: Julian Days (UT) of the samples
+            longitudes: Sidereal longitudes, columns in PLANETS order
+            latitudes: Ecliptic latitudes
+            distances: Geocentric distances (AU)
+            ayanamsa: Ayanamsa value per sample
+            ascendant: Sidereal ascendant per sample
+            mc: Sidereal MC per sample
+            armc: Local sidereal time in degrees per sample
+            geo_latitude: Geographic latitude
+            geo_longitude: Geographic longitude (east positive)
+
+        Returns:
+            ShadbalaSeries
+        """
+        jds = np.atleast_1d(np.asarray(jds, dtype=np.float64))
+        lon = np.mod(np.asarray(longitudes, dtype=np.float64), 360.0)
+        lat = np.asarray(latitudes, dtype=np.float64)
+        dist = np.asarray(distances, dtype=np.float64)
+        ayanamsa = np.asarray(ayanamsa, dtype=np.float64)
+        ascendant = np.mod(np.asarray(ascendant, dtype=np.float64), 360.0)
+        mc = np.mod(np.asarray(mc, dtype=np.float64), 360.0)
+        armc = np.asarray(armc, dtype=np.float64)
+
+        parts = {}
+        parts.update(_sthana_parts(lon, ascendant))
+
+        # Equatorial frame: declinations, and the Sun's hour angle and
+        # semi-diurnal arc for the day/night parts
+        obliquity = np.radians(_obliquity(jds))[:, None]
+        tropical = np.radians(lon + ayanamsa[:, None])
+        beta = np.radians(lat)
+        declination = np.degrees(np.arcsin(
+            np.sin(beta) * np.cos(obliquity) + np.cos(beta) * np.sin(obliquity) * np.sin(tropical)
+        ))
+        sun_ra = np.degrees(np.arctan2(
+            np.cos(obliquity[:, 0]) * np.sin(tropical[:, 0]), np.cos(tropical[:, 0])
+        ))
+        hour_angle = _wrap(armc - sun_ra)
+        phi = np.radians(geo_latitude)
+        delta = np.radians(declination[:, 0])
+        cos_arc = (np.sin(np.radians(_SUNRISE_ALTITUDE)) - np.sin(phi) * np.sin(delta)) / (np.cos(phi) * np.cos(delta))
+        semi_arc = np.degrees(np.arccos(np.clip(cos_arc, -1.0, 1.0)))
+
+        elongation = _arc(lon[:, 1], lon[:, 0])
+        parts.update(_kala_parts(hour_angle, semi_arc, elongation, declination, jds, geo_longitude))
+
+        angles = np.stack([ascendant, mc + 180.0, ascendant + 180.0, mc], axis=1)
+        dig = (180.0 - _arc(lon, angles[:, _DIG_ANGLES])) / 3.0
+
+        chesta = _chesta(lon, lat, dist)
+        chesta[:, 0] = parts['ayana'][:, 0] / 2.0
+        chesta[:, 1] = elongation / 3.0
+
+        sthana = sum(parts[name] for name in STHANA_PARTS)
+        parts['yuddha'] = _yuddha(lon, lat, sthana + dig + sum(parts[name] for name in KALA_PARTS[:-1]))
+
+        balas = {
+            'sthana': sthana,
+            'dig': dig,
+            'kala': sum(parts[name] for name in KALA_PARTS),
+            'chesta': chesta,
+            'naisargika': np.broadcast_to(NAISARGIKA_VIRUPAS, lon.shape).copy(),
+            'drik': _drik(lon, waxing=np.mod(lon[:, 1] - lon[:, 0], 360.0) < 180.0),
+        }
+        return ShadbalaSeries(jds=jds, balas=balas, parts=parts)
+
+
+def _wrap(angle):
+    """Angle reduced to [-180, 180)"""
+    return np.mod(np.asarray(angle) + 180.0, 360.0) - 180.0
+
+
+def _arc(a, b):
+    """Shortest arc between longitudes (0-180)"""
+    return np.abs(_wrap(np.asarray(a) - np.asarray(b)))
+
+
+def _obliquity(jds: np.ndarray) -> np.ndarray:
+    """True obliquity of the ecliptic in degrees (Swiss Ephemeris)"""
+    return np.array([swe.calc_ut(float(jd), swe.ECL_NUT)[0][0] for jd in np.ravel(jds)])
+
+
+def _sthana_parts(lon: np.ndarray, ascendant: np.ndarray) -> Dict[str, np.ndarray]:
+    """The five sthana bala parts"""
+    signs = (lon // 30.0).astype(np.int64) % 12
+    degree = lon - signs * 30.0
+    planet = np.arange(len(PLANETS))
+
+    uchcha = _arc(lon, EXALTATION_POINTS + 180.0) / 3.0
+
+    # Dignity in each of the seven vargas by compound relationship with
+    # the varga sign's lord: (n, 7 planets, 7 vargas)
+    varga_signs = VargaEngine.calculate(lon, SAPTAVARGA).signs
+    lords = SIGN_LORDS[varga_signs]
+    compound = VargaEngine.compound_relationships(signs)
+    points = SAPTAVARGAJA_POINTS[np.take_along_axis(compound, lords, axis=2) + 2]
+    points[lords == planet[None, :, None]] = OWN_SIGN_VIRUPAS
+    moolatrikona = (
+        (signs == _MOOLATRIKONA_SIGNS)
+        & (degree >= _MOOLATRIKONA_START)
+        & (degree < _MOOLATRIKONA_END)
+    )
+    points[..., 0] = np.where(moolatrikona, MOOLATRIKONA_VIRUPAS, points[..., 0])
+
+    navamsa_signs = varga_signs[..., SAPTAVARGA.index(9)]
+    ojayugma = (
+        15.0 * ((signs % 2 == 1) == _EVEN_SIGN_PLANETS)
+        + 15.0 * ((navamsa_signs % 2 == 1) == _EVEN_SIGN_PLANETS)
+    )
+
+    asc_signs = (ascendant // 30.0).astype(np.int64)
+    houses = (signs - asc_signs[:, None]) % 12
+
+    return {
+        'uchcha': uchcha,
+        'saptavargaja': points.sum(axis=2),
+        'ojayugmarasyamsa': ojayugma,
+        'kendradi': _KENDRADI_VIRUPAS[houses % 3],
+        'drekkana': 15.0 * (np.minimum(degree // 10.0, 2) == _DREKKANA),
+    }
+
+
+def _kala_parts(
+    hour_angle: np.ndarray,
+    semi_arc: np.ndarray,
+    elongation: np.ndarray,
+    declination: np.ndarray,
+    jds: np.ndarray,
+    geo_longitude: float
+) -> Dict[str, np.ndarray]:
+    """Kala bala parts except yuddha bala"""
+    n = len(jds)
+    planet = np.arange(len(PLANETS))[None, :]
+
+    # Natonnata: distance of the Sun from the meridian (0 at noon)
+    nata = np.abs(hour_angle)[:, None]
+    natonnata = np.where(_NATONNATA > 0, (180.0 - nata) / 3.0, nata / 3.0)
+    natonnata[:, _NATONNATA == 0] = 60.0
+
+    paksha = np.where(_BENEFICS, elongation[:, None] / 3.0, 60.0 - elongation[:, None] / 3.0)
+    paksha[:, 1] *= 2.0
+
+    # Hour angle travelled since sunrise; day lasts twice the semi-arc
+    since_rise = np.mod(hour_angle + semi_arc, 360.0)
+    day_arc = 2.0 * semi_arc
+    is_day = since_rise < day_arc
+    day_third = 3.0 * since_rise / np.maximum(day_arc, 1e-9)
+    night_third = 3.0 * (since_rise - day_arc) / np.maximum(360.0 - day_arc, 1e-9)
+    third = np.clip(np.where(is_day, day_third, night_third), 0, 2).astype(np.int64)
+    tribhaga_lord = np.where(is_day, _DAY_THIRDS[third], _NIGHT_THIRDS[third])
+    tribhaga = 60.0 * (planet == tribhaga_lord[:, None])
+    tribhaga[:, _JUPITER] = 60.0
+
+    # The Vedic day runs from sunrise; weekday 0 is Sunday (the Sun's day)
+    sunrise_day = np.floor(jds - since_rise / 360.0 + 0.5 + geo_longitude / 360.0).astype(np.int64)
+    vara_lord = (sunrise_day + 1) % 7
+    ahargana = sunrise_day - KALI_EPOCH_DAY
+    abda_lord = (KALI_EPOCH_DAY + 360 * (ahargana // 360) + 1) % 7
+    masa_lord = (KALI_EPOCH_DAY + 30 * (ahargana // 30) + 1) % 7
+    hour = (since_rise // 15.0).astype(np.int64) % 24
+    hora_lord = _HORA_ORDER[(_HORA_POSITION[vara_lord] + hour) % 7]
+
+    kranti = np.where(_AYANA == 0, np.abs(declination), _AYANA * declination)
+    ayana = np.clip((24.0 + kranti) / 48.0 * 60.0, 0.0, 60.0)
+    ayana[:, 0] *= 2.0
+
+    return {
+        'natonnata': natonnata,
+        'paksha': paksha,
+        'tribhaga': tribhaga,
+        'abda': 15.0 * (planet == abda_lord[:, None]),
+        'masa': 30.0 * (planet == masa_lord[:, None]),
+        'vara': 45.0 * (planet == vara_lord[:, None]),
+        'hora': 60.0 * (planet == hora_lord[:, None]),
+        'ayana': ayana,
+        'yuddha': np.zeros((n, len(PLANETS))),
+    }
+
+
+def _chesta(lon: np.ndarray, lat: np.ndarray, dist: np.ndarray) -> np.ndarray:
+    """
+    Chesta bala of the five star planets from the cheshta kendra
+
+    True heliocentric longitudes (geocentric vectors less the Sun's) stand
+    in for the mean positions of the classical method. The kendra is the
+    sighrochcha less the midpoint of the mean and true planet, reaching
+    180° (full strength) at retrograde opposition or inferior conjunction.
+    Sun and Moon columns are left at zero.
+    """
+    lam = np.radians(lon)
+    beta = np.radians(lat)
+    vectors = np.stack([
+        dist * np.cos(beta) * np.cos(lam),
+        dist * np.cos(beta) * np.sin(lam),
+        dist * np.sin(beta),
+    ], axis=-1)
+    helio = vectors - vectors[:, :1, :]
+    helio_lon = np.degrees(np.arctan2(helio[..., 1], helio[..., 0]))
+    sun = lon[:, :1]
+
+    def midpoint(a, b):
+        return a + _wrap(b - a) / 2.0
+
+    kendra = np.where(
+        _SUPERIOR,
+        sun - midpoint(helio_lon, lon),
+        helio_lon - midpoint(sun, lon),
+    )
+    return np.where(_SUPERIOR | _INFERIOR, _arc(kendra, 0.0) / 3.0, 0.0)
+
+
+def _yuddha(lon: np.ndarray, lat: np.ndarray, strength: np.ndarray) -> np.ndarray:
+    """
+    Yuddha bala: planets at war within YUDDHA_ORB
+
+    The northernmost planet wins and takes the difference of the two
+    strengths from the loser.
+    """
+    yuddha = np.zeros_like(strength)
+    for a, b in combinations(_YUDDHA_PLANETS, 2):
+        at_war = _arc(lon[:, a], lon[:, b]) < YUDDHA_ORB
+        difference = np.abs(strength[:, a] - strength[:, b])
+        gain = np.where(at_war, np.where(lat[:, a] > lat[:, b], difference, -difference), 0.0)
+        yuddha[:, a] += gain
+        yuddha[:, b] -= gain
+    return yuddha
+
+
+def _drik(lon: np.ndarray, waxing: np.ndarray) -> np.ndarray:
+    """Drik bala: a quarter of benefic less malefic sputa drishti received"""
+    # Arc from aspecting (axis 1) to aspected (axis 2) planet
+    arcs = np.mod(lon[:, None, :] - lon[:, :, None], 360.0)
+    drishti = np.interp(arcs, _DRISHTI_ARCS, _DRISHTI_VIRUPAS)
+    for planet, ranges in _SPECIAL_ASPECTS.items():
+        for low, high in ranges:
+            full = (arcs[:, planet] >= low) & (arcs[:, planet] < high)
+            drishti[:, planet] = np.where(full, 60.0, drishti[:, planet])
+    diagonal = np.arange(len(PLANETS))
+    drishti[:, diagonal, diagonal] = 0.0
+
+    nature = np.where(_BENEFICS, 1.0, -1.0) * np.ones((len(lon), 1))
+    nature[:, 1] = np.where(waxing, 1.0, -1.0)
+    return np.einsum('na,nab->nb', nature, drishti) / 4.0
@@ -0,0 +1,428 @@
+"""
+Synastry and composite chart calculation
+
+Compares the charts of two or more people. All natal positions come from
+one batched ephemeris call (EphemerisCalculator.calculate_positions_batch)
+and are held as a (people, points) longitude array, so inter-chart
+aspects, house overlays and midpoint composites are array operations.
+Ranking one person against a whole contact list scores every candidate
+in the same vectorized pass instead of building a chart per candidate.
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import combinations
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.services.aspect_engine import AspectEngine
+from app.services.aspect_patterns import AspectPatternEngine
+from app.services.chart_calculator import NatalChartCalculator
+from app.utils.ephemeris import SIGN_NAMES, EphemerisCalculator
+
+
+# Angles added after the bodies; NaN when the birth time is unknown
+ANGLES = ['ascendant', 'mc']
+
+
+@dataclass
+class SynastryCharts:
+    """
+    Natal positions for a group of people
+
+    Attributes:
+        points: Point names (bodies, then ascendant and mc)
+        longitudes: Longitudes shaped (n_people, n_points); NaN where a body
+            failed to calculate or, for the angles, the birth time is unknown
+        cusps: House cusps shaped (n_people, 12); NaN rows for unknown times
+        has_time: Whether each person's birth time is known
+    """
+    points: List[str]
+    longitudes: np.ndarray
+    cusps: np.ndarray
+    has_time: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.longitudes)
+
+
+class SynastryCalculator:
+    """
+    Service for synastry, composite charts and compatibility ranking
+    """
+
+    # Aspect types counted as harmonious or challenging in scores; others
+    # (conjunction, minor aspects) only add to the total
+    HARMONIOUS_ASPECTS = ('trine', 'sextile')
+    CHALLENGING_ASPECTS = ('square', 'opposition')
+
+    @staticmethod
+    def calculate_charts(
+        births: Sequence[Dict[str, Any]],
+        zodiac: str = 'tropical',
+        ayanamsa: str = 'lahiri',
+        house_system: str = 'placidus'
+    ) -> SynastryCharts:
+        """
+        Calculate natal positions for many people in one ephemeris batch
+
+        Args:
+            births: Dicts with birth_datetime, latitude, longitude and
+                optional timezone_offset_minutes and has_time (default True)
+            zodiac: 'tropical' or 'sidereal'
+            ayanamsa: Ayanamsa system for sidereal calculations
+            house_system: House system for cusps and angles
+
+        Returns:
+            SynastryCharts in the order of births
+        """
+        jds = np.array([
+            EphemerisCalculator.datetime_to_julian_day(
+                birth['birth_datetime'], birth.get('timezone_offset_minutes') or 0
+            )
+            for birth in births
+        ], dtype=np.float64)
+        has_time = np.array([birth.get('has_time', True) for birth in births], dtype=bool)
+
+        batch = EphemerisCalculator.calculate_positions_batch(jds, zodiac=zodiac, ayanamsa=ayanamsa)
+
+        # Houses are per location, so they cannot share the batch
+        angles = np.full((len(jds), len(ANGLES)), np.nan)
+        cusps = np.full((len(jds), 12), np.nan)
+        for row, birth in enumerate(births):
+            if not has_time[row]:
+                continue
+            houses = EphemerisCalculator.calculate_houses(
+                float(jds[row]), birth['latitude'], birth['longitude'], house_system
+            )
+            angles[row] = [houses['ascendant'], houses['mc']]
+            cusps[row] = houses['cusps']
+
+        if zodiac == 'sidereal' and len(jds):
+            values, _ = EphemerisCalculator.get_sidereal_context(ayanamsa).ayanamsa_arrays(jds)
+            angles = np.mod(angles - values[:, None], 360.0)
+            cusps = np.mod(cusps - values[:, None], 360.0)
+
+        return SynastryCharts(
+            points=list(batch.bodies) + ANGLES,
+            longitudes=np.concatenate([batch.longitude, angles], axis=1),
+            cusps=cusps,
+            has_time=has_time,
+        )
+
+    @classmethod
+    def calculate_synastry(
+        cls,
+        births: Sequence[Dict[str, Any]],
+        zodiac: str = 'tropical',
+        ayanamsa: str = 'lahiri',
+        house_system: str = 'placidus',
+        include_minor_aspects: bool = False,
+        custom_orbs: Optional[Dict[str, float]] = None
+    ) -> Dict[str, Any]:
+        """
+        Compare every pair in a group of people
+
+        Args:
+            births: Birth dicts as taken by calculate_charts (2 or more)
+            zodiac: 'tropical' or 'sidereal'
+            ayanamsa: Ayanamsa system for sidereal calculations
+            house_system: House system for cusps and angles
+            include_minor_aspects: Include minor aspects
+            custom_orbs: Custom orb values for aspects
+
+        Returns:
+            Dictionary with 'points' and, per pair (person1 < person2, as
+            indices into births), the inter-chart aspects, house overlays in
+            both directions, the midpoint composite and the pair's score
+        """
+        if len(births) < 2:
+            raise ValueError("Synastry needs at least two people")
+
+        aspect_set = NatalChartCalculator._build_aspect_set(include_minor_aspects, custom_orbs)
+        charts = cls.calculate_charts(births, zodiac, ayanamsa, house_system)
+
+        pairs = []
+        for first, second in combinations(range(len(charts)), 2):
+            score = cls.score_matrix(
+                charts.longitudes[first], charts.longitudes[second][None, :], aspect_set
+            )
+            pairs.append({
+                'person1': first,
+                'person2': second,
+                'aspects': cls.interchart_aspects(charts, first, second, aspect_set),
+                'house_overlays': {
+                    'person1_in_person2': cls.house_overlays(charts, first, second),
+                    'person2_in_person1': cls.house_overlays(charts, second, first),
+                },
+                'composite': cls.composite_chart(charts, first, second, aspect_set),
+                'score': {key: float(values[0]) for key, values in score.items()},
+            })
+
+        return {
+            'points': charts.points,
+            'pairs': pairs,
+            'calculation_info': {
+                'zodiac': zodiac,
+                'ayanamsa': ayanamsa if zodiac == 'sidereal' else None,
+                'house_system': house_system,
+                'include_minor_aspects': include_minor_aspects,
+            },
+        }
+
+    @classmethod
+    def rank_against(
+        cls,
+        subject: Dict[str, Any],
+        candidates: Sequence[Dict[str, Any]],
+        zodiac: str = 'tropical',
+        ayanamsa: str = 'lahiri',
+        house_system: str = 'placidus',
+        include_minor_aspects: bool = False,
+        custom_orbs: Optional[Dict[str, float]] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Rank candidates by the strength of their synastry with a subject
+
+        The subject and all candidates share one ephemeris batch, and all
+        candidates are scored together by score_matrix.
+
+        Args:
+            subject: Birth dict of the person being compared
+            candidates: Birth dicts of the people to rank
+            zodiac: 'tropical' or 'sidereal'
+            ayanamsa: Ayanamsa system for sidereal calculations
+            house_system: House system for the angles
+            include_minor_aspects: Include minor aspects
+            custom_orbs: Custom orb values for aspects
+            limit: Return only the best this many
+
+        Returns:
+            List of {'index' (into candidates), 'score', 'harmonious',
+            'challenging', 'aspect_count'}, best score first
+        """
+        aspect_set = NatalChartCalculator._build_aspect_set(include_minor_aspects, custom_orbs)
+        charts = cls.calculate_charts([subject, *candidates], zodiac, ayanamsa, house_system)
+
+        scores = cls.score_matrix(charts.longitudes[0], charts.longitudes[1:], aspect_set)
+
+        # Stable sort keeps input order among equal scores
+        order = np.argsort(-scores['score'], kind='stable')
+        if limit is not None:
+            order = order[:limit]
+
+        return [
+            {
+                'index': index,
+                'score': score,
+                'harmonious': harmonious,
+                'challenging': challenging,
+                'aspect_count': aspect_count,
+            }
+            for index, score, harmonious, challenging, aspect_count in zip(
+                order.tolist(),
+                scores['score'][order].tolist(),
+                scores['harmonious'][order].tolist(),
+                scores['challenging'][order].tolist(),
+                scores['aspect_count'][order].tolist(),
+            )
+        ]
+
+    @classmethod
+    def score_matrix(
+        cls,
+        subject_longitudes: np.ndarray,
+        candidate_longitudes: np.ndarray,
+        aspect_set: Dict[str, Dict]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Synastry scores of one chart against many
+
+        Each inter-chart aspect contributes its strength, 1 at exact falling
+        linearly to 0 at the edge of the orb.
+
+        Args:
+            subject_longitudes: Subject point longitudes, shaped (n_points,)
+            candidate_longitudes: Candidate longitudes, shaped (n_candidates, n_points)
+            aspect_set: Aspect name -> {'angle': exact angle, 'orb': max orb}
+
+        Returns:
+            Arrays shaped (n_candidates,): 'score' (all aspects), 'harmonious',
+            'challenging' and 'aspect_count'
+        """
+        separation = AspectEngine.cross_separation(subject_longitudes, candidate_longitudes)
+
+        count = len(candidate_longitudes)
+        totals = {key: np.zeros(count) for key in ('score', 'harmonious', 'challenging')}
+        aspect_count = np.zeros(count, dtype=np.int64)
+
+        # One (n_candidates, n_points, n_points) pass per aspect type keeps
+        # memory flat for long contact lists
+        for name, info in aspect_set.items():
+            deviation = np.abs(separation - info['angle'])
+            within = deviation <= info['orb']
+            strength = np.where(within, 1.0 - deviation / max(info['orb'], 1e-9), 0.0)
+            per_candidate = strength.sum(axis=(1, 2))
+
+            totals['score'] += per_candidate
+            aspect_count += within.sum(axis=(1, 2))
+            if name in cls.HARMONIOUS_ASPECTS:
+                totals['harmonious'] += per_candidate
+            elif name in cls.CHALLENGING_ASPECTS:
+                totals['challenging'] += per_candidate
+
+        return {**totals, 'aspect_count': aspect_count}
+
+    @staticmethod
+    def interchart_aspects(
+        charts: SynastryCharts,
+        first: int,
+        second: int,
+        aspect_set: Dict[str, Dict]
+    ) -> List[Dict]:
+        """
+        Aspects from one person's points to another's
+
+        Returns:
+            List of dicts with planet1 (first person's point), planet2
+            (second person's point), aspect_type, angle, orb and orb_abs
+        """
+        records = AspectEngine.find_cross_aspects(
+            charts.longitudes[first], charts.longitudes[second], aspect_set
+        )
+        aspect_types = list(aspect_set)
+        return [
+            {
+                'planet1': charts.points[i],
+                'planet2': charts.points[j],
+                'aspect_type': aspect_types[type_index],
+                'angle': aspect_set[aspect_types[type_index]]['angle'],
+                'orb': orb,
+                'orb_abs': orb_abs,
+            }
+            for i, j, type_index, orb, orb_abs in zip(
+                records['i'].tolist(), records['j'].tolist(), records['type'].tolist(),
+                records['orb'].tolist(), records['orb_abs'].tolist()
+            )
+        ]
+
+    @staticmethod
+    def house_overlays(charts: SynastryCharts, guest: int, host: int) -> Optional[Dict[str, int]]:
+        """
+        Houses of the host's chart that the guest's points fall in
+
+        Returns:
+            Point name -> house number (1-12), or None when the host's
+            birth time (and so their houses) is unknown
+        """
+        if not charts.has_time[host]:
+            return None
+        longitudes = charts.longitudes[guest]
+        known = ~np.isnan(longitudes)
+        houses = AspectPatternEngine.house_positions(longitudes[known], charts.cusps[host])
+        points = [point for point, ok in zip(charts.points, known.tolist()) if ok]
+        return dict(zip(points, houses.tolist()))
+
+    @staticmethod
+    def midpoints(longitudes_a: np.ndarray, longitudes_b: np.ndarray) -> np.ndarray:
+        """
+        Nearer midpoints of two sets of longitudes
+
+        Args:
+            longitudes_a: Longitudes in degrees
+            longitudes_b: Longitudes in degrees, same shape
+
+        Returns:
+            Midpoints on the shorter arc between each pair (0-360°)
+        """
+        a = np.asarray(longitudes_a, dtype=np.float64)
+        b = np.asarray(longitudes_b, dtype=np.float64)
+        half_arc = (np.mod(b - a + 180.0, 360.0) - 180.0) / 2.0
+        return np.mod(a + half_arc, 360.0)
+
+    @classmethod
+    def composite_chart(
+        cls,
+        charts: SynastryCharts,
+        first: int,
+        second: int,
+        aspect_set: Dict[str, Dict]
+    ) -> Dict[str, Any]:
+        """
+        Midpoint composite chart of two people
+
+        Every point and house cusp is the nearer midpoint of the two natal
+        positions. Houses are omitted if either birth time is unknown.
+
+        Returns:
+            Dictionary with 'planets', 'houses' (or None) and 'aspects' in
+            the layout of NatalChartCalculator charts
+        """
+        longitudes = cls.midpoints(charts.longitudes[first], charts.longitudes[second])
+
+        planets = {}
+        for point, longitude in zip(charts.points, longitudes.tolist()):
+            if point in ANGLES:
+                continue
+            if np.isnan(longitude):
+                planets[point] = None
+                continue
+            sign = int(longitude / 30)
+            planets[point] = {
+                'longitude': longitude,
+                'sign': sign,
+                'degree_in_sign': longitude % 30,
+                'sign_name': SIGN_NAMES[sign % 12],
+            }
+
+        houses = None
+        if charts.has_time[first] and charts.has_time[second]:
+            angles = dict(zip(charts.points, longitudes.tolist()))
+            houses = {
+                'cusps': cls.midpoints(charts.cusps[first], charts.cusps[second]).tolist(),
+                'ascendant': angles['ascendant'],
+                'mc': angles['mc'],
+            }
+
+        known = ~np.isnan(longitudes)
+        aspect_table = AspectEngine.find_aspects(
+            [point for point, ok in zip(charts.points, known.tolist()) if ok],
+            longitudes[known],
+            aspect_set
+        )
+
+        return {
+            'planets': planets,
+            'houses': houses,
+            'aspects': aspect_table.to_dicts(),
+        }
+
+    @staticmethod
+    def birth_from_record(birth_data) -> Dict[str, Any]:
+        """
+        Birth dict for calculate_charts from a BirthData row
+
+        Unknown birth times use midnight (as natal charts do) and are
+        flagged so angles and houses are left out.
+        """
+        if isinstance(birth_data.birth_date, str):
+            birth_date = datetime.fromisoformat(birth_data.birth_date).date()
+        else:
+            birth_date = birth_data.birth_date
+
+        if birth_data.birth_time:
+            if isinstance(birth_data.birth_time, str):
+                birth_time = datetime.fromisoformat(f"2000-01-01T{birth_data.birth_time}").time()
+            else:
+                birth_time = birth_data.birth_time
+        else:
+            birth_time = datetime.min.time()
+
+        return {
+            'birth_datetime': datetime.combine(birth_date, birth_time),
+            'latitude': float(birth_data.latitude),
+            'longitude': float(birth_data.longitude),
+            'timezone_offset_minutes': birth_data.utc_offset or 0,
+            'has_time': birth_data.has_time,
+        }
@@ -4,7 +4,12 @@ Calculates current planetary transits relative to natal chart positions
 """
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
+
+import numpy as np
+
+from app.core.celestial_registry import CelestialRegistry
 from app.utils.ephemeris import EphemerisCalculator
+from app.services.exact_event_calculator import ExactEventCalculator
 
 
 class TransitCalculator:
@@ -58,6 +63,31 @@ class TransitCalculator:
         ('fast', 'Moon'): 'minor',
     }
 
+    # Points that are calculated but do not transit
+    NON_TRANSITING_POINTS = {'ascendant', 'midheaven', 'lilith'}
+
+    # Timeline sampling step per transiting body (days), matched to speed
+    TIMELINE_SAMPLE_DAYS = {
+        'moon': 1 / 24,
+        'mercury': 0.25,
+        'sun': 0.5,
+        'venus': 0.5,
+        'mars': 1.0,
+        'jupiter': 4.0,
+        'saturn': 7.0,
+        'north_node': 7.0,
+        'south_node': 7.0,
+        'chiron': 10.0,
+        'uranus': 15.0,
+        'neptune': 30.0,
+        'pluto': 30.0,
+    }
+
+    # Sample steps at or below this (days) are refined by linear interpolation
+    INTERPOLATION_MAX_STEP = 0.5
+
+    SIGNIFICANCE_ORDER = {'major': 0, 'significant': 1, 'moderate': 2, 'minor': 3}
+
     @classmethod
     def calculate_current_transits(
         cls,
@@ -91,7 +121,7 @@ class TransitCalculator:
         transits = []
 
         for transit_planet, transit_data in current_planets.items():
-            if transit_planet in ['Ascendant', 'Midheaven', 'Lilith']:
+            if transit_planet.lower() in cls.NON_TRANSITING_POINTS:
                 continue  # Skip points that don't transit
             if transit_data is None:
                 continue  # Skip planets that failed to calculate
@@ -105,7 +135,7 @@ class TransitCalculator:
                 # Skip same-planet comparisons (e.g., transiting Sun to natal Sun)
                 # While technically valid, these are confusing to display
                 # Exception: Moon transits to natal Moon are fast enough to be useful
-                if transit_planet == natal_planet and transit_planet != 'Moon':
+                if transit_planet == natal_planet and transit_planet.lower() != 'moon':
                     continue
 
                 natal_lon = natal_data.get('longitude', 0)
@@ -148,12 +178,11 @@ class TransitCalculator:
                             'transit_degree': round(transit_data.get('degree_in_sign', 0), 2),
                             'natal_sign': natal_data.get('sign_name', ''),
                             'natal_degree': round(natal_data.get('degree_in_sign', 0), 2),
-                            'transit_retrograde': transit_data.get('is_retrograde', False),
+                            'transit_retrograde': transit_data.get('retrograde', False),
                         })
 
         # Sort by significance and orb
-        significance_order = {'major': 0, 'significant': 1, 'moderate': 2, 'minor': 3}
-        transits.sort(key=lambda x: (significance_order.get(x['significance'], 4), x['orb']))
+        transits.sort(key=lambda x: (cls.SIGNIFICANCE_ORDER.get(x['significance'], 4), x['orb']))
 
         return {
             'transit_datetime': transit_datetime.isoformat(),
@@ -162,6 +191,188 @@ class TransitCalculator:
             'summary': cls._generate_summary(transits)
         }
 
+    @classmethod
+    def calculate_transit_intervals(
+        cls,
+        natal_planets: Dict[str, Dict],
+        start_date: datetime,
+        end_date: datetime,
+        zodiac: str = 'tropical',
+        orb_multiplier: float = 0.8,
+        transit_bodies: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Calculate in-orb intervals for every (transit body, natal point, aspect).
+
+        Each transiting body is sampled at a step matched to its speed
+        (hourly for the Moon, monthly for Pluto) in one ephemeris batch.
+        Orb entry, exit and exact moments are then refined by root finding
+        on that single body.
+
+        Args:
+            natal_planets: Natal planet positions
+            start_date: Start of range (UTC)
+            end_date: End of range (UTC)
+            zodiac: Zodiac system
+            orb_multiplier: Adjust orbs (0.5 = tighter, 1.5 = wider)
+            transit_bodies: Optional list of transiting bodies
+
+        Returns:
+            List of interval dicts sorted by entry time
+        """
+        jd_start = EphemerisCalculator.datetime_to_julian_day(start_date, 0)
+        jd_end = EphemerisCalculator.datetime_to_julian_day(end_date, 0)
+        if jd_end <= jd_start:
+            return []
+
+        if transit_bodies is None:
+            transit_bodies = [
+                body for body in CelestialRegistry.get_planets_for_calculation()
+                if body not in cls.NON_TRANSITING_POINTS
+            ]
+
+        # One column per (natal point, aspect, side of the aspect)
+        targets = []
+        for natal_planet, natal_data in natal_planets.items():
+            if not natal_data:
+                continue
+            natal_lon = natal_data.get('longitude', 0)
+            for aspect_name, aspect_info in cls.TRANSIT_ASPECTS.items():
+                angle = aspect_info['angle']
+                sides = {round((natal_lon + angle) % 360, 10), round((natal_lon - angle) % 360, 10)}
+                for target_lon in sorted(sides):
+                    targets.append(
+                        (natal_planet, aspect_name, target_lon, aspect_info['orb'] * orb_multiplier)
+                    )
+        if not targets:
+            return []
+
+        target_lons = np.array([t[2] for t in targets])
+        target_orbs = np.array([t[3] for t in targets])
+
+        intervals = []
+        for body in transit_bodies:
+            step = cls.TIMELINE_SAMPLE_DAYS.get(body, 1.0)
+            n_samples = int(np.ceil((jd_end - jd_start) / step)) + 1
+            jds = np.linspace(jd_start, jd_end, n_samples)
+            interpolate = step <= cls.INTERPOLATION_MAX_STEP
+
+            # Interpolated crossings are never refined, so they need exact samples
+            batch = EphemerisCalculator.calculate_positions_batch(
+                jds, [body], zodiac=zodiac, use_cache=not interpolate
+            )
+            lon = batch.longitude[:, 0]
+            if np.isnan(lon).any():
+                continue
+
+            deviation = (lon[:, None] - target_lons[None, :] + 180.0) % 360.0 - 180.0
+            in_orb = np.abs(deviation) <= target_orbs[None, :]
+            for col, target in enumerate(targets):
+                if target[0] == body and body != 'moon':
+                    in_orb[:, col] = False
+
+            active_cols = np.flatnonzero(in_orb.any(axis=0))
+            if len(active_cols) == 0:
+                continue
+
+            state = ExactEventCalculator.state_function(body, zodiac)
+
+            def refine(f, a, b, fa, fb):
+                # Dense samples are near-linear; sparse ones need root finding
+                if fa == fb:
+                    return float(a)
+                if interpolate:
+                    return float(a + (b - a) * fa / (fa - fb))
+                return float(ExactEventCalculator.refine_root(f, a, b, fa, fb))
+
+            edges = np.diff(np.pad(in_orb[:, active_cols].astype(np.int8), ((1, 1), (0, 0))), axis=0)
+
+            for idx, col in enumerate(active_cols):
+                natal_planet, aspect_name, target_lon, orb = targets[col]
+                run_starts = np.flatnonzero(edges[:, idx] == 1)
+                run_ends = np.flatnonzero(edges[:, idx] == -1) - 1
+
+                def orb_excess(jd, target_lon=target_lon, orb=orb):
+                    return abs(ExactEventCalculator.wrap180(state(jd)[0] - target_lon)) - orb
+
+                def signed_deviation(jd, target_lon=target_lon):
+                    return ExactEventCalculator.wrap180(state(jd)[0] - target_lon)
+
+                excess = np.abs(deviation[:, col]) - orb
+
+                for first, last in zip(run_starts, run_ends):
+                    if first == 0:
+                        entry_jd = jd_start
+                    else:
+                        entry_jd = refine(
+                            orb_excess, jds[first - 1], jds[first],
+                            excess[first - 1], excess[first]
+                        )
+                    if last == n_samples - 1:
+                        exit_jd = jd_end
+                    else:
+                        exit_jd = refine(
+                            orb_excess, jds[last], jds[last + 1],
+                            excess[last], excess[last + 1]
+                        )
+
+                    exact_jds = []
+                    dev = deviation[first:last + 1, col]
+                    for i in np.flatnonzero(dev[:-1] * dev[1:] <= 0):
+                        if dev[i] == 0 and i > 0:
+                            continue  # Already counted at the previous sample
+                        a, b = jds[first + i], jds[first + i + 1]
+                        exact_jds.append(refine(signed_deviation, a, b, dev[i], dev[i + 1]))
+
+                    intervals.append({
+                        'transit_planet': body,
+                        'natal_planet': natal_planet,
+                        'aspect': aspect_name,
+                        'aspect_longitude': round(target_lon, 4),
+                        'orb': round(orb, 2),
+                        'significance': cls._get_significance(body, natal_planet, aspect_name),
+                        'entry_jd': float(entry_jd),
+                        'exit_jd': float(exit_jd),
+                        'exact_jds': exact_jds,
+                        'entry_date': EphemerisCalculator.julian_day_to_datetime(entry_jd).isoformat(),
+                        'exit_date': EphemerisCalculator.julian_day_to_datetime(exit_jd).isoformat(),
+                        'exact_dates': [
+                            EphemerisCalculator.julian_day_to_datetime(jd).isoformat()
+                            for jd in exact_jds
+                        ],
+                        'begins_before_range': bool(first == 0),
+                        'ends_after_range': bool(last == n_samples - 1),
+                    })
+
+        intervals.sort(key=lambda iv: (iv['entry_jd'], cls.SIGNIFICANCE_ORDER.get(iv['significance'], 4)))
+        return intervals
+
+    @classmethod
+    def _interval_snapshot(
+        cls,
+        interval: Dict[str, Any],
+        natal_data: Dict,
+        transit_lon: float,
+        transit_speed: float
+    ) -> Dict[str, Any]:
+        """Build a current-transits style aspect dict for an interval at one moment."""
+        deviation = ExactEventCalculator.wrap180(transit_lon - interval['aspect_longitude'])
+        return {
+            'transit_planet': interval['transit_planet'],
+            'natal_planet': interval['natal_planet'],
+            'aspect': interval['aspect'],
+            'orb': round(abs(deviation), 2),
+            # Applying while motion reduces the distance to the exact point
+            'is_applying': bool(deviation * transit_speed < 0),
+            'significance': interval['significance'],
+            'estimated_duration': cls._estimate_duration(interval['transit_planet'], interval['orb']),
+            'transit_sign': EphemerisCalculator.get_sign_name(int(transit_lon / 30)),
+            'transit_degree': round(transit_lon % 30, 2),
+            'natal_sign': natal_data.get('sign_name', ''),
+            'natal_degree': round(natal_data.get('degree_in_sign', 0), 2),
+            'transit_retrograde': bool(transit_speed < 0),
+        }
+
     @classmethod
     def calculate_transit_timeline(
         cls,
@@ -169,43 +380,69 @@ class TransitCalculator:
         start_date: datetime,
         end_date: datetime,
         zodiac: str = 'tropical',
-        interval_days: int = 1
+        interval_days: int = 1,
+        intervals: Optional[List[Dict[str, Any]]] = None
     ) -> List[Dict[str, Any]]:
         """
         Calculate transits over a date range for timeline visualization.
 
+        Day snapshots are read off the transit intervals plus a single
+        ephemeris batch for the sampled days.
+
         Args:
             natal_planets: Natal planet positions
             start_date: Start of range
             end_date: End of range
             zodiac: Zodiac system
             interval_days: Days between calculations
+            intervals: Precomputed calculate_transit_intervals result
+                (orb_multiplier 0.8) to reuse
 
         Returns:
             List of transit snapshots
         """
-        timeline = []
-        current_date = start_date
-
-        while current_date <= end_date:
-            transits = cls.calculate_current_transits(
-                natal_planets, current_date, zodiac, orb_multiplier=0.8
+        if intervals is None:
+            intervals = cls.calculate_transit_intervals(
+                natal_planets, start_date, end_date, zodiac, orb_multiplier=0.8
             )
+        # Include major, significant, and moderate transits in timeline
+        intervals = [
+            iv for iv in intervals
+            if iv['significance'] in ['major', 'significant', 'moderate']
+        ]
+
+        n_days = int((end_date - start_date).total_seconds() // (interval_days * 86400)) + 1
+        day_dates = [start_date + timedelta(days=i * interval_days) for i in range(n_days)]
+        jd_start = EphemerisCalculator.datetime_to_julian_day(start_date, 0)
+        day_jds = jd_start + np.arange(n_days) * interval_days
+
+        bodies = sorted({iv['transit_planet'] for iv in intervals})
+        if not bodies:
+            return []
+        batch = EphemerisCalculator.calculate_positions_batch(day_jds, bodies, zodiac=zodiac)
+
+        days: List[List[Dict]] = [[] for _ in range(n_days)]
+        for iv in intervals:
+            col = batch.body_index(iv['transit_planet'])
+            first = int(np.searchsorted(day_jds, iv['entry_jd'], side='left'))
+            last = int(np.searchsorted(day_jds, iv['exit_jd'], side='right'))
+            for i in range(first, last):
+                days[i].append(cls._interval_snapshot(
+                    iv,
+                    natal_planets[iv['natal_planet']],
+                    float(batch.longitude[i, col]),
+                    float(batch.speed_longitude[i, col])
+                ))
 
-            # Include major, significant, and moderate transits in timeline
-            significant = [
-                t for t in transits['transits']
-                if t['significance'] in ['major', 'significant', 'moderate']
-            ]
-
-            if significant:
+        timeline = []
+        for date, transits in zip(day_dates, days):
+            if transits:
+                transits.sort(key=lambda x: (cls.SIGNIFICANCE_ORDER.get(x['significance'], 4), x['orb']))
                 timeline.append({
-                    'date': current_date.isoformat(),
-                    'transits': significant
+                    'date': date.isoformat(),
+                    'transits': transits
                 })
 
-            current_date += timedelta(days=interval_days)
-
         return timeline
 
     @classmethod
@@ -222,49 +459,39 @@ class TransitCalculator:
         """
         Find exact dates when a specific transit aspect is exact.
 
-        Useful for planning around significant transits.
+        Useful for planning around significant transits. Every pass is
+        reported, so a retrograde triple hit yields three entries numbered
+        by pass_number/total_passes.
         """
-        exact_dates = []
-        current_date = start_date
-        last_diff = None
-
         if aspect not in cls.TRANSIT_ASPECTS:
             return []
 
-        target_angle = cls.TRANSIT_ASPECTS[aspect]['angle']
-        natal_lon = natal_planets.get(natal_planet, {}).get('longitude', 0)
-
-        while current_date <= end_date:
-            jd = EphemerisCalculator.datetime_to_julian_day(current_date, 0)
-            current_planets = EphemerisCalculator.calculate_all_planets(jd, zodiac=zodiac)
-
-            if transit_planet not in current_planets:
-                current_date += timedelta(hours=12)
-                continue
-
-            transit_lon = current_planets[transit_planet].get('longitude', 0)
-
-            # Calculate aspect difference
-            diff = abs(transit_lon - natal_lon)
-            if diff > 180:
-                diff = 360 - diff
-            aspect_diff = diff - target_angle
-
-            # Check for zero crossing (exact aspect)
-            if last_diff is not None:
-                if (last_diff < 0 and aspect_diff >= 0) or (last_diff > 0 and aspect_diff <= 0):
-                    exact_dates.append({
-                        'date': current_date.isoformat(),
-                        'transit_planet': transit_planet,
-                        'natal_planet': natal_planet,
-                        'aspect': aspect,
-                        'retrograde': current_planets[transit_planet].get('is_retrograde', False)
-                    })
+        natal_data = natal_planets.get(natal_planet)
+        if not natal_data:
+            return []
 
-            last_diff = aspect_diff
-            current_date += timedelta(hours=12)
+        hits = ExactEventCalculator.find_exact_aspect_dates(
+            transit_planet,
+            natal_data.get('longitude', 0),
+            cls.TRANSIT_ASPECTS[aspect]['angle'],
+            start_date,
+            end_date,
+            zodiac=zodiac
+        )
 
-        return exact_dates
+        return [
+            {
+                'date': hit['date'],
+                'transit_planet': transit_planet,
+                'natal_planet': natal_planet,
+                'aspect': aspect,
+                'retrograde': hit['retrograde'],
+                'exact_longitude': round(hit['exact_longitude'], 4),
+                'pass_number': hit['pass_number'],
+                'total_passes': hit['total_passes'],
+            }
+            for hit in hits
+        ]
 
     @classmethod
     def get_upcoming_significant_transits(
@@ -276,30 +503,50 @@ class TransitCalculator:
         """
         Get upcoming significant transits for the next N days.
 
-        Returns a summary of major and significant transits approaching.
+        Returns a summary of major and significant transits approaching,
+        in order of when they come into orb.
         """
         start = datetime.utcnow()
         end = start + timedelta(days=days_ahead)
 
-        timeline = cls.calculate_transit_timeline(
-            natal_planets, start, end, zodiac, interval_days=1
-        )
-
-        # Deduplicate and find first occurrence of each transit
+        intervals = [
+            iv for iv in cls.calculate_transit_intervals(
+                natal_planets, start, end, zodiac, orb_multiplier=0.8
+            )
+            if iv['significance'] in ['major', 'significant', 'moderate']
+        ]
+        intervals.sort(key=lambda iv: (
+            iv['entry_jd'],
+            cls.SIGNIFICANCE_ORDER.get(iv['significance'], 4),
+            iv['transit_planet']
+        ))
+
+        # First occurrence of each transit
         seen = set()
         upcoming = []
+        states = {}
 
-        for day in timeline:
-            for transit in day['transits']:
-                key = (transit['transit_planet'], transit['natal_planet'], transit['aspect'])
-                if key not in seen:
-                    seen.add(key)
-                    upcoming.append({
-                        **transit,
-                        'first_date': day['date']
-                    })
+        for iv in intervals:
+            key = (iv['transit_planet'], iv['natal_planet'], iv['aspect'])
+            if key in seen:
+                continue
+            seen.add(key)
+
+            body = iv['transit_planet']
+            if body not in states:
+                states[body] = ExactEventCalculator.state_function(body, zodiac)
+            transit_lon, transit_speed = states[body](iv['entry_jd'])
 
-        return upcoming[:20]  # Return top 20
+            upcoming.append({
+                **cls._interval_snapshot(iv, natal_planets[iv['natal_planet']], transit_lon, transit_speed),
+                'first_date': start.isoformat() if iv['begins_before_range'] else iv['entry_date'],
+                'exact_dates': iv['exact_dates'],
+                'exit_date': iv['exit_date'],
+            })
+            if len(upcoming) == 20:
+                break
+
+        return upcoming  # Top 20
 
     @classmethod
     def _is_applying(
@@ -317,6 +564,11 @@ class TransitCalculator:
             diff -= 360
         return diff < target_angle
 
+    @staticmethod
+    def _display_name(body: str) -> str:
+        """Map body IDs ('north_node') to the display names used in lookup tables."""
+        return body.replace('_', ' ').title()
+
     @classmethod
     def _get_significance(
         cls,
@@ -325,10 +577,10 @@ class TransitCalculator:
         aspect: str
     ) -> str:
         """Determine the significance level of a transit."""
-        transit_speed = cls.PLANET_SPEEDS.get(transit_planet, 'medium')
+        transit_speed = cls.PLANET_SPEEDS.get(cls._display_name(transit_planet), 'medium')
 
         # Check predefined significance
-        key = (transit_speed, natal_planet)
+        key = (transit_speed, cls._display_name(natal_planet))
         if key in cls.SIGNIFICANCE:
             return cls.SIGNIFICANCE[key]
 
@@ -345,7 +597,7 @@ class TransitCalculator:
     @classmethod
     def _estimate_duration(cls, transit_planet: str, orb: float) -> str:
         """Estimate how long a transit will be in effect."""
-        speed = cls.PLANET_SPEEDS.get(transit_planet, 'medium')
+        speed = cls.PLANET_SPEEDS.get(cls._display_name(transit_planet), 'medium')
 
         durations = {
             'fast': f"{int(orb * 2)} hours",
@@ -370,11 +622,11 @@ class TransitCalculator:
 
         # Identify themes
         themes = []
-        if len([t for t in transits if t['transit_planet'] in ['Saturn', 'Pluto']]) > 2:
+        if len([t for t in transits if cls._display_name(t['transit_planet']) in ['Saturn', 'Pluto']]) > 2:
             themes.append('transformation')
-        if len([t for t in transits if t['transit_planet'] in ['Jupiter', 'Venus']]) > 2:
+        if len([t for t in transits if cls._display_name(t['transit_planet']) in ['Jupiter', 'Venus']]) > 2:
             themes.append('expansion')
-        if len([t for t in transits if t['transit_planet'] in ['Uranus', 'Neptune']]) > 2:
+        if len([t for t in transits if cls._display_name(t['transit_planet']) in ['Uranus', 'Neptune']]) > 2:
             themes.append('awakening')
         if len([t for t in transits if t['aspect'] in ['square', 'opposition']]) > 3:
             themes.append('challenge')
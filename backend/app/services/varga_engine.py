@@ -0,0 +1,383 @@
+"""
+Varga Engine
+
+Divisional charts (vargas) for all sixteen Shodashavarga divisions, with
+the Parashari mapping rule of each division encoded as a lookup table:
+for every D-1 sign and every part of it, the sign that part maps to.
+Divisions with unequal parts (D-30 Trimsamsa) carry their own part
+boundaries, so every division goes through the same lookup. All points
+across all requested divisions are placed in one pass over NumPy arrays.
+
+Vimshopaka bala scores each planet 0-20 from the dignity of its sign in
+every varga, weighted per the Shadvarga, Saptavarga, Dasavarga and
+Shodasavarga schemes.
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.utils.ephemeris import SIGN_NAMES
+
+
+# The sixteen divisional charts of the Shodashavarga
+SHODASHAVARGA = (1, 2, 3, 4, 7, 9, 10, 12, 16, 20, 24, 27, 30, 40, 45, 60)
+
+VARGA_NAMES = {
+    1: 'Rasi (D-1)',
+    2: 'Hora (D-2)',
+    3: 'Drekkana (D-3)',
+    4: 'Chaturthamsa (D-4)',
+    7: 'Saptamsa (D-7)',
+    9: 'Navamsa (D-9)',
+    10: 'Dasamsa (D-10)',
+    12: 'Dwadasamsa (D-12)',
+    16: 'Shodasamsa (D-16)',
+    20: 'Vimsamsa (D-20)',
+    24: 'Chaturvimsamsa (D-24)',
+    27: 'Bhamsa (D-27)',
+    30: 'Trimsamsa (D-30)',
+    40: 'Khavedamsa (D-40)',
+    45: 'Akshavedamsa (D-45)',
+    60: 'Shashtiamsa (D-60)',
+}
+
+# Planets scored by Vimshopaka bala (the nodes own no signs)
+VIMSHOPAKA_PLANETS = ('sun', 'moon', 'mars', 'mercury', 'jupiter', 'venus', 'saturn')
+
+# Varga weights per Vimshopaka scheme; each scheme totals 20
+VIMSHOPAKA_SCHEMES = {
+    'shadvarga': {1: 6, 2: 2, 3: 4, 9: 5, 12: 2, 30: 1},
+    'saptavarga': {1: 5, 2: 2, 3: 3, 7: 2.5, 9: 4.5, 12: 2, 30: 1},
+    'dasavarga': {1: 3, 2: 1.5, 3: 1.5, 7: 1.5, 9: 1.5, 10: 1.5, 12: 1.5, 16: 1.5, 30: 1.5, 60: 5},
+    'shodasavarga': {
+        1: 3.5, 2: 1, 3: 1, 4: 0.5, 7: 0.5, 9: 3, 10: 0.5, 12: 0.5,
+        16: 2, 20: 0.5, 24: 0.5, 27: 0.5, 30: 1, 40: 0.5, 45: 0.5, 60: 4,
+    },
+}
+
+# Sign lords (0=Aries) as indices into VIMSHOPAKA_PLANETS
+SIGN_LORDS = np.array([2, 5, 3, 1, 0, 3, 5, 2, 4, 6, 6, 4])
+
+# Natural (naisargika) relationships: row planet's view of the column
+# planet, +1 friend, 0 neutral, -1 enemy (order of VIMSHOPAKA_PLANETS)
+NATURAL_RELATIONSHIPS = np.array([
+    # sun moon mars merc jup  ven  sat
+    [0,   1,   1,   0,   1,  -1,  -1],  # sun
+    [1,   0,   0,   1,   0,   0,   0],  # moon
+    [1,   1,   0,  -1,   1,   0,   0],  # mars
+    [1,  -1,   0,   0,   0,   1,   0],  # mercury
+    [1,   1,   1,  -1,   0,  -1,   0],  # jupiter
+    [-1, -1,   0,   1,   0,   0,   1],  # venus
+    [-1, -1,  -1,   1,   0,   1,   0],  # saturn
+])
+
+# Vimshopaka points (of 20) by compound relationship to the sign lord,
+# indexed by relationship + 2: great enemy, enemy, neutral, friend,
+# great friend; a planet in its own sign scores OWN_SIGN_POINTS
+RELATIONSHIP_POINTS = np.array([5.0, 7.0, 10.0, 15.0, 18.0])
+OWN_SIGN_POINTS = 20.0
+
+# Temporal relationship by signs counted from a planet (0 = same sign):
+# friends in the 2nd, 3rd, 4th, 10th, 11th and 12th
+_TEMPORAL = np.array([-1, 1, 1, 1, -1, -1, -1, -1, -1, 1, 1, 1])
+
+# Varga weights as a (16, n_schemes) matrix in SHODASHAVARGA order
+_SCHEME_WEIGHTS = np.array([
+    [weights.get(division, 0.0) for weights in VIMSHOPAKA_SCHEMES.values()]
+    for division in SHODASHAVARGA
+])
+
+# Trimsamsa parts (degrees) and their signs, for odd and even D-1 signs
+_TRIMSAMSA_BOUNDS = {'odd': [0, 5, 10, 18, 25, 30], 'even': [0, 5, 12, 20, 25, 30]}
+_TRIMSAMSA_SIGNS = {'odd': [0, 10, 8, 2, 6], 'even': [1, 5, 11, 9, 7]}
+
+_SIGNS = np.arange(12)
+_ODD = _SIGNS % 2 == 0          # Aries, Gemini, ... (odd-numbered signs)
+_MODALITY = _SIGNS % 3          # 0 movable, 1 fixed, 2 dual
+_ELEMENT = _SIGNS % 4           # 0 fire, 1 earth, 2 air, 3 water
+
+
+def _counted(start: np.ndarray, division: int, step: int = 1) -> np.ndarray:
+    """(12, division) table counting parts from a start sign per D-1 sign"""
+    return (start[:, None] + step * np.arange(division)[None, :]) % 12
+
+
+# Sign of each part of each D-1 sign, per division (Parashari rules)
+_EQUAL_RULES = {
+    1: _counted(_SIGNS, 1),
+    # Odd signs: Sun's hora (Leo) then Moon's (Cancer); even signs reversed
+    2: np.where(_ODD[:, None], [[4, 3]], [[3, 4]]),
+    # 1st, 5th and 9th from the sign
+    3: _counted(_SIGNS, 3, step=4),
+    # 1st, 4th, 7th and 10th from the sign
+    4: _counted(_SIGNS, 4, step=3),
+    # Odd signs from the sign itself, even from the 7th
+    7: _counted(_SIGNS + 6 * ~_ODD, 7),
+    # Movable from the sign, fixed from the 9th, dual from the 5th
+    9: _counted(_SIGNS + np.array([0, 8, 4])[_MODALITY], 9),
+    # Odd signs from the sign itself, even from the 9th
+    10: _counted(_SIGNS + 8 * ~_ODD, 10),
+    12: _counted(_SIGNS, 12),
+    # Movable from Aries, fixed from Leo, dual from Sagittarius
+    16: _counted(np.array([0, 4, 8])[_MODALITY], 16),
+    # Movable from Aries, fixed from Sagittarius, dual from Leo
+    20: _counted(np.array([0, 8, 4])[_MODALITY], 20),
+    # Odd signs from Leo, even from Cancer
+    24: _counted(np.where(_ODD, 4, 3), 24),
+    # Fire from Aries, earth from Cancer, air from Libra, water from Capricorn
+    27: _counted(np.array([0, 3, 6, 9])[_ELEMENT], 27),
+    # Odd signs from Aries, even from Libra
+    40: _counted(np.where(_ODD, 0, 6), 40),
+    # Movable from Aries, fixed from Leo, dual from Sagittarius
+    45: _counted(np.array([0, 4, 8])[_MODALITY], 45),
+    60: _counted(_SIGNS, 60),
+}
+
+
+def _build_tables():
+    """
+    Pad every division's rule to 60 parts
+
+    Returns (16, 12, 60) part signs, (16, 12, 61) part boundaries in
+    degrees, (16, 12, 60) part per cell and (16,) cells per sign. Cells
+    are equal slices of a sign that never straddle a part boundary: the
+    parts themselves for equal divisions, single degrees for D-30.
+    """
+    size = max(SHODASHAVARGA)
+    signs = np.zeros((len(SHODASHAVARGA), 12, size), dtype=np.int64)
+    bounds = np.full((len(SHODASHAVARGA), 12, size + 1), 30.0)
+    cell_parts = np.zeros((len(SHODASHAVARGA), 12, size), dtype=np.int64)
+    cells = np.array(SHODASHAVARGA, dtype=np.float64)
+
+    for row, division in enumerate(SHODASHAVARGA):
+        if division == 30:
+            for parity, mask in (('odd', _ODD), ('even', ~_ODD)):
+                signs[row, mask, :5] = _TRIMSAMSA_SIGNS[parity]
+                bounds[row, mask, :6] = _TRIMSAMSA_BOUNDS[parity]
+                cell_parts[row, mask, :30] = np.searchsorted(
+                    _TRIMSAMSA_BOUNDS[parity][1:], np.arange(30), side='right'
+                )
+        else:
+            signs[row, :, :division] = _EQUAL_RULES[division]
+            bounds[row, :, :division + 1] = np.arange(division + 1) * (30.0 / division)
+            cell_parts[row, :, :division] = np.arange(division)
+
+    return signs, bounds, cell_parts, cells
+
+
+_VARGA_SIGNS, _VARGA_BOUNDS, _CELL_PARTS, _CELLS = _build_tables()
+_DIVISION_ROWS = {division: row for row, division in enumerate(SHODASHAVARGA)}
+
+
+@dataclass
+class VargaPositions:
+    """
+    Positions of a set of points in several divisional charts
+
+    Attributes:
+        divisions: Division numbers, in column order
+        longitudes: Divisional longitudes (0-360°), shaped (..., n_divisions)
+        signs: Divisional signs (0=Aries), same shape
+    """
+    divisions: List[int]
+    longitudes: np.ndarray
+    signs: np.ndarray
+
+    def column(self, division: int) -> int:
+        """Column of a division"""
+        return self.divisions.index(division)
+
+
+class VargaEngine:
+    """
+    Divisional charts and Vimshopaka bala
+    """
+
+    @staticmethod
+    def validate_divisions(divisions: Sequence[int]) -> List[int]:
+        """
+        Check division numbers against SHODASHAVARGA
+
+        Args:
+            divisions: Division numbers
+
+        Returns:
+            The divisions as a list
+
+        Raises:
+            ValueError: If any division is not one of the sixteen
+        """
+        divisions = list(divisions)
+        unsupported = [division for division in divisions if division not in _DIVISION_ROWS]
+        if unsupported:
+            raise ValueError(
+                f"Unsupported divisional charts: {', '.join(f'D-{d}' for d in unsupported)} "
+                f"(expected {', '.join(f'D-{d}' for d in SHODASHAVARGA)})"
+            )
+        return divisions
+
+    @staticmethod
+    def calculate(
+        longitudes,
+        divisions: Sequence[int] = SHODASHAVARGA
+    ) -> VargaPositions:
+        """
+        Place points in divisional charts
+
+        Each point's degree in its D-1 sign selects a cell and through it
+        a part of the sign; the part's sign comes from the division's
+        table, and the position within the part is stretched over the
+        divisional sign.
+
+        Args:
+            longitudes: Sidereal longitudes (0-360°), any shape
+            divisions: Division numbers, all from SHODASHAVARGA
+
+        Returns:
+            VargaPositions with a trailing divisions axis
+        """
+        divisions = VargaEngine.validate_divisions(divisions)
+
+        longitudes = np.mod(np.asarray(longitudes, dtype=np.float64), 360.0)
+        flat = longitudes.ravel()
+        rows = np.array([_DIVISION_ROWS[division] for division in divisions], dtype=np.int64)
+
+        whole_signs = np.floor(flat / 30.0)
+        degree = flat - whole_signs * 30.0
+        sign = whole_signs.astype(np.int64) % 12
+
+        # Every point in every division at once: (n, n_div)
+        cells = _CELLS[rows]
+        cell = np.minimum(degree[:, None] * cells / 30.0, cells - 1).astype(np.int64)
+        table = (rows[None, :], sign[:, None])
+        part = _CELL_PARTS[table + (cell,)]
+
+        low = _VARGA_BOUNDS[table + (part,)]
+        high = _VARGA_BOUNDS[table + (part + 1,)]
+        varga_sign = _VARGA_SIGNS[table + (part,)]
+        varga_longitude = varga_sign * 30.0 + (degree[:, None] - low) / (high - low) * 30.0
+
+        shape = longitudes.shape + (len(divisions),)
+        return VargaPositions(
+            divisions=divisions,
+            longitudes=varga_longitude.reshape(shape),
+            signs=varga_sign.reshape(shape),
+        )
+
+    @classmethod
+    def divisional_charts(
+        cls,
+        planets: Dict[str, Dict],
+        divisions: Sequence[int],
+        houses: Optional[Dict] = None
+    ) -> Dict[str, Dict]:
+        """
+        Divisional charts in the layout of VedicChartCalculator charts
+
+        Args:
+            planets: D-1 planet positions (sidereal)
+            divisions: Division numbers to build
+            houses: D-1 houses; adds divisional ascendant, mc and
+                whole-sign cusps when given
+
+        Returns:
+            Dictionary 'd<n>' -> {'division', 'name', 'planets'[, 'houses']}
+        """
+        names = [
+            name for name, data in planets.items()
+            if data and data.get('longitude') is not None and not np.isnan(data['longitude'])
+        ]
+        points = [planets[name]['longitude'] for name in names]
+        angles = []
+        if houses is not None:
+            angles = [houses['ascendant'], houses['mc']]
+
+        positions = cls.calculate(points + angles, divisions)
+        longitudes = positions.longitudes.tolist()
+        signs = positions.signs.tolist()
+        degrees = np.mod(positions.longitudes, 30.0).tolist()
+
+        charts = {}
+        for column, division in enumerate(positions.divisions):
+            chart = {
+                'division': division,
+                'name': VARGA_NAMES[division],
+                'planets': {
+                    name: {
+                        'longitude': longitudes[row][column],
+                        'sign': signs[row][column],
+                        'degree_in_sign': degrees[row][column],
+                        'sign_name': SIGN_NAMES[signs[row][column]],
+                    }
+                    for row, name in enumerate(names)
+                },
+            }
+            if angles:
+                ascendant = longitudes[len(names)][column]
+                first_cusp = int(ascendant / 30) * 30.0
+                chart['houses'] = {
+                    'ascendant': ascendant,
+                    'mc': longitudes[len(names) + 1][column],
+                    'cusps': [(first_cusp + 30.0 * house) % 360.0 for house in range(12)],
+                }
+            charts[f'd{division}'] = chart
+
+        return charts
+
+    @staticmethod
+    def compound_relationships(d1_signs: np.ndarray) -> np.ndarray:
+        """
+        Compound (panchadha) relationships between the seven planets
+
+        Natural relationship plus temporal relationship: a planet is a
+        temporal friend when in the 2nd, 3rd, 4th, 10th, 11th or 12th sign
+        from the other in the D-1 chart.
+
+        Args:
+            d1_signs: D-1 signs of VIMSHOPAKA_PLANETS, shaped (..., 7)
+
+        Returns:
+            (..., 7, 7) array from -2 (great enemy) to +2 (great friend),
+            row planet's view of the column planet
+        """
+        d1_signs = np.asarray(d1_signs, dtype=np.int64)
+        distance = (d1_signs[..., None, :] - d1_signs[..., :, None]) % 12
+        return NATURAL_RELATIONSHIPS + _TEMPORAL[distance]
+
+    @classmethod
+    def vimshopaka_bala(cls, planets: Dict[str, Dict]) -> Dict[str, Dict]:
+        """
+        Vimshopaka bala of the seven planets under every scheme
+
+        Each varga awards points by the planet's relationship with the lord
+        of the sign it occupies there; the weighted points total 0-20 per
+        scheme. All sixteen vargas are placed in one pass and shared by
+        the four schemes.
+
+        Args:
+            planets: D-1 planet positions (sidereal); needs all seven planets
+
+        Returns:
+            Planet -> {scheme: score, ..., 'varga_points': {'d<n>': points of 20}}
+        """
+        longitudes = np.array([planets[name]['longitude'] for name in VIMSHOPAKA_PLANETS])
+        positions = cls.calculate(longitudes, SHODASHAVARGA)
+
+        compound = cls.compound_relationships(np.floor(longitudes / 30.0).astype(np.int64) % 12)
+        lords = SIGN_LORDS[positions.signs]
+        planet_rows = np.arange(len(VIMSHOPAKA_PLANETS))[:, None]
+
+        points = RELATIONSHIP_POINTS[compound[planet_rows, lords] + 2]
+        points[lords == planet_rows] = OWN_SIGN_POINTS
+
+        scores = (points @ _SCHEME_WEIGHTS / 20.0).tolist()
+        varga_keys = [f'd{division}' for division in SHODASHAVARGA]
+
+        return {
+            name: {
+                **dict(zip(VIMSHOPAKA_SCHEMES, scores[row])),
+                'varga_points': dict(zip(varga_keys, varga_points)),
+            }
+            for row, (name, varga_points) in enumerate(zip(VIMSHOPAKA_PLANETS, points.tolist()))
+        }
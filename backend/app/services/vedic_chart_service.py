@@ -0,0 +1,75 @@
+"""
+Vedic Chart Service
+
+Natal Vedic chart data for a birth record, shared by the strength
+endpoints (Ashtakavarga, Shadbala): a stored Vedic chart when there is
+one, otherwise the cached natal computation.
+"""
+from datetime import datetime
+from typing import Dict
+
+from sqlalchemy.orm import Session
+
+from app.models.birth_data import BirthData
+from app.models.chart import Chart
+from app.services.natal_cache_service import NatalCacheService
+from app.services.vedic_calculator import VedicChartCalculator
+
+
+class VedicChartService:
+    """
+    Natal Vedic chart data for birth records
+    """
+
+    # Most samples one strength series request may return (~30 years of days)
+    MAX_SERIES_SAMPLES = 11000
+
+    @classmethod
+    def chart_data(cls, db: Session, birth_data: BirthData, ayanamsa: str = 'lahiri') -> Dict:
+        """
+        Stored Vedic chart data for birth data, or the cached natal computation
+
+        Args:
+            db: Database session
+            birth_data: BirthData record
+            ayanamsa: Ayanamsa system for a computed chart
+
+        Returns:
+            Vedic chart data
+        """
+        chart = db.query(Chart).filter(
+            Chart.birth_data_id == birth_data.id,
+            Chart.chart_type == 'vedic'
+        ).first()
+
+        if chart and chart.chart_data:
+            return chart.chart_data
+
+        # Handle date/time that may be stored as strings in SQLite
+        if isinstance(birth_data.birth_date, str):
+            bd = datetime.strptime(birth_data.birth_date, "%Y-%m-%d").date()
+        else:
+            bd = birth_data.birth_date
+
+        if isinstance(birth_data.birth_time, str):
+            bt = datetime.strptime(birth_data.birth_time, "%H:%M:%S").time()
+        else:
+            bt = birth_data.birth_time
+
+        birth_datetime = datetime.combine(bd, bt)
+
+        return NatalCacheService.get_or_compute(
+            db,
+            birth_data,
+            'vedic',
+            lambda: VedicChartCalculator.calculate_vedic_chart(
+                birth_datetime=birth_datetime,
+                latitude=birth_data.latitude,
+                longitude=birth_data.longitude,
+                timezone_offset_minutes=birth_data.utc_offset or 0,
+                ayanamsa=ayanamsa
+            ),
+            ayanamsa=ayanamsa,
+            house_system='whole_sign',
+            include_divisional=None
+        )
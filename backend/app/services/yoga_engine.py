@@ -0,0 +1,595 @@
+"""
+Yoga Engine
+
+Declarative yoga rules compiled to bitmask checks. A chart is reduced
+once to a 9 x 12 occupancy matrix packed into one integer (bit
+graha * 12 + sign), plus the sign of every graha and the ascendant.
+
+Rules are predicates over planet references (a planet, or the lord of a
+house). They are compiled separately for each of the 12 ascendant signs,
+which fixes every house lord and every sign counted from the ascendant:
+lordship, placement, dignity and presence conditions then fold into a
+single test per rule,
+
+    (occupancy & required).bit_count() == n_required and not occupancy & forbidden
+
+(each graha sets exactly one bit). Only conditions relative to another
+planet (conjunctions, aspects, houses counted from the Moon) remain as
+small closures over the precomputed sign list. Adding rules adds one
+integer test per rule and chart.
+
+The chart is taken from sign positions alone, so the same rules run on
+the Rasi chart or on any divisional (varga) chart.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from app.services.varga_engine import SIGN_LORDS, VIMSHOPAKA_PLANETS
+
+
+# The nine grahas; indices into YogaChart.signs
+GRAHAS = VIMSHOPAKA_PLANETS + ('rahu', 'ketu')
+
+# Index of the ascendant in YogaChart.signs
+ASCENDANT_INDEX = len(GRAHAS)
+
+# Alternative keys the nodes are stored under in chart data
+NODE_ALIASES = {'rahu': ('rahu', 'north_node'), 'ketu': ('ketu', 'south_node')}
+
+KENDRAS = (1, 4, 7, 10)
+TRIKONAS = (1, 5, 9)
+DUSTHANAS = (6, 8, 12)
+
+# Signs of each dignity per graha (0=Aries); the nodes have none
+EXALTATION = {'sun': 0, 'moon': 1, 'mars': 9, 'mercury': 5, 'jupiter': 3, 'venus': 11, 'saturn': 6}
+DEBILITATION = {'sun': 6, 'moon': 7, 'mars': 3, 'mercury': 11, 'jupiter': 9, 'venus': 5, 'saturn': 0}
+OWN_SIGNS = {
+    'sun': [4], 'moon': [3], 'mars': [0, 7], 'mercury': [2, 5],
+    'jupiter': [8, 11], 'venus': [1, 6], 'saturn': [9, 10],
+}
+MOOLATRIKONA = {'sun': 4, 'moon': 1, 'mars': 0, 'mercury': 5, 'jupiter': 8, 'venus': 6, 'saturn': 10}
+
+# Houses counted from a graha that its sight (graha drishti) falls on
+ASPECT_HOUSES = {'mars': (4, 7, 8), 'jupiter': (5, 7, 9), 'saturn': (3, 7, 10)}
+
+_ALL_SIGNS = 0xFFF
+
+
+def house_mask(houses: Iterable[int]) -> int:
+    """12-bit mask of houses (bit 0 = 1st house)"""
+    mask = 0
+    for house in houses:
+        mask |= 1 << (house - 1)
+    return mask
+
+
+def _signs_from(houses: Iterable[int], origin: int) -> int:
+    """12-bit mask of the signs of houses counted from an origin sign"""
+    return house_mask((origin + house - 1) % 12 + 1 for house in houses)
+
+
+def _graha_masks(signs_by_graha: Dict[str, Any]) -> List[int]:
+    """Per graha, a 12-bit mask of signs"""
+    masks = []
+    for graha in GRAHAS:
+        signs = signs_by_graha.get(graha, [])
+        masks.append(house_mask(sign + 1 for sign in (signs if isinstance(signs, list) else [signs])))
+    return masks
+
+
+# Dignity name -> per-graha sign masks
+DIGNITY_MASKS = {
+    'exalted': _graha_masks(EXALTATION),
+    'debilitated': _graha_masks(DEBILITATION),
+    'own sign': _graha_masks(OWN_SIGNS),
+    'moolatrikona': _graha_masks(MOOLATRIKONA),
+}
+
+# Per graha, mask of houses (counted from it) its sight falls on
+_ASPECT_MASKS = [house_mask(ASPECT_HOUSES.get(graha, (7,))) for graha in GRAHAS]
+_SIGN_LORDS = [int(lord) for lord in SIGN_LORDS]
+_GRAHA_INDEX = {graha: index for index, graha in enumerate(GRAHAS)}
+
+
+@dataclass
+class YogaChart:
+    """
+    Sign-level state of one chart
+
+    Attributes:
+        signs: Sign (0-11) per graha in GRAHAS order, then the ascendant;
+            -1 for grahas missing from the chart
+        occupancy: Per sign, bitmask of grahas (bit i = GRAHAS[i]) in it
+        positions: Occupancy matrix as one integer, bit graha * 12 + sign
+    """
+    signs: List[int]
+    occupancy: List[int]
+    positions: int
+
+    @classmethod
+    def from_planets(cls, planets: Dict[str, Dict], ascendant: float) -> 'YogaChart':
+        """
+        Build from a chart's planets dict (with 'sign' or 'longitude')
+
+        Rahu and Ketu are also read from 'north_node' and 'south_node';
+        Ketu is placed opposite Rahu when only Rahu is given.
+        """
+        signs = []
+        for graha in GRAHAS:
+            sign = -1
+            for key in NODE_ALIASES.get(graha, (graha,)):
+                data = planets.get(key)
+                if isinstance(data, dict):
+                    if 'sign' in data:
+                        sign = int(data['sign']) % 12
+                    elif 'longitude' in data:
+                        sign = int(data['longitude'] / 30) % 12
+                    break
+            signs.append(sign)
+
+        rahu, ketu = _GRAHA_INDEX['rahu'], _GRAHA_INDEX['ketu']
+        if signs[ketu] < 0 <= signs[rahu]:
+            signs[ketu] = (signs[rahu] + 6) % 12
+        signs.append(int(ascendant / 30) % 12)
+
+        occupancy = [0] * 12
+        positions = 0
+        for index, sign in enumerate(signs[:ASCENDANT_INDEX]):
+            if sign >= 0:
+                occupancy[sign] |= 1 << index
+                positions |= 1 << (index * 12 + sign)
+        return cls(signs=signs, occupancy=occupancy, positions=positions)
+
+    @property
+    def ascendant_sign(self) -> int:
+        return self.signs[ASCENDANT_INDEX]
+
+    def house_lord(self, house: int) -> int:
+        """Graha index of the lord of a house (1-12)"""
+        return _SIGN_LORDS[(self.ascendant_sign + house - 1) % 12]
+
+    def house_of(self, index: int, from_index: int = ASCENDANT_INDEX) -> int:
+        """House (1-12) of signs[index] counted from signs[from_index]"""
+        return (self.signs[index] - self.signs[from_index]) % 12 + 1
+
+
+# =============================================================================
+# Planet references and output terms
+# =============================================================================
+
+@dataclass(frozen=True)
+class Planet:
+    """A graha by name"""
+    name: str
+
+    def index(self, asc_sign: int) -> int:
+        return _GRAHA_INDEX[self.name]
+
+
+@dataclass(frozen=True)
+class Lord:
+    """The lord of a house counted from the ascendant"""
+    house: int
+
+    def index(self, asc_sign: int) -> int:
+        return _SIGN_LORDS[(asc_sign + self.house - 1) % 12]
+
+
+@dataclass(frozen=True)
+class _Ascendant:
+    """The ascendant, as a reference point for counting houses"""
+
+    def index(self, asc_sign: int) -> int:
+        return ASCENDANT_INDEX
+
+
+PlanetRef = Union[Planet, Lord, _Ascendant]
+
+ASCENDANT = _Ascendant()
+SUN, MOON, MARS, MERCURY, JUPITER, VENUS, SATURN, RAHU, KETU = (Planet(graha) for graha in GRAHAS)
+
+
+@dataclass(frozen=True)
+class HouseOf:
+    """Output term: house of a planet counted from the ascendant"""
+    ref: PlanetRef
+
+
+@dataclass(frozen=True)
+class Matched:
+    """Output term: the planets an Occupants predicate bound under a name"""
+    name: str
+
+
+@dataclass(frozen=True)
+class MatchedHouses:
+    """Output term: houses of the planets bound under a name"""
+    name: str
+
+
+# =============================================================================
+# Predicates
+# =============================================================================
+
+Check = Callable[[YogaChart], bool]
+
+
+@dataclass
+class _Static:
+    """Sign-set requirements folded into the per-rule bitmask test"""
+    required: Dict[int, int] = field(default_factory=dict)
+    forbidden: int = 0
+
+
+# What a predicate compiles to for one ascendant sign
+Compiled = Union[bool, _Static, Check]
+
+
+class Predicate:
+    """
+    A condition on a chart
+
+    compile(asc_sign) returns a constant, a _Static requirement or a
+    check(chart) closure. Predicates with a bind name also provide
+    bound(chart) for formatting detected yogas.
+    """
+    bind: Optional[str] = None
+
+    def compile(self, asc_sign: int) -> Compiled:
+        raise NotImplementedError
+
+    def bound(self, chart: YogaChart) -> Any:
+        raise NotImplementedError
+
+
+@dataclass(frozen=True)
+class Placed(Predicate):
+    """Planet in any of the houses counted from a reference (default: ascendant)"""
+    ref: PlanetRef
+    houses: Tuple[int, ...]
+    from_: PlanetRef = ASCENDANT
+
+    def compile(self, asc_sign: int) -> Compiled:
+        index, origin = self.ref.index(asc_sign), self.from_.index(asc_sign)
+        if origin == ASCENDANT_INDEX:
+            if index == ASCENDANT_INDEX:
+                return 1 in self.houses
+            return _Static(required={index: _signs_from(self.houses, asc_sign)})
+
+        mask = house_mask(self.houses)
+
+        def check(chart):
+            sign, start = chart.signs[index], chart.signs[origin]
+            return sign >= 0 and start >= 0 and (mask >> ((sign - start) % 12)) & 1 == 1
+        return check
+
+
+@dataclass(frozen=True)
+class Conjunct(Predicate):
+    """Both planets in the same sign"""
+    a: PlanetRef
+    b: PlanetRef
+
+    def compile(self, asc_sign: int) -> Compiled:
+        a, b = self.a.index(asc_sign), self.b.index(asc_sign)
+        if a == b:
+            return _Static(required={a: _ALL_SIGNS})
+
+        def check(chart):
+            sign = chart.signs[a]
+            return sign >= 0 and sign == chart.signs[b]
+        return check
+
+
+@dataclass(frozen=True)
+class Distinct(Predicate):
+    """The references resolve to different planets (e.g. two house lords)"""
+    a: PlanetRef
+    b: PlanetRef
+
+    def compile(self, asc_sign: int) -> Compiled:
+        return self.a.index(asc_sign) != self.b.index(asc_sign)
+
+
+@dataclass(frozen=True)
+class Aspects(Predicate):
+    """Planet a casts its sight (graha drishti) on planet b's sign"""
+    a: PlanetRef
+    b: PlanetRef
+
+    def compile(self, asc_sign: int) -> Compiled:
+        a, b = self.a.index(asc_sign), self.b.index(asc_sign)
+        if a == ASCENDANT_INDEX:
+            return False
+        mask = _ASPECT_MASKS[a]
+
+        def check(chart):
+            sign, target = chart.signs[a], chart.signs[b]
+            return sign >= 0 and target >= 0 and (mask >> ((target - sign) % 12)) & 1 == 1
+        return check
+
+
+@dataclass(frozen=True)
+class Dignity(Predicate):
+    """
+    Planet in any of the dignities ('exalted', 'moolatrikona', 'own sign',
+    'debilitated'); the first that holds is bound under bind
+    """
+    ref: PlanetRef
+    dignities: Tuple[str, ...]
+    bind: Optional[str] = None
+
+    def compile(self, asc_sign: int) -> Compiled:
+        index = self.ref.index(asc_sign)
+        if index == ASCENDANT_INDEX:
+            return False
+        signs = 0
+        for dignity in self.dignities:
+            signs |= DIGNITY_MASKS[dignity][index]
+        return _Static(required={index: signs})
+
+    def bound(self, chart: YogaChart) -> str:
+        index = self.ref.index(chart.ascendant_sign)
+        sign = chart.signs[index]
+        return next(d for d in self.dignities if (DIGNITY_MASKS[d][index] >> sign) & 1)
+
+
+@dataclass(frozen=True)
+class Occupants(Predicate):
+    """
+    Between min_count and max_count of the listed planets occupy the houses
+    counted from a reference; the occupants (in listed order) are bound
+    under bind
+    """
+    from_: PlanetRef
+    houses: Tuple[int, ...]
+    planets: Tuple[Planet, ...]
+    min_count: int = 1
+    max_count: Optional[int] = None
+    bind: Optional[str] = None
+
+    def compile(self, asc_sign: int) -> Compiled:
+        grahas = [_GRAHA_INDEX[planet.name] for planet in self.planets]
+        high = len(grahas) if self.max_count is None else self.max_count
+        low = self.min_count
+        if low > high:
+            return False
+        if low == 0 and high >= len(grahas):
+            return True
+
+        origin = self.from_.index(asc_sign)
+        if origin == ASCENDANT_INDEX:
+            signs = _signs_from(self.houses, asc_sign)
+            if low == len(grahas):
+                return _Static(required={graha: signs for graha in grahas})
+            if high == 0:
+                return _Static(forbidden=sum(signs << (graha * 12) for graha in grahas))
+
+        offsets = [house - 1 for house in self.houses]
+        planet_mask = sum(1 << graha for graha in grahas)
+
+        def check(chart):
+            start = chart.signs[origin]
+            if start < 0:
+                return False
+            occupied = 0
+            for offset in offsets:
+                occupied |= chart.occupancy[(start + offset) % 12]
+            return low <= (occupied & planet_mask).bit_count() <= high
+        return check
+
+    def bound(self, chart: YogaChart) -> List[str]:
+        start = chart.signs[self.from_.index(chart.ascendant_sign)]
+        occupied = 0
+        for house in self.houses:
+            occupied |= chart.occupancy[(start + house - 1) % 12]
+        return [planet.name for planet in self.planets if occupied >> _GRAHA_INDEX[planet.name] & 1]
+
+
+@dataclass(frozen=True)
+class Not(Predicate):
+    """Negation of a predicate"""
+    predicate: Predicate
+
+    def compile(self, asc_sign: int) -> Compiled:
+        inner = self.predicate.compile(asc_sign)
+        if isinstance(inner, bool):
+            return not inner
+        if isinstance(inner, _Static):
+            # A single graha outside a sign set (or absent) is a forbidden mask
+            if len(inner.required) == 1 and not inner.forbidden:
+                (graha, signs), = inner.required.items()
+                return _Static(forbidden=signs << (graha * 12))
+            test = _Test.build([inner])
+            return lambda chart: not test.passes(chart)
+        return lambda chart: not inner(chart)
+
+
+# =============================================================================
+# Rules
+# =============================================================================
+
+@dataclass(frozen=True)
+class YogaRule:
+    """
+    Declarative yoga definition
+
+    name and description are str.format templates over p0, p1, ...
+    (title-cased planets), h0, h1, ... (houses) and bound names (a bound
+    list of planets is joined as 'Mars, Venus').
+
+    Every planet in planets must be in the chart for the yoga to form.
+    """
+    name: str
+    sanskrit_name: str
+    category: str
+    conditions: Tuple[Predicate, ...]
+    planets: Tuple[Union[PlanetRef, Matched], ...]
+    houses: Tuple[Union[int, HouseOf, MatchedHouses], ...]
+    description: str
+    effects: str
+    strength: str = 'moderate'
+    strong_if: Optional[Predicate] = None
+
+
+@dataclass
+class _Test:
+    """A conjunction of compiled predicates for one ascendant sign"""
+    required: int
+    n_required: int
+    forbidden: int
+    checks: List[Check]
+
+    @classmethod
+    def build(cls, parts: Sequence[Compiled]) -> Optional['_Test']:
+        """Fold compiled parts into one test; None if it can never pass"""
+        required: Dict[int, int] = {}
+        forbidden = 0
+        checks = []
+        for part in parts:
+            if part is True:
+                continue
+            if part is False:
+                return None
+            if isinstance(part, _Static):
+                for graha, signs in part.required.items():
+                    required[graha] = required.get(graha, _ALL_SIGNS) & signs
+                forbidden |= part.forbidden
+            else:
+                checks.append(part)
+        if any(signs == 0 for signs in required.values()):
+            return None
+        return cls(
+            required=sum(signs << (graha * 12) for graha, signs in required.items()),
+            n_required=len(required),
+            forbidden=forbidden,
+            checks=checks,
+        )
+
+    def passes(self, chart: YogaChart) -> bool:
+        positions = chart.positions
+        if (positions & self.required).bit_count() != self.n_required or positions & self.forbidden:
+            return False
+        for check in self.checks:
+            if not check(chart):
+                return False
+        return True
+
+
+@dataclass
+class _CompiledRule:
+    """A rule compiled for one ascendant sign"""
+    rule: YogaRule
+    test: _Test
+    strong_if: Optional[_Test]
+    binders: List[Predicate]
+    planets: List[Union[str, Matched]]
+    houses: List[Union[int, MatchedHouses]]
+    literal_houses: List[bool]
+
+
+class YogaEngine:
+    """
+    Compiled set of yoga rules
+
+    Example:
+        engine = YogaEngine(rules)
+        for yoga in engine.detect(YogaChart.from_planets(planets, ascendant)):
+            ...
+    """
+
+    def __init__(self, rules: Sequence[YogaRule]):
+        self.rules = list(rules)
+        # Per ascendant sign, the rules that can form with their tests
+        self._compiled = [self._compile(asc_sign) for asc_sign in range(12)]
+
+    def _compile(self, asc_sign: int) -> List['_CompiledRule']:
+        compiled = []
+        for rule in self.rules:
+            presence = _Static(required={
+                ref.index(asc_sign): _ALL_SIGNS
+                for ref in rule.planets if isinstance(ref, (Planet, Lord))
+            })
+            test = _Test.build([presence] + [condition.compile(asc_sign) for condition in rule.conditions])
+            if test is None:
+                continue
+            strong_if = None
+            if rule.strong_if is not None:
+                strong_if = _Test.build([rule.strong_if.compile(asc_sign)])
+            compiled.append(_CompiledRule(
+                rule=rule,
+                test=test,
+                strong_if=strong_if,
+                binders=[condition for condition in rule.conditions if condition.bind],
+                # Planet names and graha indices of houses, fixed by the ascendant
+                planets=[term if isinstance(term, Matched) else GRAHAS[term.index(asc_sign)] for term in rule.planets],
+                houses=[
+                    term.ref.index(asc_sign) if isinstance(term, HouseOf) else term
+                    for term in rule.houses
+                ],
+                literal_houses=[not isinstance(term, (HouseOf, MatchedHouses)) for term in rule.houses],
+            ))
+        return compiled
+
+    def detect(self, chart: YogaChart) -> List[Dict[str, Any]]:
+        """
+        Evaluate every rule on a chart
+
+        Returns:
+            One dict per formed yoga (fields of schemas.yogas.YogaInfo),
+            in rule order
+        """
+        positions = chart.positions
+        results = []
+        for compiled in self._compiled[chart.ascendant_sign]:
+            test = compiled.test
+            if (positions & test.required).bit_count() != test.n_required or positions & test.forbidden:
+                continue
+            for check in test.checks:
+                if not check(chart):
+                    break
+            else:
+                results.append(self._result(compiled, chart))
+        return results
+
+    @staticmethod
+    def _result(compiled: '_CompiledRule', chart: YogaChart) -> Dict[str, Any]:
+        rule = compiled.rule
+        bindings = {condition.bind: condition.bound(chart) for condition in compiled.binders}
+
+        planets: List[str] = []
+        for term in compiled.planets:
+            if isinstance(term, Matched):
+                planets.extend(bindings[term.name])
+            else:
+                planets.append(term)
+
+        houses: List[int] = []
+        for term, literal in zip(compiled.houses, compiled.literal_houses):
+            if literal:
+                houses.append(term)
+            elif isinstance(term, MatchedHouses):
+                houses.extend(chart.house_of(_GRAHA_INDEX[name]) for name in bindings[term.name])
+            else:
+                houses.append(chart.house_of(term))
+
+        fields = {
+            name: ', '.join(item.title() for item in value) if isinstance(value, list) else value
+            for name, value in bindings.items()
+        }
+        for i, planet in enumerate(planets):
+            fields[f'p{i}'] = planet.title()
+        for i, house in enumerate(houses):
+            fields[f'h{i}'] = house
+
+        strong = compiled.strong_if is not None and compiled.strong_if.passes(chart)
+        return {
+            'name': rule.name.format(**fields),
+            'sanskrit_name': rule.sanskrit_name,
+            'category': rule.category,
+            'planets_involved': planets,
+            'houses_involved': houses,
+            'strength': 'strong' if strong else rule.strength,
+            'description': rule.description.format(**fields),
+            'effects': rule.effects,
+        }
@@ -0,0 +1,385 @@
+"""
+Chebyshev ephemeris cache
+
+Tropical geocentric longitude, latitude and distance of each body, fitted
+with Chebyshev polynomials over fixed-length windows (8 days for the Moon
+up to 64 days for the outer planets) and stored in one .npy file that is
+opened memory-mapped. Positions and speeds for arrays of instants are then
+a gather plus a Clenshaw recurrence in NumPy instead of one swe.calc_ut
+call per body per instant, which makes dense time scrubbing and long
+searches cheap. Batch callers opt in with use_cache=True.
+
+Each fit is checked against Swiss Ephemeris on a dense grid when the file
+is built, and the build fails if any body exceeds
+EPHEMERIS_CACHE_TOLERANCE_ARCSEC. Typical errors are around 0.01"; the
+largest (a few arcseconds) sit at conjunctions with the Sun, where Swiss
+Ephemeris' light deflection term changes sharply.
+
+File layout: a 1-D float64 array
+    [version, start_jd, end_jd, n_bodies,
+     (swe_id, segment_days, n_coefficients, offset, n_segments, max_error) * n_bodies,
+     coefficients...]
+where each body's coefficients are shaped (n_segments, 3, n_coefficients)
+for unwrapped longitude, latitude and distance.
+Build it with scripts/build_ephemeris_cache.py.
+"""
+import logging
+import os
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from numpy.polynomial import chebyshev
+
+from app.core.config import settings
+from app.core.celestial_registry import CelestialRegistry
+from app.utils.ephemeris import BatchPositions, EphemerisCalculator
+
+logger = logging.getLogger(__name__)
+
+ARCSEC_PER_DEGREE = 3600.0
+
+
+class ChebyshevEphemeris:
+    """Memory-mapped Chebyshev fits of body positions."""
+
+    FORMAT_VERSION = 1
+
+    # Default coverage: 1900-01-01 to 2100-01-01 0h UT
+    DEFAULT_START_JD = 2415020.5
+    DEFAULT_END_JD = 2488069.5
+
+    # Body -> (window in days, number of coefficients)
+    SEGMENTS = {
+        'moon': (8, 14),
+        'mercury': (8, 14),
+        'venus': (16, 14),
+        'sun': (16, 14),
+        'mars': (16, 14),
+        'north_node': (8, 14),
+        'mean_node': (32, 14),
+        'lilith': (32, 14),
+        'lilith_true': (8, 14),
+        'jupiter': (64, 20),
+        'saturn': (64, 20),
+        'uranus': (64, 20),
+        'neptune': (64, 20),
+        'pluto': (64, 20),
+        'chiron': (64, 20),
+        'ceres': (32, 14),
+        'pallas': (32, 14),
+        'juno': (32, 14),
+        'vesta': (32, 14),
+    }
+
+    # Instants per window compared with Swiss Ephemeris at build time
+    VERIFY_SAMPLES = 64
+
+    HEADER_SIZE = 4
+    RECORD_SIZE = 6
+
+    _shared: Optional['ChebyshevEphemeris'] = None
+    _shared_path: Optional[str] = None
+
+    def __init__(self, data: np.ndarray):
+        """
+        Args:
+            data: Cache array in file layout
+        """
+        if int(data[0]) != self.FORMAT_VERSION:
+            raise ValueError(f"Unsupported ephemeris cache version {data[0]}")
+        self.start_jd = float(data[1])
+        self.end_jd = float(data[2])
+
+        # swe id -> (segment days, coefficient array, max error in arcsec)
+        self.fits: Dict[int, Tuple[float, np.ndarray, float]] = {}
+        for index in range(int(data[3])):
+            record = data[self.HEADER_SIZE + index * self.RECORD_SIZE:][:self.RECORD_SIZE]
+            swe_id, days, n_coefficients, offset, n_segments, max_error = (float(v) for v in record)
+            size = int(n_segments) * 3 * int(n_coefficients)
+            coefficients = data[int(offset):int(offset) + size].reshape(
+                int(n_segments), 3, int(n_coefficients)
+            )
+            self.fits[int(swe_id)] = (days, coefficients, max_error)
+
+    @classmethod
+    def build(
+        cls,
+        path: str,
+        start_jd: float = DEFAULT_START_JD,
+        end_jd: float = DEFAULT_END_JD,
+        bodies: Optional[List[str]] = None,
+        tolerance_arcsec: Optional[float] = None
+    ) -> 'ChebyshevEphemeris':
+        """
+        Fit every body, verify the fits and write the cache to disk
+
+        Args:
+            path: Output .npy path
+            start_jd: First Julian Day covered (UT)
+            end_jd: Last Julian Day covered (UT)
+            bodies: Bodies to fit (defaults to the calculation set, without
+                those Swiss Ephemeris cannot compute here)
+            tolerance_arcsec: Largest error allowed in longitude or
+                latitude (defaults to settings.EPHEMERIS_CACHE_TOLERANCE_ARCSEC)
+
+        Returns:
+            The cache, memory-mapped from the written file
+
+        Raises:
+            ValueError: If a body has no window size or a fit exceeds the tolerance
+        """
+        if end_jd <= start_jd:
+            raise ValueError("end_jd must be after start_jd")
+        if tolerance_arcsec is None:
+            tolerance_arcsec = settings.EPHEMERIS_CACHE_TOLERANCE_ARCSEC
+        if bodies is None:
+            bodies = [b for b in CelestialRegistry.get_planets_for_calculation() if b != 'south_node']
+
+        records = []
+        blocks = []
+        for body in bodies:
+            if body not in cls.SEGMENTS:
+                raise ValueError(f"No Chebyshev window for {body}")
+            days, n_coefficients = cls.SEGMENTS[body]
+            n_segments = int(np.ceil((end_jd - start_jd) / days))
+            segment_starts = start_jd + days * np.arange(n_segments)
+
+            coefficients = cls._fit(body, segment_starts, days, n_coefficients)
+            if coefficients is None:
+                logger.warning(f"Ephemeris cache: {body} not computable, skipped")
+                continue
+
+            max_error = cls._verify(body, segment_starts, days, coefficients)
+            if max_error > tolerance_arcsec:
+                raise ValueError(
+                    f"Chebyshev fit of {body} is off by {max_error:.3f}\" "
+                    f"(tolerance {tolerance_arcsec}\")"
+                )
+
+            records.append([
+                EphemerisCalculator.PLANETS[body], days, n_coefficients, 0, n_segments, max_error
+            ])
+            blocks.append(coefficients.ravel())
+
+        offset = cls.HEADER_SIZE + cls.RECORD_SIZE * len(records)
+        for record, block in zip(records, blocks):
+            record[3] = offset
+            offset += len(block)
+
+        header = [cls.FORMAT_VERSION, start_jd, end_jd, len(records)]
+        data = np.concatenate([np.array(header + sum(records, []), dtype=np.float64)] + blocks)
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        np.save(path, data)
+        return cls.open(path)
+
+    @classmethod
+    def open(cls, path: str) -> 'ChebyshevEphemeris':
+        """Memory-map a cache file"""
+        return cls(np.load(path, mmap_mode='r'))
+
+    @classmethod
+    def get(cls) -> Optional['ChebyshevEphemeris']:
+        """
+        Shared cache from settings.EPHEMERIS_CACHE_PATH
+
+        Returns:
+            The cache, or None if the file has not been built (checked again
+            on the next call)
+        """
+        path = settings.EPHEMERIS_CACHE_PATH
+        if cls._shared_path != path:
+            cls._shared, cls._shared_path = None, None
+            if path and os.path.exists(path):
+                try:
+                    cls._shared = cls.open(path)
+                    cls._shared_path = path
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Ephemeris cache {path} unreadable: {e}")
+        return cls._shared
+
+    def covers(self, jds: np.ndarray, bodies: Sequence[str]) -> bool:
+        """Whether every instant and body can be served from the cache"""
+        if len(jds) == 0 or jds.min() < self.start_jd or jds.max() > self.end_jd:
+            return False
+        return all(self._swe_id(body) in self.fits for body in bodies)
+
+    def max_error(self, body: str) -> float:
+        """Largest error of a body's fit found at build time (arcsec)"""
+        return self.fits[self._swe_id(body)][2]
+
+    def positions(self, jds: Sequence[float], bodies: Sequence[str]) -> BatchPositions:
+        """
+        Tropical positions and speeds of bodies at many instants
+
+        Args:
+            jds: Julian Days (UT) within the cache's range
+            bodies: Body IDs (south_node is derived from north_node)
+
+        Returns:
+            BatchPositions with arrays shaped (n_jd, n_body)
+
+        Raises:
+            ValueError: If an instant or body is not covered
+        """
+        jd_array = np.atleast_1d(np.asarray(jds, dtype=np.float64))
+        bodies = list(bodies)
+        if not self.covers(jd_array, bodies):
+            raise ValueError("Instants or bodies outside the ephemeris cache")
+
+        values = np.empty((len(jd_array), len(bodies), 3))
+        speeds = np.empty((len(jd_array), len(bodies), 3))
+        # Bodies sharing a window size share segment indices and basis
+        evaluated = {}
+        bases = {}
+        for col, body in enumerate(bodies):
+            swe_id = self._swe_id(body)
+            if swe_id not in evaluated:
+                days, coefficients, _ = self.fits[swe_id]
+                key = (days, coefficients.shape[-1])
+                if key not in bases:
+                    bases[key] = self._basis_at(jd_array, *key, len(coefficients))
+                evaluated[swe_id] = self._evaluate(coefficients, days, *bases[key])
+            values[:, col], speeds[:, col] = evaluated[swe_id]
+            if body == 'south_node':
+                values[:, col, 0] += 180.0
+
+        return BatchPositions(
+            jds=jd_array,
+            bodies=bodies,
+            longitude=np.mod(values[:, :, 0], 360.0),
+            latitude=values[:, :, 1],
+            distance=values[:, :, 2],
+            speed_longitude=speeds[:, :, 0],
+            speed_latitude=speeds[:, :, 1],
+            speed_distance=speeds[:, :, 2],
+        )
+
+    def _basis_at(
+        self,
+        jds: np.ndarray,
+        days: float,
+        n_coefficients: int,
+        n_segments: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Segment index, basis and basis derivative of each instant"""
+        elapsed = (jds - self.start_jd) / days
+        segment = np.minimum(np.floor(elapsed).astype(np.int64), n_segments - 1)
+        x = 2.0 * (elapsed - segment) - 1.0
+        return (segment,) + _basis(x, n_coefficients)
+
+    @staticmethod
+    def _evaluate(
+        coefficients: np.ndarray,
+        days: float,
+        segment: np.ndarray,
+        basis: np.ndarray,
+        derivative: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Values and per-day derivatives, each shaped (n_jd, 3)"""
+        selected = np.asarray(coefficients[segment])
+        values = np.einsum('nck,kn->nc', selected, basis)
+        rates = np.einsum('nck,kn->nc', selected, derivative) * (2.0 / days)
+        return values, rates
+
+    @staticmethod
+    def _swe_id(body: str) -> Optional[int]:
+        lookup = 'north_node' if body == 'south_node' else body.lower()
+        return EphemerisCalculator.PLANETS.get(lookup)
+
+    @staticmethod
+    def _nodes(n_coefficients: int) -> np.ndarray:
+        """Chebyshev points of the first kind on [-1, 1]"""
+        return np.cos(np.pi * (np.arange(n_coefficients) + 0.5) / n_coefficients)
+
+    @classmethod
+    def _sample(cls, body: str, jds: np.ndarray) -> Optional[np.ndarray]:
+        """Longitude, latitude and distance from Swiss Ephemeris, shaped jds.shape + (3,)"""
+        batch = EphemerisCalculator.calculate_positions_batch(jds.ravel(), [body], use_cache=False)
+        if np.isnan(batch.longitude).any():
+            return None
+        samples = np.stack([batch.longitude[:, 0], batch.latitude[:, 0], batch.distance[:, 0]], axis=-1)
+        return samples.reshape(jds.shape + (3,))
+
+    @classmethod
+    def _fit(
+        cls,
+        body: str,
+        segment_starts: np.ndarray,
+        days: float,
+        n_coefficients: int
+    ) -> Optional[np.ndarray]:
+        """Interpolating coefficients per segment, shaped (n_segments, 3, n_coefficients)"""
+        nodes = cls._nodes(n_coefficients)
+        samples = cls._sample(body, segment_starts[:, None] + (nodes[None, :] + 1.0) * days / 2.0)
+        if samples is None:
+            return None
+        samples[:, :, 0] = np.unwrap(samples[:, :, 0], period=360.0, axis=1)
+
+        # Discrete orthogonality of Chebyshev polynomials at the nodes
+        vander = chebyshev.chebvander(nodes, n_coefficients - 1)
+        coefficients = np.einsum('nk,snc->sck', vander, samples) * (2.0 / n_coefficients)
+        coefficients[:, :, 0] /= 2.0
+        return coefficients
+
+    @classmethod
+    def _verify(
+        cls,
+        body: str,
+        segment_starts: np.ndarray,
+        days: float,
+        coefficients: np.ndarray
+    ) -> float:
+        """Largest longitude/latitude error (arcsec), sampled between the nodes"""
+        x = np.linspace(-1.0, 1.0, cls.VERIFY_SAMPLES)
+        jds = segment_starts[:, None] + (x[None, :] + 1.0) * days / 2.0
+        expected = cls._sample(body, jds)
+
+        fitted = _clenshaw(np.broadcast_to(x, jds.shape), coefficients[:, None, :, :])
+        longitude_error = np.abs(np.mod(fitted[..., 0] - expected[..., 0] + 180.0, 360.0) - 180.0)
+        latitude_error = np.abs(fitted[..., 1] - expected[..., 1])
+        return float(max(longitude_error.max(), latitude_error.max()) * ARCSEC_PER_DEGREE)
+
+
+def _basis(x: np.ndarray, n_coefficients: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Chebyshev polynomials T_k(x) and their derivatives, k < n_coefficients
+
+    Uses dT_k/dx = k * U_(k-1)(x) with U the polynomials of the second kind.
+
+    Returns:
+        Two arrays shaped (n_coefficients, n_points)
+    """
+    basis = np.empty((n_coefficients, len(x)))
+    second_kind = np.empty((n_coefficients, len(x)))
+    basis[0] = 1.0
+    second_kind[0] = 1.0
+    if n_coefficients > 1:
+        basis[1] = x
+        second_kind[1] = 2.0 * x
+    for k in range(2, n_coefficients):
+        basis[k] = 2.0 * x * basis[k - 1] - basis[k - 2]
+        second_kind[k] = 2.0 * x * second_kind[k - 1] - second_kind[k - 2]
+
+    derivative = np.zeros_like(basis)
+    derivative[1:] = np.arange(1, n_coefficients)[:, None] * second_kind[:-1]
+    return basis, derivative
+
+
+def _clenshaw(x: np.ndarray, coefficients: np.ndarray) -> np.ndarray:
+    """
+    Evaluate Chebyshev series with per-point coefficients
+
+    Args:
+        x: Points in [-1, 1], shaped (...)
+        coefficients: Series shaped (..., n_series, n_coefficients)
+
+    Returns:
+        Values shaped (..., n_series)
+    """
+    x = np.asarray(x)[..., None]
+    b1 = np.zeros(coefficients.shape[:-1])
+    b2 = np.zeros_like(b1)
+    for k in range(coefficients.shape[-1] - 1, 0, -1):
+        b1, b2 = 2.0 * x * b1 - b2 + coefficients[..., k], b1
+    return x * b1 - b2 + coefficients[..., 0]
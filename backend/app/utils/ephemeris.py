@@ -2,16 +2,101 @@
 Swiss Ephemeris wrapper for astronomical calculations
 Provides high-level interface for chart calculations
 """
+import logging
+import threading
 import swisseph as swe
+import numpy as np
+from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from functools import lru_cache
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 from app.core.config import settings
 from app.core.celestial_registry import CelestialRegistry, BodyCategory
 
+logger = logging.getLogger(__name__)
+
 # Set ephemeris path on module import
 swe.set_ephe_path(settings.EPHEMERIS_PATH)
 
+# swe keeps the sidereal mode in process-global state. Every set_sid_mode
+# call, together with the swe calls that depend on it, runs under this lock
+# (see SiderealContext)
+_SID_MODE_LOCK = threading.RLock()
+
+SIGN_NAMES = [
+    'Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
+    'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces'
+]
+
+
+@dataclass
+class BatchPositions:
+    """
+    Positions for many bodies at many Julian Days
+
+    All arrays are shaped (n_jd, n_body). Bodies that failed to calculate
+    are filled with NaN (mirrors the None entries of calculate_all_planets).
+    """
+    jds: np.ndarray
+    bodies: List[str]
+    longitude: np.ndarray
+    latitude: np.ndarray
+    distance: np.ndarray
+    speed_longitude: np.ndarray
+    speed_latitude: np.ndarray
+    speed_distance: np.ndarray
+
+    @property
+    def sign(self) -> np.ndarray:
+        """Zodiac sign index (0=Aries) per position"""
+        return (np.floor(self.longitude / 30.0).astype(np.int64)) % 12
+
+    @property
+    def degree_in_sign(self) -> np.ndarray:
+        """Degree within sign (0-30) per position"""
+        return np.mod(self.longitude, 30.0)
+
+    @property
+    def retrograde(self) -> np.ndarray:
+        """Boolean retrograde flag per position"""
+        return self.speed_longitude < 0
+
+    def body_index(self, body: str) -> int:
+        """Column index of a body in the arrays"""
+        return self.bodies.index(body)
+
+    def positions_at(self, row: int) -> Dict[str, Optional[Dict]]:
+        """
+        Materialize one row as the dict layout of calculate_all_planets
+
+        Args:
+            row: Index into jds
+
+        Returns:
+            Dictionary with body names as keys and position dicts as values
+        """
+        results = {}
+        for col, body in enumerate(self.bodies):
+            longitude = float(self.longitude[row, col])
+            if np.isnan(longitude):
+                results[body] = None
+                continue
+            sign = int(longitude / 30)
+            speed_longitude = float(self.speed_longitude[row, col])
+            results[body] = {
+                'longitude': longitude,
+                'latitude': float(self.latitude[row, col]),
+                'distance': float(self.distance[row, col]),
+                'speed_longitude': speed_longitude,
+                'speed_latitude': float(self.speed_latitude[row, col]),
+                'speed_distance': float(self.speed_distance[row, col]),
+                'retrograde': speed_longitude < 0,
+                'sign': sign,
+                'degree_in_sign': longitude % 30,
+                'sign_name': SIGN_NAMES[sign % 12],
+            }
+        return results
+
 
 class EphemerisCalculator:
     """
@@ -63,6 +148,9 @@ class EphemerisCalculator:
         'true_pushya': swe.SIDM_TRUE_PUSHYA,
     }
 
+    # Mean sidereal rotation in degrees per day (rate of the ARMC)
+    SIDEREAL_RATE = 360.98564736629
+
     @staticmethod
     def datetime_to_julian_day(dt: datetime, timezone_offset_minutes: int = 0) -> float:
         """
@@ -108,7 +196,7 @@ class EphemerisCalculator:
     def calculate_planet_position(
         planet: str,
         jd: float,
-        flags: int = swe.FLG_SWIEPH,
+        flags: int = swe.FLG_SWIEPH | swe.FLG_SPEED,
         zodiac: str = 'tropical',
         ayanamsa: str = 'lahiri'
     ) -> Dict:
@@ -138,14 +226,10 @@ class EphemerisCalculator:
         if planet_id is None:
             raise ValueError(f"Unknown planet: {planet}")
 
-        # Add sidereal flag if using sidereal zodiac
-        if zodiac == 'sidereal':
-            flags |= swe.FLG_SIDEREAL
-            # Set ayanamsa from parameter (respects user selection)
-            ayanamsa_id = EphemerisCalculator.AYANAMSA_SYSTEMS.get(
-                ayanamsa.lower(), swe.SIDM_LAHIRI
-            )
-            swe.set_sid_mode(ayanamsa_id)
+        # Sidereal positions are derived from tropical ones (see
+        # SiderealContext), so swe's global sidereal mode is never touched
+        sidereal = zodiac == 'sidereal' or bool(flags & swe.FLG_SIDEREAL)
+        flags &= ~swe.FLG_SIDEREAL
 
         # Calculate position
         result, ret_flag = swe.calc_ut(jd, planet_id, flags)
@@ -157,6 +241,13 @@ class EphemerisCalculator:
         speed_latitude = result[4]
         speed_distance = result[5]
 
+        if sidereal:
+            # Set ayanamsa from parameter (respects user selection)
+            context = EphemerisCalculator.get_sidereal_context(ayanamsa)
+            value, rate = context.ayanamsa_state(jd)
+            longitude = (longitude - value) % 360
+            speed_longitude -= rate
+
         # Determine sign and degree within sign
         sign = int(longitude / 30)  # 0=Aries, 1=Taurus, etc.
         degree_in_sign = longitude % 30
@@ -231,6 +322,106 @@ class EphemerisCalculator:
 
         return results
 
+    @staticmethod
+    def calculate_positions_batch(
+        jds: Sequence[float],
+        body_ids: Optional[List[str]] = None,
+        zodiac: str = 'tropical',
+        ayanamsa: str = 'lahiri',
+        include_asteroids: bool = False,
+        use_cache: bool = False
+    ) -> BatchPositions:
+        """
+        Calculate positions for many bodies across many Julian Days
+
+        Flags and the sidereal mode are resolved once for the whole batch,
+        and results are written straight into NumPy arrays instead of
+        building a dict per body per day. With use_cache, positions are
+        evaluated from the Chebyshev ephemeris cache instead of Swiss
+        Ephemeris when it has been built and covers every instant and body;
+        fitted positions can be off by up to
+        settings.EPHEMERIS_CACHE_TOLERANCE_ARCSEC, so only samplers whose
+        results are refined against Swiss Ephemeris should opt in.
+
+        Args:
+            jds: Sequence (or array) of Julian Days
+            body_ids: Optional specific list of body IDs to calculate
+            zodiac: 'tropical' or 'sidereal'
+            ayanamsa: Ayanamsa system for sidereal calculations
+            include_asteroids: Include main asteroids when body_ids is None
+            use_cache: Allow the Chebyshev ephemeris cache (off by default)
+
+        Returns:
+            BatchPositions with arrays shaped (n_jd, n_body)
+        """
+        jd_array = np.atleast_1d(np.asarray(jds, dtype=np.float64))
+        if body_ids is not None:
+            bodies = list(body_ids)
+        else:
+            bodies = CelestialRegistry.get_planets_for_calculation(include_asteroids)
+
+        if use_cache:
+            from app.utils.chebyshev_ephemeris import ChebyshevEphemeris
+
+            cache = ChebyshevEphemeris.get()
+            if cache is not None and cache.covers(jd_array, bodies):
+                batch = cache.positions(jd_array, bodies)
+                if zodiac == 'sidereal':
+                    values, rates = EphemerisCalculator.get_sidereal_context(ayanamsa).ayanamsa_arrays(jd_array)
+                    batch.longitude = np.mod(batch.longitude - values[:, None], 360.0)
+                    batch.speed_longitude -= rates[:, None]
+                return batch
+
+        # Tropical positions; sidereal ones are shifted afterwards
+        flags = EphemerisCalculator.get_calc_flags('tropical')
+
+        # Resolve swe ids once; south node is derived from the north node
+        swe_ids = []
+        for body in bodies:
+            lookup = 'north_node' if body == 'south_node' else body.lower()
+            planet_id = EphemerisCalculator.PLANETS.get(lookup)
+            if planet_id is None:
+                raise ValueError(f"Unknown planet: {body}")
+            swe_ids.append(planet_id)
+
+        # Each swe id is computed once even if listed twice (north/south node)
+        unique_ids = list(dict.fromkeys(swe_ids))
+        raw = np.full((len(jd_array), len(unique_ids), 6), np.nan)
+        failed = set()
+        calc_ut = swe.calc_ut
+        # Date-major order lets Swiss Ephemeris reuse its per-date state
+        for row, jd in enumerate(jd_array):
+            jd = float(jd)
+            for col, planet_id in enumerate(unique_ids):
+                if planet_id in failed:
+                    continue
+                try:
+                    raw[row, col, :] = calc_ut(jd, planet_id, flags)[0]
+                except swe.Error as e:
+                    logger.warning(f"Error calculating {bodies[swe_ids.index(planet_id)]}: {e}")
+                    failed.add(planet_id)
+
+        data = raw[:, [unique_ids.index(planet_id) for planet_id in swe_ids], :]
+        for col, body in enumerate(bodies):
+            if body == 'south_node':
+                data[:, col, 0] = np.mod(data[:, col, 0] + 180.0, 360.0)
+
+        if zodiac == 'sidereal':
+            values, rates = EphemerisCalculator.get_sidereal_context(ayanamsa).ayanamsa_arrays(jd_array)
+            data[:, :, 0] = np.mod(data[:, :, 0] - values[:, None], 360.0)
+            data[:, :, 3] -= rates[:, None]
+
+        return BatchPositions(
+            jds=jd_array,
+            bodies=bodies,
+            longitude=data[:, :, 0],
+            latitude=data[:, :, 1],
+            distance=data[:, :, 2],
+            speed_longitude=data[:, :, 3],
+            speed_latitude=data[:, :, 4],
+            speed_distance=data[:, :, 5],
+        )
+
     @staticmethod
     def calculate_houses(
         jd: float,
@@ -282,6 +473,53 @@ class EphemerisCalculator:
             'co_ascendant_koch': ascmc[5],
         }
 
+    @staticmethod
+    def armc_at(jds: np.ndarray, longitude: float) -> np.ndarray:
+        """
+        ARMC (local sidereal time in degrees) for many Julian Days
+
+        Sidereal time is evaluated once and advanced at the mean sidereal
+        rate, which stays within about a second of arc over a year.
+
+        Args:
+            jds: Julian Days (UT)
+            longitude: Geographic longitude
+
+        Returns:
+            ARMC values in degrees, shaped like jds
+        """
+        jds = np.asarray(jds, dtype=np.float64)
+        jd0 = float(jds.flat[0]) if jds.size else 0.0
+        armc0 = swe.sidtime(jd0) * 15.0 + longitude
+        return np.mod(armc0 + EphemerisCalculator.SIDEREAL_RATE * (jds - jd0), 360.0)
+
+    @staticmethod
+    def angles_from_armc(
+        armc: np.ndarray,
+        latitude: float,
+        obliquity
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Ascendant and MC for an array of ARMC values
+
+        Args:
+            armc: ARMC values in degrees (any shape)
+            latitude: Geographic latitude
+            obliquity: True obliquity of the ecliptic in degrees (scalar, or
+                an array broadcasting against armc)
+
+        Returns:
+            (ascendant, mc) arrays shaped like armc
+        """
+        ramc = np.radians(armc)
+        eps = np.radians(obliquity)
+        phi = np.radians(latitude)
+        mc = np.degrees(np.arctan2(np.sin(ramc), np.cos(ramc) * np.cos(eps)))
+        asc = np.degrees(np.arctan2(
+            np.cos(ramc), -(np.sin(ramc) * np.cos(eps) + np.tan(phi) * np.sin(eps))
+        ))
+        return np.mod(asc, 360.0), np.mod(mc, 360.0)
+
     @staticmethod
     def get_sign_name(sign_number: int) -> str:
         """
@@ -293,11 +531,7 @@ class EphemerisCalculator:
         Returns:
             Sign name as string
         """
-        signs = [
-            'Aries', 'Taurus', 'Gemini', 'Cancer', 'Leo', 'Virgo',
-            'Libra', 'Scorpio', 'Sagittarius', 'Capricorn', 'Aquarius', 'Pisces'
-        ]
-        return signs[sign_number % 12]
+        return SIGN_NAMES[sign_number % 12]
 
     @staticmethod
     def get_calc_flags(zodiac_type: str = 'tropical') -> int:
@@ -310,7 +544,8 @@ class EphemerisCalculator:
         Returns:
             Swiss Ephemeris flags integer
         """
-        flags = swe.FLG_SWIEPH
+        # FLG_SPEED is required for daily motion (and so retrograde detection)
+        flags = swe.FLG_SWIEPH | swe.FLG_SPEED
         if zodiac_type == 'sidereal':
             flags |= swe.FLG_SIDEREAL
         return flags
@@ -439,12 +674,14 @@ class EphemerisCalculator:
         return None
 
     @staticmethod
-    @lru_cache(maxsize=512)
     def calculate_ayanamsa(jd: float, ayanamsa_system: str = 'lahiri') -> float:
         """
         Calculate ayanamsa value for given date (Vedic astrology)
 
-        Cached to avoid redundant Swiss Ephemeris calls for same JD + ayanamsa.
+        Served from the shared SiderealContext for the system, so repeated
+        calls for the same JD + ayanamsa don't hit Swiss Ephemeris. This is
+        the true ayanamsa (with nutation), i.e. exactly the offset between
+        tropical and sidereal positions.
 
         Args:
             jd: Julian Day
@@ -453,14 +690,29 @@ class EphemerisCalculator:
         Returns:
             Ayanamsa value in degrees
         """
-        ayanamsa_id = EphemerisCalculator.AYANAMSA_SYSTEMS.get(ayanamsa_system.lower())
-        if ayanamsa_id is None:
+        if ayanamsa_system.lower() not in EphemerisCalculator.AYANAMSA_SYSTEMS:
             raise ValueError(f"Unknown ayanamsa system: {ayanamsa_system}")
 
-        swe.set_sid_mode(ayanamsa_id)
-        ayanamsa_value = swe.get_ayanamsa_ut(jd)
+        return EphemerisCalculator.get_sidereal_context(ayanamsa_system).ayanamsa_at(jd)
+
+    @staticmethod
+    def get_sidereal_context(ayanamsa: str = 'lahiri') -> 'SiderealContext':
+        """
+        Get the shared sidereal calculation context for an ayanamsa
 
-        return ayanamsa_value
+        Unknown systems fall back to Lahiri, as in calculate_planet_position.
+
+        Args:
+            ayanamsa: Ayanamsa system name
+
+        Returns:
+            SiderealContext (one instance per ayanamsa, per process)
+        """
+        key = ayanamsa.lower()
+        context = _SIDEREAL_CONTEXTS.get(key)
+        if context is None:
+            context = _SIDEREAL_CONTEXTS.setdefault(key, SiderealContext(key))
+        return context
 
     @staticmethod
     def tropical_to_sidereal(tropical_long: float, jd: float, ayanamsa_system: str = 'lahiri') -> float:
@@ -497,6 +749,117 @@ class EphemerisCalculator:
         return tropical_long
 
 
+class SiderealContext:
+    """
+    Pins one ayanamsa for a batch of sidereal calculations.
+
+    Sidereal longitudes are tropical longitudes minus the ayanamsa, so
+    positions are computed once in the tropical zodiac and shifted by an
+    ayanamsa that is looked up once per Julian Day and cached. Only that
+    lookup depends on swe's global sidereal mode, and it runs under a
+    process-wide lock, so contexts for different ayanamsas are safe to use
+    from concurrent threads.
+    """
+
+    # Cached Julian Days per context before the cache is reset
+    MAX_CACHED_DAYS = 4096
+
+    # Half-width of the central difference used for the ayanamsa rate
+    RATE_STEP_DAYS = 0.5
+
+    def __init__(self, ayanamsa: str = 'lahiri'):
+        """
+        Args:
+            ayanamsa: Ayanamsa system name (unknown names use Lahiri)
+        """
+        self.ayanamsa = ayanamsa.lower()
+        self.sid_mode = EphemerisCalculator.AYANAMSA_SYSTEMS.get(self.ayanamsa, swe.SIDM_LAHIRI)
+        self._states: Dict[float, Tuple[float, float]] = {}
+
+    @contextmanager
+    def swe_mode(self) -> Iterator[None]:
+        """
+        Hold swe's sidereal mode on this ayanamsa
+
+        For code that must call swe with FLG_SIDEREAL itself; the mode
+        cannot be switched by another thread until the block exits.
+        """
+        with _SID_MODE_LOCK:
+            swe.set_sid_mode(self.sid_mode)
+            yield
+
+    def ayanamsa_state(self, jd: float) -> Tuple[float, float]:
+        """
+        Ayanamsa and its daily rate at a Julian Day (cached)
+
+        Args:
+            jd: Julian Day (UT)
+
+        Returns:
+            Tuple of (ayanamsa in degrees, change in degrees per day)
+        """
+        state = self._states.get(jd)
+        if state is None:
+            step = self.RATE_STEP_DAYS
+            with self.swe_mode():
+                value = swe.get_ayanamsa_ex_ut(jd, swe.FLG_SWIEPH)[1]
+                before = swe.get_ayanamsa_ex_ut(jd - step, swe.FLG_SWIEPH)[1]
+                after = swe.get_ayanamsa_ex_ut(jd + step, swe.FLG_SWIEPH)[1]
+            state = (value, (after - before) / (2 * step))
+            if len(self._states) >= self.MAX_CACHED_DAYS:
+                self._states.clear()
+            self._states[jd] = state
+        return state
+
+    def ayanamsa_at(self, jd: float) -> float:
+        """Ayanamsa in degrees at a Julian Day (cached)"""
+        return self.ayanamsa_state(jd)[0]
+
+    def ayanamsa_arrays(self, jds: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Ayanamsa values and rates for an array of Julian Days
+
+        Returns:
+            Tuple of (values, rates) arrays shaped like jds
+        """
+        states = np.array([self.ayanamsa_state(float(jd)) for jd in np.ravel(jds)])
+        states = states.reshape(np.shape(jds) + (2,))
+        return states[..., 0], states[..., 1]
+
+    def to_sidereal(self, position: Optional[Dict], jd: float) -> Optional[Dict]:
+        """
+        Shift a calculate_planet_position-style dict into this sidereal zodiac
+
+        Args:
+            position: Tropical position dict (None passes through)
+            jd: Julian Day the position was calculated for
+
+        Returns:
+            New position dict with sidereal longitude, sign and speed
+        """
+        if position is None:
+            return None
+
+        value, rate = self.ayanamsa_state(jd)
+        shifted = dict(position)
+        shifted['longitude'] = (position['longitude'] - value) % 360
+        shifted['sign'] = int(shifted['longitude'] / 30)
+        shifted['degree_in_sign'] = shifted['longitude'] % 30
+        shifted['sign_name'] = EphemerisCalculator.get_sign_name(shifted['sign'])
+        if 'speed_longitude' in position:
+            shifted['speed_longitude'] = position['speed_longitude'] - rate
+            shifted['retrograde'] = shifted['speed_longitude'] < 0
+        return shifted
+
+    def planets_to_sidereal(self, planets: Dict[str, Optional[Dict]], jd: float) -> Dict[str, Optional[Dict]]:
+        """Shift a calculate_all_planets result into this sidereal zodiac"""
+        return {name: self.to_sidereal(position, jd) for name, position in planets.items()}
+
+
+# Shared contexts by ayanamsa name (see EphemerisCalculator.get_sidereal_context)
+_SIDEREAL_CONTEXTS: Dict[str, SiderealContext] = {}
+
+
 # Example usage (for testing)
 if __name__ == "__main__":
     # Example: Calculate chart for January 15, 1990, 14:30 in New York
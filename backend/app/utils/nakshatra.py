@@ -0,0 +1,144 @@
+"""
+Nakshatra lookup tables
+
+The 27 nakshatras of 13°20' and their 108 padas of 3°20', with boundaries
+held as exact integer arc-seconds. Longitudes are placed against those
+tables in one vectorized pass, so a point that sits on a boundary falls
+in the nakshatra that starts there, and the elapsed fraction of a
+nakshatra (which sets the Vimshottari dasha balance at birth) carries no
+drift from a rounded span.
+
+Shared by the Vedic chart, the dasha calculator and hybrid (tropical +
+nakshatra) charts. Per-chart results are cached by planet positions.
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+
+ARCSEC_PER_DEGREE = 3600
+NAKSHATRA_ARCSEC = 48000    # 13°20'
+PADA_ARCSEC = 12000         # 3°20'
+NAKSHATRA_SPAN = NAKSHATRA_ARCSEC / ARCSEC_PER_DEGREE
+
+NAKSHATRA_NAMES = (
+    'Ashwini', 'Bharani', 'Krittika', 'Rohini', 'Mrigashira',
+    'Ardra', 'Punarvasu', 'Pushya', 'Ashlesha', 'Magha',
+    'Purva Phalguni', 'Uttara Phalguni', 'Hasta', 'Chitra', 'Swati',
+    'Vishakha', 'Anuradha', 'Jyeshtha', 'Mula', 'Purva Ashadha',
+    'Uttara Ashadha', 'Shravana', 'Dhanishta', 'Shatabhisha',
+    'Purva Bhadrapada', 'Uttara Bhadrapada', 'Revati',
+)
+
+# Ruling planets cycle through the Vimshottari sequence three times
+NAKSHATRA_LORDS = tuple(
+    ('ketu', 'venus', 'sun', 'moon', 'mars', 'rahu', 'jupiter', 'saturn', 'mercury')[index % 9]
+    for index in range(27)
+)
+
+
+def _frozen(array: np.ndarray) -> np.ndarray:
+    array.setflags(write=False)
+    return array
+
+
+# Boundaries in arc-seconds from 0° Aries, closing at 360°
+NAKSHATRA_BOUNDS = _frozen(np.arange(28, dtype=np.int64) * NAKSHATRA_ARCSEC)
+PADA_BOUNDS = _frozen(np.arange(109, dtype=np.int64) * PADA_ARCSEC)
+
+# Per-chart results kept by calculate_nakshatras
+CACHE_SIZE = 256
+
+
+@dataclass(frozen=True)
+class NakshatraPositions:
+    """
+    Nakshatra placement of a set of longitudes
+
+    Attributes:
+        index: Nakshatra index (0 = Ashwini)
+        pada: Pada within the nakshatra (1-4)
+        degrees_in_nakshatra: Degrees past the nakshatra's start
+        fraction: Elapsed fraction of the nakshatra (0-1)
+    """
+    index: np.ndarray
+    pada: np.ndarray
+    degrees_in_nakshatra: np.ndarray
+    fraction: np.ndarray
+
+    def info(self, position: int = 0) -> Dict:
+        """Nakshatra dict of one longitude (flat position)"""
+        index = int(self.index.flat[position])
+        return {
+            'name': NAKSHATRA_NAMES[index],
+            'number': index + 1,
+            'lord': NAKSHATRA_LORDS[index],
+            'pada': int(self.pada.flat[position]),
+            'degrees_in_nakshatra': float(self.degrees_in_nakshatra.flat[position]),
+        }
+
+
+def locate(longitudes) -> NakshatraPositions:
+    """
+    Place sidereal longitudes in the nakshatra and pada tables
+
+    Args:
+        longitudes: Sidereal longitudes in degrees, any shape
+
+    Returns:
+        NakshatraPositions shaped like longitudes
+    """
+    arcsec = np.mod(np.asarray(longitudes, dtype=np.float64), 360.0) * ARCSEC_PER_DEGREE
+    index = np.searchsorted(NAKSHATRA_BOUNDS, arcsec, side='right') - 1
+    # Values within rounding of 360° belong to Revati's last pada
+    index = np.minimum(index, 26)
+    pada_index = np.minimum(np.searchsorted(PADA_BOUNDS, arcsec, side='right') - 1, 107)
+
+    elapsed = arcsec - NAKSHATRA_BOUNDS[index]
+    return NakshatraPositions(
+        index=index,
+        pada=pada_index - 4 * index + 1,
+        degrees_in_nakshatra=elapsed / ARCSEC_PER_DEGREE,
+        fraction=elapsed / NAKSHATRA_ARCSEC,
+    )
+
+
+def nakshatra_info(longitude: float) -> Dict:
+    """
+    Nakshatra of one sidereal longitude
+
+    Returns:
+        Dictionary with name, number (1-27), lord, pada (1-4) and
+        degrees_in_nakshatra
+    """
+    return locate(longitude).info()
+
+
+def calculate_nakshatras(planets: Dict[str, Optional[Dict]]) -> Dict[str, Dict]:
+    """
+    Nakshatras of every planet of a chart, in one lookup
+
+    Results are cached per chart (by planet longitudes); each call gets
+    its own copy.
+
+    Args:
+        planets: Planet name -> position dict with sidereal 'longitude'
+
+    Returns:
+        Planet name -> nakshatra dict (see nakshatra_info); planets without
+        a position are left out
+    """
+    key = tuple(
+        (name, float(data['longitude']))
+        for name, data in planets.items()
+        if data and 'longitude' in data
+    )
+    return {name: dict(info) for name, info in _chart_nakshatras(key)}
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _chart_nakshatras(key: Tuple[Tuple[str, float], ...]) -> Tuple[Tuple[str, Dict], ...]:
+    positions = locate([longitude for _, longitude in key])
+    return tuple((name, positions.info(row)) for row, (name, _) in enumerate(key))
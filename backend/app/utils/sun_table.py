@@ -0,0 +1,168 @@
+"""
+Daily Sun longitude table
+
+Precomputed tropical Sun longitude at 0h UT for every day of a range,
+stored as a .npy file and opened memory-mapped, so a lookup only touches
+the few pages around the requested dates. Used to seed root searches on
+the Sun's longitude (e.g., the Human Design design date) with a guess that
+is already within seconds of the answer.
+
+File layout: a 1-D float64 array [start_jd, step_days, lon_0, lon_1, ...].
+The file is generated, not shipped in the repository: the app builds it in
+the background on startup when it is missing (until then the search uses
+its mean-motion guess), and the PyInstaller spec builds it before bundling.
+It can also be built with scripts/build_sun_table.py.
+"""
+import logging
+import os
+import threading
+from typing import Optional
+
+import numpy as np
+import swisseph as swe
+
+from app.core.config import settings
+from app.utils.ephemeris import EphemerisCalculator
+
+logger = logging.getLogger(__name__)
+
+
+class SunLongitudeTable:
+    """Memory-mapped daily tropical Sun longitudes."""
+
+    # Default coverage: the span of the bundled seas_18/sepl_18 files
+    DEFAULT_START_JD = 2378496.5  # 1800-01-01 0h UT
+    DEFAULT_END_JD = 2597641.5    # 2400-01-01 0h UT
+
+    HEADER_SIZE = 2
+
+    _shared: Optional['SunLongitudeTable'] = None
+    _shared_path: Optional[str] = None
+    _build_lock = threading.Lock()
+
+    def __init__(self, data: np.ndarray):
+        """
+        Args:
+            data: Table array in file layout (header + longitudes)
+        """
+        self.start_jd = float(data[0])
+        self.step = float(data[1])
+        self.longitudes = data[self.HEADER_SIZE:]
+        self.end_jd = self.start_jd + self.step * (len(self.longitudes) - 1)
+
+    @classmethod
+    def build(
+        cls,
+        path: str,
+        start_jd: float = DEFAULT_START_JD,
+        end_jd: float = DEFAULT_END_JD,
+        step: float = 1.0
+    ) -> 'SunLongitudeTable':
+        """
+        Compute the table and write it to disk
+
+        Args:
+            path: Output .npy path
+            start_jd: First Julian Day (UT)
+            end_jd: Last Julian Day (UT, inclusive)
+            step: Spacing in days
+
+        Returns:
+            The table, memory-mapped from the written file
+        """
+        jds = np.arange(start_jd, end_jd + step / 2, step)
+        flags = EphemerisCalculator.get_calc_flags('tropical')
+        calc_ut = swe.calc_ut
+
+        data = np.empty(cls.HEADER_SIZE + len(jds))
+        data[0] = start_jd
+        data[1] = step
+        data[cls.HEADER_SIZE:] = [calc_ut(float(jd), swe.SUN, flags)[0][0] for jd in jds]
+
+        # Written aside and moved into place, so readers never see a partial file
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        partial = f"{path}.partial.npy"
+        np.save(partial, data)
+        os.replace(partial, path)
+        return cls.open(path)
+
+    @classmethod
+    def open(cls, path: str) -> 'SunLongitudeTable':
+        """Memory-map a table file"""
+        return cls(np.load(path, mmap_mode='r'))
+
+    @classmethod
+    def get(cls) -> Optional['SunLongitudeTable']:
+        """
+        Shared table from settings.HD_SUN_TABLE_PATH
+
+        Returns:
+            The table, or None if the file has not been built (checked again
+            on the next call)
+        """
+        path = settings.HD_SUN_TABLE_PATH
+        if cls._shared_path != path:
+            cls._shared, cls._shared_path = None, None
+            if path and os.path.exists(path):
+                try:
+                    cls._shared = cls.open(path)
+                    cls._shared_path = path
+                except (OSError, ValueError) as e:
+                    logger.warning(f"Sun longitude table {path} unreadable: {e}")
+        return cls._shared
+
+    @classmethod
+    def ensure_built(cls) -> bool:
+        """
+        Build the shared table at settings.HD_SUN_TABLE_PATH if it is missing
+
+        Only tropical positions are computed, so the build can run on a
+        background thread next to calculations that switch sidereal modes.
+
+        Returns:
+            Whether the table file exists afterwards
+        """
+        path = settings.HD_SUN_TABLE_PATH
+        if not path:
+            return False
+        with cls._build_lock:
+            if os.path.exists(path):
+                return True
+            try:
+                cls.build(path, cls.DEFAULT_START_JD, cls.DEFAULT_END_JD)
+            except (OSError, ValueError) as e:
+                # e.g., a read-only install; the design date search falls back to mean motion
+                logger.warning(f"Sun longitude table {path} not built: {e}")
+                return False
+        logger.info(f"Built Sun longitude table {path}")
+        return True
+
+    def find_crossing(self, target: float, jd_low: float, jd_high: float) -> Optional[float]:
+        """
+        Estimate when the tropical Sun reaches a longitude
+
+        Args:
+            target: Tropical longitude (0-360°)
+            jd_low: Start of the window to search (Julian Day, UT)
+            jd_high: End of the window (less than a year after jd_low)
+
+        Returns:
+            Linearly interpolated Julian Day, or None if the window is
+            outside the table or contains no crossing
+        """
+        first = int(np.floor((jd_low - self.start_jd) / self.step))
+        last = int(np.ceil((jd_high - self.start_jd) / self.step))
+        if first < 0 or last >= len(self.longitudes) or last <= first:
+            return None
+
+        window = np.asarray(self.longitudes[first:last + 1])
+        # Signed distance to the target; the Sun is never retrograde, so
+        # it rises through zero exactly once per crossing
+        distance = (window - target + 180.0) % 360.0 - 180.0
+        rising = np.nonzero((distance[:-1] <= 0) & (distance[1:] > 0))[0]
+        if len(rising) == 0:
+            return None
+
+        i = int(rising[0])
+        fraction = -distance[i] / (distance[i + 1] - distance[i])
+        return float(self.start_jd + (first + i + fraction) * self.step)
@@ -6,6 +6,7 @@ Starts the FastAPI application with uvicorn server
 
 import sys
 import os
+import multiprocessing
 import uvicorn
 from pathlib import Path
 
@@ -81,4 +82,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Calculation workers are spawned processes; required in the frozen bundle
+    multiprocessing.freeze_support()
     main()
@@ -2,6 +2,7 @@
 
 import sys
 import os
+import subprocess
 from PyInstaller.utils.hooks import collect_all
 
 block_cipher = None
@@ -31,6 +32,14 @@ hiddenimports = [
     'passlib.handlers.bcrypt',
 ]
 
+# Generate the daily Sun table (not in the repository); the bundle is
+# read-only, so it cannot be built on first use there
+sun_table_path = os.path.join('data', 'ephemeris', 'sun_longitude_daily.npy')
+if not os.path.exists(sun_table_path):
+    result = subprocess.run([sys.executable, os.path.join('scripts', 'build_sun_table.py'), '--output', sun_table_path])
+    if result.returncode != 0:
+        print("WARNING: Sun longitude table not built; design dates will use the slower fallback")
+
 # Add Swiss Ephemeris data if it exists locally
 ephemeris_path = os.path.join('data', 'ephemeris')
 if os.path.exists(ephemeris_path):
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+The Program - Chebyshev Ephemeris Cache Builder
+
+Fits Chebyshev segments for every calculated body, checks them against
+Swiss Ephemeris and writes the cache to EPHEMERIS_CACHE_PATH. Once the file
+exists, batch position calculations inside its range are served from it.
+
+Usage:
+    python scripts/build_ephemeris_cache.py [--output PATH] [--start YEAR] [--end YEAR]
+                                            [--tolerance ARCSEC]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import swisseph as swe
+
+from app.core.config import settings
+from app.utils.chebyshev_ephemeris import ChebyshevEphemeris
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build the Chebyshev ephemeris cache")
+    parser.add_argument('--output', default=settings.EPHEMERIS_CACHE_PATH, help="Output .npy path")
+    parser.add_argument('--start', type=int, default=1900, help="First year (Jan 1)")
+    parser.add_argument('--end', type=int, default=2100, help="Last year (Jan 1, inclusive)")
+    parser.add_argument('--tolerance', type=float, default=settings.EPHEMERIS_CACHE_TOLERANCE_ARCSEC,
+                        help="Largest fit error accepted (arcseconds)")
+    args = parser.parse_args()
+
+    start_jd = swe.julday(args.start, 1, 1, 0.0)
+    end_jd = swe.julday(args.end, 1, 1, 0.0)
+
+    started = time.time()
+    try:
+        cache = ChebyshevEphemeris.build(args.output, start_jd, end_jd, tolerance_arcsec=args.tolerance)
+    except ValueError as e:
+        print(f"Build failed: {e}")
+        return 1
+
+    print(f"Wrote {len(cache.fits)} bodies ({args.start}-{args.end}) to {args.output} "
+          f"in {time.time() - started:.1f}s")
+    for swe_id, (days, coefficients, max_error) in sorted(cache.fits.items()):
+        print(f"  {swe.get_planet_name(swe_id):<12} {int(days):>3}-day windows, "
+              f"{coefficients.shape[-1]} coefficients, max error {max_error:.3f}\"")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
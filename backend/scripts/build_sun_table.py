@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+The Program - Sun Longitude Table Builder
+
+Precomputes the daily Sun longitude table used to seed the Human Design
+design date search, written to HD_SUN_TABLE_PATH (data/ephemeris/ by
+default, which the PyInstaller bundle includes). The server also builds it
+in the background on startup when it is missing.
+
+Usage:
+    python scripts/build_sun_table.py [--output PATH] [--start YEAR] [--end YEAR]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import swisseph as swe
+
+from app.core.config import settings
+from app.utils.sun_table import SunLongitudeTable
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build the daily Sun longitude table")
+    parser.add_argument('--output', default=settings.HD_SUN_TABLE_PATH, help="Output .npy path")
+    parser.add_argument('--start', type=int, default=1800, help="First year (Jan 1)")
+    parser.add_argument('--end', type=int, default=2400, help="Last year (Jan 1, inclusive)")
+    args = parser.parse_args()
+
+    start_jd = swe.julday(args.start, 1, 1, 0.0)
+    end_jd = swe.julday(args.end, 1, 1, 0.0)
+
+    started = time.time()
+    table = SunLongitudeTable.build(args.output, start_jd, end_jd)
+    print(f"Wrote {len(table.longitudes)} days ({args.start}-{args.end}) to {args.output} "
+          f"in {time.time() - started:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
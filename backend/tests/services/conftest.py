@@ -39,7 +39,9 @@ def db_engine():
 
     yield engine
 
-    # Drop all tables after test
+    # Drop all tables after test (foreign keys off so rows don't block drops)
+    with engine.connect() as conn:
+        conn.exec_driver_sql("PRAGMA foreign_keys=OFF")
     Base.metadata.drop_all(engine)
     engine.dispose()
 
@@ -0,0 +1,125 @@
+"""
+Tests for Ashtakavarga bindu matrices and transit strength series
+"""
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from app.services.ashtakavarga_calculator import (
+    KAKSHYA_LORDS,
+    AshtakavargaCalculator,
+)
+
+PLANETS = AshtakavargaCalculator.PLANETS
+
+# Sun in Aries, Moon in Taurus, ... Saturn in Libra; Cancer rising
+PLANET_SIGNS = {planet: sign for sign, planet in enumerate(PLANETS)}
+PLANET_SIGNS['ascendant'] = 3
+
+
+def bhinna_by_rules(planet, planet_signs):
+    """Bhinnashtakavarga counted straight from BENEFIC_POSITIONS"""
+    bindus = [0] * 12
+    for key, houses in AshtakavargaCalculator.BENEFIC_POSITIONS[planet].items():
+        reference = planet_signs.get(key.replace('from_', ''))
+        if reference is None:
+            continue
+        for house in houses:
+            bindus[(reference + house - 1) % 12] += 1
+    return bindus
+
+
+@pytest.fixture
+def matrices():
+    return AshtakavargaCalculator.calculate_matrices(PLANET_SIGNS)
+
+
+@pytest.mark.unit
+class TestAshtakavargaMatrices:
+
+    def test_bhinna_matches_rules(self, matrices):
+        for row, planet in enumerate(PLANETS):
+            assert matrices.bhinna[row].tolist() == bhinna_by_rules(planet, PLANET_SIGNS)
+
+    def test_classical_totals(self, matrices):
+        # Bhinna totals are fixed by the rules: Sun 48, Moon 49, ... Saturn 39
+        assert matrices.bhinna.sum(axis=1).tolist() == [48, 49, 39, 54, 56, 52, 39]
+        assert matrices.sarva.sum() == 337
+        assert matrices.prastara.shape == (7, 8, 12)
+
+    def test_missing_contributor_gives_no_bindus(self):
+        signs = dict(PLANET_SIGNS)
+        del signs['saturn']
+        matrices = AshtakavargaCalculator.calculate_matrices(signs)
+
+        assert not matrices.prastara[:, PLANETS.index('saturn')].any()
+        assert matrices.bhinna[0].tolist() == bhinna_by_rules('sun', signs)
+
+    def test_calculate_uses_matrices(self, matrices):
+        planets = {planet: {'sign': sign} for planet, sign in PLANET_SIGNS.items() if planet != 'ascendant'}
+        result = AshtakavargaCalculator.calculate(planets, ascendant=95.0)
+
+        assert result['sarvashtakavarga']['bindus_by_sign'] == matrices.sarva.tolist()
+        assert result['bhinnashtakavarga']['moon']['bindus_by_sign'] == matrices.bhinna[1].tolist()
+
+
+@pytest.mark.unit
+class TestTransitScores:
+
+    def test_scores_are_matrix_lookups(self, matrices):
+        longitudes = np.random.default_rng(11).uniform(0, 360, (50, 7))
+        series = AshtakavargaCalculator.score_positions(matrices, np.arange(50.0), longitudes)
+
+        for row, col in [(0, 0), (7, 3), (49, 6)]:
+            sign = int(longitudes[row, col] // 30)
+            kakshya = int((longitudes[row, col] % 30) // 3.75)
+            lord = (PLANETS + ['ascendant']).index(KAKSHYA_LORDS[kakshya])
+
+            assert series.signs[row, col] == sign
+            assert series.kakshyas[row, col] == kakshya
+            assert series.bhinna[row, col] == matrices.bhinna[col, sign]
+            assert series.sarva[row, col] == matrices.sarva[sign]
+            assert series.kakshya_bindus[row, col] == matrices.prastara[col, lord, sign]
+
+    def test_kakshya_boundaries(self, matrices):
+        longitudes = np.tile([[0.0], [3.74], [3.75], [29.999]], (1, 7))
+        series = AshtakavargaCalculator.score_positions(matrices, np.arange(4.0), longitudes)
+
+        assert series.kakshyas[:, 0].tolist() == [0, 0, 1, 7]
+
+    def test_periods_split_on_changes(self, matrices):
+        # Sun column walks from Aries into Taurus
+        longitudes = np.zeros((6, 7))
+        longitudes[:, 0] = [27.0, 28.0, 29.0, 30.5, 31.0, 34.0]
+        series = AshtakavargaCalculator.score_positions(matrices, np.arange(6.0), longitudes)
+
+        by_sign = series.periods('sun')
+        assert [(p['start_jd'], p['sign']) for p in by_sign] == [(0.0, 0), (3.0, 1)]
+        assert by_sign[0]['end_jd'] == 3.0
+        assert by_sign[1]['bhinna_bindus'] == matrices.bhinna[0, 1]
+
+        by_kakshya = series.periods('sun', by_kakshya=True)
+        assert [p['kakshya_lord'] for p in by_kakshya] == ['ascendant', 'saturn', 'jupiter']
+
+    def test_to_dict_is_sample_by_planet(self, matrices):
+        series = AshtakavargaCalculator.score_positions(matrices, np.array([2451545.0]), np.zeros((1, 7)))
+        data = series.to_dict()
+
+        assert data['planets'] == PLANETS
+        assert data['dates'] == ['2000-01-01T12:00:00']
+        assert len(data['bhinna_bindus'][0]) == 7
+
+
+@pytest.mark.ephemeris
+class TestTransitStrengthSeries:
+
+    def test_daily_series(self, matrices):
+        series = AshtakavargaCalculator.transit_strength_series(
+            matrices, datetime(2024, 1, 1), datetime(2024, 3, 1)
+        )
+
+        assert series.bhinna.shape == (60, 7)
+        # The Moon changes sign about every 2.5 days, Saturn not at all
+        assert 20 <= len(series.periods('moon')) <= 27
+        assert len(series.periods('saturn')) == 1
@@ -0,0 +1,92 @@
+"""
+Tests for the vectorized aspect engine
+"""
+import random
+
+import numpy as np
+import pytest
+
+from app.services.aspect_engine import AspectEngine
+from app.services.chart_calculator import NatalChartCalculator
+from app.utils.ephemeris import EphemerisCalculator
+
+
+def _brute_force(names, longitudes, aspect_set):
+    """Reference: every pair against every aspect type"""
+    aspects = []
+    for i in range(len(names)):
+        for j in range(i + 1, len(names)):
+            for aspect_name, info in aspect_set.items():
+                result = EphemerisCalculator.calculate_aspect(
+                    longitudes[i], longitudes[j], info['angle'], info['orb']
+                )
+                if result:
+                    aspects.append((names[i], names[j], aspect_name, result['orb']))
+    return aspects
+
+
+@pytest.mark.unit
+class TestAspectEngine:
+
+    def test_matches_pairwise_reference(self):
+        rng = random.Random(11)
+        names = [f'p{i}' for i in range(30)]
+        longitudes = [rng.uniform(0, 360) for _ in names]
+        aspect_set = NatalChartCalculator._build_aspect_set(include_minor_aspects=True)
+
+        table = AspectEngine.find_aspects(names, longitudes, aspect_set)
+        found = [(a['planet1'], a['planet2'], a['aspect_type'], a['orb']) for a in table.to_dicts()]
+
+        assert found == _brute_force(names, longitudes, aspect_set)
+
+    def test_wraparound_separation(self):
+        separation = AspectEngine.separation_matrix(np.array([359.0, 1.0, 181.0]))
+
+        assert separation[0, 1] == pytest.approx(2.0)
+        assert separation[1, 2] == pytest.approx(180.0)
+        assert np.array_equal(separation, separation.T)
+
+    def test_adjacency_lookup(self):
+        aspect_set = NatalChartCalculator._build_aspect_set()
+        table = AspectEngine.find_aspects(['a', 'b', 'c'], [10.0, 130.0, 100.0], aspect_set)
+
+        a, b, c = (table.index_of(name) for name in 'abc')
+        assert table.has('trine', a, b) and table.has('trine', b, a)
+        assert table.has('square', a, c)
+        assert not table.has('trine', a, c)
+        assert not table.has('quincunx', a, b)  # minor aspects not in the set
+        assert table.pairs('trine').tolist() == [[a, b]]
+
+    def test_no_points(self):
+        table = AspectEngine.find_aspects([], [], NatalChartCalculator._build_aspect_set())
+
+        assert table.to_dicts() == []
+        assert table.pairs('trine').shape == (0, 2)
+
+
+@pytest.mark.unit
+class TestNatalAspectPatterns:
+
+    def test_custom_orbs_do_not_leak(self):
+        NatalChartCalculator._build_aspect_set(custom_orbs={'trine': 1.0})
+
+        assert NatalChartCalculator.MAJOR_ASPECTS['trine']['orb'] == 8
+
+    def test_grand_trine_and_t_square(self):
+        planets = {
+            'sun': {'longitude': 5.0, 'sign': 0},
+            'moon': {'longitude': 125.0, 'sign': 4},
+            'mars': {'longitude': 245.0, 'sign': 8},
+            'venus': {'longitude': 185.0, 'sign': 6},
+            'saturn': {'longitude': 95.0, 'sign': 3},
+        }
+        houses = {'ascendant': 300.0, 'mc': 210.0}
+        table = NatalChartCalculator._calculate_all_aspects(
+            planets, houses, NatalChartCalculator._build_aspect_set()
+        )
+
+        patterns = NatalChartCalculator._detect_aspect_patterns(table, planets)
+        found = {(p['pattern_type'], frozenset(p['planets']), p.get('apex')) for p in patterns}
+
+        assert ('grand_trine', frozenset(['sun', 'moon', 'mars']), None) in found
+        assert ('t_square', frozenset(['sun', 'venus', 'saturn']), 'saturn') in found
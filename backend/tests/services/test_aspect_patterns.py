@@ -0,0 +1,118 @@
+"""
+Tests for the bitset aspect pattern engine
+"""
+import random
+from itertools import combinations
+
+import pytest
+
+from app.services.aspect_engine import AspectEngine
+from app.services.aspect_patterns import AspectPatternEngine
+from app.services.chart_calculator import NatalChartCalculator
+
+
+def _engine(longitudes, minor=False):
+    names = [f'p{i}' for i in range(len(longitudes))]
+    aspect_set = NatalChartCalculator._build_aspect_set(include_minor_aspects=minor)
+    return AspectPatternEngine(AspectEngine.find_aspects(names, longitudes, aspect_set))
+
+
+@pytest.mark.unit
+class TestAspectPatternEngine:
+
+    def test_grand_trine(self):
+        engine = _engine([10.0, 130.0, 250.0, 40.0])
+
+        assert engine.grand_trines() == [(0, 1, 2)]
+
+    def test_grand_cross(self):
+        # Every corner also sits in two T-squares' worth of squares
+        engine = _engine([0.0, 90.0, 180.0, 270.0])
+
+        assert engine.grand_crosses() == [(0, 1, 2, 3)]
+        assert len(engine.t_squares()) == 4
+
+    def test_yod_needs_quincunx(self):
+        longitudes = [0.0, 60.0, 210.0]
+
+        assert _engine(longitudes).yods() == []
+        assert _engine(longitudes, minor=True).yods() == [(0, 1, 2)]
+
+    def test_kite(self):
+        # Grand Trine 0/120/240 with a tail at 180, opposite the head at 0
+        engine = _engine([0.0, 120.0, 240.0, 180.0])
+
+        assert engine.kites() == [(0, 1, 2, 3)]
+
+    def test_mystic_rectangle(self):
+        # 0-60 and 180-240 sextiles, 60-180 and 240-0 trines
+        engine = _engine([0.0, 60.0, 180.0, 240.0])
+
+        assert engine.mystic_rectangles() == [(0, 1, 2, 3)]
+
+    def test_matches_brute_force(self):
+        rng = random.Random(7)
+        longitudes = [rng.choice(range(0, 360, 30)) + rng.uniform(-3, 3) for _ in range(28)]
+        table = AspectEngine.find_aspects(
+            [f'p{i}' for i in range(28)], longitudes,
+            NatalChartCalculator._build_aspect_set(include_minor_aspects=True)
+        )
+        engine = AspectPatternEngine(table)
+
+        def has(aspect, *points):
+            return all(table.has(aspect, a, b) for a, b in zip(points, points[1:]))
+
+        trines = {t for t in combinations(range(28), 3) if has('trine', *t, t[0])}
+        crosses = {
+            frozenset(q) for q in combinations(range(28), 4)
+            for a, b, c, d in [q, (q[0], q[1], q[3], q[2]), (q[0], q[2], q[1], q[3])]
+            if has('square', a, b, c, d, a) and has('opposition', a, c) and has('opposition', b, d)
+        }
+
+        rectangles = {
+            frozenset(q) for q in combinations(range(28), 4)
+            for a, b, c, d in [q, (q[0], q[1], q[3], q[2]), (q[0], q[2], q[1], q[3]),
+                               (q[0], q[3], q[2], q[1]), (q[0], q[2], q[3], q[1]),
+                               (q[0], q[3], q[1], q[2])]
+            if has('sextile', a, b) and has('trine', b, c) and has('sextile', c, d)
+            and has('trine', d, a) and has('opposition', a, c) and has('opposition', b, d)
+        }
+
+        assert set(engine.grand_trines()) == trines
+        assert {frozenset(c) for c in engine.grand_crosses()} == crosses
+        assert len(engine.grand_crosses()) == len(crosses)
+        assert {frozenset(r) for r in engine.mystic_rectangles()} == rectangles
+        assert len(engine.mystic_rectangles()) == len(rectangles)
+        for a, b, apex in engine.yods():
+            assert has('sextile', a, b) and has('quincunx', a, apex, b)
+
+    def test_house_positions_wrap(self):
+        cusps = [350.0 + 30.0 * i for i in range(12)]
+        cusps = [c % 360 for c in cusps]
+
+        houses = AspectPatternEngine.house_positions([355.0, 5.0, 21.0, 349.0], cusps)
+
+        assert houses.tolist() == [1, 1, 2, 12]
+
+
+@pytest.mark.unit
+class TestHouseStelliums:
+
+    def test_stellium_by_house(self):
+        planets = {
+            'sun': {'longitude': 28.0, 'sign': 0},
+            'mercury': {'longitude': 33.0, 'sign': 1},
+            'venus': {'longitude': 38.0, 'sign': 1},
+            'mars': {'longitude': 200.0, 'sign': 6},
+        }
+        houses = {'cusps': [(20.0 + 30.0 * i) % 360 for i in range(12)]}
+
+        stelliums = NatalChartCalculator._detect_stelliums(planets, houses)
+
+        assert stelliums == [{
+            'pattern_type': 'stellium',
+            'planets': ['sun', 'mercury', 'venus'],
+            'house': 1,
+            'description': 'Stellium in house 1: sun, mercury, venus',
+        }]
+        assert NatalChartCalculator._detect_stelliums(planets) == []
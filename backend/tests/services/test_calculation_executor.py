@@ -0,0 +1,112 @@
+"""
+Tests for the off-loop calculation executor
+"""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.services.calculation_executor import CalculationExecutor
+from app.utils.ephemeris import EphemerisCalculator
+
+
+J2000 = 2451545.0
+
+
+def run(coro):
+    """Run a coroutine on a private loop (leaves the thread's current loop alone)"""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class SlowCounter:
+    """Module-level callable state for thread-mode tests"""
+    calls = 0
+    lock = threading.Lock()
+
+    @classmethod
+    def compute(cls, value: int) -> dict:
+        with cls.lock:
+            cls.calls += 1
+        time.sleep(0.05)
+        return {'value': value}
+
+
+@pytest.fixture(autouse=True)
+def reset_counter():
+    SlowCounter.calls = 0
+
+
+@pytest.mark.unit
+class TestCalculationExecutor:
+
+    def test_inline_mode_runs_on_caller(self):
+        executor = CalculationExecutor(mode='inline')
+        assert run(executor.run(SlowCounter.compute, 3)) == {'value': 3}
+
+    def test_identical_calls_are_coalesced(self):
+        executor = CalculationExecutor(mode='thread')
+
+        async def concurrent_calls():
+            return await asyncio.gather(
+                executor.run(SlowCounter.compute, 1),
+                executor.run(SlowCounter.compute, 1),
+                executor.run(SlowCounter.compute, 2),
+            )
+
+        try:
+            results = run(concurrent_calls())
+        finally:
+            executor.shutdown()
+
+        assert SlowCounter.calls == 2
+        assert executor.coalesced == 1
+        assert results == [{'value': 1}, {'value': 1}, {'value': 2}]
+        # Coalesced callers get independent copies
+        assert results[0] is not results[1]
+
+    def test_completed_calls_are_not_reused(self):
+        executor = CalculationExecutor(mode='thread')
+        try:
+            run(executor.run(SlowCounter.compute, 1))
+            run(executor.run(SlowCounter.compute, 1))
+        finally:
+            executor.shutdown()
+
+        assert SlowCounter.calls == 2
+
+    def test_errors_propagate(self):
+        executor = CalculationExecutor(mode='thread')
+        try:
+            with pytest.raises(ValueError):
+                run(executor.run(EphemerisCalculator.calculate_planet_position, 'vulcan', J2000))
+        finally:
+            executor.shutdown()
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError):
+            CalculationExecutor(mode='cluster')
+
+
+@pytest.mark.slow
+class TestProcessPool:
+
+    def test_worker_results_match_local(self):
+        """Workers share no sidereal mode with each other or with the caller"""
+        executor = CalculationExecutor(mode='process', max_workers=1)
+        try:
+            sidereal = run(executor.run(
+                EphemerisCalculator.calculate_planet_position, 'sun', J2000,
+                zodiac='sidereal', ayanamsa='raman'
+            ))
+            tropical = run(executor.run(EphemerisCalculator.calculate_planet_position, 'sun', J2000))
+        finally:
+            executor.shutdown()
+
+        local = EphemerisCalculator.calculate_planet_position('sun', J2000)
+        assert tropical['longitude'] == pytest.approx(local['longitude'], abs=1e-9)
+        assert sidereal['longitude'] != pytest.approx(local['longitude'], abs=1.0)
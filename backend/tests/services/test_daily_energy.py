@@ -0,0 +1,168 @@
+"""
+Tests for the batch daily energy pipeline
+"""
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from app.models import BirthData, DailyEnergyScore
+from app.services.daily_insights_service import DailyInsightsService
+from app.services.transit_calculator import TransitCalculator
+
+
+NATAL_PLANETS = {
+    'sun': {'longitude': 294.9},
+    'moon': {'longitude': 38.2},
+    'mercury': {'longitude': 276.4},
+    'venus': {'longitude': 305.1},
+    'mars': {'longitude': 253.6},
+    'jupiter': {'longitude': 95.8},
+    'saturn': {'longitude': 287.3},
+    'chiron': None,
+}
+
+
+@pytest.fixture
+def birth_data(db_session):
+    record = BirthData(
+        name="Energy Test",
+        birth_date="1990-01-15",
+        birth_time="14:30:00",
+        time_unknown=False,
+        latitude=40.7128,
+        longitude=-74.0060,
+        timezone="America/New_York",
+        utc_offset=-300,
+    )
+    db_session.add(record)
+    db_session.commit()
+    return record
+
+
+@pytest.fixture
+def counted_days(monkeypatch):
+    """Record the days each score_days call is asked to compute"""
+    calls = []
+    original = DailyInsightsService.score_days.__func__
+
+    def score_days(cls, natal_planets, days):
+        calls.append(list(days))
+        return original(cls, natal_planets, days)
+
+    monkeypatch.setattr(DailyInsightsService, 'score_days', classmethod(score_days))
+    return calls
+
+
+@pytest.mark.ephemeris
+class TestScoreDays:
+
+    def test_matches_per_day_transit_scoring(self):
+        service = DailyInsightsService.__new__(DailyInsightsService)
+        days = [date(2024, 3, 1) + timedelta(days=i) for i in range(10)]
+        series = DailyInsightsService.score_days(NATAL_PLANETS, days)
+
+        for row, day in enumerate(days):
+            transits = TransitCalculator.calculate_current_transits(
+                NATAL_PLANETS, datetime(day.year, day.month, day.day, 12)
+            )['transits']
+            scored = service._score_transits([
+                {'transiting_planet': t['transit_planet'], 'aspect_name': t['aspect'], 'orb': t['orb']}
+                for t in transits
+            ])
+            energy = service._calculate_day_energy(scored)
+
+            assert series.transit_counts[row] == len(transits)
+            assert series.scores[row] == energy['score']
+            assert series.levels[row] == energy['level']
+            assert series.positive[row] == pytest.approx(energy['positive_score'], abs=0.11)
+
+    def test_moon_phase_matches_daily_insights(self):
+        service = DailyInsightsService.__new__(DailyInsightsService)
+        days = [date(2024, 1, 1) + timedelta(days=i) for i in range(30)]
+        series = DailyInsightsService.score_days(NATAL_PLANETS, days)
+
+        for row, day in enumerate(days):
+            phase = DailyInsightsService._moon_phase_for_day(series.moon_days[row])[0]
+            assert phase == service._get_moon_phase(day)['phase']
+
+    def test_no_natal_planets_is_neutral(self):
+        series = DailyInsightsService.score_days({}, [date(2024, 1, 1)])
+
+        assert series.levels == ['neutral']
+        assert series.scores[0] == 50
+
+
+@pytest.mark.ephemeris
+class TestEnergyTable:
+
+    def test_second_read_computes_nothing(self, db_session, birth_data, counted_days):
+        chart = {'planets': NATAL_PLANETS}
+        start = date.today()
+        first = DailyInsightsService.energy_range(db_session, birth_data.id, chart, start, 7)
+        second = DailyInsightsService.energy_range(db_session, birth_data.id, chart, start, 7)
+
+        assert first == second
+        assert len(counted_days) == 1
+        assert db_session.query(DailyEnergyScore).count() == 7
+
+    def test_rolling_window_scores_only_new_days(self, db_session, birth_data, counted_days):
+        chart = {'planets': NATAL_PLANETS}
+        start = date.today()
+        DailyInsightsService.energy_range(db_session, birth_data.id, chart, start, 7)
+        preview = DailyInsightsService.energy_range(
+            db_session, birth_data.id, chart, start + timedelta(days=1), 7
+        )
+
+        assert counted_days[1] == [start + timedelta(days=7)]
+        assert [row['date'] for row in preview][-1] == (start + timedelta(days=7)).isoformat()
+
+    def test_changed_chart_is_rescored(self, db_session, birth_data, counted_days):
+        start = date.today()
+        DailyInsightsService.energy_range(db_session, birth_data.id, {'planets': NATAL_PLANETS}, start, 3)
+        moved = {**NATAL_PLANETS, 'sun': {'longitude': 10.0}}
+        DailyInsightsService.energy_range(db_session, birth_data.id, {'planets': moved}, start, 3)
+
+        assert len(counted_days) == 2
+        keys = {row.chart_key for row in db_session.query(DailyEnergyScore)}
+        assert keys == {DailyInsightsService.chart_key(moved)}
+
+    def test_old_days_are_pruned(self, db_session, birth_data):
+        chart = {'planets': NATAL_PLANETS}
+        old = date.today() - timedelta(days=DailyInsightsService.ENERGY_RETENTION_DAYS + 5)
+        preview = DailyInsightsService.energy_range(db_session, birth_data.id, chart, old, 10)
+
+        assert len(preview) == 10
+        stored = [row.day for row in db_session.query(DailyEnergyScore)]
+        assert len(stored) == 5
+        assert min(stored) >= (date.today() - timedelta(days=DailyInsightsService.ENERGY_RETENTION_DAYS)).isoformat()
+
+    def test_store_leaves_caller_session_uncommitted(self, db_session, birth_data):
+        birth_data.name = "Renamed"
+        DailyInsightsService.energy_range(db_session, birth_data.id, {'planets': NATAL_PLANETS}, date.today(), 3)
+        db_session.rollback()
+
+        assert db_session.query(DailyEnergyScore).count() == 3
+        assert db_session.get(BirthData, birth_data.id).name == "Energy Test"
+
+    def test_store_leaves_flushed_changes_to_the_caller(self, db_session, birth_data):
+        birth_data.name = "Renamed"
+        db_session.flush()
+        preview = DailyInsightsService.energy_range(
+            db_session, birth_data.id, {'planets': NATAL_PLANETS}, date.today(), 3
+        )
+        db_session.rollback()
+
+        assert len(preview) == 3
+        assert db_session.get(BirthData, birth_data.id).name == "Energy Test"
+
+    def test_invalidate(self, db_session, birth_data):
+        DailyInsightsService.energy_range(db_session, birth_data.id, {'planets': NATAL_PLANETS}, date.today(), 3)
+
+        assert DailyInsightsService.invalidate_energy(birth_data.id, db_session) == 3
+        assert db_session.query(DailyEnergyScore).count() == 0
+
+    def test_preview_rejects_bad_range(self):
+        service = DailyInsightsService.__new__(DailyInsightsService)
+
+        with pytest.raises(ValueError):
+            service.get_preview({'planets': NATAL_PLANETS}, {}, days=0)
@@ -0,0 +1,144 @@
+"""
+Tests for the lazy Vimshottari Dasha timeline
+"""
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.services.dasha_calculator import (
+    DASHA_LEVELS,
+    DAYS_PER_YEAR,
+    VimshottariDashaCalculator,
+)
+
+BIRTH = datetime(1980, 5, 17, 9, 45)
+# Rohini (Moon's nakshatra), 5° in
+MOON_LONGITUDE = 45.0
+
+
+@pytest.fixture
+def timeline():
+    return VimshottariDashaCalculator.calculate_timeline(MOON_LONGITUDE, BIRTH)
+
+
+@pytest.mark.unit
+class TestDashaTimeline:
+
+    def test_first_mahadasha_is_remainder_of_nakshatra_lord(self, timeline):
+        mahadashas = timeline.mahadashas
+        sequence = VimshottariDashaCalculator.DASHA_SEQUENCE
+
+        assert sequence[mahadashas.lords[0]] == 'moon'
+        first_years = (mahadashas.ends[0] - mahadashas.starts[0]) / DAYS_PER_YEAR
+        assert first_years == pytest.approx(10 * (1 - 5.0 / (40.0 / 3.0)))
+        assert [sequence[lord] for lord in mahadashas.lords[1:4]] == ['mars', 'rahu', 'jupiter']
+        assert mahadashas.ends[-1] >= 120 * DAYS_PER_YEAR
+
+    def test_children_tile_parent_in_proportion(self, timeline):
+        sequence = VimshottariDashaCalculator.DASHA_SEQUENCE
+        years = VimshottariDashaCalculator.MAHADASHA_YEARS
+
+        for path in [(2,), (2, 4), (2, 4, 7), (2, 4, 7, 1)]:
+            parent = timeline.period(path)
+            children = timeline.children(path)
+
+            assert len(children) == 9
+            assert children.starts[0] == pytest.approx(timeline.days_from_birth(parent['start_date']), abs=1e-6)
+            assert np.array_equal(children.starts[1:], children.ends[:-1])
+            assert sequence[children.lords[0]] == parent['planet']
+
+            durations = (children.ends - children.starts) / DAYS_PER_YEAR
+            expected = [years[sequence[lord]] / 120 * parent['duration_years'] for lord in children.lords]
+            assert durations.tolist() == pytest.approx(expected)
+            assert children.paths[:, :-1].tolist() == [list(path)] * 9
+
+    def test_path_at_matches_linear_scan(self, timeline):
+        pranas = timeline.level(4)
+        rng = np.random.default_rng(7)
+
+        for days in rng.uniform(0, pranas.ends[-1], 200):
+            when = BIRTH + timedelta(days=float(days))
+            offset = timeline.days_from_birth(when)
+            expected = np.flatnonzero((pranas.starts <= offset) & (offset < pranas.ends))
+
+            assert len(expected) == 1
+            assert timeline.path_at(when) == tuple(pranas.paths[expected[0]].tolist())
+
+    def test_path_at_shallow_depth_and_out_of_range(self, timeline):
+        assert timeline.path_at(BIRTH, 0) == (0,)
+        assert timeline.path_at(BIRTH, 2) == (0, 0, 0)
+        assert timeline.path_at(BIRTH - timedelta(days=1)) is None
+        assert timeline.path_at(BIRTH + timedelta(days=200 * DAYS_PER_YEAR)) is None
+
+    def test_periods_at_lists_every_level(self, timeline):
+        periods = timeline.periods_at(datetime(2024, 3, 1))
+
+        assert [period['level'] for period in periods] == list(DASHA_LEVELS)
+        for outer, inner in zip(periods, periods[1:]):
+            assert inner['parent_planet'] == outer['planet']
+            assert outer['start_date'] <= inner['start_date'] < inner['end_date'] <= outer['end_date']
+
+    def test_windowed_level_matches_full_level(self, timeline):
+        start, end = datetime(2020, 1, 1), datetime(2021, 6, 1)
+        full = timeline.level(3)
+        window = timeline.level(3, start, end)
+
+        low, high = timeline.days_from_birth(start), timeline.days_from_birth(end)
+        overlap = (full.ends > low) & (full.starts < high)
+        assert window.paths.tolist() == full.paths[overlap].tolist()
+        assert np.array_equal(window.starts, full.starts[overlap])
+
+    def test_children_are_cached(self, timeline):
+        assert timeline.children((1, 2)) is timeline.children((1, 2))
+
+    def test_invalid_paths(self, timeline):
+        with pytest.raises(IndexError):
+            timeline.period((len(timeline.mahadashas),))
+        with pytest.raises(ValueError):
+            timeline.children((0, 0, 0, 0, 0))
+
+
+@pytest.mark.unit
+class TestCalculate:
+
+    def test_nested_periods_match_timeline(self, timeline):
+        result = VimshottariDashaCalculator.calculate(
+            MOON_LONGITUDE, BIRTH, include_antardashas=True, include_pratyantardashas=True
+        )
+
+        assert len(result['mahadashas']) == len(timeline.mahadashas)
+        maha = result['mahadashas'][3]
+        antar = maha['antardashas'][5]
+        pratyantar = antar['pratyantardashas'][2]
+        assert maha['period_number'] == 4
+        assert antar['parent_planet'] == maha['planet']
+        assert pratyantar == timeline.period((3, 5, 2))
+
+    def test_current_periods_found_by_bisection(self, timeline):
+        result = VimshottariDashaCalculator.calculate(
+            MOON_LONGITUDE, BIRTH, include_antardashas=True, include_pratyantardashas=True
+        )
+        path = timeline.path_at(datetime.now(), 2)
+
+        assert result['current_mahadasha'] is result['mahadashas'][path[0]]
+        assert result['current_antardasha'] is result['current_mahadasha']['antardashas'][path[1]]
+        assert result['current_pratyantardasha']['planet'] == timeline.period(path)['planet']
+
+    def test_calculate_to_date_limits_mahadashas(self):
+        result = VimshottariDashaCalculator.calculate(
+            MOON_LONGITUDE, BIRTH, calculate_to_date=BIRTH + timedelta(days=365.25 * 20),
+            include_antardashas=False
+        )
+
+        assert [maha['planet'] for maha in result['mahadashas']] == ['moon', 'mars', 'rahu']
+        assert 'antardashas' not in result['mahadashas'][0]
+
+    def test_local_datetime(self):
+        birth_data = SimpleNamespace(utc_offset=-300)
+        aware = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        assert VimshottariDashaCalculator.local_datetime(aware, birth_data) == datetime(2023, 12, 31, 19)
+        assert VimshottariDashaCalculator.local_datetime(BIRTH, birth_data) is BIRTH
+        assert VimshottariDashaCalculator.local_datetime(None, birth_data) is None
@@ -0,0 +1,151 @@
+"""
+Tests for the electional search
+"""
+from datetime import date, datetime
+
+import numpy as np
+import pytest
+
+from app.services.electional_service import ElectionalSearchService
+from app.services.event_calendar_service import EventCalendarService
+from app.services.exact_event_calculator import ExactEventCalculator
+from app.utils.ephemeris import EphemerisCalculator
+
+
+LATITUDE, LONGITUDE = 40.71, -74.0
+
+MOON = ExactEventCalculator.state_function('moon')
+SUN = ExactEventCalculator.state_function('sun')
+
+
+def midpoints(result):
+    return [0.5 * (w['start_jd'] + w['end_jd']) for w in result['windows']]
+
+
+def angular_excess(body, jd, orb=5.0):
+    """Degrees beyond the orb of the nearest angle, from swe.houses."""
+    houses = EphemerisCalculator.calculate_houses(jd, LATITUDE, LONGITUDE)
+    longitude = ExactEventCalculator.state_function(body)(jd)[0]
+    points = [houses['ascendant'], houses['mc'], houses['ascendant'] + 180.0, houses['mc'] + 180.0]
+    return min(abs(ExactEventCalculator.wrap180(longitude - point)) for point in points) - orb
+
+
+class TestIntervalSets:
+
+    def test_union_intersect_complement(self):
+        union = ElectionalSearchService.union([(5, 7), (1, 3), (2, 4), (7, 8), (9, 9)])
+        windows = [(0, 6), (7.5, 10)]
+
+        assert union == [(1, 4), (5, 8)]
+        assert ElectionalSearchService.intersect(union, windows) == [(1, 4), (5, 6), (7.5, 8)]
+        assert ElectionalSearchService.complement(union, windows) == [(0, 1), (4, 5), (8, 10)]
+        assert ElectionalSearchService.complement([], windows) == windows
+
+
+@pytest.mark.ephemeris
+class TestSearch:
+
+    def test_calendar_constraints(self, db_session):
+        result = ElectionalSearchService.search(db_session, date(2024, 3, 1), date(2024, 4, 30), [
+            {'type': 'moon_phase', 'phase': 'waxing'},
+            {'type': 'event', 'event_type': 'void_of_course', 'negate': True},
+            {'type': 'event', 'event_type': 'station', 'body': 'mercury', 'within_days': 3, 'negate': True},
+        ], limit=1000)
+        voids = EventCalendarService.events_between(
+            db_session, date(2024, 2, 27), date(2024, 4, 30), ['void_of_course']
+        )
+        stations = [
+            event.jd for event in EventCalendarService.events_between(
+                db_session, date(2024, 2, 25), date(2024, 5, 3), ['station']
+            ) if event.body == 'mercury'
+        ]
+
+        assert result['window_count'] == len(result['windows']) > 5
+        for window in result['windows']:
+            middle = 0.5 * (window['start_jd'] + window['end_jd'])
+            assert (MOON(middle)[0] - SUN(middle)[0]) % 360.0 < 180.0
+            for void in voids:
+                assert window['end_jd'] <= void.jd + 1e-9 or window['start_jd'] >= void.end_jd - 1e-9
+            for station in stations:
+                assert abs(middle - station) > 3.0
+                assert window['end_jd'] <= station - 3.0 + 1e-9 or window['start_jd'] >= station + 3.0 - 1e-9
+
+    def test_retrograde_and_sign(self, db_session):
+        result = ElectionalSearchService.search(db_session, date(2024, 3, 1), date(2024, 6, 30), [
+            {'type': 'retrograde', 'body': 'mercury'},
+            {'type': 'sign', 'body': 'mercury', 'signs': ['aries']},
+        ])
+        mercury = ExactEventCalculator.state_function('mercury')
+
+        assert len(result['windows']) == 1
+        window = result['windows'][0]
+        # Mercury was retrograde in Aries from April 1 to April 25, 2024
+        assert window['start'][:10] == '2024-04-01'
+        assert window['end'][:10] == '2024-04-25'
+        longitude, speed = mercury(0.5 * (window['start_jd'] + window['end_jd']))
+        assert speed < 0 and 0 <= longitude < 30
+
+    def test_aspect_windows_are_exact(self, db_session):
+        result = ElectionalSearchService.search(db_session, date(2024, 1, 1), date(2024, 6, 30), [
+            {'type': 'aspect', 'body': 'venus', 'targets': ['mars', 'saturn'], 'orb': 2},
+        ], limit=100)
+        venus, mars, saturn = (ExactEventCalculator.state_function(b) for b in ('venus', 'mars', 'saturn'))
+
+        def excess(jd):
+            return min(
+                abs(abs(ExactEventCalculator.wrap180(venus(jd)[0] - other(jd)[0])) - angle)
+                for other in (mars, saturn) for angle in (0.0, 90.0, 180.0)
+            ) - 2.0
+
+        range_edges = {EphemerisCalculator.datetime_to_julian_day(datetime(2024, 1, 1)),
+                       EphemerisCalculator.datetime_to_julian_day(datetime(2024, 7, 1))}
+
+        assert result['window_count'] >= 3
+        for window in result['windows']:
+            assert excess(0.5 * (window['start_jd'] + window['end_jd'])) < 0
+            for edge in {window['start_jd'], window['end_jd']} - range_edges:
+                assert abs(excess(edge)) < 1e-4
+
+    def test_angular_matches_dense_scan(self, db_session):
+        result = ElectionalSearchService.search(db_session, date(2024, 5, 1), date(2024, 5, 3), [
+            {'type': 'angular', 'body': 'moon'},
+        ], latitude=LATITUDE, longitude=LONGITUDE, limit=100)
+        start = EphemerisCalculator.datetime_to_julian_day(datetime(2024, 5, 1))
+        minutes = start + np.arange(3 * 1440) / 1440.0 + 0.5 / 1440.0
+        dense = np.array([angular_excess('moon', jd) < 0 for jd in minutes])
+        found = np.zeros(len(minutes), dtype=bool)
+        for window in result['windows']:
+            found |= (minutes >= window['start_jd']) & (minutes < window['end_jd'])
+
+        assert 8 <= result['window_count'] <= 14
+        assert (dense != found).sum() <= 2 * result['window_count']
+
+    def test_optional_constraints_rank_windows(self, db_session):
+        result = ElectionalSearchService.search(db_session, date(2024, 3, 1), date(2024, 3, 31), [
+            {'type': 'moon_phase', 'phase': 'waxing'},
+            {'type': 'angular', 'body': 'jupiter'},
+            {'type': 'aspect', 'body': 'moon', 'targets': ['jupiter', 'venus'],
+             'aspects': ['conjunction', 'sextile', 'trine'], 'orb': 6, 'required': False, 'weight': 2},
+        ], latitude=LATITUDE, longitude=LONGITUDE, min_duration_minutes=20, limit=5)
+
+        scores = [window['score'] for window in result['windows']]
+        assert len(scores) == 5
+        assert scores == sorted(scores, reverse=True)
+        assert scores[0] == pytest.approx(2.0)
+        assert all(window['duration_minutes'] >= 20 for window in result['windows'])
+        for jd in midpoints(result):
+            assert angular_excess('jupiter', jd) < 0
+
+    def test_rejects_bad_constraints(self, db_session):
+        search = ElectionalSearchService.search
+        with pytest.raises(ValueError):
+            search(db_session, date(2024, 1, 1), date(2024, 1, 5), [{'type': 'comet'}])
+        with pytest.raises(ValueError):
+            search(db_session, date(2024, 1, 1), date(2024, 1, 5), [{'type': 'angular', 'body': 'jupiter'}])
+        with pytest.raises(ValueError):
+            search(db_session, date(2024, 1, 1), date(2024, 1, 5), [{'type': 'retrograde', 'body': 'sun'}])
+        with pytest.raises(ValueError):
+            search(db_session, date(2024, 1, 1), date(2024, 1, 5),
+                   [{'type': 'aspect', 'body': 'venus', 'targets': ['mars'], 'orb': 40}])
+        with pytest.raises(ValueError):
+            search(db_session, date(2024, 1, 1), date(2025, 6, 1), [{'type': 'moon_phase', 'phase': 'waxing'}])
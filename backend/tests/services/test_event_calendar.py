@@ -0,0 +1,179 @@
+"""
+Tests for the astronomical event calendar
+"""
+from datetime import date, datetime
+
+import pytest
+
+from app.models import BirthData, SkyEvent, SkyEventMonth
+from app.services.event_calendar_service import EventCalendarService
+from app.services.exact_event_calculator import ExactEventCalculator
+from app.utils.ephemeris import EphemerisCalculator
+
+
+MARCH_2024 = EphemerisCalculator.datetime_to_julian_day(datetime(2024, 3, 1))
+MAY_2024 = EphemerisCalculator.datetime_to_julian_day(datetime(2024, 5, 1))
+
+
+@pytest.fixture(scope='module')
+def spring_2024():
+    return EventCalendarService.compute_events(MARCH_2024, MAY_2024)
+
+
+def find(events, event_type, body=None, name=None):
+    return [
+        event for event in events
+        if event['event_type'] == event_type
+        and (body is None or event['body'] == body)
+        and (name is None or event['name'] == name)
+    ]
+
+
+def minutes_from(event, when):
+    return abs(event['jd'] - EphemerisCalculator.datetime_to_julian_day(when)) * 1440
+
+
+@pytest.mark.ephemeris
+class TestComputeEvents:
+
+    def test_known_events(self, spring_2024):
+        equinox = find(spring_2024, 'ingress', 'sun', 'enters Aries')
+        eclipse = find(spring_2024, 'eclipse', 'sun')
+        stations = find(spring_2024, 'station', 'mercury')
+
+        assert minutes_from(equinox[0], datetime(2024, 3, 20, 3, 6)) < 2
+        assert eclipse[0]['name'] == 'Total Solar Eclipse'
+        assert minutes_from(eclipse[0], datetime(2024, 4, 8, 18, 17)) < 2
+        assert [s['name'] for s in stations] == ['stations retrograde', 'stations direct']
+        assert minutes_from(stations[0], datetime(2024, 4, 1, 22, 14)) < 2
+
+    def test_events_are_exact_and_in_range(self, spring_2024):
+        moon = ExactEventCalculator.state_function('moon')
+        sun = ExactEventCalculator.state_function('sun')
+
+        assert all(MARCH_2024 <= event['jd'] < MAY_2024 for event in spring_2024)
+        for event in find(spring_2024, 'ingress', 'moon'):
+            assert abs((moon(event['jd'])[0] + 15.0) % 30.0 - 15.0) < 1e-4
+        for event in find(spring_2024, 'lunation'):
+            elongation = moon(event['jd'])[0] - sun(event['jd'])[0] - event['details']['angle']
+            assert abs(ExactEventCalculator.wrap180(elongation)) < 1e-4
+
+    def test_refine_widens_a_bracket_that_just_misses(self):
+        root = MARCH_2024 + 0.3
+
+        def f(t):
+            return t - root
+
+        margin = EventCalendarService.BRACKET_MARGIN_DAYS
+        assert EventCalendarService._refine(f, root + margin / 2, root + 0.25) == pytest.approx(root, abs=1e-8)
+        assert EventCalendarService._refine(f, root + 2 * margin, root + 0.25) is None
+
+    def test_lunations_cycle_in_order(self, spring_2024):
+        phases = [event['details']['phase'] for event in find(spring_2024, 'lunation')]
+
+        assert len(phases) == 8
+        for previous, current in zip(phases, phases[1:]):
+            assert current == (previous + 1) % 4
+
+    def test_void_of_course_ends_at_moon_ingress(self, spring_2024):
+        ingresses = {round(event['jd'], 6) for event in find(spring_2024, 'ingress', 'moon')}
+        windows = find(spring_2024, 'void_of_course')
+
+        assert len(windows) >= 20
+        for window in windows:
+            assert 0 < window['end_jd'] - window['jd'] < EventCalendarService.MAX_WINDOW_DAYS
+            assert window['details']['last_aspect'] in EventCalendarService.PTOLEMAIC_ASPECTS.values()
+            if window['end_jd'] < MAY_2024:
+                assert round(window['end_jd'], 6) in ingresses
+
+
+@pytest.mark.ephemeris
+class TestCalendarStore:
+
+    def test_months_are_computed_once(self, db_session):
+        first = EventCalendarService.ensure_range(db_session, date(2024, 3, 10), date(2024, 4, 20))
+        again = EventCalendarService.ensure_range(db_session, date(2024, 3, 1), date(2024, 4, 30))
+        extended = EventCalendarService.ensure_range(db_session, date(2024, 4, 1), date(2024, 5, 5))
+
+        assert (first, again, extended) == (2, 0, 1)
+        assert db_session.query(SkyEventMonth).count() == 3
+        assert db_session.query(SkyEvent).filter(SkyEvent.event_type == 'eclipse').count() == 2
+
+    def test_months_from_older_versions_are_recomputed(self, db_session):
+        jd = EphemerisCalculator.datetime_to_julian_day(datetime(2024, 3, 15))
+        db_session.add(SkyEventMonth(month='2024-03', version=EventCalendarService.CALENDAR_VERSION - 1))
+        db_session.add(SkyEvent(
+            event_type='ingress', body='moon', name='stale', description='stale',
+            jd=jd, event_date='2024-03-15T00:00:00',
+        ))
+        db_session.commit()
+
+        assert EventCalendarService.ensure_range(db_session, date(2024, 3, 1), date(2024, 3, 31)) == 1
+        assert EventCalendarService.ensure_range(db_session, date(2024, 3, 1), date(2024, 3, 31)) == 0
+        db_session.expire_all()
+        assert db_session.query(SkyEventMonth).one().version == EventCalendarService.CALENDAR_VERSION
+        assert db_session.query(SkyEvent).filter(SkyEvent.name == 'stale').count() == 0
+        assert db_session.query(SkyEvent).filter(SkyEvent.event_type == 'lunation').count() >= 4
+
+    def test_store_leaves_caller_session_uncommitted(self, db_session):
+        db_session.add(BirthData(
+            birth_date="1990-01-15", birth_time="14:30:00", latitude=40.7, longitude=-74.0,
+            timezone="America/New_York", utc_offset=-300,
+        ))
+        EventCalendarService.ensure_range(db_session, date(2024, 3, 1), date(2024, 3, 31))
+        db_session.rollback()
+
+        assert db_session.query(SkyEventMonth).count() == 1
+        assert db_session.query(BirthData).count() == 0
+
+    def test_store_leaves_flushed_changes_to_the_caller(self, db_session):
+        db_session.add(BirthData(
+            birth_date="1990-01-15", birth_time="14:30:00", latitude=40.7, longitude=-74.0,
+            timezone="America/New_York", utc_offset=-300,
+        ))
+        db_session.flush()
+        events = EventCalendarService.events_between(db_session, date(2024, 3, 1), date(2024, 3, 31))
+
+        assert any(event.event_type == 'lunation' for event in events)
+        db_session.rollback()
+        assert db_session.query(BirthData).count() == 0
+
+    def test_events_between_filters_types(self, db_session):
+        events = EventCalendarService.events_between(
+            db_session, date(2024, 4, 1), date(2024, 4, 30), ['station', 'eclipse']
+        )
+
+        assert {event.event_type for event in events} == {'station', 'eclipse'}
+        assert [event.jd for event in events] == sorted(event.jd for event in events)
+
+    def test_windows_overlapping_the_start_are_included(self, db_session):
+        windows = EventCalendarService.events_between(
+            db_session, date(2024, 3, 1), date(2024, 3, 31), ['void_of_course']
+        )
+        window = next(w for w in windows if w.event_date[:10] != w.end_date[:10])
+        overlap_day = date.fromisoformat(window.end_date[:10])
+        later = EventCalendarService.events_between(db_session, overlap_day, overlap_day, ['void_of_course'])
+
+        assert window.id in {event.id for event in later}
+
+    def test_calendar_days(self, db_session):
+        days = {
+            day['date']: day
+            for day in EventCalendarService.calendar_days(db_session, date(2024, 4, 7), date(2024, 4, 24))
+        }
+
+        assert days['2024-04-08']['moon_phase'] == 'New Moon'
+        assert 'Total Solar Eclipse' in {event['name'] for event in days['2024-04-08']['events']}
+        assert days['2024-04-09']['moon_phase'] == 'Waxing Crescent'
+        assert days['2024-04-23']['moon_phase'] == 'Full Moon'
+        assert days['2024-04-24']['moon_phase'] == 'Waning Gibbous'
+        assert days['2024-04-07']['lunar_day'] == pytest.approx(28.2, abs=0.1)
+        assert days['2024-04-09']['lunar_day'] == pytest.approx(0.74, abs=0.01)
+
+    def test_rejects_bad_ranges(self, db_session):
+        with pytest.raises(ValueError):
+            EventCalendarService.events_between(db_session, date(2024, 4, 2), date(2024, 4, 1))
+        with pytest.raises(ValueError):
+            EventCalendarService.events_between(db_session, date(2020, 1, 1), date(2024, 1, 1))
+        with pytest.raises(ValueError):
+            EventCalendarService.events_between(db_session, date(2024, 4, 1), date(2024, 4, 2), ['comet'])
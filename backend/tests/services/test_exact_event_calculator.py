@@ -0,0 +1,94 @@
+"""
+Tests for the exact event (longitude crossing) search engine
+"""
+import pytest
+from datetime import datetime
+
+from app.services.exact_event_calculator import ExactEventCalculator
+from app.services.transit_calculator import TransitCalculator
+from app.utils.ephemeris import EphemerisCalculator
+
+
+J2000 = 2451545.0
+
+
+def _separation(body: str, jd: float, target: float) -> float:
+    lon = EphemerisCalculator.calculate_planet_position(body, jd)['longitude']
+    return abs(ExactEventCalculator.wrap180(lon - target))
+
+
+@pytest.mark.ephemeris
+class TestLongitudeCrossings:
+    """Crossing search accuracy and pass detection"""
+
+    def test_crossings_are_exact(self):
+        """Refined crossings should land on the target longitude"""
+        crossings = ExactEventCalculator.find_longitude_crossings('sun', 0.0, J2000, J2000 + 730)
+
+        assert len(crossings) == 2
+        for crossing in crossings:
+            assert _separation('sun', crossing['jd'], 0.0) < 1e-4
+
+    def test_retrograde_triple_hit(self):
+        """Mercury's Feb-Mar 2000 retrograde crosses 340° three times"""
+        crossings = ExactEventCalculator.find_longitude_crossings('mercury', 340.0, J2000, J2000 + 120)
+
+        assert [c['retrograde'] for c in crossings] == [False, True, False]
+        assert len({c['cycle'] for c in crossings}) == 1
+
+    def test_aspect_hits_number_passes(self):
+        """Hits of one retrograde loop share pass numbering"""
+        hits = ExactEventCalculator.find_aspect_hits('mercury', 340.0, 0, J2000, J2000 + 120)
+
+        assert [h['pass_number'] for h in hits] == [1, 2, 3]
+        assert all(h['total_passes'] == 3 for h in hits)
+
+    def test_both_aspect_sides_searched(self):
+        """A square is found on both sides of the natal point"""
+        hits = ExactEventCalculator.find_aspect_hits('sun', 100.0, 90, J2000, J2000 + 366)
+
+        assert {round(h['exact_longitude']) for h in hits} == {10, 190}
+
+    def test_lunar_crossings_over_decades(self):
+        """Fast bodies are tracked without missing revolutions"""
+        crossings = ExactEventCalculator.find_longitude_crossings(
+            'moon', 123.0, J2000, J2000 + 365.25 * 10
+        )
+
+        # ~13.37 sidereal months per year
+        assert 132 <= len(crossings) <= 135
+
+    def test_refine_bracket_widens_near_miss(self):
+        """A sample bracket ending just short of the root is widened"""
+        f = lambda t: t - 1.0001
+
+        assert ExactEventCalculator.refine_bracket(f, 0.0, 1.0) is None
+        assert ExactEventCalculator.refine_bracket(f, 0.0, 1.0, margin=0.01) == pytest.approx(1.0001)
+        assert ExactEventCalculator.refine_bracket(f, 2.0, 3.0, margin=0.01) is None
+
+    def test_unknown_body_raises(self):
+        with pytest.raises(ValueError):
+            ExactEventCalculator.find_longitude_crossings('vulcan', 0.0, J2000, J2000 + 10)
+
+
+@pytest.mark.ephemeris
+class TestFindExactTransitDates:
+    """TransitCalculator integration"""
+
+    def test_returns_exact_dates(self):
+        natal = {'sun': {'longitude': 340.0}}
+        results = TransitCalculator.find_exact_transit_dates(
+            natal, 'mercury', 'sun', 'conjunction',
+            datetime(2000, 1, 1), datetime(2000, 5, 1)
+        )
+
+        assert len(results) == 3
+        assert results[1]['retrograde'] is True
+        assert results[0]['date'].startswith('2000-02-11')
+
+    def test_missing_natal_point(self):
+        results = TransitCalculator.find_exact_transit_dates(
+            {}, 'mercury', 'sun', 'conjunction',
+            datetime(2000, 1, 1), datetime(2000, 5, 1)
+        )
+        assert results == []
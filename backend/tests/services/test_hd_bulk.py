@@ -0,0 +1,168 @@
+"""
+Tests for bulk Human Design calculation and the bodygraph bitset engine
+"""
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.core.human_design_data import CHANNELS, CenterType, Definition, HumanDesignType
+from app.services import human_design_bulk_service
+from app.services.bodygraph_engine import BodygraphEngine
+from app.services.calculation_executor import CalculationExecutor
+from app.services.human_design_bulk_service import HumanDesignBulkService
+from app.services.human_design_calculator import HumanDesignCalculator
+
+
+def run(coro):
+    """Run a coroutine on a private loop (leaves the thread's current loop alone)"""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def _births(count: int):
+    start = datetime(1950, 3, 14, 6, 30)
+    return [
+        {
+            'birth_datetime': start + timedelta(days=397 * i, minutes=61 * i),
+            'latitude': 40.0,
+            'longitude': -74.0,
+            'timezone_offset_minutes': (-300, 0, 330)[i % 3],
+        }
+        for i in range(count)
+    ]
+
+
+async def _collect(births, **kwargs):
+    return [item async for item in HumanDesignBulkService.stream_charts(births, **kwargs)]
+
+
+def _failing_chunk(births, **calc_params):
+    raise ValueError("bad chunk")
+
+
+@pytest.fixture
+def thread_executor(monkeypatch):
+    executor = CalculationExecutor(mode='thread')
+    monkeypatch.setattr(human_design_bulk_service, 'get_calculation_executor', lambda: executor)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.mark.unit
+class TestBodygraphEngine:
+
+    def test_channel_needs_both_gates(self):
+        one_side = BodygraphEngine.gate_mask([64])
+        both = BodygraphEngine.gate_mask([64, 47])
+
+        assert BodygraphEngine.channel_mask(one_side) == 0
+        channels = BodygraphEngine.channel_indices(BodygraphEngine.channel_mask(both))
+        assert [BodygraphEngine.CHANNEL_KEYS[i] for i in channels] == [(64, 47)]
+
+    def test_centers_from_channels(self):
+        channel_mask = BodygraphEngine.channel_mask(BodygraphEngine.gate_mask([34, 20, 1]))
+        center_mask = BodygraphEngine.center_mask(channel_mask)
+
+        defined = {c for c in CenterType if BodygraphEngine.is_defined(center_mask, c)}
+        assert defined == {CenterType.SACRAL, CenterType.THROAT}
+
+    def test_all_gates_complete_every_channel(self):
+        all_gates = BodygraphEngine.gate_mask(range(1, 65))
+
+        assert BodygraphEngine.gates_of(all_gates) == list(range(1, 65))
+        assert bin(BodygraphEngine.channel_mask(all_gates)).count('1') == len(CHANNELS)
+
+    def test_components_union_channels(self):
+        # Head-Ajna plus Sacral-Root: two separate groups
+        bodygraph = BodygraphEngine.analyze(BodygraphEngine.gate_mask([64, 47, 9, 52]))
+
+        assert sorted(bodygraph.components) == sorted([
+            BodygraphEngine.CENTER_BITS[CenterType.HEAD] | BodygraphEngine.CENTER_BITS[CenterType.AJNA],
+            BodygraphEngine.CENTER_BITS[CenterType.SACRAL] | BodygraphEngine.CENTER_BITS[CenterType.ROOT],
+        ])
+        assert BodygraphEngine.definition(bodygraph) == Definition.SPLIT
+        assert not BodygraphEngine.connected(bodygraph, CenterType.HEAD, CenterType.ROOT)
+
+    @pytest.mark.parametrize("gates,expected", [
+        ([], HumanDesignType.REFLECTOR),
+        ([34, 20], HumanDesignType.MANIFESTING_GENERATOR),
+        ([9, 52], HumanDesignType.GENERATOR),
+        # Root -> Solar Plexus -> Throat, no Sacral
+        ([30, 41, 35, 36], HumanDesignType.MANIFESTOR),
+        ([64, 47, 17, 62], HumanDesignType.PROJECTOR),
+    ])
+    def test_type(self, gates, expected):
+        bodygraph = BodygraphEngine.analyze(BodygraphEngine.gate_mask(gates))
+
+        assert BodygraphEngine.hd_type(bodygraph) == expected
+
+    def test_indirect_motor_connection(self):
+        # Heart -> G (25-51) -> Throat (8-1): motor reaches the Throat via the G
+        bodygraph = BodygraphEngine.analyze(BodygraphEngine.gate_mask([25, 51, 8, 1]))
+
+        assert BodygraphEngine.motor_to_throat(bodygraph)
+        assert BodygraphEngine.definition(bodygraph) == Definition.SINGLE
+
+
+@pytest.mark.unit
+class TestChunkPlan:
+
+    def test_chunks_cover_all_records(self):
+        chunks = HumanDesignBulkService.plan_chunks(1000, 4)
+
+        assert chunks[0][0] == 0 and chunks[-1][1] == 1000
+        assert all(a[1] == b[0] for a, b in zip(chunks, chunks[1:]))
+        assert max(stop - start for start, stop in chunks) <= HumanDesignBulkService.MAX_CHUNK_SIZE
+
+    def test_small_batches_still_spread(self):
+        assert len(HumanDesignBulkService.plan_chunks(8, 2)) == 8
+        assert HumanDesignBulkService.plan_chunks(0, 4) == []
+
+
+@pytest.mark.ephemeris
+class TestCalculateCharts:
+
+    @pytest.mark.parametrize("zodiac_type,sidereal_method", [
+        ('tropical', 'shift_positions'),
+        ('sidereal', 'shift_positions'),
+        ('sidereal', 'shift_wheel'),
+    ])
+    def test_matches_single_chart(self, zodiac_type, sidereal_method):
+        births = _births(6)
+        bulk = HumanDesignCalculator.calculate_charts(
+            births, zodiac_type=zodiac_type, sidereal_method=sidereal_method
+        )
+
+        for birth, chart in zip(births, bulk):
+            single = HumanDesignCalculator.calculate_chart(
+                birth['birth_datetime'], birth['latitude'], birth['longitude'],
+                birth['timezone_offset_minutes'],
+                zodiac_type=zodiac_type, sidereal_method=sidereal_method
+            )
+            assert chart == single
+
+    def test_empty(self):
+        assert HumanDesignCalculator.calculate_charts([]) == []
+
+
+@pytest.mark.ephemeris
+class TestStreamCharts:
+
+    def test_streams_every_record(self, thread_executor):
+        births = _births(10)
+        results = run(_collect(births, include_variables=False))
+
+        assert sorted(index for index, _, _ in results) == list(range(10))
+        for index, chart, error in results:
+            assert error is None
+            assert chart['personality_datetime'] == births[index]['birth_datetime'].isoformat()
+
+    def test_failed_chunk_reports_errors(self, thread_executor):
+        results = run(_collect(_births(3), calculate=_failing_chunk))
+
+        assert sorted(index for index, _, _ in results) == [0, 1, 2]
+        assert all(chart is None and error == "bad chunk" for _, chart, error in results)
@@ -0,0 +1,124 @@
+"""
+Tests for the Human Design design date solver and the daily Sun table
+"""
+import pytest
+
+from app.core.config import settings
+from app.services.exact_event_calculator import ExactEventCalculator
+from app.services.human_design_calculator import HumanDesignCalculator
+from app.utils.ephemeris import EphemerisCalculator
+from app.utils.sun_table import SunLongitudeTable
+
+
+J2000 = 2451545.0
+
+
+@pytest.fixture
+def sun_table(tmp_path, monkeypatch):
+    """A short table around J2000, installed as the shared table"""
+    path = str(tmp_path / 'sun.npy')
+    table = SunLongitudeTable.build(path, J2000 - 400, J2000 + 400)
+    monkeypatch.setattr(settings, 'HD_SUN_TABLE_PATH', path)
+    yield table
+    SunLongitudeTable._shared_path = None
+
+
+@pytest.fixture
+def no_sun_table(monkeypatch):
+    monkeypatch.setattr(settings, 'HD_SUN_TABLE_PATH', '')
+    yield
+    SunLongitudeTable._shared_path = None
+
+
+def _solar_arc(personality_jd: float, design_jd: float, zodiac: str = 'tropical') -> float:
+    state = ExactEventCalculator.state_function('sun', zodiac)
+    return (state(personality_jd)[0] - state(design_jd)[0]) % 360
+
+
+@pytest.mark.ephemeris
+class TestSunLongitudeTable:
+
+    def test_table_matches_ephemeris(self, sun_table):
+        day = 123
+        jd = sun_table.start_jd + day
+        expected = EphemerisCalculator.calculate_planet_position('sun', jd)['longitude']
+
+        assert sun_table.longitudes[day] == pytest.approx(expected, abs=1e-9)
+
+    def test_find_crossing_interpolates(self, sun_table):
+        estimate = sun_table.find_crossing(0.0, J2000 + 60, J2000 + 90)
+        state = ExactEventCalculator.state_function('sun')
+
+        # Linear interpolation between daily samples is good to ~1e-4°
+        assert abs(ExactEventCalculator.wrap180(state(estimate)[0])) < 1e-3
+
+    def test_find_crossing_outside_table(self, sun_table):
+        assert sun_table.find_crossing(0.0, J2000 + 500, J2000 + 530) is None
+
+    def test_built_when_missing(self, tmp_path, monkeypatch):
+        path = tmp_path / 'generated' / 'sun.npy'
+        monkeypatch.setattr(settings, 'HD_SUN_TABLE_PATH', str(path))
+        monkeypatch.setattr(SunLongitudeTable, 'DEFAULT_START_JD', J2000)
+        monkeypatch.setattr(SunLongitudeTable, 'DEFAULT_END_JD', J2000 + 30)
+        monkeypatch.setattr(SunLongitudeTable, '_shared_path', None)
+
+        assert SunLongitudeTable.get() is None
+        assert SunLongitudeTable.ensure_built()
+        assert SunLongitudeTable.get().end_jd == J2000 + 30
+        assert [p.name for p in path.parent.iterdir()] == ['sun.npy']
+
+
+@pytest.mark.ephemeris
+class TestDesignDate:
+
+    @pytest.mark.parametrize("offset", [0.0, 91.3, 182.6, 273.9])
+    def test_design_is_88_degrees_before(self, no_sun_table, offset):
+        personality_jd = J2000 + offset
+        design_jd, _, days_before = HumanDesignCalculator._find_design_datetime(
+            personality_jd, 'tropical', 'lahiri'
+        )
+
+        assert _solar_arc(personality_jd, design_jd) == pytest.approx(88.0, abs=1e-6)
+        assert 85 < days_before < 93
+
+    def test_sidereal_design_date(self, sun_table):
+        personality_jd = J2000 + 45.0
+        design_jd, _, _ = HumanDesignCalculator._find_design_datetime(
+            personality_jd, 'sidereal', 'lahiri'
+        )
+
+        state = ExactEventCalculator.state_function('sun', 'sidereal', 'lahiri')
+        arc = (state(personality_jd)[0] - state(design_jd)[0]) % 360
+        assert arc == pytest.approx(88.0, abs=1e-6)
+
+    def test_table_guess_needs_few_evaluations(self, sun_table, monkeypatch):
+        """Seeded from the table, Newton converges in one or two steps"""
+        calls = []
+        original = ExactEventCalculator.state_function
+
+        def counting_state_function(*args, **kwargs):
+            state = original(*args, **kwargs)
+
+            def counted(jd):
+                calls.append(jd)
+                return state(jd)
+            return counted
+
+        monkeypatch.setattr(ExactEventCalculator, 'state_function', counting_state_function)
+        personality_jd = J2000 + 200.0
+        design_jd, _, _ = HumanDesignCalculator._find_design_datetime(
+            personality_jd, 'tropical', 'lahiri'
+        )
+
+        # Birth Sun + at most three Newton evaluations
+        assert len(calls) <= 4
+        assert _solar_arc(personality_jd, design_jd) == pytest.approx(88.0, abs=1e-6)
+
+    def test_table_and_fallback_agree(self, sun_table):
+        personality_jd = J2000 + 10.0
+        seeded = HumanDesignCalculator._find_design_datetime(personality_jd, 'tropical', 'lahiri')[0]
+
+        settings.HD_SUN_TABLE_PATH = ''
+        fallback = HumanDesignCalculator._find_design_datetime(personality_jd, 'tropical', 'lahiri')[0]
+
+        assert seeded == pytest.approx(fallback, abs=1e-6)
@@ -0,0 +1,163 @@
+"""
+Tests for the Human Design transit interval calendar
+"""
+from datetime import date, datetime
+
+import numpy as np
+import pytest
+
+from app.core.human_design_data import (
+    CHANNELS,
+    HD_WHEEL_START,
+    LINE_ARC,
+    get_gate_at_degree,
+    get_line_at_degree,
+)
+from app.models import BirthData, HDTransitInterval, HDTransitMonth
+from app.services.hd_transit_service import HumanDesignTransitService
+from app.utils.ephemeris import EphemerisCalculator
+
+
+MARCH_2024 = EphemerisCalculator.datetime_to_julian_day(datetime(2024, 3, 1))
+APRIL_2024 = EphemerisCalculator.datetime_to_julian_day(datetime(2024, 4, 1))
+
+# Sun/Earth of a 2024-03 chart plus a few gates that open channels
+NATAL_GATES = [25, 46, 1, 8, 34, 57, 10, 20, 3, 60]
+
+
+@pytest.fixture(scope='module')
+def march_2024():
+    return HumanDesignTransitService.compute_intervals(MARCH_2024, APRIL_2024)
+
+
+def longitude(body, jd):
+    source, offset = HumanDesignTransitService.DERIVED_BODIES.get(body, (body, 0.0))
+    return (EphemerisCalculator.calculate_planet_position(source, jd)['longitude'] + offset) % 360.0
+
+
+@pytest.mark.ephemeris
+class TestComputeIntervals:
+
+    def test_intervals_tile_the_range(self, march_2024):
+        for body in HumanDesignTransitService.BODIES:
+            rows = [interval for interval in march_2024 if interval['body'] == body]
+
+            assert rows[0]['start_jd'] == MARCH_2024 and not rows[0]['start_exact']
+            assert rows[-1]['end_jd'] == APRIL_2024
+            for previous, current in zip(rows, rows[1:]):
+                assert previous['end_jd'] == current['start_jd']
+                assert (previous['gate'], previous['line']) != (current['gate'], current['line'])
+
+    def test_gate_and_line_match_position(self, march_2024):
+        for interval in march_2024:
+            position = longitude(interval['body'], (interval['start_jd'] + interval['end_jd']) / 2)
+
+            assert get_gate_at_degree(position) == interval['gate']
+            assert get_line_at_degree(position) == interval['line']
+
+    def test_starts_are_exact_boundaries(self, march_2024):
+        for interval in march_2024:
+            if interval['start_exact']:
+                offset = (longitude(interval['body'], interval['start_jd']) - HD_WHEEL_START) % LINE_ARC
+                assert min(offset, LINE_ARC - offset) < 1e-4
+
+    def test_derived_bodies_are_opposite(self, march_2024):
+        sun = [(i['start_jd'], i['end_jd']) for i in march_2024 if i['body'] == 'sun']
+        earth = [(i['start_jd'], i['end_jd']) for i in march_2024 if i['body'] == 'earth']
+
+        assert np.allclose(sun, earth)
+
+
+@pytest.mark.ephemeris
+class TestTransitStore:
+
+    def test_months_are_computed_once(self, db_session):
+        first = HumanDesignTransitService.ensure_range(db_session, date(2024, 3, 5), date(2024, 4, 2))
+        again = HumanDesignTransitService.ensure_range(db_session, date(2024, 3, 1), date(2024, 4, 30))
+
+        assert (first, again) == (2, 0)
+        assert db_session.query(HDTransitMonth).count() == 2
+        assert db_session.query(HDTransitInterval).filter(HDTransitInterval.body == 'pluto').count() >= 2
+
+    def test_store_leaves_caller_session_uncommitted(self, db_session):
+        db_session.add(BirthData(
+            birth_date="1990-01-15", birth_time="14:30:00", latitude=40.7, longitude=-74.0,
+            timezone="America/New_York", utc_offset=-300,
+        ))
+        HumanDesignTransitService.ensure_range(db_session, date(2024, 3, 1), date(2024, 3, 31))
+        db_session.rollback()
+
+        assert db_session.query(HDTransitMonth).count() == 1
+        assert db_session.query(BirthData).count() == 0
+
+    def test_store_leaves_flushed_changes_to_the_caller(self, db_session):
+        db_session.add(BirthData(
+            birth_date="1990-01-15", birth_time="14:30:00", latitude=40.7, longitude=-74.0,
+            timezone="America/New_York", utc_offset=-300,
+        ))
+        db_session.flush()
+        intervals = HumanDesignTransitService.intervals_between(db_session, date(2024, 3, 1), date(2024, 3, 31))
+        db_session.rollback()
+
+        assert any(interval['body'] == 'pluto' for interval in intervals)
+        assert db_session.query(BirthData).count() == 0
+
+    def test_pieces_are_joined_across_months(self, db_session):
+        for level in ('gate', 'line'):
+            intervals = HumanDesignTransitService.intervals_between(
+                db_session, date(2024, 3, 1), date(2024, 4, 30), level=level
+            )
+            spanning = [i for i in intervals if i['start_jd'] < APRIL_2024 < i['end_jd']]
+
+            assert not [i for i in intervals if i['start_jd'] == APRIL_2024 and not i['start_exact']]
+            assert {i['body'] for i in spanning} >= {'jupiter', 'saturn', 'uranus', 'pluto'}
+
+    def test_gate_ingresses_match_dense_scan(self, db_session):
+        ingresses = HumanDesignTransitService.ingresses(
+            db_session, date(2024, 3, 1), date(2024, 3, 31), level='gate', bodies=['sun', 'mercury']
+        )
+        hours = MARCH_2024 + np.arange(0, 31 * 24) / 24.0
+        for body in ('sun', 'mercury'):
+            gates = [get_gate_at_degree(longitude(body, jd)) for jd in hours]
+            changes = sum(1 for a, b in zip(gates, gates[1:]) if a != b)
+
+            assert len([i for i in ingresses if i['body'] == body]) == changes
+
+    def test_activations_at(self, db_session):
+        moment = datetime(2024, 3, 15, 6, 30)
+        activations = HumanDesignTransitService.activations_at(db_session, moment)
+        jd = EphemerisCalculator.datetime_to_julian_day(moment)
+
+        assert list(activations) == list(HumanDesignTransitService.BODIES)
+        for body, activation in activations.items():
+            position = longitude(body, jd)
+            assert (activation['gate'], activation['line']) == (
+                get_gate_at_degree(position), get_line_at_degree(position)
+            )
+
+    def test_channel_windows_match_dense_scan(self, db_session):
+        bodies = [body for body in HumanDesignTransitService.BODIES if body != 'moon']
+        windows = HumanDesignTransitService.channel_windows(
+            db_session, NATAL_GATES, date(2024, 3, 1), date(2024, 3, 31), bodies=bodies
+        )
+
+        natal = set(NATAL_GATES)
+        open_channels = {key for key in CHANNELS if not (key[0] in natal and key[1] in natal)}
+        for hour in range(0, 31 * 24, 5):
+            jd = MARCH_2024 + hour / 24.0 + 1e-3
+            gates = natal | {get_gate_at_degree(longitude(body, jd)) for body in bodies}
+            expected = {f"{g1}-{g2}" for g1, g2 in open_channels if g1 in gates and g2 in gates}
+            found = {w['channel'] for w in windows if w['start_jd'] <= jd < w['end_jd']}
+
+            assert found == expected
+
+    def test_rejects_bad_ranges(self, db_session):
+        with pytest.raises(ValueError):
+            HumanDesignTransitService.intervals_between(db_session, date(2024, 4, 2), date(2024, 4, 1))
+        with pytest.raises(ValueError):
+            HumanDesignTransitService.intervals_between(
+                db_session, date(2024, 4, 1), date(2024, 4, 2), bodies=['chiron']
+            )
+        assert db_session.query(HDTransitMonth).count() == 0
+        with pytest.raises(ValueError):
+            HumanDesignTransitService.intervals_between(db_session, date(2024, 4, 1), date(2024, 4, 2), level='color')
@@ -286,7 +286,8 @@ class TestVedicChartWithWesternAspects:
 
                 # Verify valid pattern types
                 assert pattern['pattern_type'] in [
-                    'grand_trine', 't_square', 'grand_cross', 'yod', 'stellium'
+                    'grand_trine', 't_square', 'grand_cross', 'yod', 'stellium',
+                    'kite', 'mystic_rectangle'
                 ]
 
 
@@ -0,0 +1,138 @@
+"""
+Tests for the content-addressed natal computation cache
+"""
+import asyncio
+
+import pytest
+
+from app.models import BirthData, NatalChartCache
+from app.services.natal_cache_service import NatalCacheService
+
+
+@pytest.fixture
+def birth_data(db_session):
+    record = BirthData(
+        name="Cache Test",
+        birth_date="1990-01-15",
+        birth_time="14:30:00",
+        time_unknown=False,
+        latitude=40.7128,
+        longitude=-74.0060,
+        timezone="America/New_York",
+        utc_offset=-300,
+    )
+    db_session.add(record)
+    db_session.commit()
+    return record
+
+
+@pytest.fixture(autouse=True)
+def empty_memory_tier():
+    NatalCacheService.clear()
+    yield
+    NatalCacheService.clear()
+
+
+class CountingCompute:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return {'planets': {'sun': {'longitude': 294.5}}}
+
+
+@pytest.mark.unit
+class TestNatalCacheService:
+
+    def test_memory_hit_skips_compute(self, db_session, birth_data):
+        compute = CountingCompute()
+        first = NatalCacheService.get_or_compute(db_session, birth_data, 'western', compute, zodiac='tropical')
+        second = NatalCacheService.get_or_compute(db_session, birth_data, 'western', compute, zodiac='tropical')
+
+        assert compute.calls == 1
+        assert first == second
+
+    def test_returned_data_is_a_copy(self, db_session, birth_data):
+        compute = CountingCompute()
+        data = NatalCacheService.get_or_compute(db_session, birth_data, 'western', compute)
+        data['planets']['sun']['longitude'] = 0
+
+        again = NatalCacheService.get_or_compute(db_session, birth_data, 'western', compute)
+        assert again['planets']['sun']['longitude'] == 294.5
+
+    def test_stored_data_is_a_copy(self, db_session, birth_data):
+        data = {'planets': {'sun': {'longitude': 294.5}}}
+        NatalCacheService.store(db_session, birth_data, 'western', data)
+        data['planets']['sun']['longitude'] = 0
+
+        cached = NatalCacheService.lookup(db_session, birth_data, 'western')
+        assert cached['planets']['sun']['longitude'] == 294.5
+
+    def test_sqlite_tier_survives_memory_clear(self, db_session, birth_data):
+        compute = CountingCompute()
+        NatalCacheService.get_or_compute(db_session, birth_data, 'western', compute)
+        NatalCacheService.clear()
+        NatalCacheService.get_or_compute(db_session, birth_data, 'western', compute)
+
+        assert compute.calls == 1
+        assert db_session.query(NatalChartCache).count() == 1
+
+    def test_parameters_are_part_of_key(self, db_session, birth_data):
+        compute = CountingCompute()
+        NatalCacheService.get_or_compute(db_session, birth_data, 'western', compute, zodiac='tropical')
+        NatalCacheService.get_or_compute(db_session, birth_data, 'western', compute, zodiac='sidereal')
+        NatalCacheService.get_or_compute(db_session, birth_data, 'vedic', compute, zodiac='sidereal')
+
+        assert compute.calls == 3
+
+    def test_birth_data_change_changes_key(self, birth_data):
+        key = NatalCacheService.make_key(birth_data, 'western', zodiac='tropical')
+        birth_data.birth_time = "14:31:00"
+
+        assert NatalCacheService.make_key(birth_data, 'western', zodiac='tropical') != key
+
+    def test_invalidate_drops_both_tiers(self, db_session, birth_data):
+        compute = CountingCompute()
+        NatalCacheService.get_or_compute(db_session, birth_data, 'western', compute)
+
+        assert NatalCacheService.invalidate(birth_data.id, db_session) == 1
+        db_session.commit()
+        assert db_session.query(NatalChartCache).count() == 0
+
+        NatalCacheService.get_or_compute(db_session, birth_data, 'western', compute)
+        assert compute.calls == 2
+
+    def test_async_variant_shares_tiers(self, db_session, birth_data):
+        compute = CountingCompute()
+
+        async def compute_async():
+            return compute()
+
+        loop = asyncio.new_event_loop()
+        try:
+            first = loop.run_until_complete(
+                NatalCacheService.get_or_compute_async(db_session, birth_data, 'western', compute_async)
+            )
+        finally:
+            loop.close()
+        second = NatalCacheService.get_or_compute(db_session, birth_data, 'western', compute)
+
+        assert compute.calls == 1
+        assert first == second
+
+    def test_store_leaves_caller_session_uncommitted(self, db_session, birth_data):
+        birth_data.name = "Renamed"
+        NatalCacheService.get_or_compute(db_session, birth_data, 'western', CountingCompute())
+        db_session.rollback()
+
+        assert db_session.query(NatalChartCache).count() == 1
+        assert db_session.get(BirthData, birth_data.id).name == "Cache Test"
+
+    def test_store_leaves_flushed_changes_to_the_caller(self, db_session, birth_data):
+        birth_data.name = "Renamed"
+        db_session.flush()
+        NatalCacheService.get_or_compute(db_session, birth_data, 'western', CountingCompute())
+        db_session.rollback()
+
+        assert db_session.get(BirthData, birth_data.id).name == "Cache Test"
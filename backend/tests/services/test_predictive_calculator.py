@@ -0,0 +1,97 @@
+"""
+Tests for progressions, solar arc directions and return search
+"""
+import time
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from app.services.exact_event_calculator import ExactEventCalculator
+from app.services.predictive_calculator import PredictiveChartCalculator
+from app.utils.ephemeris import EphemerisCalculator
+
+BIRTH = datetime(1980, 5, 17, 9, 45)
+LAT, LON, OFFSET = 40.7, -74.0, -240
+
+
+@pytest.mark.unit
+class TestProgressedDays:
+
+    def test_day_for_a_year(self):
+        natal_jd = 2444377.0
+        progressed = PredictiveChartCalculator.progressed_julian_days(
+            natal_jd, [natal_jd, natal_jd + 10 * PredictiveChartCalculator.TROPICAL_YEAR]
+        )
+
+        assert progressed.tolist() == pytest.approx([natal_jd, natal_jd + 10])
+
+    def test_returns_need_sun_or_moon(self):
+        with pytest.raises(ValueError):
+            PredictiveChartCalculator.find_returns('mars', 0.0, 2451545.0, 2451645.0)
+
+
+@pytest.mark.ephemeris
+class TestProgressions:
+
+    def test_solar_arc_directs_every_point(self):
+        results = PredictiveChartCalculator.calculate_progressions(
+            BIRTH, LAT, LON, OFFSET, [datetime(2010, 5, 17), datetime(2020, 5, 17)]
+        )
+        natal_jd = EphemerisCalculator.datetime_to_julian_day(BIRTH, OFFSET)
+        natal_sun = EphemerisCalculator.calculate_positions_batch([natal_jd], ['sun']).longitude[0, 0]
+
+        for result, years in zip(results, (30, 40)):
+            arc = result['solar_arc']['arc']
+            assert result['planets']['sun']['longitude'] == pytest.approx((natal_sun + arc) % 360)
+            # The Sun moves about a degree a day, so a degree a year of arc
+            assert arc == pytest.approx(years, abs=2.0)
+            assert result['solar_arc']['directed']['sun'] == pytest.approx(result['planets']['sun']['longitude'])
+
+    def test_progressed_date_is_days_after_birth(self):
+        result = PredictiveChartCalculator.calculate_progressions(
+            BIRTH, LAT, LON, OFFSET, [datetime(2010, 5, 17, 13, 45)]
+        )[0]
+
+        assert result['progressed_datetime'].startswith('1980-06-16')
+
+
+@pytest.mark.ephemeris
+class TestReturns:
+
+    def test_lunar_returns_match_crossing_search(self):
+        natal_jd = EphemerisCalculator.datetime_to_julian_day(BIRTH, OFFSET)
+        moon = EphemerisCalculator.calculate_positions_batch([natal_jd], ['moon']).longitude[0, 0]
+        start = EphemerisCalculator.datetime_to_julian_day(datetime(2020, 1, 1))
+        end = EphemerisCalculator.datetime_to_julian_day(datetime(2022, 1, 1))
+
+        returns = PredictiveChartCalculator.find_returns('moon', moon, start, end)
+        reference = [c['jd'] for c in ExactEventCalculator.find_longitude_crossings('moon', moon, start, end)]
+
+        assert len(returns) == len(reference)
+        assert np.max(np.abs(returns - np.array(reference))) < 1e-5
+
+    def test_solar_returns_are_exact(self):
+        returns = PredictiveChartCalculator.calculate_returns(
+            BIRTH, LAT, LON, OFFSET, 'sun', datetime(2000, 1, 1), datetime(2010, 1, 1), include_charts=True
+        )
+        natal_jd = EphemerisCalculator.datetime_to_julian_day(BIRTH, OFFSET)
+        natal_sun = EphemerisCalculator.calculate_positions_batch([natal_jd], ['sun']).longitude[0, 0]
+
+        assert len(returns) == 10
+        for result in returns:
+            assert result['datetime'][5:10] in ('05-16', '05-17', '05-18')
+            assert result['planets']['sun']['longitude'] == pytest.approx(natal_sun, abs=1e-5)
+            assert len(result['houses']['cusps']) == 12
+
+    @pytest.mark.slow
+    def test_fifty_years_of_lunar_returns(self):
+        started = time.perf_counter()
+        returns = PredictiveChartCalculator.calculate_returns(
+            BIRTH, LAT, LON, OFFSET, 'moon', datetime(2000, 1, 1), datetime(2050, 1, 1)
+        )
+
+        assert time.perf_counter() - started < 1.0
+        assert 665 <= len(returns) <= 670
+        gaps = np.diff([r['julian_day'] for r in returns])
+        assert gaps.min() > 27.0 and gaps.max() < 27.7
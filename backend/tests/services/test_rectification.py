@@ -0,0 +1,109 @@
+"""
+Tests for birth time rectification
+"""
+from datetime import date, datetime
+
+import numpy as np
+import pytest
+
+from app.services.exact_event_calculator import ExactEventCalculator
+from app.services.rectification_service import RectificationService
+from app.utils.ephemeris import EphemerisCalculator
+
+
+pytestmark = pytest.mark.ephemeris
+
+LATITUDE, LONGITUDE, OFFSET = 40.71, -74.0, -240
+BIRTH = datetime(1985, 6, 15, 14, 37)
+
+
+@pytest.fixture(scope='module')
+def timed_events():
+    """Events dated by transits squaring the angles of the true birth time"""
+    natal_jd = EphemerisCalculator.datetime_to_julian_day(BIRTH, OFFSET)
+    houses = EphemerisCalculator.calculate_houses(natal_jd, LATITUDE, LONGITUDE)
+    start = EphemerisCalculator.datetime_to_julian_day(datetime(1995, 1, 1))
+    end = EphemerisCalculator.datetime_to_julian_day(datetime(2020, 1, 1))
+
+    events = []
+    for body in ['jupiter', 'saturn', 'uranus', 'neptune', 'pluto']:
+        for angle in ['ascendant', 'mc']:
+            hits = ExactEventCalculator.find_aspect_hits(body, houses[angle], 90.0, start, end)
+            if hits:
+                day = EphemerisCalculator.julian_day_to_datetime(hits[0]['jd']).date()
+                events.append({
+                    'id': f'{body}-{angle}',
+                    'title': f'{body} square {angle}',
+                    'date': datetime.combine(day, datetime.min.time()).replace(hour=12),
+                    'importance': 'major',
+                })
+    return events
+
+
+@pytest.fixture(scope='module')
+def updates(timed_events):
+    return list(RectificationService.iter_rectification(
+        BIRTH.date(), LATITUDE, LONGITUDE, OFFSET, timed_events
+    ))
+
+
+def test_angles_match_swiss_ephemeris(timed_events):
+    grid = RectificationService.build_grid(
+        BIRTH.date(), LATITUDE, LONGITUDE, OFFSET, timed_events, step_minutes=5
+    )
+
+    assert grid.size == 288
+    for index in (0, 100, 287):
+        houses = EphemerisCalculator.calculate_houses(grid.jds[index], LATITUDE, LONGITUDE)
+        assert abs(ExactEventCalculator.wrap180(grid.angles[index, 0] - houses['ascendant'])) < 1e-3
+        assert abs(ExactEventCalculator.wrap180(grid.angles[index, 1] - houses['mc'])) < 1e-3
+
+
+def test_hard_aspect_orb():
+    orbs = RectificationService.hard_aspect_orb(np.array([0.5, -0.5, 91.0, 179.0, -268.0, 45.0]))
+
+    assert orbs.tolist() == pytest.approx([0.5, 0.5, 1.0, 1.0, 2.0, 45.0])
+
+
+def test_recovers_birth_time(updates, timed_events):
+    result = updates[-1]['result']
+    best = result['candidates'][0]
+
+    assert len(timed_events) >= 5
+    assert result['candidate_count'] == 1440
+    assert len(result['scores']) == 1440
+    assert abs(int(best['time'][:2]) * 60 + int(best['time'][3:]) - (14 * 60 + 37)) <= 3
+    assert {hit['event_id'] for hit in best['hits'] if hit['technique'] == 'transits'} == \
+        {event['id'] for event in timed_events}
+    assert len(best['cusps']) == 12
+
+
+def test_progress_stream(updates):
+    progress = [update['progress'] for update in updates]
+
+    assert progress == sorted(progress)
+    assert updates[-1]['stage'] == 'done'
+    assert {update['stage'] for update in updates[:-1]} == {'ephemeris', *RectificationService.TECHNIQUES}
+
+
+def test_ranked_candidates_are_separated(updates):
+    candidates = updates[-1]['result']['candidates']
+    minutes = [int(c['time'][:2]) * 60 + int(c['time'][3:]) for c in candidates]
+    scores = [c['score'] for c in candidates]
+
+    assert len(candidates) == 5
+    assert scores == sorted(scores, reverse=True)
+    assert min(abs(a - b) for i, a in enumerate(minutes) for b in minutes[i + 1:]) >= \
+        RectificationService.MIN_SEPARATION_MINUTES
+
+
+def test_rejects_bad_input(timed_events):
+    early = [{'date': datetime(1980, 1, 1), 'importance': 'major'}]
+
+    with pytest.raises(ValueError):
+        RectificationService.rectify(BIRTH.date(), LATITUDE, LONGITUDE, OFFSET, early)
+    with pytest.raises(ValueError):
+        RectificationService.rectify(date(1985, 6, 15), 70.0, LONGITUDE, OFFSET, timed_events)
+    with pytest.raises(ValueError):
+        RectificationService.rectify(BIRTH.date(), LATITUDE, LONGITUDE, OFFSET, timed_events,
+                                     house_system='nonexistent')
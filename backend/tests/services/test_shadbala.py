@@ -0,0 +1,180 @@
+"""
+Tests for the Shadbala calculator
+"""
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from app.services.shadbala_calculator import (
+    BALAS,
+    NAISARGIKA_VIRUPAS,
+    PLANETS,
+    ShadbalaCalculator,
+    _obliquity,
+)
+from app.services.vedic_calculator import VedicChartCalculator
+from app.utils.ephemeris import EphemerisCalculator
+
+
+def score(longitudes, latitudes=None, jd=2451545.0, ascendant=0.0, mc=270.0, armc=0.0):
+    """Score one sample of sidereal longitudes with fixed angles"""
+    longitudes = np.array([longitudes], dtype=np.float64)
+    if latitudes is None:
+        latitudes = np.zeros_like(longitudes)
+    # Sun at 1 AU, the rest farther out so heliocentric vectors are defined
+    distances = np.array([[1.0, 0.0026, 1.5, 1.0, 5.2, 0.7, 9.5]])
+    return ShadbalaCalculator.score_positions(
+        jds=[jd], longitudes=longitudes, latitudes=np.array(latitudes, ndmin=2),
+        distances=distances, ayanamsa=[24.0], ascendant=[ascendant], mc=[mc],
+        armc=[armc], geo_latitude=28.6, geo_longitude=77.2,
+    )
+
+
+def column(planet):
+    return PLANETS.index(planet)
+
+
+@pytest.mark.unit
+class TestSthanaBala:
+
+    def test_uchcha_full_at_exaltation_zero_at_debilitation(self):
+        # Sun exalted at 10° Aries, Saturn debilitated at 20° Aries
+        series = score([10.0, 100.0, 150.0, 200.0, 250.0, 300.0, 20.0])
+
+        assert series.parts['uchcha'][0, column('sun')] == pytest.approx(60.0)
+        assert series.parts['uchcha'][0, column('saturn')] == pytest.approx(0.0)
+
+    def test_saptavargaja_own_and_moolatrikona(self):
+        # Sun at 15° Leo is in moolatrikona in the rasi
+        series = score([135.0, 100.0, 150.0, 200.0, 250.0, 300.0, 20.0])
+        with_moolatrikona = series.parts['saptavargaja'][0, column('sun')]
+
+        # At 25° Leo it is only in its own sign
+        series = score([145.0, 100.0, 150.0, 200.0, 250.0, 300.0, 20.0])
+        own_sign = series.parts['saptavargaja'][0, column('sun')]
+
+        assert with_moolatrikona > own_sign
+        assert 30.0 <= own_sign <= 7 * 45.0
+
+    def test_kendradi_and_drekkana(self):
+        # Aries rising: Sun in the 1st (kendra), Moon in the 2nd, Mars in the 3rd
+        series = score([5.0, 45.0, 75.0, 200.0, 250.0, 300.0, 20.0])
+
+        assert series.parts['kendradi'][0, :3].tolist() == [60.0, 30.0, 15.0]
+        # Sun (male) in the first decanate, Moon (female) in the second
+        assert series.parts['drekkana'][0, column('sun')] == 15.0
+        assert series.parts['drekkana'][0, column('moon')] == 0.0
+
+    def test_ojayugmarasyamsa_parity(self):
+        # 1° Aries: odd sign, Aries navamsa; 31° (1° Taurus): even sign, Capricorn navamsa
+        series = score([1.0, 31.0, 31.0, 200.0, 250.0, 300.0, 20.0])
+
+        assert series.parts['ojayugmarasyamsa'][0, column('sun')] == 30.0
+        assert series.parts['ojayugmarasyamsa'][0, column('moon')] == 30.0
+        assert series.parts['ojayugmarasyamsa'][0, column('mars')] == 0.0
+
+
+@pytest.mark.unit
+class TestOtherBalas:
+
+    def test_dig_bala_from_angles(self):
+        # Jupiter on the ascendant, Saturn on the descendant, Sun at the IC
+        series = score([90.0, 100.0, 150.0, 200.0, 0.0, 300.0, 180.0], ascendant=0.0, mc=270.0)
+
+        assert series.balas['dig'][0, column('jupiter')] == pytest.approx(60.0)
+        assert series.balas['dig'][0, column('saturn')] == pytest.approx(60.0)
+        assert series.balas['dig'][0, column('sun')] == pytest.approx(0.0)
+
+    def test_paksha_bala_at_full_moon(self):
+        series = score([0.0, 180.0, 150.0, 200.0, 250.0, 300.0, 20.0])
+        paksha = series.parts['paksha'][0]
+
+        # Benefics full, malefics empty; the Moon's is doubled
+        assert paksha[column('jupiter')] == pytest.approx(60.0)
+        assert paksha[column('saturn')] == pytest.approx(0.0)
+        assert paksha[column('moon')] == pytest.approx(120.0)
+
+    def test_one_lord_each_for_time_parts(self):
+        series = score([0.0, 180.0, 150.0, 200.0, 250.0, 300.0, 20.0])
+
+        for name, virupas in [('abda', 15.0), ('masa', 30.0), ('vara', 45.0), ('hora', 60.0)]:
+            assert sorted(series.parts[name][0].tolist()) == [0.0] * 6 + [virupas]
+
+    def test_chesta_full_at_retrograde_opposition(self):
+        # Mars opposite the Sun at its closest, Jupiter conjunct the Sun
+        series = score([0.0, 100.0, 180.0, 200.0, 0.0, 300.0, 20.0])
+
+        assert series.balas['chesta'][0, column('mars')] == pytest.approx(60.0)
+        assert series.balas['chesta'][0, column('jupiter')] == pytest.approx(0.0)
+
+    def test_naisargika_is_fixed(self):
+        series = score([0.0, 100.0, 150.0, 200.0, 250.0, 300.0, 20.0])
+
+        assert series.balas['naisargika'][0].tolist() == NAISARGIKA_VIRUPAS.tolist()
+        assert series.balas['naisargika'][0, column('sun')] == 60.0
+
+    def test_drik_bala_special_aspects(self):
+        # Saturn 90° behind Mars casts its full 10th-house aspect on it;
+        # 10° behind it casts none
+        aspecting = score([100.0, 110.0, 0.0, 120.0, 5.0, 35.0, 90.0])
+        clear = score([100.0, 110.0, 0.0, 120.0, 5.0, 35.0, 350.0])
+
+        drik = aspecting.balas['drik'][0, column('mars')] - clear.balas['drik'][0, column('mars')]
+        assert drik == pytest.approx(-60.0 / 4)
+
+    def test_yuddha_moves_strength_between_planets(self):
+        # Mars and Jupiter within a degree; Jupiter further north wins
+        series = score(
+            [0.0, 100.0, 200.0, 300.0, 200.5, 50.0, 20.0],
+            latitudes=[0.0, 0.0, -1.0, 0.0, 1.0, 0.0, 0.0]
+        )
+        yuddha = series.parts['yuddha'][0]
+
+        assert yuddha[column('jupiter')] > 0
+        assert yuddha[column('jupiter')] == pytest.approx(-yuddha[column('mars')])
+
+
+@pytest.mark.ephemeris
+class TestShadbalaCalculation:
+
+    @pytest.fixture(scope='class')
+    def chart(self):
+        return VedicChartCalculator.calculate_vedic_chart(
+            datetime(1990, 1, 15, 14, 30), 40.7128, -74.0060, timezone_offset_minutes=-300
+        )
+
+    def test_natal_result(self, chart):
+        result = ShadbalaCalculator.calculate(chart)
+
+        assert set(result['planets']) == set(PLANETS)
+        assert sorted(p['rank'] for p in result['planets'].values()) == list(range(1, 8))
+        sun = result['planets']['sun']
+        assert sum(sun[f'{name}_bala'] for name in BALAS) == pytest.approx(sun['total_virupas'], abs=0.05)
+        # Born on a Monday
+        assert result['planets']['moon']['kala_parts']['vara'] == 45.0
+
+    def test_vectorized_angles_match_swiss_ephemeris(self, chart):
+        jd = chart['calculation_info']['julian_day']
+        houses = EphemerisCalculator.calculate_houses(jd, 40.7128, -74.0060, 'placidus')
+        armc = EphemerisCalculator.armc_at(np.array([jd]), -74.0060)
+        ascendant, mc = EphemerisCalculator.angles_from_armc(armc, 40.7128, _obliquity(np.array([jd])))
+
+        assert armc[0] == pytest.approx(houses['armc'], abs=1e-4)
+        assert ascendant[0] == pytest.approx(houses['ascendant'], abs=1e-4)
+        assert mc[0] == pytest.approx(houses['mc'], abs=1e-4)
+
+    def test_series_first_sample_matches_natal(self, chart):
+        natal = ShadbalaCalculator.calculate(chart)
+        series = ShadbalaCalculator.strength_series(
+            datetime(1990, 1, 15, 14, 30), datetime(1990, 2, 14, 14, 30),
+            40.7128, -74.0060, timezone_offset_minutes=-300
+        )
+
+        assert series.rupas.shape == (30, 7)
+        for col, planet in enumerate(PLANETS):
+            assert series.rupas[0, col] == pytest.approx(natal['planets'][planet]['total_rupas'], abs=0.02)
+
+    def test_rejects_bad_step(self):
+        with pytest.raises(ValueError):
+            ShadbalaCalculator.strength_series(datetime(2024, 1, 1), datetime(2024, 2, 1), 0.0, 0.0, step_days=0)
@@ -0,0 +1,118 @@
+"""
+Tests for the synastry and composite chart calculator
+"""
+import random
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from app.services.aspect_engine import AspectEngine
+from app.services.chart_calculator import NatalChartCalculator
+from app.services.synastry_calculator import SynastryCalculator, SynastryCharts
+from app.utils.ephemeris import EphemerisCalculator
+
+
+def _births(count: int):
+    rng = random.Random(5)
+    return [
+        {
+            'birth_datetime': datetime(1960, 1, 1) + timedelta(minutes=rng.randrange(0, 60 * 24 * 365 * 40)),
+            'latitude': rng.uniform(-50, 50),
+            'longitude': rng.uniform(-170, 170),
+            'timezone_offset_minutes': 0,
+        }
+        for _ in range(count)
+    ]
+
+
+@pytest.mark.unit
+class TestSynastryMath:
+
+    def test_midpoints_take_shorter_arc(self):
+        midpoints = SynastryCalculator.midpoints(np.array([350.0, 10.0, 100.0]), np.array([10.0, 350.0, 140.0]))
+
+        assert midpoints.tolist() == pytest.approx([0.0, 0.0, 120.0])
+
+    def test_cross_aspects_match_pairwise_reference(self):
+        rng = random.Random(3)
+        a = [rng.uniform(0, 360) for _ in range(14)]
+        b = [rng.uniform(0, 360) for _ in range(14)]
+        aspect_set = NatalChartCalculator._build_aspect_set(include_minor_aspects=True)
+
+        records = AspectEngine.find_cross_aspects(a, b, aspect_set)
+        found = [(i, j, list(aspect_set)[t]) for i, j, t in zip(records['i'], records['j'], records['type'])]
+
+        expected = [
+            (i, j, name)
+            for i in range(14) for j in range(14) for name, info in aspect_set.items()
+            if EphemerisCalculator.calculate_aspect(a[i], b[j], info['angle'], info['orb'])
+        ]
+        assert found == expected
+
+    def test_score_matrix_ranks_exact_aspects_higher(self):
+        aspect_set = NatalChartCalculator._build_aspect_set()
+        subject = np.array([0.0, 200.0])
+        candidates = np.array([
+            [120.0, 320.0],    # two exact trines
+            [124.0, np.nan],   # one trine 4° wide, one point missing
+            [40.0, 250.0],     # no aspects
+        ])
+
+        scores = SynastryCalculator.score_matrix(subject, candidates, aspect_set)
+
+        assert scores['score'].tolist() == pytest.approx([2.0, 0.5, 0.0])
+        assert scores['harmonious'].tolist() == pytest.approx([2.0, 0.5, 0.0])
+        assert scores['aspect_count'].tolist() == [2, 1, 0]
+
+    def test_house_overlays_skip_unknown_time(self):
+        charts = SynastryCharts(
+            points=['sun', 'moon', 'ascendant', 'mc'],
+            longitudes=np.array([[15.0, 95.0, 0.0, 270.0], [200.0, 10.0, np.nan, np.nan]]),
+            cusps=np.array([[30.0 * h for h in range(12)], [np.nan] * 12]),
+            has_time=np.array([True, False]),
+        )
+
+        assert SynastryCalculator.house_overlays(charts, 1, 0) == {'sun': 7, 'moon': 1}
+        assert SynastryCalculator.house_overlays(charts, 0, 1) is None
+
+
+@pytest.mark.ephemeris
+class TestSynastryCharts:
+
+    def test_positions_match_natal_chart(self):
+        birth = _births(1)[0]
+        charts = SynastryCalculator.calculate_charts([birth])
+        natal = NatalChartCalculator.calculate_natal_chart(
+            birth['birth_datetime'], birth['latitude'], birth['longitude'], 0
+        )
+
+        for col, point in enumerate(charts.points):
+            if point in ('ascendant', 'mc'):
+                assert charts.longitudes[0, col] == pytest.approx(natal['houses'][point])
+            elif natal['planets'][point] is None:
+                assert np.isnan(charts.longitudes[0, col])
+            else:
+                assert charts.longitudes[0, col] == pytest.approx(natal['planets'][point]['longitude'])
+        assert charts.cusps[0].tolist() == pytest.approx(natal['houses']['cusps'])
+
+    def test_ranking_agrees_with_pair_scores(self):
+        births = _births(6)
+        ranking = SynastryCalculator.rank_against(births[0], births[1:])
+        synastry = SynastryCalculator.calculate_synastry(births)
+
+        pair_scores = {p['person2'] - 1: p['score']['score'] for p in synastry['pairs'] if p['person1'] == 0}
+        assert [entry['index'] for entry in ranking] == sorted(pair_scores, key=lambda i: -pair_scores[i])
+        for entry in ranking:
+            assert entry['score'] == pytest.approx(pair_scores[entry['index']])
+
+    def test_unknown_time_drops_angles(self):
+        births = _births(2)
+        births[1]['has_time'] = False
+
+        pair = SynastryCalculator.calculate_synastry(births)['pairs'][0]
+
+        assert pair['house_overlays']['person2_in_person1'] is not None
+        assert pair['house_overlays']['person1_in_person2'] is None
+        assert pair['composite']['houses'] is None
+        assert not any(a['planet2'] in ('ascendant', 'mc') for a in pair['aspects'])
@@ -0,0 +1,96 @@
+"""
+Tests for the interval-based transit timeline
+"""
+import pytest
+from datetime import datetime
+
+from app.services.chart_calculator import NatalChartCalculator
+from app.services.exact_event_calculator import ExactEventCalculator
+from app.services.transit_calculator import TransitCalculator
+from app.utils.ephemeris import EphemerisCalculator
+
+
+@pytest.fixture
+def natal_planets(sample_birth_data_1):
+    chart = NatalChartCalculator.calculate_natal_chart(
+        birth_datetime=sample_birth_data_1['birth_time'],
+        latitude=sample_birth_data_1['latitude'],
+        longitude=sample_birth_data_1['longitude'],
+        timezone_offset_minutes=sample_birth_data_1['timezone_offset'],
+    )
+    return chart['planets']
+
+
+@pytest.mark.ephemeris
+class TestTransitIntervals:
+    """calculate_transit_intervals behaviour"""
+
+    def test_interval_boundaries_sit_on_orb(self, natal_planets):
+        """Refined entry/exit times should be at the orb edge, exact at zero"""
+        intervals = TransitCalculator.calculate_transit_intervals(
+            natal_planets, datetime(2025, 1, 1), datetime(2025, 3, 1),
+            transit_bodies=['moon', 'mars', 'saturn']
+        )
+        assert intervals
+
+        for interval in intervals:
+            state = ExactEventCalculator.state_function(interval['transit_planet'])
+
+            def deviation(jd):
+                return abs(ExactEventCalculator.wrap180(state(jd)[0] - interval['aspect_longitude']))
+
+            if not interval['begins_before_range']:
+                assert deviation(interval['entry_jd']) == pytest.approx(interval['orb'], abs=0.01)
+            if not interval['ends_after_range']:
+                assert deviation(interval['exit_jd']) == pytest.approx(interval['orb'], abs=0.01)
+            for jd in interval['exact_jds']:
+                assert interval['entry_jd'] <= jd <= interval['exit_jd']
+                assert deviation(jd) < 0.01
+
+    def test_timeline_matches_daily_snapshots(self, natal_planets):
+        """A timeline day should list the same transits as a direct snapshot"""
+        day = datetime(2025, 4, 11)
+        timeline = TransitCalculator.calculate_transit_timeline(
+            natal_planets, datetime(2025, 4, 1), datetime(2025, 4, 20)
+        )
+        entry = next(d for d in timeline if d['date'].startswith('2025-04-11'))
+
+        snapshot = TransitCalculator.calculate_current_transits(natal_planets, day, orb_multiplier=0.8)
+        expected = {
+            (t['transit_planet'], t['natal_planet'], t['aspect'])
+            for t in snapshot['transits']
+            if t['significance'] in ['major', 'significant', 'moderate']
+        }
+        actual = {(t['transit_planet'], t['natal_planet'], t['aspect']) for t in entry['transits']}
+        assert actual == expected
+
+    def test_empty_range(self, natal_planets):
+        assert TransitCalculator.calculate_transit_intervals(
+            natal_planets, datetime(2025, 1, 2), datetime(2025, 1, 1)
+        ) == []
+
+    def test_only_refined_bodies_use_the_cache(self, natal_planets, monkeypatch):
+        """Interpolated crossings are not refined, so their samples must be exact"""
+        batch = EphemerisCalculator.calculate_positions_batch
+        use_cache = {}
+
+        def recording_batch(jds, body_ids, **kwargs):
+            use_cache[body_ids[0]] = kwargs.get('use_cache', False)
+            return batch(jds, body_ids, **kwargs)
+
+        monkeypatch.setattr(EphemerisCalculator, 'calculate_positions_batch', recording_batch)
+        TransitCalculator.calculate_transit_intervals(
+            natal_planets, datetime(2025, 1, 1), datetime(2025, 1, 15),
+            transit_bodies=['moon', 'venus', 'mars', 'saturn']
+        )
+
+        assert use_cache == {'moon': False, 'venus': False, 'mars': True, 'saturn': True}
+
+
+@pytest.mark.unit
+class TestSignificanceNames:
+    """Lookup tables use display names; calculations use lowercase IDs"""
+
+    def test_body_ids_resolve_to_significance(self):
+        assert TransitCalculator._get_significance('pluto', 'sun', 'square') == 'major'
+        assert TransitCalculator._get_significance('north_node', 'mars', 'trine') == 'moderate'
@@ -0,0 +1,175 @@
+"""
+Tests for the divisional chart (varga) engine and Vimshopaka bala
+"""
+from datetime import datetime
+from uuid import uuid4
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.chart import ChartCalculationRequest
+from app.schemas.yogas import YogasFromChartRequest, YogasRequest
+from app.services.varga_engine import (
+    SHODASHAVARGA,
+    VIMSHOPAKA_PLANETS,
+    VIMSHOPAKA_SCHEMES,
+    VargaEngine,
+)
+from app.services.vedic_calculator import VedicChartCalculator
+
+
+def varga_sign(longitude, division):
+    return int(VargaEngine.calculate([longitude], [division]).signs[0, 0])
+
+
+@pytest.mark.unit
+class TestVargaPositions:
+
+    @pytest.mark.parametrize('longitude,division,expected', [
+        # Hora: odd signs Leo then Cancer, even signs Cancer then Leo
+        (5.0, 2, 4), (20.0, 2, 3), (35.0, 2, 3), (50.0, 2, 4),
+        # Drekkana: 1st, 5th, 9th from the sign
+        (12.0, 3, 4), (25.0, 3, 8), (40.0, 3, 5),
+        # Chaturthamsa: 1st, 4th, 7th, 10th from the sign
+        (8.0, 4, 3), (59.0, 4, 10),
+        # Saptamsa: even signs count from the 7th
+        (1.0, 7, 0), (31.0, 7, 7),
+        # Dasamsa: even signs count from the 9th
+        (1.0, 10, 0), (31.0, 10, 9),
+        # Dwadasamsa counts from the sign itself
+        (31.0, 12, 1), (59.0, 12, 0),
+        # Shodasamsa: movable Aries, fixed Leo, dual Sagittarius
+        (1.0, 16, 0), (31.0, 16, 4), (61.0, 16, 8),
+        # Vimsamsa: movable Aries, fixed Sagittarius, dual Leo
+        (31.0, 20, 8), (61.0, 20, 4),
+        # Chaturvimsamsa: odd signs from Leo, even from Cancer
+        (1.0, 24, 4), (31.0, 24, 3),
+        # Bhamsa: fire Aries, earth Cancer, air Libra, water Capricorn
+        (31.0, 27, 3), (61.0, 27, 6), (91.0, 27, 9),
+        # Khavedamsa: odd signs from Aries, even from Libra
+        (1.0, 40, 1), (31.0, 40, 7),
+        # Akshavedamsa: dual signs from Sagittarius
+        (61.0, 45, 9),
+        # Shashtiamsa counts from the sign itself
+        (31.0, 60, 3),
+    ])
+    def test_parashari_rules(self, longitude, division, expected):
+        assert varga_sign(longitude, division) == expected
+
+    @pytest.mark.parametrize('degree,odd_sign,even_sign', [
+        (3.0, 0, 1),     # Mars / Venus
+        (7.0, 10, 5),    # Saturn (Aquarius) / Mercury (Virgo)
+        (11.0, 8, 5),    # Jupiter (Sagittarius) / Mercury (Virgo)
+        (15.0, 8, 11),   # Jupiter (Sagittarius) / Jupiter (Pisces)
+        (22.0, 2, 9),    # Mercury (Gemini) / Saturn (Capricorn)
+        (27.0, 6, 7),    # Venus (Libra) / Mars (Scorpio)
+    ])
+    def test_trimsamsa_unequal_parts(self, degree, odd_sign, even_sign):
+        assert varga_sign(degree, 30) == odd_sign
+        assert varga_sign(30.0 + degree, 30) == even_sign
+
+    def test_trimsamsa_part_spans_whole_sign(self):
+        # Jupiter's part of an odd sign (10-18°) maps onto all of Sagittarius
+        longitudes = VargaEngine.calculate([10.0, 14.0], [30]).longitudes[:, 0]
+
+        assert longitudes.tolist() == pytest.approx([240.0, 255.0])
+
+    def test_navamsa_matches_classical_formula(self):
+        longitudes = np.random.default_rng(3).uniform(0, 360, 500)
+        positions = VargaEngine.calculate(longitudes, [9])
+
+        sign = (longitudes // 30).astype(int)
+        part = ((longitudes % 30) // (30 / 9)).astype(int)
+        assert positions.signs[:, 0].tolist() == ((sign * 9 + part) % 12).tolist()
+
+    def test_d1_is_identity_and_signs_agree(self):
+        longitudes = np.random.default_rng(5).uniform(0, 360, 300)
+        positions = VargaEngine.calculate(longitudes)
+
+        assert positions.longitudes[:, positions.column(1)] == pytest.approx(longitudes)
+        assert np.array_equal(positions.signs, (positions.longitudes // 30).astype(int) % 12)
+
+    def test_keeps_input_shape(self):
+        positions = VargaEngine.calculate(np.zeros((4, 3)), [9, 30])
+
+        assert positions.longitudes.shape == (4, 3, 2)
+
+    def test_unsupported_division(self):
+        with pytest.raises(ValueError):
+            VargaEngine.calculate([10.0], [5])
+
+    def test_request_schemas_share_division_check(self):
+        assert YogasRequest(birth_data_id='x', division=60).division == 60
+        for schema, fields in (
+            (YogasRequest, {'birth_data_id': 'x', 'division': 5}),
+            (YogasFromChartRequest, {'chart_id': 'x', 'division': 8}),
+            (ChartCalculationRequest, {'birth_data_id': str(uuid4()), 'include_divisional': [9, 11]}),
+        ):
+            with pytest.raises(ValidationError, match='Unsupported divisional charts'):
+                schema(**fields)
+
+
+@pytest.mark.unit
+class TestDivisionalCharts:
+
+    PLANETS = {
+        name: {'longitude': longitude}
+        for name, longitude in zip(VIMSHOPAKA_PLANETS, [125.0, 130.0, 10.0, 150.0, 95.0, 200.0, 290.0])
+    }
+
+    def test_layout_and_whole_sign_houses(self):
+        charts = VargaEngine.divisional_charts(
+            self.PLANETS, [9, 30], {'ascendant': 31.0, 'mc': 280.0, 'cusps': []}
+        )
+
+        assert set(charts) == {'d9', 'd30'}
+        navamsa = charts['d9']
+        assert navamsa['name'] == 'Navamsa (D-9)'
+        assert navamsa['planets']['sun']['sign'] == varga_sign(125.0, 9)
+        assert navamsa['planets']['sun']['sign_name'] == 'Taurus'
+
+        houses = navamsa['houses']
+        first = varga_sign(31.0, 9)
+        assert int(houses['ascendant'] // 30) == first
+        assert houses['cusps'] == [(first * 30.0 + 30.0 * house) % 360.0 for house in range(12)]
+
+    def test_vimshopaka_bala(self):
+        bala = VargaEngine.vimshopaka_bala(self.PLANETS)
+
+        # Sun in Leo owns its D-1 sign
+        assert bala['sun']['varga_points']['d1'] == 20.0
+        # Moon in Leo with the Sun: natural friend, temporal enemy -> neutral
+        assert bala['moon']['varga_points']['d1'] == 10.0
+
+        for scores in bala.values():
+            for scheme in VIMSHOPAKA_SCHEMES:
+                assert 5.0 <= scores[scheme] <= 20.0
+            assert set(scores['varga_points']) == {f'd{division}' for division in SHODASHAVARGA}
+
+    def test_schemes_total_twenty(self):
+        for weights in VIMSHOPAKA_SCHEMES.values():
+            assert sum(weights.values()) == pytest.approx(20.0)
+
+    def test_compound_relationships(self):
+        # All seven in one sign: every temporal relationship is enemy
+        compound = VargaEngine.compound_relationships(np.zeros(7, dtype=int))
+        sun, moon, saturn = 0, 1, 6
+
+        assert compound[sun, moon] == 0
+        assert compound[sun, saturn] == -2
+
+
+@pytest.mark.ephemeris
+class TestVedicChartVargas:
+
+    def test_all_sixteen_vargas(self):
+        chart = VedicChartCalculator.calculate_vedic_chart(
+            datetime(1990, 6, 15, 14, 30), 40.7, -74.0, -240,
+            include_divisional=list(SHODASHAVARGA)
+        )
+
+        assert set(chart['divisional_charts']) == {f'd{division}' for division in SHODASHAVARGA[1:]}
+        moon = chart['d1']['planets']['moon']['longitude']
+        assert chart['divisional_charts']['d9']['planets']['moon']['sign'] == varga_sign(moon, 9)
+        assert set(chart['vimshopaka_bala']) == set(VIMSHOPAKA_PLANETS)
@@ -0,0 +1,138 @@
+"""
+Tests for the rule-compiled yoga engine and YogasCalculator
+"""
+import pytest
+
+from app.services.yoga_engine import (
+    ASCENDANT,
+    GRAHAS,
+    MOON,
+    SUN,
+    Conjunct,
+    Lord,
+    Not,
+    Placed,
+    YogaChart,
+    YogaEngine,
+    YogaRule,
+)
+from app.services.yogas_calculator import YogasCalculator
+
+
+def chart_planets(**signs):
+    """Planets dict with each planet at 15 degrees of the given sign"""
+    return {name: {'sign': sign, 'longitude': sign * 30.0 + 15.0} for name, sign in signs.items()}
+
+
+def yoga_names(result):
+    return [yoga['name'] for yogas in result['yogas'].values() for yoga in yogas]
+
+
+@pytest.mark.unit
+class TestCompilation:
+
+    def test_placement_from_ascendant_is_static(self):
+        compiled = Placed(SUN, (1, 10)).compile(asc_sign=2)
+
+        # Gemini rising: 1st = Gemini, 10th = Pisces
+        assert compiled.required == {0: (1 << 2) | (1 << 11)}
+        assert Placed(ASCENDANT, (1,)).compile(0) is True
+
+    def test_relative_conditions_are_checks(self):
+        check = Conjunct(SUN, MOON).compile(0)
+        same = YogaChart.from_planets(chart_planets(sun=4, moon=4), 0.0)
+        apart = YogaChart.from_planets(chart_planets(sun=4, moon=5), 0.0)
+
+        assert check(same) and not check(apart)
+
+    def test_negated_placement_is_forbidden_mask(self):
+        compiled = Not(Placed(MOON, (1,))).compile(asc_sign=3)
+
+        assert compiled.forbidden == 1 << (1 * 12 + 3)
+
+    def test_rules_are_filtered_per_ascendant(self):
+        # Aries rising: the 1st and 8th lords are both Mars
+        rule = YogaRule(
+            name="Test", sanskrit_name="Test", category='other',
+            conditions=(Placed(Lord(1), (8,)),), planets=(Lord(1),), houses=(1,),
+            description="{p0}", effects="",
+        )
+        engine = YogaEngine([rule])
+        chart = YogaChart.from_planets(chart_planets(mars=7), 0.0)
+
+        assert [yoga['description'] for yoga in engine.detect(chart)] == ['Mars']
+        assert engine.detect(YogaChart.from_planets(chart_planets(mars=6), 0.0)) == []
+
+
+@pytest.mark.unit
+class TestYogaChart:
+
+    def test_nodes_read_from_north_node(self):
+        chart = YogaChart.from_planets(chart_planets(sun=2, north_node=2), 0.0)
+
+        assert chart.signs[GRAHAS.index('rahu')] == 2
+        # Ketu opposite Rahu when not given
+        assert chart.signs[GRAHAS.index('ketu')] == 8
+
+    def test_missing_and_outer_planets_are_ignored(self):
+        chart = YogaChart.from_planets(chart_planets(moon=0, uranus=1), 45.0)
+
+        assert chart.signs[GRAHAS.index('sun')] == -1
+        assert chart.occupancy[1] == 0
+        assert chart.ascendant_sign == 1
+
+
+@pytest.mark.unit
+class TestYogasCalculator:
+
+    def test_gaja_kesari_and_hamsa(self):
+        # Cancer rising, Moon in Aries, Jupiter exalted in Cancer
+        planets = chart_planets(sun=4, moon=0, mars=6, mercury=5, jupiter=3, venus=4, saturn=10)
+        result = YogasCalculator.detect_all_yogas(planets, 95.0)
+
+        gaja = result['yogas']['raja'][0]
+        assert gaja['name'] == 'Gaja Kesari Yoga'
+        assert gaja['houses_involved'] == [10, 1]
+        hamsa = result['yogas']['pancha_mahapurusha']
+        assert [(y['name'], y['strength']) for y in hamsa] == [('Hamsa Yoga', 'strong')]
+        assert result['calculation_info']['ascendant_sign'] == 'Cancer'
+
+    def test_parivartana(self):
+        # Aries rising: Mars (1st lord) in Libra, Venus (7th lord) in Aries
+        planets = chart_planets(sun=3, moon=9, mars=6, mercury=3, jupiter=10, venus=0, saturn=5)
+        names = yoga_names(YogasCalculator.detect_all_yogas(planets, 5.0))
+
+        assert 'Maha Parivartana Yoga (Mars-Venus)' in names
+
+        del planets['venus']
+        names = yoga_names(YogasCalculator.detect_all_yogas(planets, 5.0))
+        assert not any('Parivartana' in name for name in names)
+
+    def test_kemadruma_cancelled_by_jupiter(self):
+        # Taurus rising, Moon alone in Aries (12th); Jupiter in Gemini has no sight on it
+        planets = chart_planets(sun=3, moon=0, mars=5, mercury=3, jupiter=2, venus=3, saturn=9)
+        assert 'Kemadruma Yoga' in yoga_names(YogasCalculator.detect_all_yogas(planets, 35.0))
+
+        # Jupiter in Leo casts its 9th-house sight on Aries
+        planets['jupiter'] = {'sign': 4}
+        assert 'Kemadruma Yoga' not in yoga_names(YogasCalculator.detect_all_yogas(planets, 35.0))
+
+    def test_grahan_yoga_from_north_node(self):
+        planets = chart_planets(sun=2, moon=7, north_node=2)
+        names = yoga_names(YogasCalculator.detect_all_yogas(planets, 0.0))
+
+        assert 'Grahan Yoga (Sun-Rahu)' in names
+
+    def test_outer_planets_do_not_form_sunapha(self):
+        planets = chart_planets(sun=6, moon=0, uranus=1)
+
+        assert 'Sunapha Yoga' not in yoga_names(YogasCalculator.detect_all_yogas(planets, 0.0))
+
+    def test_divisional_yogas(self):
+        planets = chart_planets(sun=4, moon=0, mars=6, mercury=5, jupiter=3, venus=4, saturn=10)
+        houses = {'ascendant': 95.0, 'mc': 5.0}
+        results = YogasCalculator.detect_divisional_yogas(planets, houses, [1, 9])
+
+        assert set(results) == {'d1', 'd9'}
+        assert results['d1'] == YogasCalculator.detect_all_yogas(planets, 95.0)
+        assert results['d9']['total_count'] == sum(len(y) for y in results['d9']['yogas'].values())
@@ -0,0 +1,51 @@
+"""
+Tests for the Dasha timeline endpoints
+"""
+import pytest
+from fastapi import status
+
+from app.models import BirthData
+
+
+@pytest.fixture
+def birth_data(test_db):
+    record = BirthData(
+        birth_date="1990-01-15",
+        birth_time="14:30:00",
+        time_unknown=False,
+        latitude=40.7128,
+        longitude=-74.0060,
+        timezone="America/New_York",
+        utc_offset=-300,
+    )
+    test_db.add(record)
+    test_db.commit()
+    return record
+
+
+@pytest.mark.integration
+@pytest.mark.ephemeris
+class TestDashaDates:
+    """Timezone-aware query dates are taken at the birth place"""
+
+    def test_at_accepts_aware_dates(self, client_with_db, birth_data):
+        aware = client_with_db.get(f"/api/dasha/at/{birth_data.id}", params={'date': '2024-01-01T05:00:00Z'})
+        naive = client_with_db.get(f"/api/dasha/at/{birth_data.id}", params={'date': '2024-01-01T00:00:00'})
+
+        assert aware.status_code == status.HTTP_200_OK
+        assert aware.json() == naive.json()
+
+    def test_periods_accept_aware_dates(self, client_with_db, birth_data):
+        response = client_with_db.get(f"/api/dasha/periods/{birth_data.id}", params={
+            'start': '2024-01-01T00:00:00Z', 'end': '2025-01-01T00:00:00+01:00',
+        })
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()['periods']
+
+    def test_shadbala_series_accepts_aware_dates(self, client_with_db, birth_data):
+        response = client_with_db.get(f"/api/shadbala/dasha-series/{birth_data.id}", params={
+            'level': 'pranadasha', 'at': '2024-01-01T00:00:00Z', 'step_days': 1,
+        })
+
+        assert response.status_code == status.HTTP_200_OK
@@ -0,0 +1,60 @@
+"""
+Tests for reusing dated charts in POST /charts/get-or-create
+"""
+import pytest
+from fastapi import status
+
+from app.models import BirthData
+
+
+@pytest.fixture
+def birth_data(test_db):
+    record = BirthData(
+        birth_date="1990-01-15",
+        birth_time="14:30:00",
+        time_unknown=False,
+        latitude=40.7128,
+        longitude=-74.0060,
+        timezone="America/New_York",
+        utc_offset=-300,
+    )
+    test_db.add(record)
+    test_db.commit()
+    return record
+
+
+@pytest.mark.integration
+@pytest.mark.ephemeris
+class TestGetOrCreateDatedCharts:
+    """Test which stored progressed and return charts are reused"""
+
+    def get_or_create(self, client, birth_data, **fields):
+        response = client.post("/api/charts/get-or-create", json={
+            'birth_data_id': birth_data.id, 'chart_type': 'solar_return',
+            'return_date': '2024-01-01T00:00:00', **fields,
+        })
+        assert response.status_code == status.HTTP_200_OK
+        return response.json()
+
+    def test_same_request_reuses_the_chart(self, client_with_db, birth_data):
+        first = self.get_or_create(client_with_db, birth_data)
+        again = self.get_or_create(client_with_db, birth_data)
+
+        assert again['id'] == first['id']
+
+    def test_relocated_return_is_cast_for_its_place(self, client_with_db, birth_data):
+        home = self.get_or_create(client_with_db, birth_data)
+        london = self.get_or_create(client_with_db, birth_data, return_latitude=51.5074, return_longitude=-0.1278)
+
+        assert london['id'] != home['id']
+        assert london['chart_data']['return_location'] == {'latitude': 51.5074, 'longitude': -0.1278}
+        assert self.get_or_create(client_with_db, birth_data)['id'] == home['id']
+
+    def test_zodiac_and_houses_are_part_of_the_match(self, client_with_db, birth_data):
+        tropical = self.get_or_create(client_with_db, birth_data)
+        sidereal = self.get_or_create(client_with_db, birth_data, zodiac_type='sidereal')
+        koch = self.get_or_create(client_with_db, birth_data, house_system='koch')
+
+        assert len({tropical['id'], sidereal['id'], koch['id']}) == 3
+        assert sidereal['zodiac_type'] == 'sidereal'
+        assert koch['house_system'] == 'koch'
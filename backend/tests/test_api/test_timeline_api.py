@@ -0,0 +1,50 @@
+"""
+Tests for the timeline range endpoint
+"""
+import pytest
+from fastapi import status
+
+from app.models import BirthData
+
+
+@pytest.fixture
+def birth_data(test_db):
+    record = BirthData(
+        birth_date="1990-01-15",
+        birth_time="14:30:00",
+        time_unknown=False,
+        latitude=40.7128,
+        longitude=-74.0060,
+        timezone="America/New_York",
+        utc_offset=-300,
+    )
+    test_db.add(record)
+    test_db.commit()
+    return record
+
+
+@pytest.mark.integration
+@pytest.mark.ephemeris
+class TestTimelineRange:
+    """Test POST /timeline/range"""
+
+    def test_short_range_has_sky_events(self, client_with_db, birth_data):
+        response = client_with_db.post("/api/timeline/range", json={
+            'birth_data_id': birth_data.id, 'start_date': '2024-04-01', 'end_date': '2024-04-30',
+        })
+
+        assert response.status_code == status.HTTP_200_OK
+        points = response.json()['data_points']
+        assert len(points) == 30
+        assert all(point['lunar_phase'] for point in points)
+        assert any(event['type'] == 'eclipse' for point in points for event in point['sky_events'])
+
+    def test_long_range_is_served_without_sky_events(self, client_with_db, birth_data):
+        response = client_with_db.post("/api/timeline/range", json={
+            'birth_data_id': birth_data.id, 'start_date': '2020-01-01', 'end_date': '2024-12-31',
+        })
+
+        assert response.status_code == status.HTTP_200_OK
+        points = response.json()['data_points']
+        assert len(points) == 1827
+        assert all(point['lunar_phase'] is None and point['sky_events'] == [] for point in points)
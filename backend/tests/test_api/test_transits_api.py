@@ -0,0 +1,61 @@
+"""
+Tests for the sky event and electional endpoints
+"""
+import pytest
+from fastapi import status
+
+
+@pytest.mark.integration
+@pytest.mark.ephemeris
+class TestSkyEvents:
+    """Test GET /transits/sky-events"""
+
+    def test_events_in_range(self, client_with_db):
+        response = client_with_db.get("/api/transits/sky-events", params={
+            'start_date': '2024-04-01', 'end_date': '2024-04-30', 'types': 'eclipse',
+        })
+
+        assert response.status_code == status.HTTP_200_OK
+        events = response.json()['events']
+        assert [event['date'][:10] for event in events] == ['2024-04-08']
+
+    def test_by_day(self, client_with_db):
+        response = client_with_db.get("/api/transits/sky-events", params={
+            'start_date': '2024-04-01', 'end_date': '2024-04-07', 'by_day': True,
+        })
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()['days']) == 7
+
+    def test_unknown_type(self, client_with_db):
+        response = client_with_db.get("/api/transits/sky-events", params={
+            'start_date': '2024-04-01', 'end_date': '2024-04-07', 'types': 'comet',
+        })
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.integration
+@pytest.mark.ephemeris
+class TestElectional:
+    """Test POST /transits/electional"""
+
+    def test_search(self, client_with_db):
+        response = client_with_db.post("/api/transits/electional", json={
+            'start_date': '2024-03-01', 'end_date': '2024-06-30',
+            'constraints': [
+                {'type': 'retrograde', 'body': 'mercury'},
+                {'type': 'sign', 'body': 'mercury', 'signs': ['aries']},
+            ],
+        })
+
+        assert response.status_code == status.HTTP_200_OK
+        windows = response.json()['windows']
+        assert [(w['start'][:10], w['end'][:10]) for w in windows] == [('2024-04-01', '2024-04-25')]
+
+    def test_unknown_constraint(self, client_with_db):
+        response = client_with_db.post("/api/transits/electional", json={
+            'start_date': '2024-03-01', 'end_date': '2024-03-05', 'constraints': [{'type': 'comet'}],
+        })
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
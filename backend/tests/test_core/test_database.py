@@ -0,0 +1,90 @@
+"""
+Tests for cache writes alongside a request session
+"""
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.core.database_sqlite import Base, CacheSession
+from app.models import BirthData, NatalChartCache
+
+
+@pytest.fixture
+def file_db(tmp_path):
+    """A session on a file database, shared connection as in the app"""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'test.db'}",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    record = BirthData(
+        name="Cache Test",
+        birth_date="1990-01-15",
+        birth_time="14:30:00",
+        latitude=40.7128,
+        longitude=-74.0060,
+        timezone="America/New_York",
+    )
+    session.add(record)
+    session.commit()
+
+    yield session, record
+
+    session.close()
+    engine.dispose()
+
+
+def cache_row(record, key='key'):
+    return NatalChartCache(
+        cache_key=key, birth_data_id=record.id, chart_kind='western', params={}, chart_data={}
+    )
+
+
+@pytest.mark.unit
+class TestCacheSession:
+
+    def test_commits_on_its_own_connection(self, file_db):
+        db, record = file_db
+        record.name = "Renamed"
+
+        with CacheSession(db) as session:
+            assert session is not db
+            assert session.connection().connection.driver_connection is not \
+                db.connection().connection.driver_connection
+            session.add(cache_row(record))
+        db.rollback()
+
+        assert db.query(NatalChartCache).count() == 1
+        assert db.get(BirthData, record.id).name == "Cache Test"
+
+    def test_joins_a_flushed_transaction(self, file_db):
+        db, record = file_db
+        record.name = "Renamed"
+        db.flush()
+
+        with CacheSession(db) as session:
+            session.add(cache_row(record))
+        assert db.query(NatalChartCache).count() == 1
+        db.rollback()
+
+        assert db.query(NatalChartCache).count() == 0
+        assert db.get(BirthData, record.id).name == "Cache Test"
+
+    def test_duplicate_rolls_back_only_the_cache_rows(self, file_db):
+        db, record = file_db
+        with CacheSession(db) as session:
+            session.add(cache_row(record))
+
+        record.name = "Renamed"
+        db.flush()
+        with pytest.raises(IntegrityError):
+            with CacheSession(db) as session:
+                session.add(cache_row(record))
+        db.commit()
+
+        assert db.query(NatalChartCache).count() == 1
+        assert db.get(BirthData, record.id).name == "Renamed"
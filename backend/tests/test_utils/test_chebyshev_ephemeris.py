@@ -0,0 +1,112 @@
+"""
+Tests for the Chebyshev ephemeris cache
+"""
+import numpy as np
+import pytest
+
+from app.core.config import settings
+from app.utils.chebyshev_ephemeris import ChebyshevEphemeris, _basis
+from app.utils.ephemeris import EphemerisCalculator
+
+
+START_JD = 2451545.0
+END_JD = START_JD + 200
+BODIES = ['sun', 'moon', 'mars', 'jupiter', 'north_node']
+
+
+@pytest.fixture(scope='module')
+def cache(tmp_path_factory):
+    path = tmp_path_factory.mktemp('ephemeris') / 'chebyshev.npy'
+    return ChebyshevEphemeris.build(str(path), START_JD, END_JD, bodies=BODIES)
+
+
+@pytest.fixture
+def shared_cache(cache, monkeypatch):
+    """Serve batch calculations from the test cache"""
+    monkeypatch.setattr(ChebyshevEphemeris, '_shared', cache)
+    monkeypatch.setattr(ChebyshevEphemeris, '_shared_path', settings.EPHEMERIS_CACHE_PATH)
+    return cache
+
+
+@pytest.mark.unit
+class TestChebyshevBasis:
+
+    def test_matches_numpy_chebyshev(self):
+        x = np.linspace(-1, 1, 7)
+        basis, derivative = _basis(x, 6)
+
+        for k in range(6):
+            series = np.polynomial.Chebyshev.basis(k)
+            assert basis[k] == pytest.approx(series(x))
+            assert derivative[k] == pytest.approx(series.deriv()(x))
+
+
+@pytest.mark.ephemeris
+class TestChebyshevEphemeris:
+
+    def test_positions_match_swiss_ephemeris(self, cache):
+        jds = np.random.default_rng(21).uniform(START_JD, END_JD, 500)
+        expected = EphemerisCalculator.calculate_positions_batch(jds, BODIES, use_cache=False)
+        fitted = cache.positions(jds, BODIES)
+
+        longitude_error = np.abs(np.mod(fitted.longitude - expected.longitude + 180, 360) - 180) * 3600
+        for col, body in enumerate(BODIES):
+            # Random instants can land between the verification samples
+            assert longitude_error[:, col].max() <= 2 * cache.max_error(body) + 0.01
+        assert np.abs(fitted.latitude - expected.latitude).max() * 3600 < settings.EPHEMERIS_CACHE_TOLERANCE_ARCSEC
+        assert fitted.distance == pytest.approx(expected.distance, rel=1e-6)
+        assert fitted.speed_longitude == pytest.approx(expected.speed_longitude, abs=1e-3)
+
+    def test_moon_fit_is_tight(self, cache):
+        assert cache.max_error('moon') < 0.01
+
+    def test_south_node_is_opposite(self, cache):
+        batch = cache.positions([START_JD + 10.3], ['north_node', 'south_node'])
+
+        assert np.mod(batch.longitude[0, 1] - batch.longitude[0, 0], 360) == pytest.approx(180.0)
+
+    def test_covers(self, cache):
+        assert cache.covers(np.array([START_JD, END_JD]), ['moon', 'south_node'])
+        assert not cache.covers(np.array([START_JD - 1]), ['moon'])
+        assert not cache.covers(np.array([START_JD]), ['venus'])
+        with pytest.raises(ValueError):
+            cache.positions([END_JD + 1], ['moon'])
+
+    def test_batch_uses_cache_in_range(self, shared_cache):
+        jds = np.linspace(START_JD, END_JD, 50)
+        cached = EphemerisCalculator.calculate_positions_batch(jds, ['moon'], zodiac='sidereal', use_cache=True)
+        direct = EphemerisCalculator.calculate_positions_batch(jds, ['moon'], zodiac='sidereal')
+
+        assert np.abs(cached.longitude - direct.longitude).max() * 3600 < 0.01
+        assert cached.speed_longitude == pytest.approx(direct.speed_longitude, abs=1e-4)
+
+    def test_batch_falls_back_outside_cache(self, shared_cache):
+        jds = [START_JD - 30, START_JD]
+        batch = EphemerisCalculator.calculate_positions_batch(jds, ['moon', 'venus'], use_cache=True)
+        direct = EphemerisCalculator.calculate_positions_batch(jds, ['moon', 'venus'])
+
+        np.testing.assert_array_equal(batch.longitude, direct.longitude)
+
+    def test_batch_is_exact_by_default(self, shared_cache):
+        jds = np.linspace(START_JD, END_JD, 50)
+        batch = EphemerisCalculator.calculate_positions_batch(jds, ['moon'])
+        direct = EphemerisCalculator.calculate_positions_batch(jds, ['moon'], use_cache=False)
+
+        np.testing.assert_array_equal(batch.longitude, direct.longitude)
+
+    def test_shared_cache_picked_up_once_built(self, tmp_path, monkeypatch):
+        path = tmp_path / 'shared.npy'
+        monkeypatch.setattr(settings, 'EPHEMERIS_CACHE_PATH', str(path))
+        monkeypatch.setattr(ChebyshevEphemeris, '_shared', None)
+        monkeypatch.setattr(ChebyshevEphemeris, '_shared_path', None)
+
+        assert ChebyshevEphemeris.get() is None
+        ChebyshevEphemeris.build(str(path), START_JD, START_JD + 64, bodies=['moon'])
+        assert ChebyshevEphemeris.get().covers(np.array([START_JD]), ['moon'])
+
+    def test_build_rejects_fit_over_tolerance(self, tmp_path):
+        with pytest.raises(ValueError):
+            ChebyshevEphemeris.build(
+                str(tmp_path / 'tight.npy'), START_JD, START_JD + 64,
+                bodies=['jupiter'], tolerance_arcsec=1e-9
+            )
@@ -2,7 +2,10 @@
 Comprehensive tests for Swiss Ephemeris wrapper
 Tests planetary calculations, house systems, aspects, and conversions
 """
+import threading
+
 import pytest
+import swisseph as swe
 from datetime import datetime
 from app.utils.ephemeris import EphemerisCalculator
 
@@ -468,6 +471,91 @@ class TestSiderealTropicalConversions:
         assert abs(original_tropical - back_to_tropical) < 0.001
 
 
+class TestSiderealContext:
+    """Sidereal positions derived from tropical ones via a pinned ayanamsa"""
+
+    JD = 2460000.25
+
+    @pytest.mark.ephemeris
+    @pytest.mark.unit
+    @pytest.mark.parametrize("ayanamsa_system", ['lahiri', 'raman', 'krishnamurti'])
+    def test_derived_positions_match_native_sidereal(self, ayanamsa_system):
+        """tropical - ayanamsa should equal Swiss Ephemeris' own sidereal output"""
+        context = EphemerisCalculator.get_sidereal_context(ayanamsa_system)
+        flags = EphemerisCalculator.get_calc_flags('sidereal')
+
+        for body in ['sun', 'moon', 'mars', 'pluto']:
+            derived = EphemerisCalculator.calculate_planet_position(
+                body, self.JD, zodiac='sidereal', ayanamsa=ayanamsa_system
+            )
+            with context.swe_mode():
+                native = swe.calc_ut(self.JD, EphemerisCalculator.PLANETS[body], flags)[0]
+
+            assert derived['longitude'] == pytest.approx(native[0], abs=1e-9)
+            assert derived['speed_longitude'] == pytest.approx(native[3], abs=1e-5)
+
+    @pytest.mark.ephemeris
+    @pytest.mark.unit
+    def test_to_sidereal_shifts_tropical_dict(self):
+        """to_sidereal should match a direct sidereal calculation"""
+        context = EphemerisCalculator.get_sidereal_context('raman')
+        tropical = EphemerisCalculator.calculate_planet_position('venus', self.JD)
+        sidereal = EphemerisCalculator.calculate_planet_position(
+            'venus', self.JD, zodiac='sidereal', ayanamsa='raman'
+        )
+        shifted = context.to_sidereal(tropical, self.JD)
+
+        assert shifted['longitude'] == pytest.approx(sidereal['longitude'], abs=1e-9)
+        assert shifted['sign'] == sidereal['sign']
+        assert (tropical['longitude'] - shifted['longitude']) % 360 == pytest.approx(
+            EphemerisCalculator.calculate_ayanamsa(self.JD, 'raman'), abs=1e-9
+        )
+
+    @pytest.mark.ephemeris
+    @pytest.mark.unit
+    def test_concurrent_ayanamsas_do_not_interfere(self):
+        """Threads using different ayanamsas must not corrupt each other"""
+        expected = {
+            system: EphemerisCalculator.calculate_planet_position(
+                'sun', self.JD, zodiac='sidereal', ayanamsa=system
+            )['longitude']
+            for system in ['lahiri', 'raman']
+        }
+        mismatches = []
+
+        def worker(system: str, offset: int):
+            for i in range(200):
+                # Uncached days force fresh ayanamsa lookups in both threads
+                jd = self.JD + offset + i * 1e-3
+                lon = EphemerisCalculator.calculate_planet_position(
+                    'sun', jd, zodiac='sidereal', ayanamsa=system
+                )['longitude']
+                with EphemerisCalculator.get_sidereal_context(system).swe_mode():
+                    native = swe.calc_ut(jd, swe.SUN, EphemerisCalculator.get_calc_flags('sidereal'))[0][0]
+                if abs(lon - native) > 1e-9:
+                    mismatches.append((system, jd))
+
+        threads = [threading.Thread(target=worker, args=(system, n))
+                   for n, system in enumerate(expected)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert mismatches == []
+        assert expected['lahiri'] != pytest.approx(expected['raman'], abs=0.1)
+
+    @pytest.mark.unit
+    def test_context_is_shared_per_ayanamsa(self):
+        assert EphemerisCalculator.get_sidereal_context('Lahiri') is \
+            EphemerisCalculator.get_sidereal_context('lahiri')
+
+    @pytest.mark.unit
+    def test_unknown_ayanamsa_raises(self):
+        with pytest.raises(ValueError):
+            EphemerisCalculator.calculate_ayanamsa(2451545.0, 'galactic_center_of_nowhere')
+
+
 # =============================================================================
 # Utility Function Tests
 # =============================================================================
@@ -523,6 +611,66 @@ class TestUtilityFunctions:
         assert expected_degree_range[0] <= degree < expected_degree_range[1]
 
 
+# =============================================================================
+# Batch Calculation Tests
+# =============================================================================
+
+class TestBatchPositions:
+    """Test vectorized batch ephemeris API"""
+
+    BODIES = ['sun', 'moon', 'mercury', 'mars', 'saturn', 'north_node', 'south_node']
+
+    @pytest.mark.unit
+    @pytest.mark.ephemeris
+    @pytest.mark.parametrize("zodiac", ['tropical', 'sidereal'])
+    def test_batch_matches_single_calculation(self, zodiac):
+        """Batch arrays should match per-call results"""
+        jds = [2451545.0, 2451545.5, 2460000.25]
+        batch = EphemerisCalculator.calculate_positions_batch(
+            jds, self.BODIES, zodiac=zodiac, ayanamsa='raman'
+        )
+
+        assert batch.longitude.shape == (3, len(self.BODIES))
+        for row, jd in enumerate(jds):
+            single = EphemerisCalculator.calculate_all_planets(
+                jd, zodiac=zodiac, body_ids=self.BODIES, ayanamsa='raman'
+            )
+            for col, body in enumerate(self.BODIES):
+                assert batch.longitude[row, col] == pytest.approx(single[body]['longitude'], abs=1e-9)
+                assert batch.speed_longitude[row, col] == pytest.approx(single[body]['speed_longitude'], abs=1e-9)
+                assert batch.sign[row, col] == single[body]['sign']
+                assert batch.retrograde[row, col] == single[body]['retrograde']
+
+    @pytest.mark.unit
+    @pytest.mark.ephemeris
+    def test_positions_at_matches_dict_layout(self):
+        """positions_at should return calculate_all_planets-shaped dicts"""
+        batch = EphemerisCalculator.calculate_positions_batch([2451545.0], self.BODIES)
+        row = batch.positions_at(0)
+        single = EphemerisCalculator.calculate_all_planets(2451545.0, body_ids=self.BODIES)
+
+        assert set(row) == set(single)
+        assert set(row['sun']) == set(single['sun'])
+        assert row['south_node']['sign_name'] == single['south_node']['sign_name']
+
+    @pytest.mark.unit
+    @pytest.mark.ephemeris
+    def test_batch_includes_speeds(self):
+        """Speeds should be populated so retrograde can be derived"""
+        # Mercury stationed retrograde on 2023-12-13
+        jd = EphemerisCalculator.datetime_to_julian_day(datetime(2023, 12, 20, 12, 0), 0)
+        batch = EphemerisCalculator.calculate_positions_batch([jd], ['sun', 'mercury'])
+
+        assert batch.speed_longitude[0, 0] == pytest.approx(1.0, abs=0.05)
+        assert bool(batch.retrograde[0, 1]) is True
+
+    @pytest.mark.unit
+    def test_unknown_body_raises(self):
+        """Unknown bodies should raise ValueError"""
+        with pytest.raises(ValueError):
+            EphemerisCalculator.calculate_positions_batch([2451545.0], ['vulcan'])
+
+
 # =============================================================================
 # Integration Tests
 # =============================================================================
@@ -0,0 +1,77 @@
+"""
+Tests for the nakshatra lookup tables
+"""
+import numpy as np
+import pytest
+
+from app.utils import nakshatra
+from app.utils.nakshatra import (
+    NAKSHATRA_BOUNDS,
+    NAKSHATRA_LORDS,
+    NAKSHATRA_NAMES,
+    calculate_nakshatras,
+    locate,
+    nakshatra_info,
+)
+from app.services.dasha_calculator import VimshottariDashaCalculator
+
+
+@pytest.mark.unit
+class TestNakshatraTables:
+
+    def test_tables_are_exact_and_immutable(self):
+        assert NAKSHATRA_BOUNDS[-1] == 360 * 3600
+        assert len(NAKSHATRA_NAMES) == len(NAKSHATRA_LORDS) == 27
+        with pytest.raises(ValueError):
+            NAKSHATRA_BOUNDS[1] = 0
+
+    @pytest.mark.parametrize('longitude,name,pada', [
+        (0.0, 'Ashwini', 1),
+        (40.0 / 3.0, 'Bharani', 1),
+        (40.0, 'Rohini', 1),
+        (43.34, 'Rohini', 2),
+        (359.9999999, 'Revati', 4),
+        (360.0, 'Ashwini', 1),
+    ])
+    def test_boundaries(self, longitude, name, pada):
+        info = nakshatra_info(longitude)
+
+        assert info['name'] == name
+        assert info['pada'] == pada
+
+    def test_vectorized_matches_scalar(self):
+        longitudes = np.random.default_rng(19).uniform(0, 360, (40, 3))
+        positions = locate(longitudes)
+
+        assert positions.index.shape == (40, 3)
+        for flat in (0, 17, 119):
+            assert positions.info(flat) == nakshatra_info(longitudes.flat[flat])
+
+    def test_dasha_balance_has_no_span_drift(self):
+        # Exactly at the start of Rohini the whole Moon dasha remains
+        _, lord, remaining = VimshottariDashaCalculator._dasha_start(40.0)
+
+        assert lord == 'moon'
+        assert remaining == 10.0
+
+
+@pytest.mark.unit
+class TestChartNakshatras:
+
+    def test_skips_missing_planets(self):
+        planets = {'sun': {'longitude': 10.0}, 'moon': {'longitude': 200.0}, 'chiron': None}
+        result = calculate_nakshatras(planets)
+
+        assert set(result) == {'sun', 'moon'}
+        assert result['moon'] == nakshatra_info(200.0)
+
+    def test_cached_per_chart_with_fresh_copies(self):
+        nakshatra._chart_nakshatras.cache_clear()
+        planets = {'sun': {'longitude': 10.0}, 'moon': {'longitude': 200.0}}
+
+        first = calculate_nakshatras(planets)
+        first['sun']['pada'] = 99
+        second = calculate_nakshatras(planets)
+
+        assert nakshatra._chart_nakshatras.cache_info().hits == 1
+        assert second['sun']['pada'] == 4
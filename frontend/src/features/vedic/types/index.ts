@@ -78,6 +78,15 @@ export interface DivisionalChartData {
   }
 }
 
+// Vimshopaka bala (0-20) per scheme, with each varga's points (of 20)
+export interface VimshopakaBala {
+  shadvarga: number
+  saptavarga: number
+  dasavarga: number
+  shodasavarga: number
+  varga_points: Record<string, number>
+}
+
 // Complete Vedic chart response
 export interface VedicChartData {
   id: string
@@ -86,6 +95,7 @@ export interface VedicChartData {
     d9?: DivisionalChartData
     [key: string]: DivisionalChartData | undefined
   }
+  vimshopaka_bala?: Record<string, VimshopakaBala>
   calculation_info: {
     julian_day: number
     ayanamsa: string
@@ -66,6 +66,41 @@ export interface TransitScoreResponse {
   description: string
 }
 
+export interface TransitStrengthPeriod {
+  start_jd: number
+  end_jd: number
+  sign: number
+  sign_name: string
+  bhinna_bindus: number
+  sarva_bindus: number
+  kakshya: number
+  kakshya_lord: string
+  kakshya_bindu: boolean
+}
+
+/** Sample-by-planet arrays; columns follow `planets` */
+export interface TransitStrengthSeries {
+  start: string
+  end: string
+  step_days: number
+  bhinna_bindus_by_sign: Record<string, number[]>
+  sarva_bindus_by_sign: number[]
+  planets: string[]
+  dates: string[]
+  signs: number[][]
+  kakshyas: number[][]
+  bhinna_bindus: number[][]
+  sarva_bindus: number[][]
+  kakshya_bindus: number[][]
+  periods?: Record<string, TransitStrengthPeriod[]>
+}
+
+export interface TransitStrengthSeriesOptions {
+  stepDays?: number
+  ayanamsa?: string
+  includePeriods?: boolean
+}
+
 /**
  * Calculate Ashtakavarga from birth data
  */
@@ -103,3 +138,27 @@ export async function getTransitScore(
   })
   return response.data
 }
+
+/**
+ * Get transit strength of all 7 planets over a date range
+ */
+export async function getTransitStrengthSeries(
+  birthDataId: string,
+  start: string,
+  end: string,
+  options: TransitStrengthSeriesOptions = {}
+): Promise<TransitStrengthSeries> {
+  const response = await apiClient.get<TransitStrengthSeries>(
+    `/ashtakavarga/transit-series/${birthDataId}`,
+    {
+      params: {
+        start,
+        end,
+        step_days: options.stepDays ?? 1,
+        ayanamsa: options.ayanamsa ?? 'lahiri',
+        include_periods: options.includePeriods ?? false,
+      },
+    }
+  )
+  return response.data
+}
@@ -167,3 +167,101 @@ export async function getOrCreateChart(data: ChartCalculationRequest, signal?: A
     throw new Error(getErrorMessage(error))
   }
 }
+
+// =============================================================================
+// Birth Time Rectification
+// =============================================================================
+
+export interface RectificationRequest {
+  birth_data_id: string
+  event_ids?: string[]  // Default: all timeline events of the birth data
+  step_minutes?: number  // Minutes between candidate times (1-60)
+  top?: number  // Ranked candidates to return (1-20)
+  house_system?: string
+}
+
+export interface RectificationHit {
+  event_id: string | null
+  event_title: string | null
+  event_date: string
+  technique: 'transits' | 'progressed' | 'directed'
+  point: string  // Transiting/progressed body, or directed angle
+  target: string  // Natal angle, or natal planet
+  orb: number
+  score: number
+}
+
+export interface RectificationCandidate {
+  time: string  // HH:MM local
+  local_datetime: string
+  utc_datetime: string
+  julian_day: number
+  ascendant: number
+  ascendant_sign: string
+  mc: number
+  mc_sign: string
+  cusps: number[]
+  score: number
+  relative_score: number  // Score relative to the best candidate
+  technique_scores: Record<string, number>
+  hits: RectificationHit[]
+}
+
+export interface RectificationResult {
+  birth_date: string
+  step_minutes: number
+  candidate_count: number
+  event_count: number
+  candidates: RectificationCandidate[]  // Best first
+  scores: number[]  // One per candidate time, in time order
+}
+
+export interface RectificationProgress {
+  stage: string
+  progress: number  // 0..1
+}
+
+/**
+ * Rank candidate birth times against the user's timeline events.
+ * The server streams newline-delimited JSON progress updates; onProgress
+ * is called for each and the final result is returned.
+ */
+export async function rectifyBirthTime(
+  data: RectificationRequest,
+  onProgress?: (update: RectificationProgress) => void,
+  signal?: AbortSignal
+): Promise<RectificationResult> {
+  const token = localStorage.getItem('token')
+  const response = await fetch(`${apiClient.defaults.baseURL}/charts/rectify`, {
+    method: 'POST',
+    headers: {
+      'Content-Type': 'application/json',
+      ...(token ? { Authorization: `Bearer ${token}` } : {}),
+    },
+    body: JSON.stringify(data),
+    signal,
+  })
+  if (!response.ok || !response.body) {
+    const body = await response.json().catch(() => null)
+    throw new Error(body?.detail || `Rectification failed (${response.status})`)
+  }
+
+  const reader = response.body.getReader()
+  const decoder = new TextDecoder()
+  let buffer = ''
+  for (;;) {
+    const { done, value } = await reader.read()
+    buffer += decoder.decode(value, { stream: !done })
+    const lines = buffer.split('\n')
+    buffer = lines.pop() ?? ''
+    for (const line of lines) {
+      if (!line.trim()) continue
+      const update = JSON.parse(line)
+      if (update.stage === 'error') throw new Error(update.error)
+      onProgress?.({ stage: update.stage, progress: update.progress })
+      if (update.result) return update.result as RectificationResult
+    }
+    if (done) break
+  }
+  throw new Error('Rectification stream ended without a result')
+}
@@ -13,10 +13,19 @@ export interface DashaPeriod {
   start_date: string
   end_date: string
   duration_years: number
-  level: 'mahadasha' | 'antardasha' | 'pratyantardasha'
+  level: DashaLevel
   parent_planet?: string
+  /** Row index at every level; present on /at and /periods results */
+  path?: number[]
 }
 
+export type DashaLevel =
+  | 'mahadasha'
+  | 'antardasha'
+  | 'pratyantardasha'
+  | 'sookshmadasha'
+  | 'pranadasha'
+
 export interface Mahadasha extends DashaPeriod {
   period_number: number
   antardashas?: DashaPeriod[]
@@ -80,27 +89,33 @@ export interface DashaDirectRequest {
   calculate_years?: number
 }
 
+export interface CurrentDashaPeriod {
+  planet: string
+  planet_name: string
+  start_date: string
+  end_date: string
+}
+
 export interface CurrentDashaResponse {
   current_period: string
-  mahadasha?: {
-    planet: string
-    planet_name: string
-    start_date: string
-    end_date: string
+  mahadasha?: CurrentDashaPeriod & {
     remaining_years?: number
   }
-  antardasha?: {
-    planet: string
-    planet_name: string
-    start_date: string
-    end_date: string
-  }
-  pratyantardasha?: {
-    planet: string
-    planet_name: string
-    start_date: string
-    end_date: string
-  }
+  antardasha?: CurrentDashaPeriod
+  pratyantardasha?: CurrentDashaPeriod
+  sookshmadasha?: CurrentDashaPeriod
+  pranadasha?: CurrentDashaPeriod
+}
+
+export interface DashaAtDateResponse {
+  date: string
+  periods: DashaPeriod[]
+  current_period: string
+}
+
+export interface DashaPeriodsResponse {
+  level: DashaLevel
+  periods: DashaPeriod[]
 }
 
 /**
@@ -157,6 +172,47 @@ export async function getCurrentDasha(
   }
 }
 
+/**
+ * Get the Dasha periods containing a date, Mahadasha first, down to a level
+ */
+export async function getDashaAtDate(
+  birthDataId: string,
+  date: string,
+  level: DashaLevel = 'pranadasha',
+  ayanamsa: string = 'lahiri'
+): Promise<DashaAtDateResponse> {
+  try {
+    const response = await apiClient.get<DashaAtDateResponse>(
+      `/dasha/at/${birthDataId}`,
+      { params: { date, level, ayanamsa } }
+    )
+    return response.data
+  } catch (error) {
+    throw new Error(getErrorMessage(error))
+  }
+}
+
+/**
+ * Get every period of one Dasha level, optionally within a date range
+ */
+export async function getDashaPeriods(
+  birthDataId: string,
+  level: DashaLevel,
+  start?: string,
+  end?: string,
+  ayanamsa: string = 'lahiri'
+): Promise<DashaPeriodsResponse> {
+  try {
+    const response = await apiClient.get<DashaPeriodsResponse>(
+      `/dasha/periods/${birthDataId}`,
+      { params: { level, start, end, ayanamsa } }
+    )
+    return response.data
+  } catch (error) {
+    throw new Error(getErrorMessage(error))
+  }
+}
+
 /**
  * Get nakshatra info for a longitude
  */
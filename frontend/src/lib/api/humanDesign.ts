@@ -273,6 +273,69 @@ export interface HDFullReadingResponse {
   }
 }
 
+export interface HDTransitInterval {
+  body: string
+  gate: number
+  line: number | null
+  start_jd: number
+  end_jd: number
+  start: string
+  end: string
+  start_exact: boolean
+  retrograde: boolean
+}
+
+export interface HDTransitIntervalsResponse {
+  start_date: string
+  end_date: string
+  level: 'gate' | 'line'
+  intervals: HDTransitInterval[]
+}
+
+export interface HDGateIngress {
+  body: string
+  gate: number
+  line: number
+  jd: number
+  date: string
+  retrograde: boolean
+}
+
+export interface HDTransitIngressesResponse {
+  start_date: string
+  end_date: string
+  level: 'gate' | 'line'
+  ingresses: HDGateIngress[]
+}
+
+export interface HDTransitActivationsResponse {
+  at: string
+  activations: Record<string, { gate: number; line: number; until: string }>
+}
+
+export interface HDTransitChannelWindow {
+  channel: string
+  name: string
+  gates: [number, number]
+  natal_gates: number[]
+  transit_gates: number[]
+  start_jd: number
+  end_jd: number
+  start: string
+  end: string
+  bodies: string[]
+  begins_before_range: boolean
+  ends_after_range: boolean
+}
+
+export interface HDTransitChannelsResponse {
+  birth_data_id: string
+  start_date: string
+  end_date: string
+  natal_gates: number[]
+  windows: HDTransitChannelWindow[]
+}
+
 // ==================== API Functions ====================
 
 /**
@@ -629,6 +692,86 @@ export async function getFullHDReading(
   }
 }
 
+/**
+ * Get the gates (or lines) each transiting HD body occupies over a date range
+ */
+export async function getHDTransitIntervals(
+  startDate: string,
+  endDate: string,
+  options: {
+    level?: 'gate' | 'line'
+    gates?: number[]
+    bodies?: string[]
+  } = {}
+): Promise<HDTransitIntervalsResponse> {
+  try {
+    const response = await apiClient.get('/human-design/transits/intervals', {
+      params: {
+        start_date: startDate,
+        end_date: endDate,
+        level: options.level,
+        gates: options.gates?.join(','),
+        bodies: options.bodies?.join(','),
+      }
+    })
+    return response.data
+  } catch (error) {
+    throw new Error(getErrorMessage(error))
+  }
+}
+
+/**
+ * Get the exact times transiting HD bodies enter new gates or lines
+ */
+export async function getHDTransitIngresses(
+  startDate: string,
+  endDate: string,
+  level: 'gate' | 'line' = 'gate',
+  bodies?: string[]
+): Promise<HDTransitIngressesResponse> {
+  try {
+    const response = await apiClient.get('/human-design/transits/ingresses', {
+      params: { start_date: startDate, end_date: endDate, level, bodies: bodies?.join(',') }
+    })
+    return response.data
+  } catch (error) {
+    throw new Error(getErrorMessage(error))
+  }
+}
+
+/**
+ * Get the transit gate and line of every HD body at a moment (defaults to now)
+ */
+export async function getHDTransitActivations(at?: string): Promise<HDTransitActivationsResponse> {
+  try {
+    const response = await apiClient.get('/human-design/transits/activations', {
+      params: { at }
+    })
+    return response.data
+  } catch (error) {
+    throw new Error(getErrorMessage(error))
+  }
+}
+
+/**
+ * Get when transits temporarily define channels open in a natal chart
+ */
+export async function getHDTransitChannels(
+  birthDataId: string,
+  startDate: string,
+  endDate: string,
+  includeMoon: boolean = true
+): Promise<HDTransitChannelsResponse> {
+  try {
+    const response = await apiClient.get(`/human-design/transits/channels/${birthDataId}`, {
+      params: { start_date: startDate, end_date: endDate, include_moon: includeMoon }
+    })
+    return response.data
+  } catch (error) {
+    throw new Error(getErrorMessage(error))
+  }
+}
+
 // ==================== Helper Functions ====================
 
 /**
@@ -4,6 +4,7 @@
  * Part of Phase 3: AI Proactive Intelligence
  */
 import { apiClient } from './client'
+import type { SkyEvent } from './transits'
 
 // ============================================================================
 // Types
@@ -20,7 +21,8 @@ export interface DayEnergy {
 export interface MoonPhase {
   phase: string
   description: string
-  day_of_cycle: number
+  day_of_cycle: number | null
+  events?: SkyEvent[]
 }
 
 export interface TransitInfo {
@@ -58,6 +60,7 @@ export interface WeekPreviewDay {
   energy_score: number
   key_transit_count: number
   moon_phase: string
+  sky_events?: SkyEvent[]
 }
 
 export interface WeekPreview {
@@ -65,6 +68,16 @@ export interface WeekPreview {
   week_preview: WeekPreviewDay[]
 }
 
+export interface MonthPreview {
+  name: string
+  month_preview: WeekPreviewDay[]
+}
+
+export interface YearPreview {
+  name: string
+  year_preview: WeekPreviewDay[]
+}
+
 export interface JournalConsistency {
   score: number
   streak: number
@@ -168,6 +181,33 @@ export const getWeekPreview = async (birthDataId: string): Promise<WeekPreview>
   return response.data
 }
 
+/**
+ * Get month preview (28-31 days from startDate, default today)
+ */
+export const getMonthPreview = async (
+  birthDataId: string,
+  startDate?: string,
+  days: number = 30
+): Promise<MonthPreview> => {
+  const response = await apiClient.get(`/insights/month-preview/${birthDataId}`, {
+    params: { start_date: startDate, days },
+  })
+  return response.data
+}
+
+/**
+ * Get year preview (365 days from startDate, default today)
+ */
+export const getYearPreview = async (
+  birthDataId: string,
+  startDate?: string
+): Promise<YearPreview> => {
+  const response = await apiClient.get(`/insights/year-preview/${birthDataId}`, {
+    params: startDate ? { start_date: startDate } : undefined,
+  })
+  return response.data
+}
+
 /**
  * Get current moon phase
  */
@@ -0,0 +1,102 @@
+/**
+ * Shadbala API Client
+ *
+ * API functions for calculating Shadbala (six-fold planetary strength).
+ */
+
+import { apiClient } from './client'
+
+export interface PlanetShadbala {
+  sthana_bala: number  // virupas
+  dig_bala: number
+  kala_bala: number
+  chesta_bala: number
+  naisargika_bala: number
+  drik_bala: number
+  sthana_parts: Record<string, number>
+  kala_parts: Record<string, number>
+  total_virupas: number
+  total_rupas: number
+  required_rupas: number
+  strength_ratio: number
+  is_strong: boolean
+  rank: number  // 1 = strongest by ratio
+}
+
+export interface ShadbalaResponse {
+  planets: Record<string, PlanetShadbala>
+  strongest_planet: string
+  weakest_planet: string
+  calculation_info: {
+    julian_day: number
+    ayanamsa: string | null
+    latitude: number
+    longitude: number
+  }
+}
+
+export interface ShadbalaDashaSeries {
+  period: {
+    planet: string
+    planet_name: string
+    level: string
+    start_date: string
+    end_date: string
+    duration_years: number
+    parent_planet?: string
+  }
+  step_days: number
+  planets: string[]
+  dates: string[]
+  // Sample-by-planet arrays, in rupas
+  sthana_bala: number[][]
+  dig_bala: number[][]
+  kala_bala: number[][]
+  chesta_bala: number[][]
+  naisargika_bala: number[][]
+  drik_bala: number[][]
+  total_rupas: number[][]
+  strength_ratio: number[][]
+}
+
+export interface ShadbalaDashaSeriesOptions {
+  level?: 'mahadasha' | 'antardasha' | 'pratyantardasha' | 'sookshmadasha' | 'pranadasha'
+  at?: string
+  stepDays?: number
+  ayanamsa?: string
+}
+
+/**
+ * Get natal Shadbala for birth data
+ */
+export async function getShadbalaForBirthData(
+  birthDataId: string,
+  ayanamsa: string = 'lahiri'
+): Promise<ShadbalaResponse> {
+  const response = await apiClient.get<ShadbalaResponse>(
+    `/shadbala/birth-data/${birthDataId}`,
+    { params: { ayanamsa } }
+  )
+  return response.data
+}
+
+/**
+ * Get Shadbala of all 7 planets across a dasha period
+ */
+export async function getShadbalaDashaSeries(
+  birthDataId: string,
+  options: ShadbalaDashaSeriesOptions = {}
+): Promise<ShadbalaDashaSeries> {
+  const response = await apiClient.get<ShadbalaDashaSeries>(
+    `/shadbala/dasha-series/${birthDataId}`,
+    {
+      params: {
+        level: options.level ?? 'mahadasha',
+        at: options.at,
+        step_days: options.stepDays ?? 1,
+        ayanamsa: options.ayanamsa ?? 'lahiri',
+      },
+    }
+  )
+  return response.data
+}
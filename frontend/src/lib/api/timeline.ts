@@ -4,6 +4,7 @@
  * Part of Phase 2: Transit Timeline
  */
 import { apiClient, getErrorMessage } from './client'
+import type { SkyEvent } from './transits'
 
 // Types
 export interface UserEvent {
@@ -82,6 +83,7 @@ export interface TimelineDataPoint {
   transit_context: TransitContext | null
   significant_transits: Array<Record<string, unknown>>
   lunar_phase: string | null
+  sky_events: SkyEvent[]
 }
 
 export interface TimelineRangeResponse {
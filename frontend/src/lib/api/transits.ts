@@ -52,15 +52,35 @@ export interface TransitTimelineEntry {
   transits: TransitAspect[]
 }
 
+export interface TransitInterval {
+  transit_planet: string
+  natal_planet: string
+  aspect: string
+  aspect_longitude: number
+  orb: number
+  significance: string
+  entry_jd: number
+  exit_jd: number
+  exact_jds: number[]
+  entry_date: string
+  exit_date: string
+  exact_dates: string[]
+  begins_before_range: boolean
+  ends_after_range: boolean
+}
+
 export interface TransitTimelineResponse {
   start_date: string
   end_date: string
   timeline: TransitTimelineEntry[]
   total_days: number
+  intervals?: TransitInterval[]
 }
 
 export interface UpcomingTransit extends TransitAspect {
   first_date: string
+  exact_dates?: string[]
+  exit_date?: string
 }
 
 export interface UpcomingTransitsResponse {
@@ -75,6 +95,9 @@ export interface ExactTransitDate {
   natal_planet: string
   aspect: string
   retrograde: boolean
+  exact_longitude?: number
+  pass_number?: number
+  total_passes?: number
 }
 
 export interface ExactTransitDatesResponse {
@@ -98,6 +121,38 @@ export interface TransitReportResponse {
   summary: TransitSummary
 }
 
+export type SkyEventType = 'ingress' | 'station' | 'lunation' | 'eclipse' | 'void_of_course'
+
+export interface SkyEvent {
+  type: SkyEventType
+  body: string
+  name: string
+  description: string
+  date: string
+  end_date: string | null
+  sign: string | null
+  details: Record<string, any>
+}
+
+export interface SkyEventDay {
+  date: string
+  moon_phase: string | null
+  lunar_day: number | null
+  events: SkyEvent[]
+}
+
+export interface SkyEventsResponse {
+  start_date: string
+  end_date: string
+  events: SkyEvent[]
+}
+
+export interface SkyEventDaysResponse {
+  start_date: string
+  end_date: string
+  days: SkyEventDay[]
+}
+
 export interface DailySnapshotResponse {
   date: string
   moon_phase: string
@@ -106,6 +161,7 @@ export interface DailySnapshotResponse {
   active_transits: TransitAspect[]
   themes: string[]
   major_transit: TransitAspect | null
+  sky_events: SkyEvent[]
 }
 
 // Request types
@@ -266,6 +322,104 @@ export async function getDailySnapshot(
   }
 }
 
+/**
+ * Get exact sky events (ingresses, stations, lunations, eclipses,
+ * void-of-course Moon) for a date range (UTC days, end inclusive)
+ */
+export async function getSkyEvents(
+  startDate: string,
+  endDate: string,
+  types?: SkyEventType[]
+): Promise<SkyEventsResponse> {
+  try {
+    const response = await apiClient.get('/transits/sky-events', {
+      params: { start_date: startDate, end_date: endDate, types: types?.join(',') }
+    })
+    return response.data
+  } catch (error) {
+    throw new Error(getErrorMessage(error))
+  }
+}
+
+/**
+ * Get sky events grouped by day, with each day's Moon phase
+ */
+export async function getSkyEventDays(
+  startDate: string,
+  endDate: string
+): Promise<SkyEventDaysResponse> {
+  try {
+    const response = await apiClient.get('/transits/sky-events', {
+      params: { start_date: startDate, end_date: endDate, by_day: true }
+    })
+    return response.data
+  } catch (error) {
+    throw new Error(getErrorMessage(error))
+  }
+}
+
+// Electional search
+
+interface ElectionalConstraintOptions {
+  negate?: boolean  // Match when the condition does not hold
+  required?: boolean  // false: only scores windows (default true)
+  weight?: number  // Score weight of an optional constraint
+  label?: string
+}
+
+export type ElectionalConstraint = ElectionalConstraintOptions & (
+  | { type: 'moon_phase'; phase: 'waxing' | 'waning' }
+  | { type: 'event'; event_type: SkyEventType; body?: string; within_days?: number }
+  | { type: 'retrograde'; body: string }
+  | { type: 'sign'; body: string; signs: string[] }
+  | { type: 'aspect'; body: string; targets: string[]; aspects?: string[]; orb?: number }
+  | { type: 'angular'; body: string; angles?: Array<'ascendant' | 'mc' | 'descendant' | 'ic'>; orb?: number }
+)
+
+export interface ElectionalSearchRequest {
+  start_date: string  // YYYY-MM-DD (UTC)
+  end_date: string  // YYYY-MM-DD (UTC), inclusive
+  constraints: ElectionalConstraint[]
+  latitude?: number  // Required for angular constraints
+  longitude?: number
+  min_duration_minutes?: number
+  limit?: number
+}
+
+export interface ElectionalWindow {
+  start: string
+  end: string
+  start_jd: number
+  end_jd: number
+  duration_minutes: number
+  score: number
+  optional: Array<{ label: string; coverage: number }>
+}
+
+export interface ElectionalSearchResponse {
+  start_date: string
+  end_date: string
+  constraints: Array<ElectionalConstraint & { label: string }>
+  window_count: number
+  total_minutes: number
+  windows: ElectionalWindow[]  // Ranked, best first
+}
+
+/**
+ * Find time windows satisfying every required electional constraint,
+ * ranked by the optional ones
+ */
+export async function searchElectionalWindows(
+  request: ElectionalSearchRequest
+): Promise<ElectionalSearchResponse> {
+  try {
+    const response = await apiClient.post('/transits/electional', request)
+    return response.data
+  } catch (error) {
+    throw new Error(getErrorMessage(error))
+  }
+}
+
 // Helper functions
 
 /**
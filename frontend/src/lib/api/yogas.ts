@@ -45,11 +45,13 @@ export interface YogasRequest {
   birth_data_id: string
   ayanamsa?: string
   include_weak?: boolean
+  division?: number
 }
 
 export interface YogasFromChartRequest {
   chart_id: string
   include_weak?: boolean
+  division?: number
 }
 
 /**
@@ -74,11 +76,12 @@ export async function calculateYogasFromChart(request: YogasFromChartRequest): P
 export async function getYogasForBirthData(
   birthDataId: string,
   ayanamsa: string = 'lahiri',
-  includeWeak: boolean = false
+  includeWeak: boolean = false,
+  division: number = 1
 ): Promise<YogasResponse> {
   const response = await apiClient.get<YogasResponse>(
     `/yogas/birth-data/${birthDataId}`,
-    { params: { ayanamsa, include_weak: includeWeak } }
+    { params: { ayanamsa, include_weak: includeWeak, division } }
   )
   return response.data
 }